@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Measure how a `ConcurrencyBudget` keeps a slow domain from starving the others in a `BasicCrawler`.
+
+The queue starts with requests to a slow domain, followed by requests to several fast domains. The request handler
+only sleeps, for a long time on the slow domain and briefly on the others, so the results do not depend on the
+network. For every configuration, the script prints the time until all the fast requests are done and the time
+until the whole crawl is done.
+
+Single-purpose: run with no arguments from anywhere in the repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from crawlee import ConcurrencySettings
+from crawlee._autoscaling import ConcurrencyBudget
+from crawlee.crawlers import BasicCrawler, BasicCrawlingContext
+
+CONCURRENCY = 20
+SLOW_REQUESTS = 100
+SLOW_DURATION = 0.5
+FAST_DOMAINS = 4
+FAST_REQUESTS_PER_DOMAIN = 100
+FAST_DURATION = 0.02
+
+
+async def crawl(name: str, budget: ConcurrencyBudget | None) -> tuple[float, float]:
+    """Return the time until the fast domains are done and until the crawl is done, in seconds."""
+    # The crawlers share the default request queue, so every run needs its own URLs.
+    slow_urls = [f'http://slow.example/{name}/{i}' for i in range(SLOW_REQUESTS)]
+    fast_urls = [
+        f'http://fast-{domain}.example/{name}/{i}'
+        for i in range(FAST_REQUESTS_PER_DOMAIN)
+        for domain in range(FAST_DOMAINS)
+    ]
+    remaining_fast = len(fast_urls)
+    fast_done_at = 0.0
+
+    crawler = BasicCrawler(
+        concurrency_settings=ConcurrencySettings(
+            min_concurrency=CONCURRENCY,
+            desired_concurrency=CONCURRENCY,
+            max_concurrency=CONCURRENCY,
+            concurrency_budget=budget,
+        ),
+        configure_logging=False,
+    )
+
+    @crawler.router.default_handler
+    async def handler(context: BasicCrawlingContext) -> None:
+        nonlocal remaining_fast, fast_done_at
+
+        if context.request.url.startswith('http://slow.'):
+            await asyncio.sleep(SLOW_DURATION)
+            return
+
+        await asyncio.sleep(FAST_DURATION)
+        remaining_fast -= 1
+        if remaining_fast == 0:
+            fast_done_at = time.perf_counter()
+
+    started_at = time.perf_counter()
+    await crawler.run(slow_urls + fast_urls)
+    return fast_done_at - started_at, time.perf_counter() - started_at
+
+
+async def main() -> None:
+    logging.getLogger('crawlee').setLevel(logging.ERROR)
+
+    configurations: dict[str, ConcurrencyBudget | None] = {
+        'no budget': None,
+        'fair share': ConcurrencyBudget(),
+        'slow domain capped at 5': ConcurrencyBudget(max_concurrency_by_key={'slow.example': 5}),
+    }
+
+    print(f'{"configuration":<26} {"fast done s":>12} {"all done s":>12}')
+    for name, budget in configurations.items():
+        fast_done, all_done = await crawl(name.replace(' ', '-'), budget)
+        print(f'{name:<26} {fast_done:>12.2f} {all_done:>12.2f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
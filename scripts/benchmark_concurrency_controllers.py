@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Compare how quickly the `AutoscaledPool` concurrency controllers converge on a simulated system.
+
+The simulated system has a fixed capacity - the concurrency at which its CPU reaches the overload limit. Below the
+capacity, throughput grows linearly with concurrency. Above it, the share of overloaded CPU samples grows and the
+throughput degrades as tasks compete for the CPU. Every autoscaling interval, the controller gets the status the pool
+would give it and the simulation applies the new desired concurrency, so no real time passes and the results are
+deterministic for a given seed.
+
+For every controller and capacity, the script prints the number of intervals until the desired concurrency stays
+within the tolerance of the capacity, and the spread of the desired concurrency over the last intervals.
+
+Single-purpose: run with no arguments from anywhere in the repository.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from crawlee._autoscaling import (
+    AimdConcurrencyController,
+    StepConcurrencyController,
+    ThroughputConcurrencyController,
+)
+from crawlee._autoscaling._types import ConcurrencyStatus, LoadRatioInfo, SystemInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from crawlee._autoscaling import ConcurrencyController
+
+INTERVAL = timedelta(seconds=10)
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 1000
+INTERVALS = 200
+TOLERANCE = 0.2
+TAIL = 50
+TASKS_PER_SECOND_PER_SLOT = 0.5
+CPU_LIMIT_RATIO = 0.4
+
+CONTROLLERS: dict[str, Callable[[], ConcurrencyController]] = {
+    'step': StepConcurrencyController,
+    'aimd': AimdConcurrencyController,
+    'throughput': ThroughputConcurrencyController,
+}
+
+
+def simulate_interval(concurrency: int, capacity: int, rng: random.Random) -> tuple[SystemInfo, int]:
+    """Return the system status and the number of finished tasks for one interval at the given concurrency."""
+    load = concurrency / capacity
+    # The share of overloaded CPU samples reaches the limit exactly at the capacity.
+    cpu_ratio = min(1.0, max(0.0, CPU_LIMIT_RATIO + (load - 1) * 2 + rng.uniform(-0.05, 0.05)))
+    idle = LoadRatioInfo(limit_ratio=0.2, actual_ratio=0.0)
+    system_info = SystemInfo(
+        cpu_info=LoadRatioInfo(limit_ratio=CPU_LIMIT_RATIO, actual_ratio=cpu_ratio),
+        memory_info=idle,
+        event_loop_info=idle,
+        client_info=idle,
+    )
+
+    effective_slots = concurrency if load <= 1 else capacity / load**0.5
+    throughput = effective_slots * TASKS_PER_SECOND_PER_SLOT * rng.uniform(0.97, 1.03)
+    return system_info, round(throughput * INTERVAL.total_seconds())
+
+
+def run(controller: ConcurrencyController, capacity: int, seed: int) -> list[int]:
+    """Run the simulation and return the desired concurrency after each interval."""
+    rng = random.Random(seed)
+    desired_concurrency = MIN_CONCURRENCY
+    history = list[int]()
+
+    for _ in range(INTERVALS):
+        system_info, finished_task_count = simulate_interval(desired_concurrency, capacity, rng)
+        status = ConcurrencyStatus(
+            desired_concurrency=desired_concurrency,
+            current_concurrency=desired_concurrency,
+            min_concurrency=MIN_CONCURRENCY,
+            max_concurrency=MAX_CONCURRENCY,
+            system_info=system_info,
+            finished_task_count=finished_task_count,
+            interval=INTERVAL,
+        )
+        new_concurrency = controller.get_desired_concurrency(status)
+        desired_concurrency = max(MIN_CONCURRENCY, min(MAX_CONCURRENCY, new_concurrency))
+        history.append(desired_concurrency)
+
+    return history
+
+
+def intervals_to_converge(history: list[int], capacity: int) -> int | None:
+    """Return the number of intervals after which the history stays within the tolerance of the capacity."""
+    converged_at = None
+    for index, concurrency in enumerate(history):
+        if abs(concurrency - capacity) <= TOLERANCE * capacity:
+            converged_at = index + 1 if converged_at is None else converged_at
+        else:
+            converged_at = None
+    return converged_at
+
+
+def main() -> None:
+    print(f'{"controller":<12}{"capacity":>10}{"intervals":>12}{"time":>10}{"tail min":>10}{"tail max":>10}')
+
+    for capacity in (20, 100, 500):
+        for name, controller_factory in CONTROLLERS.items():
+            history = run(controller_factory(), capacity, seed=capacity)
+            converged = intervals_to_converge(history, capacity)
+            time = f'{converged * INTERVAL.total_seconds() / 60:.1f}m' if converged else '-'
+            tail = history[-TAIL:]
+            print(f'{name:<12}{capacity:>10}{converged or "never":>12}{time:>10}{min(tail):>10}{max(tail):>10}')
+
+
+if __name__ == '__main__':
+    main()
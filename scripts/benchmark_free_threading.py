@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Compare the throughput of the CPU-heavy crawler stages with and without the free-threaded mode.
+
+Every document goes through the stages the free-threaded mode moves to the CPU thread pool: it is parsed with the
+`ParselParser`, its links are resolved and filtered like `enqueue_links` does it, and the extracted items are encoded
+to JSON like the file system storage client does it. The documents are processed concurrently, the way a crawler
+processes requests. The script prints the wall time and the number of documents per second with the mode disabled
+(the stages run through `asyncio.to_thread`, or on the event loop for link filtering) and enabled with 1 thread
+and with as many threads as there are CPUs.
+
+Run it once with a regular build and once with a free-threaded build of Python (e.g. `python3.13t`) to compare them,
+on a GIL build the mode is not expected to be any faster.
+
+Single-purpose: run with no arguments from anywhere in the repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from typing import TYPE_CHECKING, cast
+
+from yarl import URL
+
+from crawlee import HttpHeaders
+from crawlee._utils.free_threading import configure_free_threading, is_gil_enabled, run_cpu_bound
+from crawlee._utils.json_codec import get_json_codec
+from crawlee._utils.urls import filter_url, to_absolute_url_iterator
+from crawlee.crawlers._parsel._parsel_parser import ParselParser
+
+if TYPE_CHECKING:
+    from crawlee.http_clients import HttpResponse
+
+DOCUMENTS = 200
+CONCURRENCY = 32
+ORIGIN_URL = 'https://example.com/listing'
+DOCUMENT = (
+    '<html><head><title>Listing</title></head><body>'
+    + ''.join(
+        f'<div class="item"><a href="/item/{i}">Item {i}</a><a href="https://other.com/{i}">Other</a>'
+        f'<span class="price">{i}.99</span></div>'
+        for i in range(1500)
+    )
+    + '</body></html>'
+).encode()
+
+
+class StaticResponse:
+    def __init__(self) -> None:
+        self.http_version = 'HTTP/1.1'
+        self.status_code = 200
+        self.headers = HttpHeaders({'content-type': 'text/html'})
+
+    async def read(self) -> bytes:
+        return DOCUMENT
+
+
+def filter_links(links: list[str]) -> list[str]:
+    origin = URL(ORIGIN_URL)
+    absolute_links = to_absolute_url_iterator(ORIGIN_URL, iter(links))
+    return [link for link in absolute_links if filter_url(target=URL(link), strategy='same-hostname', origin=origin)[0]]
+
+
+async def process_document(parser: ParselParser, *, free_threading: bool) -> int:
+    selector = await parser.parse(cast('HttpResponse', StaticResponse()))
+    links = list(parser.find_links(selector, 'a', 'href'))
+    urls = await run_cpu_bound(filter_links, links) if free_threading else filter_links(links)
+    prices = selector.css('.price::text').getall()
+    items = [{'url': url, 'price': price} for url, price in zip(urls, prices, strict=True)]
+    await run_cpu_bound(get_json_codec().encode_many, items, indent=True)
+    return len(urls)
+
+
+async def measure(*, free_threading: bool, threads: int | None) -> float:
+    """Return the wall time of processing all the documents, in seconds."""
+    configure_free_threading(enabled=free_threading, max_workers=threads)
+    parser = ParselParser()
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def process() -> int:
+        async with semaphore:
+            return await process_document(parser, free_threading=free_threading)
+
+    started_at = time.perf_counter()
+    results = await asyncio.gather(*(process() for _ in range(DOCUMENTS)))
+    elapsed = time.perf_counter() - started_at
+
+    if set(results) != {1500}:
+        raise RuntimeError(f'Unexpected number of filtered links: {set(results)}')
+
+    return elapsed
+
+
+async def main() -> None:
+    cpus = os.cpu_count() or 1
+    print(f'python: {sys.version.split()[0]}, GIL enabled: {is_gil_enabled()}, cpus: {cpus}')
+    print(f'{"mode":>20} {"wall s":>8} {"docs/s":>8}')
+
+    elapsed = await measure(free_threading=False, threads=None)
+    print(f'{"disabled":>20} {elapsed:>8.2f} {DOCUMENTS / elapsed:>8.1f}')
+
+    for threads in sorted({1, cpus}):
+        elapsed = await measure(free_threading=True, threads=threads)
+        label = f'enabled, {threads} thr'
+        print(f'{label:>20} {elapsed:>8.2f} {DOCUMENTS / elapsed:>8.1f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
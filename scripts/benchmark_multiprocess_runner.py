@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Compare the throughput of a CPU-bound crawl run by a `MultiprocessCrawlerRunner` with 1 and with N workers.
+
+The request handler parses a synthetic HTML document with the standard library parser instead of downloading
+anything, so the crawl is bound by the CPU and the results do not depend on the network. The requests are shared
+through the storage broker serving a memory storage client. The script prints the wall time and the number of
+requests per second of a single crawler in the script process, and of the runner with 1 worker and with as many
+workers as there are CPUs (at least 2). The runner times include starting the worker processes.
+
+Single-purpose: run with no arguments from anywhere in the repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from html.parser import HTMLParser
+
+from crawlee.configuration import Configuration
+from crawlee.crawlers import BasicCrawler, BasicCrawlingContext, MultiprocessCrawlerRunner
+from crawlee.storage_clients import MemoryStorageClient, StorageClient
+
+REQUESTS = 400
+DOCUMENT = (
+    '<html><body>'
+    + ''.join(f'<div class="item"><a href="/{i}">Item {i}</a></div>' for i in range(2000))
+    + '</body></html>'
+)
+
+
+class LinkCounter(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.links = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:  # noqa: ARG002
+        if tag == 'a':
+            self.links += 1
+
+
+def create_crawler(storage_client: StorageClient | None = None) -> BasicCrawler:
+    logging.getLogger('crawlee').setLevel(logging.ERROR)
+    crawler = BasicCrawler(configure_logging=False, storage_client=storage_client)
+
+    @crawler.router.default_handler
+    async def handler(context: BasicCrawlingContext) -> None:
+        parser = LinkCounter()
+        parser.feed(DOCUMENT)
+        await context.push_data({'url': context.request.url, 'links': parser.links})
+
+    return crawler
+
+
+async def crawl_in_process() -> float:
+    """Return the wall time of the same crawl run by a single crawler in this process, in seconds."""
+    crawler = create_crawler(MemoryStorageClient())
+    started_at = time.perf_counter()
+    await crawler.run([f'https://example.com/in-process/{i}' for i in range(REQUESTS)])
+    return time.perf_counter() - started_at
+
+
+async def crawl(worker_count: int) -> float:
+    """Return the wall time of a crawl with the given number of workers, in seconds."""
+    runner = MultiprocessCrawlerRunner(
+        create_crawler,
+        worker_count=worker_count,
+        storage_client=MemoryStorageClient(),
+        configuration=Configuration(purge_on_start=True),
+    )
+
+    async with runner:
+        started_at = time.perf_counter()
+        statistics = await runner.run([f'https://example.com/{worker_count}/{i}' for i in range(REQUESTS)])
+        elapsed = time.perf_counter() - started_at
+
+    if statistics.requests_finished != REQUESTS:
+        raise RuntimeError(f'Expected {REQUESTS} finished requests, got {statistics.requests_finished}')
+
+    return elapsed
+
+
+async def main() -> None:
+    print(f'cpus: {os.cpu_count()}')
+    print(f'{"workers":>12} {"wall s":>8} {"req/s":>8}')
+    elapsed = await crawl_in_process()
+    print(f'{"in process":>12} {elapsed:>8.2f} {REQUESTS / elapsed:>8.1f}')
+    for worker_count in sorted({1, max(2, os.cpu_count() or 1)}):
+        elapsed = await crawl(worker_count)
+        print(f'{worker_count:>12} {elapsed:>8.2f} {REQUESTS / elapsed:>8.1f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
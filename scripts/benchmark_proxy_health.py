@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Compare round-robin proxy rotation with the routing of `ProxyHealthTracker` on a simulated proxy pool.
+
+The pool has proxies of different speed, two unreliable proxies, one proxy blocked by one of the crawled websites
+and one proxy that stops working halfway through the crawl. Every request is retried with another proxy until it
+succeeds. The simulation reports the time to a successful response, counting the failed attempts, the share of failed
+attempts and the overhead of picking a proxy. The time is simulated, so the script runs in a few seconds.
+
+Single-purpose: run with no arguments from anywhere in the repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import statistics
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Literal
+from unittest.mock import patch
+
+from yarl import URL
+
+from crawlee import Request
+from crawlee.proxy_configuration import ProxyConfiguration, ProxyHealthTracker
+
+REQUESTS = 20_000
+CONCURRENCY = 20
+DOMAINS = ('shop.example.com', 'news.example.org', 'api.example.net', 'blog.example.io')
+TIMEOUT = 10.0
+
+
+@dataclass
+class SimulatedProxy:
+    url: str
+    latency: float
+    error_rate: float = 0.0
+    blocked_domain: str | None = None
+    dies_at_request: int | None = None
+
+    def request(self, domain: str, request_number: int) -> tuple[float, Literal['success', 'error', 'blocked']]:
+        """Return the latency and the outcome of a request through the proxy."""
+        if self.dies_at_request is not None and request_number >= self.dies_at_request:
+            return TIMEOUT, 'error'
+        if random.random() < self.error_rate:
+            return TIMEOUT, 'error'
+        latency = random.lognormvariate(0, 0.3) * self.latency
+        if domain == self.blocked_domain:
+            return latency, 'blocked'
+        return latency, 'success'
+
+
+PROXIES = [
+    SimulatedProxy('http://fast-1.proxy:8000', 0.2),
+    SimulatedProxy('http://fast-2.proxy:8000', 0.25, blocked_domain='shop.example.com'),
+    SimulatedProxy('http://medium-1.proxy:8000', 0.6),
+    SimulatedProxy('http://medium-2.proxy:8000', 0.8, dies_at_request=REQUESTS // 2),
+    SimulatedProxy('http://slow.proxy:8000', 2.0),
+    SimulatedProxy('http://flaky-1.proxy:8000', 0.3, error_rate=0.3),
+    SimulatedProxy('http://flaky-2.proxy:8000', 0.5, error_rate=0.5),
+]
+
+
+async def simulate(health_tracker: ProxyHealthTracker | None) -> tuple[float, float, float]:
+    """Return the mean and 95th percentile time to a successful response and the share of failed attempts."""
+    random.seed(42)
+    proxies = {proxy.url: proxy for proxy in PROXIES}
+    configuration = ProxyConfiguration(proxy_urls=list(proxies), health_tracker=health_tracker)
+    times_to_success = list[float]()
+    attempts = failures = 0
+
+    # The simulated clock moves by the latency of each attempt divided by the number of concurrent requests.
+    now = 0.0
+    with patch.object(time, 'monotonic', lambda: now):
+        for request_number in range(REQUESTS):
+            domain = DOMAINS[request_number % len(DOMAINS)]
+            request = Request.from_url(f'https://{domain}/{request_number}')
+            elapsed = 0.0
+
+            while True:
+                proxy_info = await configuration.new_proxy_info(None, request, None)
+                if proxy_info is None:
+                    raise RuntimeError('The proxy configuration did not pick a proxy')
+                latency, outcome = proxies[proxy_info.url].request(domain, request_number)
+                elapsed += latency
+                now += latency / CONCURRENCY
+                attempts += 1
+
+                if health_tracker is not None:
+                    if outcome != 'error':
+                        health_tracker.record_latency(proxy_info.url, domain, timedelta(seconds=latency))
+                    health_tracker.record_outcome(proxy_info.url, domain, outcome)
+
+                if outcome == 'success':
+                    break
+                failures += 1
+
+            times_to_success.append(elapsed)
+
+    percentile_95 = statistics.quantiles(times_to_success, n=20)[-1]
+    return statistics.fmean(times_to_success), percentile_95, failures / attempts
+
+
+def measure_pick(health_tracker: ProxyHealthTracker | None) -> float:
+    """Return the time to pick a proxy URL, in microseconds."""
+    configuration = ProxyConfiguration(proxy_urls=[proxy.url for proxy in PROXIES], health_tracker=health_tracker)
+    urls = [URL(proxy.url) for proxy in PROXIES]
+    next_url = configuration._next_url  # noqa: SLF001
+    request = Request.from_url('https://shop.example.com/')
+    repetitions = 100_000
+
+    started_at = time.perf_counter()
+    for _ in range(repetitions):
+        next_url(urls, request)
+    return (time.perf_counter() - started_at) / repetitions * 1_000_000
+
+
+async def main() -> None:
+    print(f'{"routing":>12} {"mean s":>8} {"p95 s":>8} {"failed %":>9} {"pick us":>8}')
+    for name, health_tracker_factory in (('round-robin', lambda: None), ('health', ProxyHealthTracker)):
+        mean, percentile_95, failure_rate = await simulate(health_tracker_factory())
+        pick_time = measure_pick(health_tracker_factory())
+        print(f'{name:>12} {mean:>8.2f} {percentile_95:>8.2f} {failure_rate * 100:>9.1f} {pick_time:>8.1f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Compare the cost of persisting a large `RecoverableState` with and without incremental persistence.
+
+The state is the state of a file system request queue with many handled requests. Between two persists, a batch
+of pending requests is handled, like a crawler does it between two `PERSIST_STATE` events. The state is persisted
+to a file system key-value store in a temporary directory. The script prints the average time of a persist, the
+average number of bytes written by a persist and the time of loading the state back.
+
+Single-purpose: run with no arguments from anywhere in the repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import tempfile
+import time
+from typing import Any
+
+from crawlee._utils.recoverable_state import RecoverableState
+from crawlee.configuration import Configuration
+from crawlee.storage_clients import FileSystemStorageClient
+from crawlee.storage_clients._file_system._request_queue_client import RequestQueueState
+from crawlee.storages import KeyValueStore
+
+HANDLED_REQUESTS = 1_000_000
+PENDING_REQUESTS = 50_000
+REQUESTS_PER_PERSIST = 1_000
+PERSISTS = 30
+
+
+class WriteCounter:
+    """Counts the bytes of the JSON records written to a key-value store."""
+
+    def __init__(self) -> None:
+        self.written = 0
+
+    def wrap(self, kvs: KeyValueStore) -> KeyValueStore:
+        set_value = kvs.set_value
+
+        async def counting_set_value(key: str, value: Any, content_type: str | None = None) -> None:
+            self.written += len(json.dumps(value))
+            await set_value(key, value, content_type)
+
+        kvs.set_value = counting_set_value  # type: ignore[method-assign]
+        return kvs
+
+
+def create_state(
+    storage_dir: str, *, incremental_persistence: bool, counter: WriteCounter
+) -> RecoverableState[RequestQueueState]:
+    configuration = Configuration(storage_dir=storage_dir)
+
+    async def kvs_factory() -> KeyValueStore:
+        kvs = await KeyValueStore.open(storage_client=FileSystemStorageClient(), configuration=configuration)
+        return counter.wrap(kvs)
+
+    return RecoverableState(
+        default_state=RequestQueueState(),
+        persist_state_key='BENCHMARK_STATE',
+        persistence_enabled='explicit_only',
+        persist_state_kvs_factory=kvs_factory,
+        logger=logging.getLogger(__name__),
+        incremental_persistence=incremental_persistence,
+    )
+
+
+async def measure(*, incremental_persistence: bool) -> tuple[float, float, float]:
+    """Return the average persist time in seconds, the average bytes written per persist and the load time."""
+    with tempfile.TemporaryDirectory() as storage_dir:
+        counter = WriteCounter()
+        recoverable_state = create_state(storage_dir, incremental_persistence=incremental_persistence, counter=counter)
+        state = await recoverable_state.initialize()
+        state.handled_requests.update(f'https://example.com/handled/{i}' for i in range(HANDLED_REQUESTS))
+        state.regular_requests.update({f'https://example.com/pending/{i}': i for i in range(PENDING_REQUESTS)})
+        state.sequence_counter = PENDING_REQUESTS
+        await recoverable_state.persist_state()
+
+        elapsed = 0.0
+        counter.written = 0
+        pending = iter(range(PENDING_REQUESTS))
+        for _ in range(PERSISTS):
+            for i in (next(pending) for _ in range(REQUESTS_PER_PERSIST)):
+                unique_key = f'https://example.com/pending/{i}'
+                del state.regular_requests[unique_key]
+                state.handled_requests.add(unique_key)
+                recoverable_state.mark_dirty('regular_requests', unique_key)
+                recoverable_state.mark_dirty('handled_requests', unique_key)
+
+            started_at = time.perf_counter()
+            await recoverable_state.persist_state()
+            elapsed += time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        restored = await create_state(
+            storage_dir, incremental_persistence=incremental_persistence, counter=WriteCounter()
+        ).initialize()
+        load_time = time.perf_counter() - started_at
+
+        if restored != state:
+            raise RuntimeError('The restored state differs from the persisted one')
+
+    return elapsed / PERSISTS, counter.written / PERSISTS, load_time
+
+
+async def main() -> None:
+    print(f'{"mode":>12} {"ms/persist":>11} {"KiB/persist":>12} {"load s":>7}')
+    for incremental_persistence in (False, True):
+        persist_time, written, load_time = await measure(incremental_persistence=incremental_persistence)
+        mode = 'incremental' if incremental_persistence else 'full'
+        print(f'{mode:>12} {persist_time * 1000:>11.1f} {written / 1024:>12.1f} {load_time:>7.2f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
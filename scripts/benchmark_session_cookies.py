@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Compare the per-request cookie overhead of `SessionCookies` with that of a plain `CookieJar`.
+
+A session holds cookies for a few sites, the way it does after a crawl visited them. Every simulated request builds
+the `Cookie` header for a URL of one of the sites, and every response sets a couple of cookies - a tracking cookie
+refreshed with the same value and, for every fourth response, a session cookie with a new value. The baseline goes
+through the cookie policy of a `CookieJar` with `urllib` requests and fake responses, the way `SessionCookies` did
+before it got its own index. The script also measures converting the cookies to dictionaries and to the Playwright
+format, which happens whenever the session is persisted or handed to a browser.
+
+Single-purpose: run with no arguments from anywhere in the repository.
+"""
+
+from __future__ import annotations
+
+import time
+from email.message import Message
+from http.cookiejar import CookieJar
+from typing import TYPE_CHECKING
+from urllib.request import Request
+
+from crawlee.sessions import SessionCookies
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SITES = ('shop.example.com', 'www.example.org', 'news.example.net', 'api.example.io', 'cdn.example.dev')
+COOKIES_PER_SITE = 8
+REQUESTS = 20_000
+CONVERSIONS = 2_000
+
+
+class FakeResponse:
+    """Exposes `Set-Cookie` headers to `CookieJar.extract_cookies`."""
+
+    def __init__(self, set_cookie_headers: list[str]) -> None:
+        self._message = Message()
+        for header in set_cookie_headers:
+            self._message['Set-Cookie'] = header
+
+    def info(self) -> Message:
+        return self._message
+
+
+def jar_cookie_string(jar: CookieJar, url: str) -> str:
+    request = Request(url)  # noqa: S310
+    jar.add_cookie_header(request)
+    return request.get_header('Cookie', '')
+
+
+def jar_extract_cookies(jar: CookieJar, url: str, set_cookie_headers: list[str]) -> None:
+    jar.extract_cookies(FakeResponse(set_cookie_headers), Request(url))  # noqa: S310 # ty: ignore[invalid-argument-type]
+    jar.clear_expired_cookies()
+
+
+def create_session_cookies() -> SessionCookies:
+    session_cookies = SessionCookies()
+    for site in SITES:
+        session_cookies.extract_cookies_from_headers(
+            f'https://{site}/',
+            [f'cookie_{i}={"x" * 32}; Path=/; Max-Age=86400; HttpOnly' for i in range(COOKIES_PER_SITE)],
+        )
+    return session_cookies
+
+
+def get_traffic() -> list[tuple[str, list[str]]]:
+    traffic = []
+    for i in range(REQUESTS):
+        site = SITES[i % len(SITES)]
+        set_cookie_headers = [f'tracking={site}; Path=/; Max-Age=86400']
+        if i % 4 == 0:
+            set_cookie_headers.append(f'sid={i}; Path=/; Secure; HttpOnly; SameSite=Lax')
+        traffic.append((f'https://{site}/category/{i % 100}/item?page={i}', set_cookie_headers))
+    return traffic
+
+
+def measure(function: Callable[[], object], repetitions: int) -> float:
+    """Return the time of a single call of the function, in microseconds."""
+    started_at = time.perf_counter()
+    for _ in range(repetitions):
+        function()
+    return (time.perf_counter() - started_at) / repetitions * 1_000_000
+
+
+def main() -> None:
+    traffic = get_traffic()
+    session_cookies = create_session_cookies()
+    jar = CookieJar()
+    for cookie in session_cookies.jar:
+        jar.set_cookie(cookie)
+
+    def jar_requests() -> None:
+        for url, set_cookie_headers in traffic:
+            jar_cookie_string(jar, url)
+            jar_extract_cookies(jar, url, set_cookie_headers)
+
+    def session_cookies_requests() -> None:
+        for url, set_cookie_headers in traffic:
+            session_cookies.get_cookie_string(url)
+            session_cookies.extract_cookies_from_headers(url, set_cookie_headers)
+
+    if any(jar_cookie_string(jar, url) != session_cookies.get_cookie_string(url) for url, _ in traffic[:100]):
+        raise RuntimeError('The cookie headers of the implementations differ')
+
+    # The baseline conversions are those of the cookies of the jar, rebuilt on every call.
+    convert_cookie = session_cookies._convert_cookie_to_dict  # noqa: SLF001
+    to_playwright = session_cookies._to_playwright  # noqa: SLF001
+
+    def jar_dicts() -> None:
+        [convert_cookie(cookie) for cookie in jar]
+
+    def jar_playwright() -> None:
+        [to_playwright(convert_cookie(cookie)) for cookie in jar]
+
+    print(f'{"operation":>30} {"CookieJar us":>13} {"SessionCookies us":>18}')
+    rows = [
+        ('request (header + Set-Cookie)', jar_requests, session_cookies_requests, 1, REQUESTS),
+        ('get_cookies_as_dicts', jar_dicts, session_cookies.get_cookies_as_dicts, CONVERSIONS, 1),
+        ('playwright format', jar_playwright, session_cookies.get_cookies_as_playwright_format, CONVERSIONS, 1),
+    ]
+    for name, baseline, candidate, repetitions, calls_per_repetition in rows:
+        baseline_time = measure(baseline, repetitions) / calls_per_repetition
+        candidate_time = measure(candidate, repetitions) / calls_per_repetition
+        print(f'{name:>30} {baseline_time:>13.1f} {candidate_time:>18.1f}')
+
+
+if __name__ == '__main__':
+    main()
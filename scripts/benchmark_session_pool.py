@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Measure the throughput of `SessionPool.get_session` for pools of different sizes.
+
+Every retrieved session is marked as good, like a crawler does it after a successful request, and a small share
+of them as bad, so sessions keep getting used up and replaced during the measurement. The script prints the number
+of `get_session` calls per second and the time of a single call for every pool size.
+
+Single-purpose: run with no arguments from anywhere in the repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from crawlee.sessions import SessionPool
+
+CALLS = 50_000
+POOL_SIZES = (100, 1_000, 5_000)
+
+
+async def measure(pool_size: int) -> float:
+    """Return the number of `get_session` calls per second for a pool of the given size."""
+    async with SessionPool(max_pool_size=pool_size) as session_pool:
+        started_at = time.perf_counter()
+        for index in range(CALLS):
+            session = await session_pool.get_session()
+            if index % 20:
+                session.mark_good()
+            else:
+                session.mark_bad()
+        elapsed = time.perf_counter() - started_at
+
+    return CALLS / elapsed
+
+
+async def main() -> None:
+    print(f'{"pool size":>10} {"calls/s":>10} {"us/call":>8}')
+    for pool_size in POOL_SIZES:
+        calls_per_second = await measure(pool_size)
+        print(f'{pool_size:>10} {calls_per_second:>10.0f} {1_000_000 / calls_per_second:>8.1f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
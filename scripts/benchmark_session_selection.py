@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Compare the session selection strategies of `SessionPool` on a simulated crawl.
+
+Every new session gets a hidden probability of being blocked - most sessions are clean, the rest are burned (e.g.
+their proxy is flagged). The crawl processes the pages in batches of concurrent requests: the sessions for a batch
+are taken from the pool first and the outcomes reported afterwards, the way concurrent requests overlap in
+a crawler. A blocked request marks its session as bad and is retried with another session, a successful one marks
+its session as good. The script prints the block rate, the retries per successful page and the time of a single
+`get_session` call for every strategy and pool size.
+
+Single-purpose: run with no arguments from anywhere in the repository.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import TYPE_CHECKING
+
+from crawlee.sessions import (
+    LeastRecentlyUsedSessionSelection,
+    LowestErrorScoreSessionSelection,
+    RandomSessionSelection,
+    Session,
+    SessionPool,
+    WeightedSessionSelection,
+)
+
+if TYPE_CHECKING:
+    from crawlee.sessions import SessionSelectionStrategy
+
+PAGES = 100_000
+CONCURRENCY = 20
+POOL_SIZES = (100, 1_000)
+CLEAN_SHARE = 0.7
+CLEAN_BLOCK_PROBABILITY = 0.02
+BURNED_BLOCK_PROBABILITY = 0.5
+SEED = 42
+
+
+class SimulatedCrawl:
+    def __init__(self, session_selection: SessionSelectionStrategy, pool_size: int) -> None:
+        self.session_selection = session_selection
+        self.pool_size = pool_size
+        self.block_probabilities = dict[str, float]()
+        self.requests = 0
+        self.blocked = 0
+
+    def create_session(self) -> Session:
+        session = Session()
+        clean = random.random() < CLEAN_SHARE
+        self.block_probabilities[session.id] = CLEAN_BLOCK_PROBABILITY if clean else BURNED_BLOCK_PROBABILITY
+        return session
+
+    async def run(self) -> float:
+        """Crawl all the pages and return the time of a single `get_session` call, in microseconds."""
+        get_session_time = 0.0
+        pending_pages = PAGES
+
+        async with SessionPool(
+            max_pool_size=self.pool_size,
+            create_session_function=self.create_session,
+            session_selection=self.session_selection,
+        ) as session_pool:
+            while pending_pages:
+                started_at = time.perf_counter()
+                batch = [await session_pool.get_session() for _ in range(min(CONCURRENCY, pending_pages))]
+                get_session_time += time.perf_counter() - started_at
+
+                for session in batch:
+                    self.requests += 1
+                    if random.random() < self.block_probabilities[session.id]:
+                        self.blocked += 1
+                        session.mark_bad()
+                    else:
+                        pending_pages -= 1
+                        session.mark_good()
+
+        return get_session_time / self.requests * 1_000_000
+
+
+async def main() -> None:
+    strategies: list[tuple[str, type[SessionSelectionStrategy]]] = [
+        ('random', RandomSessionSelection),
+        ('least recently used', LeastRecentlyUsedSessionSelection),
+        ('lowest error score', LowestErrorScoreSessionSelection),
+        ('weighted', WeightedSessionSelection),
+    ]
+
+    print(f'{"pool size":>10} {"strategy":>20} {"block rate":>11} {"retries/page":>13} {"us/call":>8}')
+    for pool_size in POOL_SIZES:
+        for name, strategy_class in strategies:
+            random.seed(SEED)
+            crawl = SimulatedCrawl(strategy_class(), pool_size)
+            us_per_call = await crawl.run()
+            block_rate = crawl.blocked / crawl.requests
+            print(f'{pool_size:>10} {name:>20} {block_rate:>11.2%} {crawl.blocked / PAGES:>13.3f} {us_per_call:>8.1f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Compare the overhead of the system metrics samplers used by the `LocalEventManager`.
+
+The script starts a number of idle child processes, as a crawler with several browsers would have, and then takes
+repeated CPU and memory readings with every sampler supported on the current system. For every sampler and reading,
+it prints the mean wall time and the mean CPU time of the process per reading. The CPU usage reading of the psutil
+sampler blocks for its sampling interval, so its wall time is dominated by the interval rather than by the work done.
+
+Single-purpose: run with no arguments from anywhere in the repository.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from crawlee.events import ProcfsSystemMetricsSampler, PsutilSystemMetricsSampler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from crawlee.events import SystemMetricsSampler
+
+CHILD_PROCESSES = 30
+READINGS = 20
+
+
+def measure(reading: Callable[[], object]) -> tuple[float, float]:
+    """Return the mean wall time and the mean CPU time of the process per reading, in milliseconds."""
+    wall_started_at = time.perf_counter()
+    cpu_started_at = time.process_time()
+
+    for _ in range(READINGS):
+        reading()
+
+    wall_time = time.perf_counter() - wall_started_at
+    cpu_time = time.process_time() - cpu_started_at
+    return wall_time / READINGS * 1000, cpu_time / READINGS * 1000
+
+
+def main() -> None:
+    samplers: dict[str, SystemMetricsSampler] = {'psutil': PsutilSystemMetricsSampler()}
+    if ProcfsSystemMetricsSampler.is_supported():
+        samplers['procfs'] = ProcfsSystemMetricsSampler()
+
+    children = [
+        subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(600)']) for _ in range(CHILD_PROCESSES)
+    ]
+
+    try:
+        # Give the children time to start, so their memory is in place for all the samplers alike.
+        time.sleep(1)
+
+        print(f'{CHILD_PROCESSES} child processes, {READINGS} readings per sampler')
+        print(f'{"sampler":<10} {"reading":<8} {"wall ms":>10} {"cpu ms":>10}')
+
+        for name, sampler in samplers.items():
+            for reading_name, reading in (('cpu', sampler.get_cpu_info), ('memory', sampler.get_memory_info)):
+                wall_ms, cpu_ms = measure(reading)
+                print(f'{name:<10} {reading_name:<8} {wall_ms:>10.3f} {cpu_ms:>10.3f}')
+    finally:
+        for child in children:
+            child.kill()
+        for child in children:
+            child.wait()
+
+
+if __name__ == '__main__':
+    main()
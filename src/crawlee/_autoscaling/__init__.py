@@ -1,5 +1,23 @@
 from .autoscaled_pool import AutoscaledPool
+from .concurrency_budget import ConcurrencyBudget
+from .concurrency_controller import (
+    AimdConcurrencyController,
+    ConcurrencyController,
+    StepConcurrencyController,
+    ThroughputConcurrencyController,
+)
+from .event_loop_monitor import EventLoopMonitor
 from .snapshotter import Snapshotter
 from .system_status import SystemStatus
 
-__all__ = ['AutoscaledPool', 'Snapshotter', 'SystemStatus']
+__all__ = [
+    'AimdConcurrencyController',
+    'AutoscaledPool',
+    'ConcurrencyBudget',
+    'ConcurrencyController',
+    'EventLoopMonitor',
+    'Snapshotter',
+    'StepConcurrencyController',
+    'SystemStatus',
+    'ThroughputConcurrencyController',
+]
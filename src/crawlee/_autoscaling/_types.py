@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Annotated
@@ -29,6 +30,54 @@ class LoadRatioInfo:
         """Indicate whether the resource is currently overloaded."""
         return self.actual_ratio > self.limit_ratio
 
+    @property
+    def overload_ratio(self) -> float:
+        """The ratio of the actual ratio to the limit ratio, above 1 means the resource is overloaded."""
+        if self.limit_ratio <= 0:
+            return math.inf if self.actual_ratio > self.limit_ratio else 0.0
+        return self.actual_ratio / self.limit_ratio
+
+
+@dataclass
+class EventLoopLatencyInfo:
+    """Percentiles of the event loop lag measured by an `EventLoopMonitor`.
+
+    The lag is the time between the moment a callback was scheduled to run and the moment it actually ran.
+    """
+
+    p50: timedelta
+    """The median lag."""
+
+    p90: timedelta
+    """The 90th percentile of the lag."""
+
+    p99: timedelta
+    """The 99th percentile of the lag."""
+
+    max: timedelta
+    """The longest lag."""
+
+    count: int
+    """The number of lag measurements the percentiles are computed from."""
+
+
+@dataclass
+class SlowCallbackInfo:
+    """Statistics of the slow callbacks attributed to a single location in the code."""
+
+    location: str
+    """The qualified name of the coroutine or function that ran the callback, with the file and line at which
+    it was resumed."""
+
+    count: int
+    """The number of slow callbacks attributed to the location."""
+
+    total_duration: timedelta
+    """The total time for which the callbacks blocked the event loop."""
+
+    max_duration: timedelta
+    """The longest time for which a single callback blocked the event loop."""
+
 
 @dataclass
 class SystemInfo:
@@ -49,6 +98,17 @@ class SystemInfo:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     """The time at which the system load information was measured."""
 
+    event_loop_latency: EventLoopLatencyInfo | None = None
+    """Percentiles of the recent event loop lag, available only when the event loop is monitored by
+    an `EventLoopMonitor`."""
+
+    @property
+    def max_overload_ratio(self) -> float:
+        """The highest ratio of the actual load ratio to its limit among all resources, above 1 means overloaded."""
+        return max(
+            info.overload_ratio for info in (self.cpu_info, self.memory_info, self.event_loop_info, self.client_info)
+        )
+
     @property
     def is_system_idle(self) -> bool:
         """Indicate whether the system is currently idle or overloaded."""
@@ -70,6 +130,45 @@ class SystemInfo:
         return '; '.join(f'{name} = {ratio}' for name, ratio in stats.items())
 
 
+@dataclass
+class ConcurrencyStatus:
+    """The input of a `ConcurrencyController` for a single autoscaling decision."""
+
+    desired_concurrency: int
+    """The current desired concurrency of the pool."""
+
+    current_concurrency: int
+    """The number of tasks currently running in the pool."""
+
+    min_concurrency: int
+    """The minimum concurrency of the pool."""
+
+    max_concurrency: int
+    """The maximum concurrency of the pool."""
+
+    system_info: SystemInfo
+    """The status of the system since the start of the pool."""
+
+    finished_task_count: int
+    """The number of tasks finished since the previous decision."""
+
+    interval: timedelta
+    """The time elapsed since the previous decision."""
+
+    @property
+    def throughput(self) -> float:
+        """The number of tasks finished per second since the previous decision."""
+        seconds = self.interval.total_seconds()
+        return self.finished_task_count / seconds if seconds > 0 else 0.0
+
+    def is_saturated(self, desired_concurrency_ratio: float) -> bool:
+        """Check whether the pool runs at least the given ratio of its desired concurrency.
+
+        Scaling up a pool that does not use its desired concurrency would not have any effect.
+        """
+        return self.current_concurrency >= math.floor(desired_concurrency_ratio * self.desired_concurrency)
+
+
 @dataclass
 class CpuSnapshot:
     """A snapshot of CPU usage."""
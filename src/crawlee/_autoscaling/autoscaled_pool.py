@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import math
+import time
 from contextlib import suppress
 from datetime import timedelta
 from logging import getLogger
 from typing import TYPE_CHECKING
 
+from crawlee._autoscaling._types import ConcurrencyStatus
+from crawlee._autoscaling.concurrency_controller import StepConcurrencyController
 from crawlee._types import ConcurrencySettings
 from crawlee._utils.docs import docs_group
 from crawlee._utils.recurring_task import RecurringTask
@@ -17,6 +20,7 @@ if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
     from crawlee._autoscaling import SystemStatus
+    from crawlee._utils.work_signal import WorkSignal
 
 logger = getLogger(__name__)
 
@@ -50,17 +54,26 @@ class AutoscaledPool:
     """Interval at which the autoscaled pool logs its current state."""
 
     _DESIRED_CONCURRENCY_RATIO = 0.9
-    """Minimum ratio of desired concurrency that must be reached before allowing further scale-up."""
+    """Minimum ratio of desired concurrency that must be reached before allowing further scale-up by the default
+    concurrency controller."""
 
     _SCALE_UP_STEP_RATIO = 0.05
-    """Fraction of desired concurrency to add during each scale-up operation."""
+    """Fraction of desired concurrency to add during each scale-up operation of the default concurrency controller."""
 
     _SCALE_DOWN_STEP_RATIO = 0.05
-    """Fraction of desired concurrency to remove during each scale-down operation."""
+    """Fraction of desired concurrency to remove during each scale-down operation of the default concurrency
+    controller."""
 
     _TASK_TIMEOUT: timedelta | None = None
     """Timeout within which the `run_task_function` must complete."""
 
+    _POLL_INTERVAL = timedelta(seconds=0.5)
+    """Interval at which the pool re-checks whether it can start a new task when it is not notified sooner."""
+
+    _WORK_SIGNAL_POLL_INTERVAL = timedelta(seconds=5)
+    """Interval at which the pool re-checks for new tasks in the push-based mode, as a safety net for changes made
+    without a notification."""
+
     def __init__(
         self,
         *,
@@ -69,6 +82,7 @@ class AutoscaledPool:
         run_task_function: Callable[[], Awaitable],
         is_task_ready_function: Callable[[], Awaitable[bool]],
         is_finished_function: Callable[[], Awaitable[bool]],
+        get_work_signal_function: Callable[[], Awaitable[WorkSignal | None]] | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -84,6 +98,10 @@ class AutoscaledPool:
                 resolves to `True` then the pool's run finishes. Being called only when there are no tasks being
                 processed means that as long as `is_task_ready_function` keeps resolving to `True`,
                 `is_finished_function` will never be called. To abort a run, use the `abort` method.
+            get_work_signal_function: A function resolving to a signal that is notified whenever new tasks may become
+                ready or the pool may become finished. If it resolves to a signal, the pool runs in a push-based mode
+                - it does not call `is_finished_function` and `is_task_ready_function` while it cannot start any more
+                tasks, and instead of polling, it waits for the signal or for a task to complete.
         """
         concurrency_settings = concurrency_settings or ConcurrencySettings()
 
@@ -91,10 +109,22 @@ class AutoscaledPool:
         self._run_task_function = run_task_function
         self._is_task_ready_function = is_task_ready_function
         self._is_finished_function = is_finished_function
+        self._get_work_signal_function = get_work_signal_function
         self._desired_concurrency = concurrency_settings.desired_concurrency
         self._max_concurrency = concurrency_settings.max_concurrency
         self._min_concurrency = concurrency_settings.min_concurrency
         self._max_tasks_per_minute = concurrency_settings.max_tasks_per_minute
+        self._concurrency_controller = concurrency_settings.concurrency_controller or StepConcurrencyController(
+            desired_concurrency_ratio=self._DESIRED_CONCURRENCY_RATIO,
+            scale_up_step_ratio=self._SCALE_UP_STEP_RATIO,
+            scale_down_step_ratio=self._SCALE_DOWN_STEP_RATIO,
+        )
+        self._concurrency_budget = concurrency_settings.concurrency_budget
+        self._update_concurrency_budget()
+        # Running several tasks in one worker would bypass the delay between task starts.
+        self._task_batch_size = (
+            concurrency_settings.task_batch_size if not math.isfinite(self._max_tasks_per_minute) else 1
+        )
 
         self._log_system_status_task = RecurringTask(self._log_system_status, self._LOGGING_INTERVAL)
         self._autoscale_task = RecurringTask(self._autoscale, self._AUTOSCALE_INTERVAL)
@@ -102,6 +132,11 @@ class AutoscaledPool:
         self._is_paused = False
         self._current_run: _AutoscaledPoolRun | None = None
 
+        self._finished_task_count = 0
+        """The number of tasks finished since the last autoscaling decision."""
+
+        self._last_autoscaled_at = time.monotonic()
+
     async def run(self) -> None:
         """Start the autoscaled pool and return when all tasks are completed and `is_finished_function` returns True.
 
@@ -112,6 +147,8 @@ class AutoscaledPool:
 
         run = _AutoscaledPoolRun()
         self._current_run = run
+        self._finished_task_count = 0
+        self._last_autoscaled_at = time.monotonic()
 
         logger.debug('Starting the pool')
 
@@ -173,6 +210,11 @@ class AutoscaledPool:
         """The current desired concurrency, possibly updated by the pool according to system load."""
         return self._desired_concurrency
 
+    @property
+    def task_batch_size(self) -> int:
+        """The maximum number of tasks a worker runs one after another, which is 1 if the task rate is limited."""
+        return self._task_batch_size
+
     @property
     def current_concurrency(self) -> int:
         """The number of concurrent tasks in progress."""
@@ -183,23 +225,27 @@ class AutoscaledPool:
 
     def _autoscale(self) -> None:
         """Inspect system load status and adjust desired concurrency if necessary. Do not call directly."""
-        status = self._system_status.get_historical_system_info()
-
-        min_current_concurrency = math.floor(self._DESIRED_CONCURRENCY_RATIO * self.desired_concurrency)
-        should_scale_up = (
-            status.is_system_idle
-            and self._desired_concurrency < self._max_concurrency
-            and self.current_concurrency >= min_current_concurrency
+        now = time.monotonic()
+        status = ConcurrencyStatus(
+            desired_concurrency=self._desired_concurrency,
+            current_concurrency=self.current_concurrency,
+            min_concurrency=self._min_concurrency,
+            max_concurrency=self._max_concurrency,
+            system_info=self._system_status.get_historical_system_info(),
+            finished_task_count=self._finished_task_count,
+            interval=timedelta(seconds=now - self._last_autoscaled_at),
         )
+        self._finished_task_count = 0
+        self._last_autoscaled_at = now
 
-        should_scale_down = not status.is_system_idle and self._desired_concurrency > self._min_concurrency
+        desired_concurrency = self._concurrency_controller.get_desired_concurrency(status)
+        self._desired_concurrency = max(self._min_concurrency, min(self._max_concurrency, desired_concurrency))
+        self._update_concurrency_budget()
 
-        if should_scale_up:
-            step = math.ceil(self._SCALE_UP_STEP_RATIO * self._desired_concurrency)
-            self._desired_concurrency = min(self._max_concurrency, self._desired_concurrency + step)
-        elif should_scale_down:
-            step = math.ceil(self._SCALE_DOWN_STEP_RATIO * self._desired_concurrency)
-            self._desired_concurrency = max(self._min_concurrency, self._desired_concurrency - step)
+    def _update_concurrency_budget(self) -> None:
+        """Let the concurrency budget split the current desired concurrency between the groups of tasks."""
+        if self._concurrency_budget is not None:
+            self._concurrency_budget.total_concurrency = self._desired_concurrency
 
     def _log_system_status(self) -> None:
         system_status = self._system_status.get_historical_system_info()
@@ -216,23 +262,34 @@ class AutoscaledPool:
         Exits when `is_finished_function` returns True.
         """
         finished = False
+        work_signal = await self._get_work_signal_function() if self._get_work_signal_function else None
 
         try:
-            while not (finished := await self._is_finished_function()) and not run.result.done():
+            while not run.result.done():
                 run.worker_tasks_updated.clear()
+                work_signal_generation = work_signal.generation if work_signal else 0
+                wait_for_notification = work_signal is not None
+
+                # In the push-based mode, a saturated pool only needs to act once a task completes, so there is no
+                # point in asking whether it is finished in the meantime.
+                is_saturated = self.current_concurrency > 0 and self._is_saturated()
+                if not (work_signal and is_saturated) and (finished := await self._is_finished_function()):
+                    break
 
                 current_status = self._system_status.get_current_system_info()
                 if not current_status.is_system_idle:
                     logger.debug('Not scheduling new tasks - system is overloaded')
+                    wait_for_notification = False
                 elif self._is_paused:
                     logger.debug('Not scheduling new tasks - the autoscaled pool is paused')
+                    wait_for_notification = False
                 elif self.current_concurrency >= self.desired_concurrency:
                     logger.debug('Not scheduling new tasks - already running at desired concurrency')
                 elif not await self._is_task_ready_function():
                     logger.debug('Not scheduling new task - no task is ready')
                 else:
                     logger.debug('Scheduling a new task')
-                    worker_task = asyncio.create_task(self._worker_task(), name='autoscaled pool worker task')
+                    worker_task = asyncio.create_task(self._worker_task(run), name='autoscaled pool worker task')
                     worker_task.add_done_callback(lambda task: self._reap_worker_task(task, run))
                     run.worker_tasks.append(worker_task)
 
@@ -241,8 +298,11 @@ class AutoscaledPool:
 
                     continue
 
-                with suppress(asyncio.TimeoutError):
-                    await asyncio.wait_for(run.worker_tasks_updated.wait(), timeout=0.5)
+                if work_signal and wait_for_notification:
+                    await self._wait_for_notification(run, work_signal, work_signal_generation)
+                else:
+                    with suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(run.worker_tasks_updated.wait(), self._POLL_INTERVAL.total_seconds())
         finally:
             if finished:
                 logger.debug('`is_finished_function` reports that we are finished')
@@ -259,6 +319,31 @@ class AutoscaledPool:
             if not run.result.done():
                 run.result.set_result(object())
 
+    def _is_saturated(self) -> bool:
+        """Return True if the pool cannot start any more tasks right now, regardless of whether a task is ready."""
+        return (
+            self._is_paused
+            or self.current_concurrency >= self.desired_concurrency
+            or not self._system_status.get_current_system_info().is_system_idle
+        )
+
+    async def _wait_for_notification(self, run: _AutoscaledPoolRun, work_signal: WorkSignal, generation: int) -> None:
+        """Wait until a worker task completes, the work signal is notified or the fallback poll interval elapses."""
+        waiters = [
+            asyncio.create_task(run.worker_tasks_updated.wait()),
+            asyncio.create_task(work_signal.wait(generation)),
+        ]
+
+        try:
+            await asyncio.wait(
+                waiters,
+                timeout=self._WORK_SIGNAL_POLL_INTERVAL.total_seconds(),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
     def _reap_worker_task(self, task: asyncio.Task, run: _AutoscaledPoolRun) -> None:
         """Handle cleanup and tracking of a completed worker task.
 
@@ -272,16 +357,36 @@ class AutoscaledPool:
         if not task.cancelled() and (exception := task.exception()) and not run.result.done():
             run.result.set_exception(exception)
 
-    async def _worker_task(self) -> None:
+    async def _worker_task(self, run: _AutoscaledPoolRun) -> None:
+        """Run up to `task_batch_size` tasks one after another while the pool has capacity and tasks are ready."""
+        try:
+            for task_index in range(self._task_batch_size):
+                if task_index > 0 and not await self._can_continue_worker(run):
+                    break
+
+                await self._run_task()
+        finally:
+            logger.debug('Worker task finished')
+
+    async def _can_continue_worker(self, run: _AutoscaledPoolRun) -> bool:
+        """Check whether a worker may run another task instead of returning control to the pool."""
+        return (
+            not run.result.done()
+            and not self._is_paused
+            and self.current_concurrency <= self.desired_concurrency
+            and self._system_status.get_current_system_info().is_system_idle
+            and await self._is_task_ready_function()
+        )
+
+    async def _run_task(self) -> None:
         try:
             await asyncio.wait_for(
                 self._run_task_function(),
                 timeout=self._TASK_TIMEOUT.total_seconds() if self._TASK_TIMEOUT is not None else None,
             )
+            self._finished_task_count += 1
         except asyncio.TimeoutError:
             if self._TASK_TIMEOUT is None:
                 # Without a timeout, `wait_for` cannot time out - the error comes from the task function itself.
                 raise
             logger.warning(f'Task timed out after {self._TASK_TIMEOUT.total_seconds()} seconds')
-        finally:
-            logger.debug('Worker task finished')
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import TYPE_CHECKING
+
+from yarl import URL
+
+from crawlee._utils.docs import docs_group
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from crawlee import Request
+
+
+def _get_request_hostname(request: Request) -> str | None:
+    return URL(request.url).host
+
+
+@docs_group('Autoscaling')
+class ConcurrencyBudget:
+    """Splits the concurrency of an `AutoscaledPool` between groups of requests, such as requests to the same domain.
+
+    The budget is hierarchical - the desired concurrency of the pool is the global budget, and every group, identified
+    by a key computed from the request, gets a share of it. A group never runs more than its `max_concurrency_per_key`
+    or `max_concurrency_by_key` limit. With `fair_share`, the groups with requests in progress or waiting also split
+    the global budget equally, with one more share kept for the groups whose requests have not been fetched yet.
+
+    The budget is enforced when a crawler picks the request for a new task. A request whose group is over its fair
+    share is set aside in a local buffer and the crawler fetches another one, so a slow domain that fills the front of
+    the queue does not keep requests to other domains from starting. Buffered requests are dispatched first as soon
+    as their group is back within its share, starting with the group with the fewest requests in progress. Only when
+    there is no other request to fetch, or the buffer holds `max_buffered_requests`, may a group exceed its fair share
+    up to its limit, so no task slot stays idle when a single domain is left to crawl.
+
+    Unlike `ThrottlingRequestManager`, which spaces out the requests to a domain in time, the budget limits how many
+    of them are in progress at once. The two can be combined.
+
+    ### Usage
+
+    ```python
+    from crawlee import ConcurrencySettings
+    from crawlee._autoscaling import ConcurrencyBudget
+    from crawlee.crawlers import HttpCrawler
+
+    crawler = HttpCrawler(
+        concurrency_settings=ConcurrencySettings(
+            max_concurrency=50,
+            concurrency_budget=ConcurrencyBudget(
+                max_concurrency_per_key=10,
+                max_concurrency_by_key={'slow.example.com': 2},
+            ),
+        ),
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        key_function: Callable[[Request], str | None] | None = None,
+        max_concurrency_per_key: int | None = None,
+        max_concurrency_by_key: Mapping[str, int] | None = None,
+        fair_share: bool = True,
+        max_buffered_requests: int = 1000,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            key_function: Computes the key of the group a request belongs to. By default, requests are grouped by the
+                hostname of their URL. Use e.g. `lambda request: request.label` to group them by label. Requests for
+                which the function returns `None` are not limited by the budget.
+            max_concurrency_per_key: The maximum number of requests of a single group in progress at once. If not
+                provided, a group is only limited by its fair share and by the concurrency of the pool.
+            max_concurrency_by_key: Limits of specific groups, which take precedence over `max_concurrency_per_key`.
+            fair_share: Whether to split the concurrency of the pool equally between the groups waiting for it.
+            max_buffered_requests: The maximum number of requests set aside because their group is over budget.
+        """
+        if max_concurrency_per_key is not None and max_concurrency_per_key < 1:
+            raise ValueError('max_concurrency_per_key must be 1 or larger')
+
+        if any(limit < 1 for limit in (max_concurrency_by_key or {}).values()):
+            raise ValueError('The limits in max_concurrency_by_key must be 1 or larger')
+
+        if max_buffered_requests < 1:
+            raise ValueError('max_buffered_requests must be 1 or larger')
+
+        self._key_function = key_function or _get_request_hostname
+        self._max_concurrency_per_key = max_concurrency_per_key or math.inf
+        self._max_concurrency_by_key = dict(max_concurrency_by_key or {})
+        self._fair_share = fair_share
+        self._max_buffered_requests = max_buffered_requests
+
+        self._total_concurrency: int | None = None
+        self._in_progress = dict[str, int]()
+        """The number of requests in progress by group, without the groups that have none."""
+
+        self._buffered: dict[str, deque[Request]] = {}
+        """Requests set aside because their group was over budget, by group, without the empty groups."""
+
+        self._buffered_count = 0
+        self._acquired_keys = dict[int, str]()
+        """Keys of the requests in progress by the ID of the request, so a request is released from the group it was
+        counted in even if its key would change in the meantime."""
+
+    @property
+    def total_concurrency(self) -> int | None:
+        """The global budget split between the groups, kept equal to the desired concurrency of the pool."""
+        return self._total_concurrency
+
+    @total_concurrency.setter
+    def total_concurrency(self, value: int) -> None:
+        self._total_concurrency = value
+
+    @property
+    def buffered_count(self) -> int:
+        """The number of requests set aside because their group is over budget."""
+        return self._buffered_count
+
+    @property
+    def is_buffer_full(self) -> bool:
+        """Indicate whether no more requests can be set aside, so no new requests should be fetched."""
+        return self._buffered_count >= self._max_buffered_requests
+
+    def get_in_progress_by_key(self) -> dict[str, int]:
+        """Return the number of requests in progress for every group that has any."""
+        return dict(self._in_progress)
+
+    def try_acquire(self, request: Request) -> bool:
+        """Count the request as in progress if its group is within its limit and its fair share.
+
+        Args:
+            request: The request about to be processed.
+
+        Returns:
+            True if the request may be processed right away, in which case `release` has to be called once it is done.
+        """
+        key = self._key_function(request)
+        if key is None:
+            return True
+
+        if not self._can_dispatch(key):
+            return False
+
+        self._acquire(request, key)
+        return True
+
+    def release(self, request: Request) -> None:
+        """Stop counting a request previously admitted by `try_acquire` or `pop_ready` as in progress."""
+        key = self._acquired_keys.pop(id(request), None)
+        if key is None:
+            return
+
+        if self._in_progress[key] > 1:
+            self._in_progress[key] -= 1
+        else:
+            del self._in_progress[key]
+
+    def defer(self, request: Request) -> None:
+        """Set aside a request rejected by `try_acquire` until its group has capacity again."""
+        key = self._key_function(request)
+        if key is None:
+            raise ValueError('Only requests that belong to a group can be deferred')
+
+        self._buffered.setdefault(key, deque()).append(request)
+        self._buffered_count += 1
+
+    def has_ready(self, *, within_fair_share: bool = True) -> bool:
+        """Indicate whether any of the requests set aside can be processed now.
+
+        Args:
+            within_fair_share: If set, only groups within their fair share are considered. Otherwise, the groups
+                within their limits are.
+        """
+        return any(self._can_dispatch(key, within_fair_share=within_fair_share) for key in self._buffered)
+
+    def pop_ready(self, *, within_fair_share: bool = True) -> Request | None:
+        """Take a request set aside earlier whose group has capacity again, and count it as in progress.
+
+        The request is taken from the group with the fewest requests in progress, to even out the groups.
+
+        Args:
+            within_fair_share: If set, only groups within their fair share are considered. Otherwise, the groups
+                within their limits are, which is meant for capacity that no other group has a request for.
+        """
+        ready_keys = [key for key in self._buffered if self._can_dispatch(key, within_fair_share=within_fair_share)]
+        if not ready_keys:
+            return None
+
+        key = min(ready_keys, key=lambda key: self._in_progress.get(key, 0))
+        requests = self._buffered[key]
+        request = requests.popleft()
+        self._buffered_count -= 1
+
+        if not requests:
+            del self._buffered[key]
+
+        self._acquire(request, key)
+        return request
+
+    def drain(self) -> list[Request]:
+        """Remove and return all the requests set aside, e.g. to give them back to the request manager."""
+        requests = [request for requests in self._buffered.values() for request in requests]
+        self._buffered.clear()
+        self._buffered_count = 0
+        return requests
+
+    def _acquire(self, request: Request, key: str) -> None:
+        self._in_progress[key] = self._in_progress.get(key, 0) + 1
+        self._acquired_keys[id(request)] = key
+
+    def _get_key_limit(self, key: str) -> float:
+        return self._max_concurrency_by_key.get(key, self._max_concurrency_per_key)
+
+    def _can_dispatch(self, key: str, *, within_fair_share: bool = True) -> bool:
+        in_progress = self._in_progress.get(key, 0)
+        if in_progress >= self._get_key_limit(key):
+            return False
+
+        if not within_fair_share or not self._fair_share or self._total_concurrency is None:
+            return True
+
+        # One share is kept for groups whose requests have not been seen yet, which may be further down the queue.
+        active_count = len(self._in_progress.keys() | self._buffered.keys() | {key})
+        return in_progress < max(1, self._total_concurrency // (active_count + 1))
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from crawlee._utils.docs import docs_group
+
+if TYPE_CHECKING:
+    from crawlee._autoscaling._types import ConcurrencyStatus
+
+
+@docs_group('Autoscaling')
+class ConcurrencyController(ABC):
+    """Decides the desired concurrency of an `AutoscaledPool`.
+
+    The pool calls the controller at a regular interval with the current `ConcurrencyStatus` and sets its desired
+    concurrency to the returned value, clamped between the minimum and maximum concurrency. Controllers may keep
+    state between the calls, so a single instance should not be shared by multiple pools.
+    """
+
+    @abstractmethod
+    def get_desired_concurrency(self, status: ConcurrencyStatus) -> int:
+        """Compute the new desired concurrency.
+
+        Args:
+            status: The state of the pool and of the system since the previous call.
+
+        Returns:
+            The new desired concurrency.
+        """
+
+
+@docs_group('Autoscaling')
+class StepConcurrencyController(ConcurrencyController):
+    """Scales the desired concurrency by a fixed fraction in the direction indicated by the system status.
+
+    This is the default controller. It scales up when the system has been idle and the pool actually uses most of its
+    desired concurrency, and scales down when the system has been overloaded.
+    """
+
+    def __init__(
+        self,
+        *,
+        desired_concurrency_ratio: float = 0.9,
+        scale_up_step_ratio: float = 0.05,
+        scale_down_step_ratio: float = 0.05,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            desired_concurrency_ratio: Minimum ratio of desired concurrency that must be reached before allowing
+                further scale-up.
+            scale_up_step_ratio: Fraction of desired concurrency to add during each scale-up operation.
+            scale_down_step_ratio: Fraction of desired concurrency to remove during each scale-down operation.
+        """
+        self._desired_concurrency_ratio = desired_concurrency_ratio
+        self._scale_up_step_ratio = scale_up_step_ratio
+        self._scale_down_step_ratio = scale_down_step_ratio
+
+    @override
+    def get_desired_concurrency(self, status: ConcurrencyStatus) -> int:
+        desired_concurrency = status.desired_concurrency
+
+        if status.system_info.is_system_idle:
+            if status.is_saturated(self._desired_concurrency_ratio):
+                return desired_concurrency + math.ceil(self._scale_up_step_ratio * desired_concurrency)
+            return desired_concurrency
+
+        return desired_concurrency - math.ceil(self._scale_down_step_ratio * desired_concurrency)
+
+
+@docs_group('Autoscaling')
+class AimdConcurrencyController(ConcurrencyController):
+    """Additive-increase/multiplicative-decrease controller driven by the overload ratios of the system.
+
+    Like TCP congestion control, the controller starts in a slow-start phase in which it multiplies the desired
+    concurrency while the system stays idle, so it reaches the right order of magnitude in a few intervals. After
+    the first overload, it only adds a fixed step while idle and cuts the concurrency by a factor when overloaded.
+    The cut is proportional to how much the most loaded resource exceeds its overload limit.
+    """
+
+    def __init__(
+        self,
+        *,
+        additive_increase: int = 1,
+        multiplicative_decrease: float = 0.5,
+        slow_start_factor: float = 2.0,
+        desired_concurrency_ratio: float = 0.9,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            additive_increase: The number of tasks added to the desired concurrency in each idle interval after
+                the slow-start phase.
+            multiplicative_decrease: The smallest factor the desired concurrency is multiplied by in an overloaded
+                interval. Within this bound, the concurrency is reduced in proportion to how much the most loaded
+                resource exceeds its limit.
+            slow_start_factor: The factor the desired concurrency is multiplied by in each idle interval until the
+                first overload.
+            desired_concurrency_ratio: Minimum ratio of desired concurrency that must be reached before allowing
+                further scale-up.
+        """
+        if not 0 < multiplicative_decrease < 1:
+            raise ValueError('multiplicative_decrease must be between 0 and 1')
+
+        if slow_start_factor < 1:
+            raise ValueError('slow_start_factor must be 1 or larger')
+
+        self._additive_increase = additive_increase
+        self._multiplicative_decrease = multiplicative_decrease
+        self._slow_start_factor = slow_start_factor
+        self._desired_concurrency_ratio = desired_concurrency_ratio
+        self._in_slow_start = True
+
+    @override
+    def get_desired_concurrency(self, status: ConcurrencyStatus) -> int:
+        desired_concurrency = status.desired_concurrency
+        overload_ratio = status.system_info.max_overload_ratio
+
+        if overload_ratio > 1:
+            self._in_slow_start = False
+            # Cut deeper the more the system is overloaded. The square root damps the reaction to a slight overload,
+            # as the share of overloaded samples grows much faster than the load itself.
+            factor = max(self._multiplicative_decrease, overload_ratio**-0.5)
+            return min(desired_concurrency - 1, math.floor(desired_concurrency * factor))
+
+        if not status.is_saturated(self._desired_concurrency_ratio):
+            return desired_concurrency
+
+        if self._in_slow_start:
+            return max(desired_concurrency + 1, math.floor(desired_concurrency * self._slow_start_factor))
+
+        return desired_concurrency + self._additive_increase
+
+
+@docs_group('Autoscaling')
+class ThroughputConcurrencyController(ConcurrencyController):
+    """Hill-climbing controller that maximizes the number of tasks completed per second.
+
+    After each move, the controller compares the relative change in throughput to the relative change in concurrency.
+    While adding concurrency adds throughput in proportion (or removing it does not cost much), it keeps moving in
+    the same direction. Otherwise it has passed the point where the system saturates, so it turns around and halves
+    its step. An overloaded system always makes it back off, so the search stays within the limits of the system.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_step_ratio: float = 1.0,
+        min_step_ratio: float = 0.05,
+        min_efficiency: float = 0.5,
+        desired_concurrency_ratio: float = 0.9,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            initial_step_ratio: The size of the first steps as a fraction of the desired concurrency. The default
+                doubles the concurrency until the throughput stops growing.
+            min_step_ratio: The smallest step as a fraction of the desired concurrency. Steps much smaller than
+                the noise in the measured throughput do not tell the controller anything.
+            min_efficiency: The minimum ratio of the relative change in throughput to the relative change in
+                concurrency for which a move is considered worth it.
+            desired_concurrency_ratio: Minimum ratio of desired concurrency that must be reached before allowing
+                further scale-up.
+        """
+        if not 0 < min_step_ratio <= initial_step_ratio:
+            raise ValueError('min_step_ratio must be positive and not greater than initial_step_ratio')
+
+        self._min_step_ratio = min_step_ratio
+        self._min_efficiency = min_efficiency
+        self._desired_concurrency_ratio = desired_concurrency_ratio
+
+        self._step_ratio = initial_step_ratio
+        self._direction = 1
+        self._last_throughput: float | None = None
+        self._last_concurrency: int | None = None
+
+    @override
+    def get_desired_concurrency(self, status: ConcurrencyStatus) -> int:
+        desired_concurrency = status.desired_concurrency
+        throughput = status.throughput
+
+        if not status.system_info.is_system_idle:
+            self._direction = -1
+            self._halve_step()
+        elif (
+            self._last_throughput is not None
+            and self._last_concurrency is not None
+            and self._last_concurrency != desired_concurrency
+        ):
+            throughput_change = (throughput - self._last_throughput) / max(self._last_throughput, 1e-9)
+            concurrency_change = (desired_concurrency - self._last_concurrency) / self._last_concurrency
+            efficiency = throughput_change / concurrency_change
+
+            # Moving up should add throughput in proportion, moving down should not cost it.
+            move_paid_off = (
+                efficiency >= self._min_efficiency if self._direction > 0 else efficiency < self._min_efficiency
+            )
+            if not move_paid_off:
+                self._direction = -self._direction
+                self._halve_step()
+
+        if self._direction > 0 and not status.is_saturated(self._desired_concurrency_ratio):
+            # The pool does not use its current concurrency, so adding more cannot increase the throughput.
+            return desired_concurrency
+
+        self._last_throughput = throughput
+        self._last_concurrency = desired_concurrency
+
+        step = max(1, math.ceil(self._step_ratio * desired_concurrency))
+        return desired_concurrency + self._direction * step
+
+    def _halve_step(self) -> None:
+        self._step_ratio = max(self._min_step_ratio, self._step_ratio / 2)
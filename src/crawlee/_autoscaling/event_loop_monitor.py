@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from datetime import timedelta
+from logging import getLogger
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from crawlee._autoscaling._types import EventLoopLatencyInfo, SlowCallbackInfo
+from crawlee._utils.docs import docs_group
+from crawlee._utils.histogram import LatencyHistogram
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import CodeType, TracebackType
+
+logger = getLogger(__name__)
+
+_ASYNCIO_PATH = str(Path(asyncio.__file__).parent)
+
+
+@docs_group('Autoscaling')
+class EventLoopMonitor:
+    """Measures the lag of an asyncio event loop and finds the callbacks that block it.
+
+    While active, the monitor wraps the execution of every callback on its event loop. It records how long each
+    callback ran and, for timers, how late they ran compared to their scheduled time - the event loop lag. The
+    durations are kept in HDR-style histograms, so recording is cheap and percentiles stay accurate over long runs.
+    A periodic probe timer makes sure there are lag measurements even when the code does not schedule timers itself.
+
+    Callbacks that run for longer than `slow_callback_threshold` are attributed to the code that ran them. For task
+    steps, that is the innermost coroutine the task was resumed in, with the line at which it resumed, which points
+    at the request handler or parser that blocked the loop rather than at the task machinery.
+
+    Only the pure Python event loop of the standard library can be instrumented. With other implementations, such as
+    uvloop, or with `instrument_callbacks` disabled, only the probe timer measures the lag.
+    """
+
+    _MAX_SLOW_CALLBACK_LOCATIONS = 100
+    """Maximum number of distinct locations tracked, further slow callbacks are attributed to `<other>`."""
+
+    _monitors_by_loop: ClassVar[dict[asyncio.AbstractEventLoop, EventLoopMonitor]] = {}
+    """Active monitors by the event loop they are monitoring."""
+
+    _instrumenting_monitors_by_loop: ClassVar[dict[asyncio.AbstractEventLoop, EventLoopMonitor]] = {}
+    """Active monitors that instrument callbacks by the event loop they are monitoring."""
+
+    _original_handle_run: ClassVar[Callable[[asyncio.Handle], None] | None] = None
+    """The `asyncio.Handle._run` method replaced while any monitor instruments callbacks."""
+
+    def __init__(
+        self,
+        *,
+        slow_callback_threshold: timedelta = timedelta(milliseconds=100),
+        probe_interval: timedelta = timedelta(milliseconds=100),
+        recent_window: timedelta = timedelta(seconds=30),
+        instrument_callbacks: bool = True,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            slow_callback_threshold: Callbacks running for at least this long are attributed to the code that ran
+                them.
+            probe_interval: The interval of the probe timer measuring the lag.
+            recent_window: The approximate duration covered by the recent lag statistics.
+            instrument_callbacks: Whether to wrap the execution of every callback. When disabled, only the probe timer
+                measures the lag and no slow callbacks are reported, but the monitor has no per-callback overhead.
+        """
+        self._slow_callback_threshold = slow_callback_threshold.total_seconds()
+        self._probe_interval = probe_interval.total_seconds()
+        self._recent_window = recent_window.total_seconds()
+        self._instrument_callbacks = instrument_callbacks
+
+        self._lag_histogram = LatencyHistogram()
+        self._callback_duration_histogram = LatencyHistogram()
+        self._recent_lag_histogram = LatencyHistogram()
+        self._previous_recent_lag_histogram = LatencyHistogram()
+        self._recent_window_started_at = 0.0
+        self._max_lag = 0.0
+        self._slow_callbacks = dict[str, SlowCallbackInfo]()
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._probe_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def active(self) -> bool:
+        """Indicate whether the monitor is active."""
+        return self._loop is not None
+
+    @property
+    def lag_histogram(self) -> LatencyHistogram:
+        """The histogram of all event loop lag measurements since the monitor was started or reset."""
+        return self._lag_histogram
+
+    @property
+    def callback_duration_histogram(self) -> LatencyHistogram:
+        """The histogram of the run times of all callbacks since the monitor was started or reset."""
+        return self._callback_duration_histogram
+
+    async def __aenter__(self) -> EventLoopMonitor:
+        """Start monitoring the running event loop."""
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        """Stop monitoring the event loop."""
+        self.stop()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop.
+
+        Raises:
+            RuntimeError: If the monitor is already active, or if another monitor is monitoring the same loop.
+        """
+        if self._loop is not None:
+            raise RuntimeError(f'The {self.__class__.__name__} is already active.')
+
+        loop = asyncio.get_running_loop()
+        if loop in self._monitors_by_loop:
+            raise RuntimeError(f'Another {self.__class__.__name__} is already monitoring the running event loop.')
+
+        self._loop = loop
+        self._recent_window_started_at = loop.time()
+        self._monitors_by_loop[loop] = self
+
+        if self._instrument_callbacks:
+            self._instrumenting_monitors_by_loop[loop] = self
+            self._install_hook()
+
+        self._schedule_probe()
+
+    def stop(self) -> None:
+        """Stop monitoring the event loop. The collected statistics are kept."""
+        if self._loop is None:
+            return
+
+        if self._probe_handle is not None:
+            self._probe_handle.cancel()
+            self._probe_handle = None
+
+        del self._monitors_by_loop[self._loop]
+        self._instrumenting_monitors_by_loop.pop(self._loop, None)
+        self._loop = None
+
+        if not self._instrumenting_monitors_by_loop:
+            self._uninstall_hook()
+
+    def reset(self) -> None:
+        """Discard all collected statistics."""
+        for histogram in (
+            self._lag_histogram,
+            self._callback_duration_histogram,
+            self._recent_lag_histogram,
+            self._previous_recent_lag_histogram,
+        ):
+            histogram.reset()
+
+        self._max_lag = 0.0
+        self._slow_callbacks.clear()
+
+    def get_latency_info(self, *, recent: bool = True) -> EventLoopLatencyInfo:
+        """Return percentiles of the event loop lag.
+
+        Args:
+            recent: If set, only the lag measured within about the `recent_window` is considered. Otherwise, all
+                the measurements since the monitor was started or reset are.
+        """
+        if recent:
+            histogram = LatencyHistogram()
+            histogram.merge(self._previous_recent_lag_histogram)
+            histogram.merge(self._recent_lag_histogram)
+        else:
+            histogram = self._lag_histogram
+
+        return EventLoopLatencyInfo(
+            p50=histogram.get_percentile(50),
+            p90=histogram.get_percentile(90),
+            p99=histogram.get_percentile(99),
+            max=histogram.max,
+            count=histogram.count,
+        )
+
+    def get_slow_callbacks(self) -> list[SlowCallbackInfo]:
+        """Return the statistics of slow callbacks by location, starting with the location that blocked the most."""
+        return sorted(
+            (replace(info) for info in self._slow_callbacks.values()),
+            key=lambda info: info.total_duration,
+            reverse=True,
+        )
+
+    def take_max_lag(self) -> timedelta:
+        """Return the longest lag measured since the previous call and start measuring anew."""
+        max_lag, self._max_lag = self._max_lag, 0.0
+        return timedelta(seconds=max_lag)
+
+    def _schedule_probe(self) -> None:
+        if self._loop is not None:
+            self._probe_handle = self._loop.call_later(self._probe_interval, self._probe, self._loop.time())
+
+    def _probe(self, scheduled_at: float) -> None:
+        if self._loop is None:
+            return
+
+        now = self._loop.time()
+
+        # With instrumented callbacks, the lag of the probe timer is recorded along with all the other timers.
+        if not self._instrument_callbacks:
+            self._record_lag(now - scheduled_at - self._probe_interval)
+
+        if now - self._recent_window_started_at >= self._recent_window / 2:
+            self._previous_recent_lag_histogram, self._recent_lag_histogram = (
+                self._recent_lag_histogram,
+                self._previous_recent_lag_histogram,
+            )
+            self._recent_lag_histogram.reset()
+            self._recent_window_started_at = now
+
+        self._schedule_probe()
+
+    def _record_lag(self, lag: float) -> None:
+        self._lag_histogram.record(lag)
+        self._recent_lag_histogram.record(lag)
+        self._max_lag = max(self._max_lag, lag)
+
+    def _run_handle(self, handle: asyncio.Handle, run: Callable[[asyncio.Handle], None]) -> None:
+        """Run the callback of the handle and record its lag and duration."""
+        if isinstance(handle, asyncio.TimerHandle) and self._loop is not None:
+            self._record_lag(self._loop.time() - handle.when())
+
+        # The location a task resumes in has to be read before the task step runs.
+        resume_point = _get_task_resume_point(handle._callback)  # noqa: SLF001
+
+        started_at = perf_counter()
+        try:
+            run(handle)
+        finally:
+            duration = perf_counter() - started_at
+            self._callback_duration_histogram.record(duration)
+
+            if duration >= self._slow_callback_threshold:
+                self._record_slow_callback(_get_location(handle._callback, resume_point), duration)  # noqa: SLF001
+
+    def _record_slow_callback(self, location: str, duration: float) -> None:
+        info = self._slow_callbacks.get(location)
+
+        if info is None and len(self._slow_callbacks) >= self._MAX_SLOW_CALLBACK_LOCATIONS:
+            location = '<other>'
+            info = self._slow_callbacks.get(location)
+
+        if info is None:
+            info = self._slow_callbacks[location] = SlowCallbackInfo(
+                location=location,
+                count=0,
+                total_duration=timedelta(),
+                max_duration=timedelta(),
+            )
+
+        duration_delta = timedelta(seconds=duration)
+        info.count += 1
+        info.total_duration += duration_delta
+        info.max_duration = max(info.max_duration, duration_delta)
+
+        logger.debug(f'Slow callback {location} blocked the event loop for {duration:.3f}s.')
+
+    @classmethod
+    def _install_hook(cls) -> None:
+        if cls._original_handle_run is not None:
+            return
+
+        original_handle_run = asyncio.Handle._run  # noqa: SLF001
+        monitors_by_loop = cls._instrumenting_monitors_by_loop
+
+        def run_monitored_handle(handle: asyncio.Handle) -> None:
+            monitor = monitors_by_loop.get(handle._loop)  # noqa: SLF001
+            if monitor is None:
+                original_handle_run(handle)
+            else:
+                monitor._run_handle(handle, original_handle_run)  # noqa: SLF001
+
+        cls._original_handle_run = original_handle_run
+        asyncio.Handle._run = run_monitored_handle  # noqa: SLF001  # ty: ignore[invalid-assignment]
+
+    @classmethod
+    def _uninstall_hook(cls) -> None:
+        if cls._original_handle_run is None:
+            return
+
+        asyncio.Handle._run = cls._original_handle_run  # noqa: SLF001  # ty: ignore[invalid-assignment]
+        cls._original_handle_run = None
+
+
+def _get_task_resume_point(callback: Any) -> tuple[CodeType, int] | None:
+    """Return the code and line of the innermost coroutine a task step is going to resume, if the callback is one."""
+    task = getattr(callback, '__self__', None)
+    if not isinstance(task, asyncio.Task):
+        return None
+
+    # Coroutines of asyncio itself, such as `asyncio.sleep`, only return to the code that awaited them.
+    resume_point = None
+    coroutine: Any = task.get_coro()
+
+    while (frame := getattr(coroutine, 'cr_frame', None)) is not None:
+        if resume_point is None or not frame.f_code.co_filename.startswith(_ASYNCIO_PATH):
+            resume_point = frame.f_code, frame.f_lineno
+        coroutine = coroutine.cr_await
+
+    return resume_point
+
+
+def _get_location(callback: Any, resume_point: tuple[CodeType, int] | None) -> str:
+    """Describe the code that ran a callback."""
+    if resume_point is not None:
+        code, line = resume_point
+        return f'{getattr(code, "co_qualname", code.co_name)} ({code.co_filename}:{line})'
+
+    function = getattr(callback, '__func__', callback)
+    code = getattr(function, '__code__', None)
+    if code is None:
+        return getattr(function, '__qualname__', repr(callback))
+
+    return f'{getattr(code, "co_qualname", code.co_name)} ({code.co_filename}:{code.co_firstlineno})'
@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 from bisect import insort
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 from logging import WARNING, getLogger
-from typing import TYPE_CHECKING, TypeVar, cast
+from typing import TYPE_CHECKING, TypeVar, cast, overload
 
 from crawlee import service_locator
-from crawlee._autoscaling._types import ClientSnapshot, CpuSnapshot, EventLoopSnapshot, MemorySnapshot, Ratio, Snapshot
+from crawlee._autoscaling._types import (
+    ClientSnapshot,
+    CpuSnapshot,
+    EventLoopLatencyInfo,
+    EventLoopSnapshot,
+    MemorySnapshot,
+    Ratio,
+    Snapshot,
+)
+from crawlee._autoscaling.event_loop_monitor import EventLoopMonitor
 from crawlee._utils.byte_size import ByteSize
 from crawlee._utils.context import ensure_context
 from crawlee._utils.docs import docs_group
@@ -28,12 +38,152 @@ logger_once = LoggerOnce(logger)
 T = TypeVar('T', bound=Snapshot)
 
 
-class SortedSnapshotList(list[T]):
-    """A list that maintains sorted order by `created_at` attribute for snapshot objects."""
+class SnapshotBuffer(Sequence[T]):
+    """A fixed-size ring buffer of snapshots, ordered by their `created_at` attribute.
 
-    def add(self, item: T) -> None:
-        """Add an item to the list maintaining sorted order by `created_at` using binary search."""
-        insort(self, item, key=lambda item: item.created_at)
+    Next to the snapshots, the buffer keeps running totals of the time between them and of the part of that time
+    during which the resource was overloaded (the time between two snapshots is attributed to the later one).
+    The overloaded ratio of any time window is then the difference of the totals at the ends of the window,
+    so it does not have to walk the snapshots in between.
+
+    Snapshots are expected to arrive in order, in which case adding one is O(1). A snapshot older than the latest
+    one is inserted in place, which rebuilds the buffer. When the buffer is full, the oldest snapshot is dropped.
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        """Initialize a new instance.
+
+        Args:
+            capacity: The maximum number of snapshots kept in the buffer.
+        """
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+
+        self._capacity = capacity
+        self._snapshots: list[T | None] = [None] * capacity
+        self._overloaded_time = [0.0] * capacity
+        self._total_time = [0.0] * capacity
+
+        # Absolute positions of the oldest snapshot and of the slot after the latest one. The slot of a position
+        # is the position modulo the capacity.
+        self._start = 0
+        self._end = 0
+
+        # Cached window starts per sample duration. The latest snapshot only moves forward in time, so the starts
+        # only move forward too and finding them costs O(1) amortized.
+        self._window_starts = dict[timedelta, int]()
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self._get(self._start + position) for position in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('SnapshotBuffer index out of range')
+
+        return self._get(self._start + index)
+
+    def add(self, snapshot: T) -> None:
+        """Add a snapshot to the buffer, maintaining the order by `created_at`."""
+        if self and snapshot.created_at < self[-1].created_at:
+            snapshots = list(self)
+            insort(snapshots, snapshot, key=lambda item: item.created_at)
+            self.clear()
+            for item in snapshots:
+                self._append(item)
+            return
+
+        self._append(snapshot)
+
+    def clear(self) -> None:
+        """Remove all snapshots from the buffer."""
+        self._snapshots = [None] * self._capacity
+        self._start = self._end = 0
+        self._window_starts.clear()
+
+    def remove_older_than(self, cutoff: datetime) -> None:
+        """Remove all snapshots created before the `cutoff`."""
+        while self._start < self._end and self._get(self._start).created_at < cutoff:
+            self._snapshots[self._start % self._capacity] = None
+            self._start += 1
+
+    def get_sample(self, duration: timedelta | None = None) -> list[T]:
+        """Return the snapshots within the `duration` from the latest one, or all of them if `duration` is None."""
+        return [self._get(position) for position in range(self._get_window_start(duration), self._end)]
+
+    def get_overloaded_ratio(self, duration: timedelta | None = None) -> float:
+        """Return the ratio of time during which the resource was overloaded.
+
+        Args:
+            duration: The duration of the window from the latest snapshot. If omitted, the full history is used.
+
+        Returns:
+            The overloaded time divided by the total time between the snapshots in the window. If the window contains
+            a single snapshot, 1 when it is overloaded and 0 otherwise.
+        """
+        if not self:
+            return 0.0
+
+        start = self._get_window_start(duration)
+        last = self._end - 1
+
+        if start == last:
+            return float(self._get(last).is_overloaded)
+
+        start_slot = start % self._capacity
+        last_slot = last % self._capacity
+        total_time = self._total_time[last_slot] - self._total_time[start_slot]
+
+        if total_time <= 0:
+            return 0.0
+
+        return (self._overloaded_time[last_slot] - self._overloaded_time[start_slot]) / total_time
+
+    def _get(self, position: int) -> T:
+        return cast('T', self._snapshots[position % self._capacity])
+
+    def _append(self, snapshot: T) -> None:
+        overloaded_time = 0.0
+        total_time = 0.0
+
+        if self:
+            previous_slot = (self._end - 1) % self._capacity
+            interval = (snapshot.created_at - self._get(self._end - 1).created_at).total_seconds()
+            overloaded_time = self._overloaded_time[previous_slot] + (interval if snapshot.is_overloaded else 0.0)
+            total_time = self._total_time[previous_slot] + interval
+
+        if len(self) == self._capacity:
+            self._start += 1
+
+        slot = self._end % self._capacity
+        self._snapshots[slot] = snapshot
+        self._overloaded_time[slot] = overloaded_time
+        self._total_time[slot] = total_time
+        self._end += 1
+
+    def _get_window_start(self, duration: timedelta | None) -> int:
+        if not duration or not self:
+            return self._start
+
+        latest_time = self._get(self._end - 1).created_at
+        start = max(self._window_starts.get(duration, self._start), self._start)
+
+        while start < self._end - 1 and latest_time - self._get(start).created_at > duration:
+            start += 1
+
+        self._window_starts[duration] = start
+        return start
 
 
 @docs_group('Autoscaling')
@@ -55,6 +205,9 @@ class Snapshotter:
     _SNAPSHOT_HISTORY = timedelta(seconds=30)
     """The time interval for which the snapshots are kept."""
 
+    _SNAPSHOT_BUFFER_CAPACITY = 1000
+    """The maximum number of snapshots of each kind kept, regardless of their age."""
+
     _RESERVE_MEMORY_RATIO = 0.5
     """Fraction of memory kept in reserve. Used to calculate critical memory overload threshold."""
 
@@ -72,6 +225,7 @@ class Snapshotter:
         max_event_loop_delay: timedelta,
         max_client_errors: int,
         max_memory_size: ByteSize | Ratio,
+        event_loop_monitor: EventLoopMonitor | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -90,17 +244,20 @@ class Snapshotter:
             max_memory_size: Sets the maximum amount of system memory to be used by the `AutoscaledPool`. When of type
                 `ByteSize` then it is used as fixed memory size. When of type `Ratio` then it allows for dynamic memory
                 scaling based on the available system memory.
+            event_loop_monitor: An optional monitor started and stopped together with the snapshotter. Its lag
+                measurements refine the event loop snapshots, which otherwise only see the delay of a recurring task.
         """
         self._max_used_cpu_ratio = max_used_cpu_ratio
         self._max_used_memory_ratio = max_used_memory_ratio
         self._max_event_loop_delay = max_event_loop_delay
         self._max_client_errors = max_client_errors
         self._max_memory_size = max_memory_size
+        self._event_loop_monitor = event_loop_monitor
 
-        self._cpu_snapshots = self._get_sorted_list_by_created_at(list[CpuSnapshot]())
-        self._event_loop_snapshots = self._get_sorted_list_by_created_at(list[EventLoopSnapshot]())
-        self._memory_snapshots = self._get_sorted_list_by_created_at(list[MemorySnapshot]())
-        self._client_snapshots = self._get_sorted_list_by_created_at(list[ClientSnapshot]())
+        self._cpu_snapshots = self._create_snapshot_buffer(list[CpuSnapshot]())
+        self._event_loop_snapshots = self._create_snapshot_buffer(list[EventLoopSnapshot]())
+        self._memory_snapshots = self._create_snapshot_buffer(list[MemorySnapshot]())
+        self._client_snapshots = self._create_snapshot_buffer(list[ClientSnapshot]())
 
         self._snapshot_event_loop_task = RecurringTask(self._snapshot_event_loop, self._EVENT_LOOP_SNAPSHOT_INTERVAL)
         self._snapshot_client_task = RecurringTask(self._snapshot_client, self._CLIENT_SNAPSHOT_INTERVAL)
@@ -134,16 +291,19 @@ class Snapshotter:
             max_event_loop_delay=config.max_event_loop_delay,
             max_client_errors=config.max_client_errors,
             max_memory_size=max_memory_size,
+            event_loop_monitor=(
+                EventLoopMonitor(slow_callback_threshold=config.max_event_loop_delay)
+                if config.event_loop_monitoring
+                else None
+            ),
         )
 
-    @staticmethod
-    def _get_sorted_list_by_created_at(input_list: list[T]) -> SortedSnapshotList[T]:
-        """Create a sorted list from the input list.
-
-        Returns a custom list that maintains sorted order by created_at when items are added.
-        """
-        result = SortedSnapshotList[T]()
-        result.extend(input_list)
+    @classmethod
+    def _create_snapshot_buffer(cls, snapshots: list[T]) -> SnapshotBuffer[T]:
+        """Create a snapshot buffer containing the given snapshots."""
+        result = SnapshotBuffer[T](cls._SNAPSHOT_BUFFER_CAPACITY)
+        for snapshot in snapshots:
+            result.add(snapshot)
         return result
 
     @property
@@ -151,6 +311,11 @@ class Snapshotter:
         """Indicate whether the context is active."""
         return self._active
 
+    @property
+    def event_loop_monitor(self) -> EventLoopMonitor | None:
+        """The monitor of the event loop lag, if event loop monitoring is enabled."""
+        return self._event_loop_monitor
+
     async def __aenter__(self) -> Snapshotter:
         """Start capturing snapshots at configured intervals.
 
@@ -164,6 +329,8 @@ class Snapshotter:
         event_manager = service_locator.get_event_manager()
         event_manager.on(event=Event.SYSTEM_INFO, listener=self._snapshot_cpu)
         event_manager.on(event=Event.SYSTEM_INFO, listener=self._snapshot_memory)
+        if self._event_loop_monitor is not None:
+            self._event_loop_monitor.start()
         self._snapshot_event_loop_task.start()
         self._snapshot_client_task.start()
         return self
@@ -190,6 +357,8 @@ class Snapshotter:
         event_manager.off(event=Event.SYSTEM_INFO, listener=self._snapshot_memory)
         await self._snapshot_event_loop_task.stop()
         await self._snapshot_client_task.stop()
+        if self._event_loop_monitor is not None:
+            self._event_loop_monitor.stop()
         self._active = False
 
     @ensure_context
@@ -202,8 +371,7 @@ class Snapshotter:
         Returns:
             A sample of memory snapshots.
         """
-        snapshots = cast('list[Snapshot]', self._memory_snapshots)
-        return self._get_sample(snapshots, duration)
+        return cast('list[Snapshot]', self._memory_snapshots.get_sample(duration))
 
     @ensure_context
     def get_event_loop_sample(self, duration: timedelta | None = None) -> list[Snapshot]:
@@ -215,8 +383,7 @@ class Snapshotter:
         Returns:
             A sample of event loop snapshots.
         """
-        snapshots = cast('list[Snapshot]', self._event_loop_snapshots)
-        return self._get_sample(snapshots, duration)
+        return cast('list[Snapshot]', self._event_loop_snapshots.get_sample(duration))
 
     @ensure_context
     def get_cpu_sample(self, duration: timedelta | None = None) -> list[Snapshot]:
@@ -228,8 +395,7 @@ class Snapshotter:
         Returns:
             A sample of CPU snapshots.
         """
-        snapshots = cast('list[Snapshot]', self._cpu_snapshots)
-        return self._get_sample(snapshots, duration)
+        return cast('list[Snapshot]', self._cpu_snapshots.get_sample(duration))
 
     @ensure_context
     def get_client_sample(self, duration: timedelta | None = None) -> list[Snapshot]:
@@ -241,20 +407,75 @@ class Snapshotter:
         Returns:
             A sample of client snapshots.
         """
-        snapshots = cast('list[Snapshot]', self._client_snapshots)
-        return self._get_sample(snapshots, duration)
+        return cast('list[Snapshot]', self._client_snapshots.get_sample(duration))
+
+    @ensure_context
+    def get_memory_overloaded_ratio(self, duration: timedelta | None = None) -> float:
+        """Return the ratio of time during which the memory was overloaded.
+
+        Unlike computing the ratio from `get_memory_sample`, this takes constant time regardless of the sample size.
+
+        Args:
+            duration: The duration of the sample from the latest snapshot. If omitted, it uses a full history.
+
+        Returns:
+            The overloaded time divided by the total time between the memory snapshots in the sample.
+        """
+        return self._memory_snapshots.get_overloaded_ratio(duration)
 
-    @staticmethod
-    def _get_sample(snapshots: list[Snapshot], duration: timedelta | None = None) -> list[Snapshot]:
-        """Return a time-limited sample from snapshots or full history if duration is None."""
-        if not duration:
-            return snapshots
+    @ensure_context
+    def get_event_loop_overloaded_ratio(self, duration: timedelta | None = None) -> float:
+        """Return the ratio of time during which the event loop was overloaded.
+
+        Unlike computing the ratio from `get_event_loop_sample`, this takes constant time regardless of the sample size.
 
-        if not snapshots:
-            return []
+        Args:
+            duration: The duration of the sample from the latest snapshot. If omitted, it uses a full history.
+
+        Returns:
+            The overloaded time divided by the total time between the event loop snapshots in the sample.
+        """
+        return self._event_loop_snapshots.get_overloaded_ratio(duration)
+
+    @ensure_context
+    def get_cpu_overloaded_ratio(self, duration: timedelta | None = None) -> float:
+        """Return the ratio of time during which the CPU was overloaded.
 
-        latest_time = snapshots[-1].created_at
-        return [snapshot for snapshot in snapshots if latest_time - snapshot.created_at <= duration]
+        Unlike computing the ratio from `get_cpu_sample`, this takes constant time regardless of the sample size.
+
+        Args:
+            duration: The duration of the sample from the latest snapshot. If omitted, it uses a full history.
+
+        Returns:
+            The overloaded time divided by the total time between the CPU snapshots in the sample.
+        """
+        return self._cpu_snapshots.get_overloaded_ratio(duration)
+
+    @ensure_context
+    def get_client_overloaded_ratio(self, duration: timedelta | None = None) -> float:
+        """Return the ratio of time during which the client was overloaded.
+
+        Unlike computing the ratio from `get_client_sample`, this takes constant time regardless of the sample size.
+
+        Args:
+            duration: The duration of the sample from the latest snapshot. If omitted, it uses a full history.
+
+        Returns:
+            The overloaded time divided by the total time between the client snapshots in the sample.
+        """
+        return self._client_snapshots.get_overloaded_ratio(duration)
+
+    @ensure_context
+    def get_event_loop_latency(self) -> EventLoopLatencyInfo | None:
+        """Return percentiles of the recent event loop lag.
+
+        Returns:
+            The lag percentiles, or None if event loop monitoring is disabled.
+        """
+        if self._event_loop_monitor is None:
+            return None
+
+        return self._event_loop_monitor.get_latency_info()
 
     async def _snapshot_cpu(self, event_data: EventSystemInfoData) -> None:
         """Capture a snapshot of the current CPU usage.
@@ -273,9 +494,8 @@ class Snapshotter:
             created_at=event_data.cpu_info.created_at,
         )
 
-        snapshots = cast('list[Snapshot]', self._cpu_snapshots)
         self._cpu_snapshots.add(snapshot)
-        self._prune_snapshots(snapshots, self._cpu_snapshots[-1].created_at)
+        self._prune_snapshots(self._cpu_snapshots)
 
     async def _snapshot_memory(self, event_data: EventSystemInfoData) -> None:
         """Capture a snapshot of the current memory usage.
@@ -330,9 +550,8 @@ class Snapshotter:
             system_wide_memory_size=system_wide_memory_size,
         )
 
-        snapshots = cast('list[Snapshot]', self._memory_snapshots)
         self._memory_snapshots.add(snapshot)
-        self._prune_snapshots(snapshots, self._memory_snapshots[-1].created_at)
+        self._prune_snapshots(self._memory_snapshots)
 
         self._evaluate_memory_load(
             event_data.memory_info.current_size,
@@ -357,9 +576,12 @@ class Snapshotter:
             event_loop_delay = snapshot.created_at - previous_snapshot.created_at - self._EVENT_LOOP_SNAPSHOT_INTERVAL
             snapshot.delay = event_loop_delay
 
-        snapshots = cast('list[Snapshot]', self._event_loop_snapshots)
+        if self._event_loop_monitor is not None:
+            # The monitor sees the lag of every timer, not just the one of the recurring task.
+            snapshot.delay = max(snapshot.delay, self._event_loop_monitor.take_max_lag())
+
         self._event_loop_snapshots.add(snapshot)
-        self._prune_snapshots(snapshots, self._event_loop_snapshots[-1].created_at)
+        self._prune_snapshots(self._event_loop_snapshots)
 
     async def _snapshot_client(self) -> None:
         """Capture a snapshot of the current API state by checking for rate limit errors (HTTP 429).
@@ -381,34 +603,17 @@ class Snapshotter:
             max_error_count=self._max_client_errors,
         )
 
-        snapshots = cast('list[Snapshot]', self._client_snapshots)
         self._client_snapshots.add(snapshot)
-        self._prune_snapshots(snapshots, self._client_snapshots[-1].created_at)
-
-    def _prune_snapshots(self, snapshots: list[Snapshot], now: datetime) -> None:
-        """Remove snapshots that are older than the `self._snapshot_history`.
+        self._prune_snapshots(self._client_snapshots)
 
-        This method modifies the list of snapshots in place, removing all snapshots that are older than the defined
-        snapshot history relative to the `now` parameter.
+    def _prune_snapshots(self, snapshots: SnapshotBuffer[T]) -> None:
+        """Remove snapshots that are older than the `self._SNAPSHOT_HISTORY` relative to the latest snapshot.
 
         Args:
-            snapshots: List of snapshots to be pruned in place.
-            now: The current date and time, used as the reference for pruning.
+            snapshots: Buffer of snapshots to be pruned in place.
         """
-        # Find the index where snapshots start to be within the allowed history window.
-        # We'll keep snapshots from this index onwards.
-        keep_from_index = None
-        for i, snapshot in enumerate(snapshots):
-            if now - snapshot.created_at <= self._SNAPSHOT_HISTORY:
-                keep_from_index = i
-                break
-
-        # If all snapshots are old, keep_from_index will remain None, so we clear the list.
-        # Otherwise, we keep only the recent snapshots.
-        if keep_from_index is not None:
-            del snapshots[:keep_from_index]
-        else:
-            snapshots.clear()
+        if snapshots:
+            snapshots.remove_older_than(snapshots[-1].created_at - self._SNAPSHOT_HISTORY)
 
     def _evaluate_memory_load(
         self, current_memory_usage_size: ByteSize, snapshot_timestamp: datetime, max_memory_size: ByteSize
@@ -6,9 +6,7 @@ from datetime import timedelta
 from logging import getLogger
 from typing import TYPE_CHECKING
 
-from more_itertools import pairwise
-
-from crawlee._autoscaling._types import LoadRatioInfo, Snapshot, SystemInfo
+from crawlee._autoscaling._types import LoadRatioInfo, SystemInfo
 from crawlee._utils.docs import docs_group
 
 if TYPE_CHECKING:
@@ -110,6 +108,7 @@ class SystemStatus:
             event_loop_info=event_loop_info,
             cpu_info=cpu_info,
             client_info=client_info,
+            event_loop_latency=self._snapshotter.get_event_loop_latency(),
         )
 
     def _is_cpu_overloaded(self, sample_duration: timedelta | None = None) -> LoadRatioInfo:
@@ -122,8 +121,8 @@ class SystemStatus:
         Returns:
             CPU load ratio information.
         """
-        sample = self._snapshotter.get_cpu_sample(sample_duration)
-        return self._is_sample_overloaded(sample, self._cpu_overload_threshold)
+        overloaded_ratio = self._snapshotter.get_cpu_overloaded_ratio(sample_duration)
+        return LoadRatioInfo(limit_ratio=self._cpu_overload_threshold, actual_ratio=round(overloaded_ratio, 3))
 
     def _is_memory_overloaded(self, sample_duration: timedelta | None = None) -> LoadRatioInfo:
         """Determine if memory has been overloaded within a specified time duration.
@@ -135,8 +134,8 @@ class SystemStatus:
         Returns:
             Memory load ratio information.
         """
-        sample = self._snapshotter.get_memory_sample(sample_duration)
-        return self._is_sample_overloaded(sample, self._memory_overload_threshold)
+        overloaded_ratio = self._snapshotter.get_memory_overloaded_ratio(sample_duration)
+        return LoadRatioInfo(limit_ratio=self._memory_overload_threshold, actual_ratio=round(overloaded_ratio, 3))
 
     def _is_event_loop_overloaded(self, sample_duration: timedelta | None = None) -> LoadRatioInfo:
         """Determine if the event loop has been overloaded within a specified time duration.
@@ -148,8 +147,8 @@ class SystemStatus:
         Returns:
             Event loop load ratio information.
         """
-        sample = self._snapshotter.get_event_loop_sample(sample_duration)
-        return self._is_sample_overloaded(sample, self._event_loop_overload_threshold)
+        overloaded_ratio = self._snapshotter.get_event_loop_overloaded_ratio(sample_duration)
+        return LoadRatioInfo(limit_ratio=self._event_loop_overload_threshold, actual_ratio=round(overloaded_ratio, 3))
 
     def _is_client_overloaded(self, sample_duration: timedelta | None = None) -> LoadRatioInfo:
         """Determine if the client has been overloaded within a specified time duration.
@@ -161,41 +160,5 @@ class SystemStatus:
         Returns:
             Client load ratio information.
         """
-        sample = self._snapshotter.get_client_sample(sample_duration)
-        return self._is_sample_overloaded(sample, self._client_overload_threshold)
-
-    def _is_sample_overloaded(self, sample: list[Snapshot], threshold: float) -> LoadRatioInfo:
-        """Determine if a sample of snapshot data is overloaded based on a specified ratio.
-
-        Args:
-            sample: A list of snapshot data to analyze.
-            threshold: The threshold ratio to use for determining if the sample is overloaded.
-
-        Returns:
-            An object with an `is_overloaded` property set to `True` if the sample is considered overloaded based
-            on the specified threshold ratio. Otherwise, `is_overloaded` is set to `False`.
-        """
-        if not sample:
-            return LoadRatioInfo(limit_ratio=threshold, actual_ratio=0)
-
-        if len(sample) == 1:
-            return LoadRatioInfo(limit_ratio=threshold, actual_ratio=float(sample[0].is_overloaded))
-
-        overloaded_time = 0.0
-        non_overloaded_time = 0.0
-
-        for previous, current in pairwise(sample):
-            time = (current.created_at - previous.created_at).total_seconds()
-            if time < 0:
-                raise ValueError('Negative time. Code assumptions are not valid. Expected time sorted samples.')
-            if current.is_overloaded:
-                overloaded_time += time
-            else:
-                non_overloaded_time += time
-
-        if (total_time := overloaded_time + non_overloaded_time) == 0:
-            overloaded_ratio = 0.0
-        else:
-            overloaded_ratio = overloaded_time / total_time
-
-        return LoadRatioInfo(limit_ratio=threshold, actual_ratio=round(overloaded_ratio, 3))
+        overloaded_ratio = self._snapshotter.get_client_overloaded_ratio(sample_duration)
+        return LoadRatioInfo(limit_ratio=self._client_overload_threshold, actual_ratio=round(overloaded_ratio, 3))
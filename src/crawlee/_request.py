@@ -5,7 +5,16 @@ from datetime import datetime
 from enum import IntEnum
 from typing import TYPE_CHECKING, Annotated, Any, TypedDict, cast
 
-from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, PlainSerializer, PlainValidator, TypeAdapter
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    TypeAdapter,
+    ValidationInfo,
+)
 from yarl import URL
 
 from crawlee._types import EnqueueStrategy, HttpHeaders, HttpMethod, HttpPayload, JsonSerializable
@@ -18,6 +27,17 @@ if TYPE_CHECKING:
     from typing_extensions import NotRequired, Required, Self
 
 
+TRUSTED_RECORD_CONTEXT_KEY = 'crawlee_trusted_record'
+"""Key of the validation context flag marking data written by Crawlee from already validated requests."""
+
+
+def _validate_request_url(value: str | None, info: ValidationInfo) -> str | None:
+    """Validate a URL of the request, unless it comes from a trusted record where it was validated already."""
+    if info.context is not None and info.context.get(TRUSTED_RECORD_CONTEXT_KEY):
+        return value
+    return validate_http_url(value)
+
+
 class RequestState(IntEnum):
     """Crawlee-specific request handling state."""
 
@@ -180,7 +200,7 @@ class Request(BaseModel):
     and specify which URLs shall be considered equal.
     """
 
-    url: Annotated[str, BeforeValidator(validate_http_url), Field(frozen=True)]
+    url: Annotated[str, BeforeValidator(_validate_request_url), Field(frozen=True)]
     """The URL of the web page to crawl. Must be a valid HTTP or HTTPS URL, and may include query parameters
     and fragments."""
 
@@ -234,7 +254,7 @@ class Request(BaseModel):
     no_retry: Annotated[bool, Field(alias='noRetry')] = False
     """If set to `True`, the request will not be retried in case of failure."""
 
-    loaded_url: Annotated[str | None, BeforeValidator(validate_http_url), Field(alias='loadedUrl')] = None
+    loaded_url: Annotated[str | None, BeforeValidator(_validate_request_url), Field(alias='loadedUrl')] = None
     """URL of the web page that was loaded. This can differ from the original URL in case of redirects."""
 
     handled_at: Annotated[datetime | None, Field(alias='handledAt')] = None
@@ -18,6 +18,8 @@ if TYPE_CHECKING:
     from typing_extensions import NotRequired, Required, Self, Unpack
 
     from crawlee import Glob, Request
+    from crawlee._autoscaling.concurrency_budget import ConcurrencyBudget
+    from crawlee._autoscaling.concurrency_controller import ConcurrencyController
     from crawlee._request import RequestOptions
     from crawlee.configuration import Configuration
     from crawlee.http_clients import HttpResponse
@@ -108,6 +110,10 @@ class ConcurrencySettings:
         max_concurrency: int = 100,
         max_tasks_per_minute: float = float('inf'),
         desired_concurrency: int = 10,
+        *,
+        task_batch_size: int = 1,
+        concurrency_controller: ConcurrencyController | None = None,
+        concurrency_budget: ConcurrencyBudget | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -119,6 +125,16 @@ class ConcurrencySettings:
                 to infinity, but you can pass any positive, non-zero number.
             desired_concurrency: The desired number of tasks that should be running parallel on the start of the pool,
                 if there is a large enough supply of them.
+            task_batch_size: The maximum number of tasks a single worker runs one after another before it returns
+                control to the pool. Larger batches reduce the scheduling overhead of short tasks, and crawlers fetch
+                this many requests from the request manager at once. Batching is not used together with
+                `max_tasks_per_minute`.
+            concurrency_controller: Decides how the desired concurrency changes according to the system load. By
+                default, it is changed in small steps based on whether the system is idle or overloaded. Controllers
+                keep state, so do not share one instance between crawlers running at the same time.
+            concurrency_budget: Splits the desired concurrency between groups of requests, such as requests to the
+                same domain, with a limit for each group and a fair share between them. By default, any request can
+                take any free task slot. Budgets keep state, so do not share one instance between crawlers.
         """
         if min_concurrency < 1:
             raise ValueError('min_concurrency must be 1 or larger')
@@ -135,10 +151,16 @@ class ConcurrencySettings:
         if max_tasks_per_minute <= 0:
             raise ValueError('max_tasks_per_minute must be positive')
 
+        if task_batch_size < 1:
+            raise ValueError('task_batch_size must be 1 or larger')
+
         self.min_concurrency = min_concurrency
         self.max_concurrency = max_concurrency
         self.desired_concurrency = desired_concurrency
         self.max_tasks_per_minute = max_tasks_per_minute
+        self.task_batch_size = task_batch_size
+        self.concurrency_controller = concurrency_controller
+        self.concurrency_budget = concurrency_budget
 
 
 class EnqueueLinksKwargs(TypedDict):
@@ -308,6 +330,31 @@ class RequestHandlerRunResult:
             )
         )
 
+    def get_batched_push_data_calls(self) -> list[PushDataFunctionCall]:
+        """Merge the tracked `push_data` calls that target the same dataset into a single call each.
+
+        The items keep the order in which they were pushed, so committing the merged calls stores the same data as
+        committing the calls one by one, with a single write per dataset.
+        """
+        batches = dict[tuple[str | None, str | None, str | None], PushDataFunctionCall]()
+
+        for call in self.push_data_calls:
+            key = (call['dataset_id'], call['dataset_name'], call['dataset_alias'])
+            data = call['data']
+            items = [data] if isinstance(data, Mapping) else list(data)
+
+            if key in batches:
+                cast('list', batches[key]['data']).extend(items)
+            else:
+                batches[key] = PushDataFunctionCall(
+                    data=items,
+                    dataset_id=call['dataset_id'],
+                    dataset_name=call['dataset_name'],
+                    dataset_alias=call['dataset_alias'],
+                )
+
+        return list(batches.values())
+
     async def get_key_value_store(
         self,
         *,
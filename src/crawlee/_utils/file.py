@@ -10,8 +10,10 @@ from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING, overload
 
+from crawlee._utils.free_threading import run_cpu_bound
+
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Mapping
+    from collections.abc import AsyncIterator, Mapping, Sequence
     from typing import Any, TextIO
 
     from typing_extensions import Unpack
@@ -130,7 +132,7 @@ async def json_dumps(obj: Any) -> str:
     Returns:
         A string containing the JSON representation of the input object.
     """
-    return await asyncio.to_thread(json.dumps, obj, ensure_ascii=False, indent=2, default=str)
+    return await run_cpu_bound(json.dumps, obj, ensure_ascii=False, indent=2, default=str)
 
 
 @overload
@@ -185,6 +187,35 @@ async def atomic_write(
         raise
 
 
+async def atomic_write_many(
+    files: Sequence[tuple[Path, str | bytes]],
+    *,
+    retry_count: int = 0,
+) -> None:
+    """Write multiple files atomically, in a single worker thread call.
+
+    Each file is written the same way as by `atomic_write`. Rewriting a file is harmless, so on a retry the whole
+    batch is written again.
+
+    Args:
+        files: Pairs of the destination path and the data to write to it.
+        retry_count: Internal parameter to track the number of retry attempts (default: 0).
+    """
+    max_retries = 3
+
+    def write_files() -> None:
+        for path, data in files:
+            _write_file(path, data)
+
+    try:
+        await asyncio.to_thread(write_files)
+    except (FileNotFoundError, PermissionError):
+        if retry_count < max_retries:
+            return await atomic_write_many(files, retry_count=retry_count + 1)
+        # If we reach the maximum number of retries, raise the exception.
+        raise
+
+
 async def export_json_to_stream(
     iterator: AsyncIterator[Mapping[str, JsonSerializable]],
     dst: TextIO,
@@ -194,6 +225,26 @@ async def export_json_to_stream(
     json.dump(items, dst, **kwargs)
 
 
+async def export_json_records_to_stream(
+    iterator: AsyncIterator[bytes],
+    dst: TextIO,
+) -> None:
+    """Write JSON records in the compact form of the standard library `json` module as a JSON array.
+
+    For such records, the output is the same as that of `export_json_to_stream` without kwargs. Records that are pure
+    ASCII are written as they are, the rest are re-encoded to escape non-ASCII characters, which is the default
+    behavior of `json.dump`.
+    """
+    dst.write('[')
+    first = True
+    async for record in iterator:
+        if not first:
+            dst.write(', ')
+        first = False
+        dst.write(record.decode('ascii') if record.isascii() else json.dumps(json.loads(record)))
+    dst.write(']')
+
+
 async def export_csv_to_stream(
     iterator: AsyncIterator[Mapping[str, JsonSerializable]],
     dst: TextIO,
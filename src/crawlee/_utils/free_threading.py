@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from crawlee.configuration import Configuration
+
+P = ParamSpec('P')
+T = TypeVar('T')
+
+
+def is_gil_enabled() -> bool:
+    """Check whether the interpreter runs with the GIL, which is the case everywhere except free-threaded builds."""
+    return getattr(sys, '_is_gil_enabled', lambda: True)()
+
+
+@dataclass
+class _FreeThreadingState:
+    enabled: bool
+    max_workers: int | None = None
+    executor: ThreadPoolExecutor | None = None
+
+
+# Without the GIL the CPU thread pool runs work in parallel, so the mode is on by default on free-threaded builds.
+_state = _FreeThreadingState(enabled=not is_gil_enabled())
+
+
+def configure_free_threading(*, enabled: bool | None = None, max_workers: int | None = None) -> None:
+    """Configure the free-threaded execution mode of the process.
+
+    In the free-threaded mode, the CPU-heavy stages of a crawl - parsing, JSON encoding and link filtering - run
+    in a thread pool sized to the number of CPUs. This only speeds things up on free-threaded (no-GIL) builds of
+    Python, on the other builds the threads take turns holding the GIL and the hand-offs cost more than they save.
+
+    Args:
+        enabled: Whether to enable the mode. If `None`, it is enabled when the interpreter runs without the GIL.
+        max_workers: The number of threads in the pool. Defaults to the number of CPUs.
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f'max_workers must be a positive integer, got {max_workers}')
+
+    _state.enabled = not is_gil_enabled() if enabled is None else enabled
+    _set_max_workers(max_workers)
+
+
+def apply_free_threading_configuration(configuration: Configuration) -> None:
+    """Apply the free-threading settings that are explicitly set in the configuration, see `configure_free_threading`.
+
+    The mode applies to the whole process, so the settings left at their defaults keep the current values instead of
+    overriding the ones applied by an earlier configuration or by a call to `configure_free_threading`.
+    """
+    fields_set = configuration.model_fields_set
+
+    if 'free_threading' in fields_set:
+        enabled = configuration.free_threading
+        _state.enabled = not is_gil_enabled() if enabled is None else enabled
+
+    if 'cpu_thread_pool_size' in fields_set:
+        _set_max_workers(configuration.cpu_thread_pool_size)
+
+
+def is_free_threading_enabled() -> bool:
+    """Check whether the free-threaded execution mode is enabled, see `configure_free_threading`."""
+    return _state.enabled
+
+
+async def run_cpu_bound(func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run a CPU-bound function outside of the event loop.
+
+    In the free-threaded mode, the function runs in the shared CPU thread pool, otherwise in the default executor
+    of the event loop, like with `asyncio.to_thread`. The context variables of the caller are propagated either way.
+    """
+    if not _state.enabled:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(_get_executor(), call)
+
+
+def _set_max_workers(max_workers: int | None) -> None:
+    if max_workers != _state.max_workers:
+        _state.max_workers = max_workers
+        if _state.executor is not None:
+            # Work already submitted finishes in the old pool, new work goes to a pool of the new size.
+            _state.executor.shutdown(wait=False)
+            _state.executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    if _state.executor is None:
+        _state.executor = ThreadPoolExecutor(
+            max_workers=_state.max_workers or os.cpu_count() or 1,
+            thread_name_prefix='crawlee_cpu',
+        )
+
+    return _state.executor
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+
+class LatencyHistogram:
+    """A fixed-size histogram of durations with a bounded relative error, in the style of HdrHistogram.
+
+    Durations are recorded in microseconds into log-linear buckets: every power of two is split into the same number
+    of linear sub-buckets, so each recorded value is off by less than 1/64 of its magnitude. Recording a value is O(1)
+    and the memory used does not depend on the number of recorded values. Durations above `max_value` are recorded
+    as `max_value`.
+    """
+
+    _SUB_BUCKET_BITS = 7
+    _SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+    _SUB_BUCKET_HALF_COUNT = _SUB_BUCKET_COUNT // 2
+
+    def __init__(self, max_value: timedelta = timedelta(hours=1)) -> None:
+        """Initialize a new instance.
+
+        Args:
+            max_value: The highest duration tracked by the histogram.
+        """
+        self._max_trackable = max(int(max_value / timedelta(microseconds=1)), self._SUB_BUCKET_COUNT)
+        self._counts = [0] * (self._get_index(self._max_trackable) + 1)
+        self._count = 0
+        self._total = 0
+        self._max = 0
+
+    @property
+    def count(self) -> int:
+        """The number of recorded durations."""
+        return self._count
+
+    @property
+    def total(self) -> timedelta:
+        """The sum of all recorded durations."""
+        return timedelta(microseconds=self._total)
+
+    @property
+    def max(self) -> timedelta:
+        """The longest recorded duration."""
+        return timedelta(microseconds=self._max)
+
+    @property
+    def mean(self) -> timedelta:
+        """The mean of the recorded durations."""
+        return timedelta(microseconds=self._total / self._count) if self._count else timedelta()
+
+    def record(self, seconds: float) -> None:
+        """Record a duration.
+
+        Args:
+            seconds: The duration in seconds. Negative durations are recorded as zero.
+        """
+        # This is called for every callback of a monitored event loop, so it avoids function calls where possible.
+        value = int(seconds * 1_000_000)
+        if value < 0:
+            value = 0
+        elif value > self._max_trackable:
+            value = self._max_trackable
+
+        if value < self._SUB_BUCKET_COUNT:
+            self._counts[value] += 1
+        else:
+            self._counts[self._get_index(value)] += 1
+
+        self._count += 1
+        self._total += value
+        if value > self._max:  # noqa: PLR1730
+            self._max = value
+
+    def get_percentile(self, percentile: float) -> timedelta:
+        """Return the duration below or at which the given percentage of the recorded durations lies.
+
+        Args:
+            percentile: The percentile, between 0 and 100.
+
+        Returns:
+            The highest duration equivalent to the bucket containing the percentile, or zero if nothing was recorded.
+        """
+        if not 0 <= percentile <= 100:  # noqa: PLR2004
+            raise ValueError('percentile must be between 0 and 100')
+
+        if not self._count:
+            return timedelta()
+
+        target = max(1, round(self._count * percentile / 100))
+        seen = 0
+
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return timedelta(microseconds=min(self._get_highest_equivalent_value(index), self._max))
+
+        return self.max
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add all durations recorded by another histogram with the same `max_value` to this one."""
+        if len(other._counts) != len(self._counts):
+            raise ValueError('Only histograms with the same max_value can be merged')
+
+        for index, count in enumerate(other._counts):
+            if count:
+                self._counts[index] += count
+
+        self._count += other._count
+        self._total += other._total
+        self._max = max(self._max, other._max)
+
+    def reset(self) -> None:
+        """Remove all recorded durations."""
+        self._counts = [0] * len(self._counts)
+        self._count = 0
+        self._total = 0
+        self._max = 0
+
+    def _get_index(self, value: int) -> int:
+        if value < self._SUB_BUCKET_COUNT:
+            return value
+
+        shift = value.bit_length() - self._SUB_BUCKET_BITS
+        return shift * self._SUB_BUCKET_HALF_COUNT + (value >> shift)
+
+    def _get_highest_equivalent_value(self, index: int) -> int:
+        if index < self._SUB_BUCKET_COUNT:
+            return index
+
+        shift = index // self._SUB_BUCKET_HALF_COUNT - 1
+        sub_bucket = index - shift * self._SUB_BUCKET_HALF_COUNT
+        return ((sub_bucket + 1) << shift) - 1
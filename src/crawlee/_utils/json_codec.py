@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from functools import cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+JsonCodecName = Literal['auto', 'json', 'orjson', 'msgspec']
+"""Names of the JSON codecs that can be selected with `Configuration.json_codec`."""
+
+
+class JsonCodec(ABC):
+    """Encoder and decoder of JSON documents used by the storage clients.
+
+    The codec works with UTF-8 encoded bytes, so the encoded documents can be written out without an extra `str`
+    encode step. Non-ASCII characters are not escaped and objects that are not JSON serializable are encoded as their
+    string representation, like `json.dumps(..., ensure_ascii=False, default=str)` does.
+    """
+
+    name: str
+    """The name of the codec."""
+
+    @abstractmethod
+    def encode(self, obj: Any, *, indent: bool = False) -> bytes:
+        """Encode an object to a UTF-8 encoded JSON document.
+
+        Args:
+            obj: The object to encode.
+            indent: Whether to pretty-print the document with an indentation of two spaces.
+
+        Returns:
+            The encoded document.
+        """
+
+    @abstractmethod
+    def decode(self, data: bytes | str) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data: The document to decode.
+
+        Returns:
+            The decoded object.
+
+        Raises:
+            ValueError: If the document is not valid JSON.
+        """
+
+    def encode_many(self, objs: Sequence[Any], *, indent: bool = False) -> list[bytes]:
+        """Encode multiple objects, see `encode`."""
+        return [self.encode(obj, indent=indent) for obj in objs]
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec based on the standard library `json` module, producing the default output of Crawlee."""
+
+    name = 'json'
+
+    def encode(self, obj: Any, *, indent: bool = False) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None, default=str).encode('utf-8')
+
+    def decode(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec based on the `orjson` package.
+
+    Dates, times, dataclasses and subclasses of the built-in types are passed to `str` like in the standard library
+    codec. The documents differ in the whitespace of the compact form, the exponent format of floats, plain enums
+    (encoded by their value) and non-finite floats (encoded as `null`). Objects `orjson` cannot encode at all, like
+    integers over 64 bits, are encoded by the standard library codec.
+    """
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson  # noqa: PLC0415
+
+        self._orjson = orjson
+        self._options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+        )
+        self._fallback = StdlibJsonCodec()
+
+    def encode(self, obj: Any, *, indent: bool = False) -> bytes:
+        options = self._options | self._orjson.OPT_INDENT_2 if indent else self._options
+        try:
+            return self._orjson.dumps(obj, default=str, option=options)
+        except self._orjson.JSONEncodeError:
+            return self._fallback.encode(obj, indent=indent)
+
+    def decode(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecJsonCodec(JsonCodec):
+    """JSON codec based on the `msgspec` package.
+
+    Unlike the standard library codec, `msgspec` encodes dates and times in the RFC 3339 format (with a `T` separator)
+    and enums by their value. Pretty-printing costs an extra formatting pass.
+    """
+
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        import msgspec  # noqa: PLC0415
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder(enc_hook=str)
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: Any, *, indent: bool = False) -> bytes:
+        data = self._encoder.encode(obj)
+        return self._msgspec.json.format(data, indent=2) if indent else data
+
+    def decode(self, data: bytes | str) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+
+_CODECS: dict[str, type[JsonCodec]] = {
+    'orjson': OrjsonCodec,
+    'msgspec': MsgspecJsonCodec,
+    'json': StdlibJsonCodec,
+}
+
+
+def get_json_codec(name: JsonCodecName = 'json') -> JsonCodec:
+    """Get the shared instance of a JSON codec.
+
+    Args:
+        name: The name of the codec. With `'auto'`, the fastest installed codec is used, falling back to the standard
+            library `json` module.
+
+    Returns:
+        The codec instance.
+
+    Raises:
+        ImportError: If the package of an explicitly requested codec is not installed.
+    """
+    if name == 'auto':
+        name = next(codec_name for codec_name in _CODECS if codec_name == 'json' or find_spec(codec_name) is not None)
+
+    if name not in _CODECS:
+        raise ValueError(f'Unknown JSON codec {name!r}, expected one of: auto, {", ".join(_CODECS)}')
+
+    return _create_json_codec(name)
+
+
+@cache
+def _create_json_codec(name: str) -> JsonCodec:
+    try:
+        return _CODECS[name]()
+    except ImportError as exc:
+        raise ImportError(
+            f'The {name!r} JSON codec requires the {name!r} package, install it with `pip install {name}`.'
+        ) from exc
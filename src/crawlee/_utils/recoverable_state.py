@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generic, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 
 from pydantic import BaseModel
 
+from crawlee._utils.crypto import crypto_random_object_id
 from crawlee._utils.raise_if_too_many_kwargs import raise_if_too_many_kwargs
 from crawlee.events._types import Event, EventPersistStateData
 
@@ -15,6 +16,9 @@ if TYPE_CHECKING:
 
 TStateModel = TypeVar('TStateModel', bound=BaseModel)
 
+_JOURNAL_GENERATION_KEY = '__journalGeneration__'
+"""The key of the snapshot record under which the generation of its journal is stored."""
+
 
 class RecoverableState(Generic[TStateModel]):
     """A class for managing persistent recoverable state using a Pydantic model.
@@ -26,6 +30,12 @@ class RecoverableState(Generic[TStateModel]):
     The state is represented by a Pydantic model that can be serialized to and deserialized from JSON.
     The class automatically hooks into the event system to persist state when needed.
 
+    By default, the whole state is written on every persist. With incremental persistence, the owner of the state
+    reports the changed fields, and the changed keys of dictionary and set fields, with `mark_dirty`. A persist then
+    writes only the changes, as a new journal record next to the last full snapshot of the state, and writes a new
+    snapshot once the journal grows too long. Loading the state replays the journal on top of the snapshot. Changes
+    that are not reported with `mark_dirty` are only persisted with the next snapshot.
+
     Type Parameters:
         TStateModel: A Pydantic BaseModel type that defines the structure of the state data.
                      Typically, it should be inferred from the `default_state` constructor parameter.
@@ -41,6 +51,8 @@ class RecoverableState(Generic[TStateModel]):
         persist_state_kvs_id: str | None = None,
         persist_state_kvs_factory: Callable[[], Coroutine[None, None, KeyValueStore]] | None = None,
         logger: logging.Logger,
+        incremental_persistence: bool = False,
+        max_journal_entries: int = 100,
     ) -> None:
         """Initialize a new recoverable state object.
 
@@ -57,6 +69,9 @@ class RecoverableState(Generic[TStateModel]):
             persist_state_kvs_factory: Factory that can be awaited to create KeyValueStore to use for persistence. If
                 not provided, a system-wide KeyValueStore will be used, based on service locator configuration.
             logger: A logger instance for logging operations related to state persistence
+            incremental_persistence: Persist only the changes reported with `mark_dirty`, instead of the whole state.
+            max_journal_entries: The number of incremental persists after which the whole state is written again
+                and the journal is dropped.
         """
         raise_if_too_many_kwargs(
             persist_state_kvs_name=persist_state_kvs_name,
@@ -90,6 +105,17 @@ class RecoverableState(Generic[TStateModel]):
         self._key_value_store: KeyValueStore | None = None
         self._log = logger
 
+        self._incremental_persistence = incremental_persistence and persistence_enabled is not False
+        self._max_journal_entries = max_journal_entries
+
+        # The journal belongs to the snapshot with the same generation, `None` until a snapshot with a journal exists.
+        self._journal_generation: str | None = None
+        self._journal_length = 0
+
+        # Changes made since the last persist, whole fields and keys of dictionary and set fields.
+        self._dirty_fields = set[str]()
+        self._dirty_keys = dict[str, set[str]]()
+
     async def initialize(self) -> TStateModel:
         """Initialize the recoverable state.
 
@@ -171,6 +197,25 @@ class RecoverableState(Generic[TStateModel]):
                 raise RuntimeError('Recoverable state has not yet been initialized')
 
             await self._key_value_store.set_value(self._persist_state_key, None)
+            await self._drop_journal()
+
+    def mark_dirty(self, field: str, *keys: str) -> None:
+        """Report a change of the state, to be written by the next incremental persist.
+
+        Does nothing unless incremental persistence is enabled.
+
+        Args:
+            field: The name of the changed field of the state model.
+            keys: The added, changed or removed keys of a dictionary or set field. If none are given, the whole field
+                is written.
+        """
+        if not self._incremental_persistence:
+            return
+
+        if keys:
+            self._dirty_keys.setdefault(field, set()).update(keys)
+        else:
+            self._dirty_fields.add(field)
 
     async def persist_state(self, event_data: EventPersistStateData | None = None) -> None:
         """Persist the current state to the KeyValueStore.
@@ -189,11 +234,16 @@ class RecoverableState(Generic[TStateModel]):
             raise RuntimeError('Recoverable state has not yet been initialized')
 
         if self._persistence_enabled is True or self._persistence_enabled == 'explicit_only':
-            await self._key_value_store.set_value(
-                self._persist_state_key,
-                self._state.model_dump(mode='json', by_alias=True),
-                'application/json',
-            )
+            if not self._incremental_persistence:
+                await self._key_value_store.set_value(
+                    self._persist_state_key,
+                    self._state.model_dump(mode='json', by_alias=True),
+                    'application/json',
+                )
+            elif self._journal_generation is None or self._journal_length >= self._max_journal_entries:
+                await self._persist_snapshot()
+            else:
+                await self._persist_changes()
         else:
             self._log.debug('Persistence is not enabled - not doing anything')
 
@@ -204,5 +254,124 @@ class RecoverableState(Generic[TStateModel]):
         stored_state = await self._key_value_store.get_value(self._persist_state_key)
         if stored_state is None:
             self._state = self._default_state.model_copy(deep=True)
-        else:
-            self._state = self._state_type.model_validate(stored_state)
+            return
+
+        generation = stored_state.pop(_JOURNAL_GENERATION_KEY, None) if isinstance(stored_state, dict) else None
+        self._state = self._state_type.model_validate(stored_state)
+
+        # Snapshots written without incremental persistence have no journal.
+        if generation is None:
+            return
+
+        self._journal_generation = generation
+        self._journal_length = 0
+        while (entry := await self._key_value_store.get_value(self._get_journal_key(self._journal_length))) is not None:
+            self._apply_journal_entry(entry)
+            self._journal_length += 1
+
+    async def _persist_snapshot(self) -> None:
+        """Write the whole state as a snapshot with a new, empty journal and drop the previous journal."""
+        if self._key_value_store is None or self._state is None:
+            raise RuntimeError('Recoverable state has not yet been initialized')
+
+        snapshot = self._state.model_dump(mode='json', by_alias=True)
+        self._dirty_fields.clear()
+        self._dirty_keys.clear()
+
+        # The previous journal is dropped only after the new snapshot is written. If that fails, the previous
+        # journal is left behind, but it is never replayed, because it belongs to a different generation.
+        previous_generation, previous_length = self._journal_generation, self._journal_length
+        generation = crypto_random_object_id()
+        snapshot[_JOURNAL_GENERATION_KEY] = generation
+        await self._key_value_store.set_value(self._persist_state_key, snapshot, 'application/json')
+
+        self._journal_generation, self._journal_length = generation, 0
+        for index in range(previous_length):
+            await self._key_value_store.delete_value(self._get_journal_key(index, previous_generation))
+
+    async def _persist_changes(self) -> None:
+        """Append the changes made since the last persist to the journal."""
+        if self._key_value_store is None or self._state is None:
+            raise RuntimeError('Recoverable state has not yet been initialized')
+
+        if not self._dirty_fields and not self._dirty_keys:
+            return
+
+        entry = self._dump_changes(self._state)
+        self._dirty_fields.clear()
+        self._dirty_keys.clear()
+
+        await self._key_value_store.set_value(self._get_journal_key(self._journal_length), entry, 'application/json')
+        self._journal_length += 1
+
+    def _dump_changes(self, state: TStateModel) -> dict[str, Any]:
+        """Serialize the dirty fields and keys of the state to a journal entry."""
+        entry: dict[str, Any] = {}
+
+        if self._dirty_fields:
+            dumped = state.model_dump(mode='json', by_alias=True, include=self._dirty_fields)
+            entry['replace'] = dict(zip(self._get_field_names(dumped), dumped.values(), strict=True))
+
+        updated = dict[str, Any]()
+        deleted = dict[str, list[str]]()
+        for field, keys in self._dirty_keys.items():
+            if field in self._dirty_fields:
+                continue
+            value = getattr(state, field)
+            present = {key for key in keys if key in value}
+            updated[field] = {key: value[key] for key in present} if isinstance(value, dict) else present
+            if removed := keys - present:
+                deleted[field] = sorted(removed)
+
+        if updated:
+            # Only the changed keys are serialized, through a shallow copy of the state with the fields narrowed down.
+            dumped = state.model_copy(update=updated).model_dump(mode='json', by_alias=True, include=set(updated))
+            entry['update'] = dict(zip(self._get_field_names(dumped), dumped.values(), strict=True))
+        if deleted:
+            entry['delete'] = deleted
+
+        return entry
+
+    def _apply_journal_entry(self, entry: dict[str, Any]) -> None:
+        """Apply the changes from a journal entry to the loaded state."""
+        state = self.current_value
+        validator = self._state_type.__pydantic_validator__
+
+        for field, value in entry.get('replace', {}).items():
+            validator.validate_assignment(state, field, value)
+
+        for field, value in entry.get('update', {}).items():
+            # Validate the changed keys on a shallow copy, so they are converted the same way as the whole field.
+            changes = state.model_copy()
+            validator.validate_assignment(changes, field, value)
+            getattr(state, field).update(getattr(changes, field))
+
+        for field, keys in entry.get('delete', {}).items():
+            value = getattr(state, field)
+            for key in keys:
+                if isinstance(value, dict):
+                    value.pop(key, None)
+                else:
+                    value.discard(key)
+
+    def _get_field_names(self, dumped: dict[str, Any]) -> list[str]:
+        """Map the serialization aliases of a dumped subset of the state fields back to the field names."""
+        aliases = {
+            (field_info.serialization_alias or field_info.alias or name): name
+            for name, field_info in self._state_type.model_fields.items()
+        }
+        return [aliases[alias] for alias in dumped]
+
+    async def _drop_journal(self) -> None:
+        """Delete the journal of the current snapshot and forget the changes that were not persisted yet."""
+        if self._key_value_store is not None and self._journal_generation is not None:
+            for index in range(self._journal_length):
+                await self._key_value_store.delete_value(self._get_journal_key(index))
+
+        self._journal_generation = None
+        self._journal_length = 0
+        self._dirty_fields.clear()
+        self._dirty_keys.clear()
+
+    def _get_journal_key(self, index: int, generation: str | None = None) -> str:
+        return f'{self._persist_state_key}_JOURNAL_{generation or self._journal_generation}_{index}'
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from crawlee._request import TRUSTED_RECORD_CONTEXT_KEY, Request
+from crawlee._utils.json_codec import get_json_codec
+
+if TYPE_CHECKING:
+    from crawlee._utils.json_codec import JsonCodec
+
+REQUEST_RECORD_VERSION = 1
+"""Version of the compact request record format, stored as the first element of every record."""
+
+_FIELDS = (
+    'unique_key',
+    'url',
+    'method',
+    'payload',
+    'headers',
+    'user_data',
+    'retry_count',
+    'no_retry',
+    'loaded_url',
+    'handled_at',
+)
+"""Fields of the `Request` in the order of their position in the compact record."""
+
+_UNIQUE_KEY_POSITION = 1 + _FIELDS.index('unique_key')
+_HANDLED_AT_POSITION = 1 + _FIELDS.index('handled_at')
+
+_TRUSTED_CONTEXT = {TRUSTED_RECORD_CONTEXT_KEY: True}
+
+
+def encode_request(request: Request, json_codec: JsonCodec | None = None) -> bytes:
+    """Encode a request to a compact record.
+
+    The record is a JSON array with the format version followed by the values of the request fields in a fixed order,
+    so the field names are not repeated in every record. Records produced by this function can be loaded back with
+    `decode_request` without validating the URLs again.
+
+    Args:
+        request: The request to encode.
+        json_codec: The codec used to encode the record, the standard library one by default.
+
+    Returns:
+        The UTF-8 encoded record.
+    """
+    data = request.model_dump(mode='json')
+    record = [REQUEST_RECORD_VERSION, *(data[field] for field in _FIELDS)]
+    return (json_codec or get_json_codec()).encode(record)
+
+
+def decode_request(data: bytes | str, json_codec: JsonCodec | None = None) -> Request:
+    """Decode a request from a compact record or from the JSON representation of the `Request` model.
+
+    The data is expected to be written by Crawlee from already validated requests, either by `encode_request` or as
+    the JSON representation of the model by earlier versions, so the URLs in it are not validated again.
+
+    Args:
+        data: The record to decode.
+        json_codec: The codec used to decode the record, the standard library one by default.
+
+    Returns:
+        The decoded request.
+
+    Raises:
+        ValueError: If the record is not valid.
+    """
+    if not _is_compact_record(data):
+        return Request.model_validate_json(data, context=_TRUSTED_CONTEXT)
+
+    record = (json_codec or get_json_codec()).decode(data)
+    return _validate_record(record)
+
+
+def decode_request_summary(data: bytes | str, json_codec: JsonCodec | None = None) -> tuple[str, bool]:
+    """Read the unique key and the handled flag of an encoded request without constructing the `Request`.
+
+    Args:
+        data: The record to read, see `decode_request`.
+        json_codec: The codec used to decode the record, the standard library one by default.
+
+    Returns:
+        The unique key of the request and whether the request is handled.
+
+    Raises:
+        ValueError: If the record is not valid.
+    """
+    decoded = (json_codec or get_json_codec()).decode(data)
+
+    try:
+        if isinstance(decoded, list):
+            _check_version(decoded)
+            return decoded[_UNIQUE_KEY_POSITION], decoded[_HANDLED_AT_POSITION] is not None
+        return decoded['unique_key'], decoded['handled_at'] is not None
+    except (KeyError, IndexError, TypeError) as exc:
+        raise ValueError(f'Invalid request record: {exc!s}') from exc
+
+
+def _is_compact_record(data: bytes | str) -> bool:
+    return data[:1] in (b'[', '[')
+
+
+def _check_version(record: list[Any]) -> None:
+    if not record or record[0] != REQUEST_RECORD_VERSION:
+        raise ValueError(f'Unsupported request record version: {record[0] if record else None!r}')
+
+
+def _validate_record(record: Any) -> Request:
+    if not isinstance(record, list) or len(record) != len(_FIELDS) + 1:
+        raise ValueError('Invalid request record: unexpected number of fields')
+    _check_version(record)
+
+    return Request.model_validate(
+        dict(zip(_FIELDS, record[1:], strict=True)),
+        context=_TRUSTED_CONTEXT,
+    )
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+
+from typing_extensions import override
+
+
+class WorkSignal:
+    """Notification primitive through which producers of work wake up the consumers waiting for it.
+
+    Producers call `notify` whenever the amount of pending work changes in a way consumers should react to, for example
+    when new requests are added to a request queue. Consumers read `generation` before they check for work and then
+    `wait` for a newer notification, so that a notification sent between the check and the wait is never lost.
+    """
+
+    def __init__(self) -> None:
+        self._generation = 0
+        self._waiters = set[asyncio.Future[None]]()
+
+    @property
+    def generation(self) -> int:
+        """The number of notifications sent so far."""
+        return self._generation
+
+    def notify(self) -> None:
+        """Wake up all consumers currently waiting for a notification."""
+        self._generation += 1
+
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        self._waiters.clear()
+
+    async def wait(self, generation: int) -> None:
+        """Wait until a notification newer than `generation` is sent.
+
+        Args:
+            generation: The value of `generation` read by the consumer when it last checked for work.
+        """
+        if self._generation != generation:
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.add(waiter)
+
+        try:
+            await waiter
+        finally:
+            self._waiters.discard(waiter)
+
+
+class CombinedWorkSignal(WorkSignal):
+    """A work signal that is notified whenever any of the signals it combines is notified, or when notified directly.
+
+    It lets consumers wait for new work from several producers, e.g. both parts of a `RequestManagerTandem`.
+    """
+
+    def __init__(self, *signals: WorkSignal) -> None:
+        super().__init__()
+        self._signals = signals
+
+    @property
+    @override
+    def generation(self) -> int:
+        # All the generations only grow, so their sum changes whenever any of the signals is notified.
+        return super().generation + sum(signal.generation for signal in self._signals)
+
+    @override
+    async def wait(self, generation: int) -> None:
+        if self.generation != generation:
+            return
+
+        waiters = [
+            asyncio.create_task(super().wait(super().generation)),
+            *(asyncio.create_task(signal.wait(signal.generation)) for signal in self._signals),
+        ]
+
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
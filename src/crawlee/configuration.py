@@ -8,6 +8,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from crawlee._types import LogLevel
 from crawlee._utils.docs import docs_group
+from crawlee._utils.json_codec import JsonCodecName
 from crawlee._utils.models import timedelta_ms
 
 if TYPE_CHECKING:
@@ -151,6 +152,18 @@ class Configuration(BaseSettings):
     """The maximum event loop delay. If the event loop delay exceeds this value, it is considered overloaded.
     This option is used by the `Snapshotter`."""
 
+    event_loop_monitoring: Annotated[
+        bool,
+        Field(
+            validation_alias=AliasChoices(
+                'crawlee_event_loop_monitoring',
+            )
+        ),
+    ] = False
+    """Whether to instrument the event loop with an `EventLoopMonitor`, which measures the lag of every callback and
+    attributes callbacks that block the loop for longer than `max_event_loop_delay` to the code that ran them.
+    This option is used by the `Snapshotter`."""
+
     max_client_errors: Annotated[
         int,
         Field(
@@ -216,6 +229,23 @@ class Configuration(BaseSettings):
     https://playwright.dev/docs/api/class-browsertype#browser-type-launch.
     """
 
+    json_codec: Annotated[JsonCodecName, Field(alias='crawlee_json_codec')] = 'json'
+    """The JSON codec used by the storage clients to encode and decode dataset items, key-value store values and
+    request queue records. Options are `'json'` (the standard library, default), `'orjson'`, `'msgspec'` and
+    `'auto'`, which picks the fastest installed codec. The `orjson` and `msgspec` packages are not installed
+    with Crawlee and need to be installed separately."""
+
+    free_threading: Annotated[bool | None, Field(alias='crawlee_free_threading')] = None
+    """Whether to run the CPU-heavy stages of a crawl - parsing, JSON encoding and link filtering - in a thread pool
+    sized to the number of CPUs, where they run in parallel on free-threaded (no-GIL) builds of Python. If `None`,
+    the mode is enabled when the interpreter runs without the GIL. The setting applies to the whole process and is
+    applied when a crawler is created, but only if it is set explicitly, so a crawler with the default configuration
+    keeps the mode configured earlier in the process."""
+
+    cpu_thread_pool_size: Annotated[int | None, Field(alias='crawlee_cpu_thread_pool_size', ge=1)] = None
+    """The number of threads used for the CPU-heavy stages in the free-threaded mode. Defaults to the number
+    of CPUs. Like `free_threading`, it applies to the whole process and only if it is set explicitly."""
+
     @classmethod
     def get_global_configuration(cls) -> Self:
         """Retrieve the global instance of the configuration.
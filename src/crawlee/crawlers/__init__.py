@@ -1,10 +1,18 @@
 from crawlee._utils.try_import import install_import_hook as _install_import_hook
 from crawlee._utils.try_import import try_import as _try_import
 
-from ._abstract_http import AbstractHttpCrawler, AbstractHttpParser, HttpCrawlerOptions, ParsedHttpCrawlingContext
+from ._abstract_http import (
+    AbstractHttpCrawler,
+    AbstractHttpParser,
+    HttpCrawlerOptions,
+    ParsedHttpCrawlingContext,
+    ProcessPoolParser,
+    ProcessPoolParseResult,
+)
 from ._basic import BasicCrawler, BasicCrawlerOptions, BasicCrawlingContext, ContextPipeline
 from ._file_download import FileDownloadCrawler, FileDownloadCrawlingContext
 from ._http import HttpCrawler, HttpCrawlingContext, HttpCrawlingResult
+from ._multiprocess import MultiprocessCrawlerRunner
 
 _install_import_hook(__name__)
 
@@ -120,6 +128,7 @@ __all__ = [
     'HttpCrawlerOptions',
     'HttpCrawlingContext',
     'HttpCrawlingResult',
+    'MultiprocessCrawlerRunner',
     'ParsedHttpCrawlingContext',
     'ParselCrawler',
     'ParselCrawlingContext',
@@ -127,6 +136,8 @@ __all__ = [
     'PlaywrightCrawlingContext',
     'PlaywrightPostNavCrawlingContext',
     'PlaywrightPreNavCrawlingContext',
+    'ProcessPoolParseResult',
+    'ProcessPoolParser',
     'PydanticAiCleanHtmlDistiller',
     'PydanticAiCrawler',
     'PydanticAiCrawlingContext',
@@ -1,10 +1,13 @@
 from ._abstract_http_crawler import AbstractHttpCrawler, HttpCrawlerOptions
 from ._abstract_http_parser import AbstractHttpParser
 from ._http_crawling_context import ParsedHttpCrawlingContext
+from ._process_pool_parser import ProcessPoolParser, ProcessPoolParseResult
 
 __all__ = [
     'AbstractHttpCrawler',
     'AbstractHttpParser',
     'HttpCrawlerOptions',
     'ParsedHttpCrawlingContext',
+    'ProcessPoolParseResult',
+    'ProcessPoolParser',
 ]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from abc import ABC
+from contextlib import AbstractAsyncContextManager
 from datetime import timedelta
 from typing import TYPE_CHECKING, Generic
 
@@ -12,7 +13,8 @@ from typing_extensions import NotRequired, TypeVar
 
 from crawlee._request import Request, RequestOptions, RequestState
 from crawlee._utils.docs import docs_group
-from crawlee._utils.time import SharedTimeout
+from crawlee._utils.free_threading import is_free_threading_enabled, run_cpu_bound
+from crawlee._utils.time import SharedTimeout, measure_time
 from crawlee._utils.urls import to_absolute_url_iterator
 from crawlee.crawlers._basic import BasicCrawler, BasicCrawlerOptions, ContextPipeline
 from crawlee.errors import SessionError
@@ -86,6 +88,10 @@ class AbstractHttpCrawler(
                 'AbstractHttpCrawler._create_static_content_crawler_pipeline() method to initialize it.'
             )
 
+        # Parsers holding resources, such as the worker processes of a `ProcessPoolParser`, live as long as a run.
+        if isinstance(parser, AbstractAsyncContextManager):
+            kwargs['_additional_context_managers'] = [*kwargs.get('_additional_context_managers', []), parser]
+
         kwargs.setdefault('_logger', logging.getLogger(self.__class__.__name__))
         super().__init__(**kwargs)
 
@@ -214,25 +220,32 @@ class AbstractHttpCrawler(
             kwargs.setdefault('strategy', 'same-hostname')
             strategy = kwargs.get('strategy', 'same-hostname')
 
-            links_iterator: Iterator[str] = iter(
-                self._parser.find_links(parsed_content, selector=selector, attribute=attribute)
-            )
+            def filter_links() -> tuple[list[str], list[str]]:
+                links_iterator: Iterator[str] = iter(
+                    self._parser.find_links(parsed_content, selector=selector, attribute=attribute)
+                )
 
-            # Get base URL from <base> tag if present
-            extracted_base_urls = list(self._parser.find_links(parsed_content, 'base[href]', 'href'))
-            base_url: str = (
-                str(extracted_base_urls[0])
-                if extracted_base_urls
-                else context.request.loaded_url or context.request.url
-            )
-            links_iterator = to_absolute_url_iterator(base_url, links_iterator, logger=context.log)
+                # Get base URL from <base> tag if present
+                extracted_base_urls = list(self._parser.find_links(parsed_content, 'base[href]', 'href'))
+                base_url: str = (
+                    str(extracted_base_urls[0])
+                    if extracted_base_urls
+                    else context.request.loaded_url or context.request.url
+                )
+                links_iterator = to_absolute_url_iterator(base_url, links_iterator, logger=context.log)
 
-            if robots_txt_file:
-                skipped, links_iterator = partition(robots_txt_file.is_allowed, links_iterator)
-            else:
-                skipped = iter([])
+                if robots_txt_file:
+                    skipped, links_iterator = partition(robots_txt_file.is_allowed, links_iterator)
+                else:
+                    skipped = iter([])
 
-            for url in self._enqueue_links_filter_iterator(links_iterator, context.request.url, **kwargs):
+                urls = list(self._enqueue_links_filter_iterator(links_iterator, context.request.url, **kwargs))
+                return urls, list(skipped)
+
+            # Resolving and filtering thousands of links is CPU-bound, in the free-threaded mode it leaves the loop.
+            urls, skipped = await run_cpu_bound(filter_links) if is_free_threading_enabled() else filter_links()
+
+            for url in urls:
                 request_options = RequestOptions(
                     url=url, user_data={**base_user_data}, label=label, enqueue_strategy=strategy
                 )
@@ -274,15 +287,17 @@ class AbstractHttpCrawler(
         Yields:
             The original crawling context enhanced by HTTP response.
         """
-        async with self._shared_navigation_timeouts[id(context.request)] as remaining_timeout:
-            result = await self._http_client.crawl(
-                request=context.request,
-                session=context.session,
-                proxy_info=context.proxy_info,
-                statistics=self._statistics,
-                timeout=remaining_timeout,
-            )
+        with measure_time() as timer:
+            async with self._shared_navigation_timeouts[id(context.request)] as remaining_timeout:
+                result = await self._http_client.crawl(
+                    request=context.request,
+                    session=context.session,
+                    proxy_info=context.proxy_info,
+                    statistics=self._statistics,
+                    timeout=remaining_timeout,
+                )
 
+        self._record_proxy_latency(context, timedelta(seconds=timer.wall or 0))
         context.request.state = RequestState.AFTER_NAV
         yield HttpCrawlingContext.from_basic_crawling_context(context=context, http_response=result.http_response)
 
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Generic, Literal
+
+from typing_extensions import override
+
+from crawlee import HttpHeaders
+from crawlee._utils.docs import docs_group
+from crawlee.crawlers._types import BlockedInfo
+
+from ._abstract_http_parser import AbstractHttpParser
+from ._http_crawling_context import TParseResult
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Iterable, Mapping, Sequence
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from crawlee.http_clients import HttpResponse
+
+
+@dataclass(frozen=True)
+@docs_group('HTTP parsers')
+class ProcessPoolParseResult:
+    """The compact result of parsing a document in a worker process of a `ProcessPoolParser`."""
+
+    links: Mapping[tuple[str, str], Sequence[str]]
+    """Links found in the document by selector and attribute, for every pair in `link_selectors` of the parser."""
+
+    matched_selectors: frozenset[str]
+    """The selectors out of `match_selectors` of the parser that match an element of the document."""
+
+    blocked_reason: str
+    """The reason why the document looks like a blocked response, or an empty string if it does not."""
+
+    extracted: Mapping[str, Any] = field(default_factory=dict)
+    """The values returned by the `extractors` of the parser, by the name of the extractor."""
+
+
+@dataclass(frozen=True)
+class _BufferedHttpResponse:
+    """An `HttpResponse` with the content already read, which can be sent to the worker processes."""
+
+    http_version: str
+    status_code: int
+    headers: HttpHeaders
+    _content: bytes
+
+    async def read(self) -> bytes:
+        return self._content
+
+    async def read_stream(self) -> AsyncGenerator[bytes, None]:
+        yield self._content
+
+
+@dataclass(frozen=True)
+class _WorkerConfig(Generic[TParseResult]):
+    parser: AbstractHttpParser[TParseResult, Any]
+    link_selectors: tuple[tuple[str, str], ...]
+    match_selectors: tuple[str, ...]
+    extractors: Mapping[str, Callable[[TParseResult], Any]]
+
+
+@dataclass
+class _WorkerState:
+    config: _WorkerConfig | None = None
+    loop: asyncio.AbstractEventLoop | None = None
+
+
+_worker_state = _WorkerState()
+"""The configuration of the parser in the current worker process, set when the process starts."""
+
+
+def _initialize_worker(config: _WorkerConfig) -> None:
+    _worker_state.config = config
+    # The parsers are asynchronous, a single event loop serves all the documents the worker parses.
+    _worker_state.loop = asyncio.new_event_loop()
+
+
+def _parse_in_worker(response: _BufferedHttpResponse) -> ProcessPoolParseResult:
+    config, loop = _worker_state.config, _worker_state.loop
+    if config is None or loop is None:
+        raise RuntimeError('The parsing worker process was not initialized.')
+
+    parser = config.parser
+    parsed_content = loop.run_until_complete(parser.parse(response))
+
+    return ProcessPoolParseResult(
+        links={
+            (selector, attribute): list(parser.find_links(parsed_content, selector, attribute))
+            for selector, attribute in config.link_selectors
+        },
+        matched_selectors=frozenset(
+            selector for selector in config.match_selectors if parser.is_matching_selector(parsed_content, selector)
+        ),
+        blocked_reason=parser.is_blocked(parsed_content).reason,
+        extracted={name: extractor(parsed_content) for name, extractor in config.extractors.items()},
+    )
+
+
+@docs_group('HTTP parsers')
+class ProcessPoolParser(AbstractHttpParser[ProcessPoolParseResult, object], Generic[TParseResult]):
+    """Parser that parses HTTP responses with another parser in a pool of worker processes.
+
+    Parsers such as `BeautifulSoupParser` or `ParselParser` build the document tree in a thread, where it still
+    competes for the GIL with the event loop, so at high concurrency the parsing slows down the whole crawler.
+    This parser sends the response body to a worker process instead, where the wrapped parser builds the tree and
+    everything the crawler needs from it is computed right away - the links for `enqueue_links`, the blocking
+    detection and the values of user defined `extractors`. Only these compact results are sent back and the tree
+    is discarded, so the crawling context holds a `ProcessPoolParseResult` rather than the parsed document.
+
+    Links can only be extracted with the selector and attribute pairs given in `link_selectors`, and
+    `is_matching_selector` only answers for the selectors in `match_selectors`. Selecting elements in the request
+    handler is not supported, use the `extractors` instead. The wrapped parser and the extractors are sent to the
+    worker processes, so they have to be picklable, e.g. functions defined at the module level.
+
+    The worker processes are started when the crawler starts and stopped when it finishes, or on the first parsed
+    response if the parser is used on its own. If a worker process dies, e.g. when it runs out of memory, the responses
+    being parsed at the time fail with `BrokenProcessPool` and the pool is replaced by a new one for the next ones.
+
+    ### Usage
+
+    ```python
+    from parsel import Selector
+
+    from crawlee.crawlers import (
+        AbstractHttpCrawler,
+        ParsedHttpCrawlingContext,
+        ProcessPoolParser,
+        ProcessPoolParseResult,
+    )
+    from crawlee.crawlers._parsel._parsel_parser import ParselParser
+
+
+    def get_title(selector: Selector) -> str | None:
+        return selector.css('title::text').get()
+
+
+    parser = ProcessPoolParser(ParselParser(), extractors={'title': get_title}, max_workers=4)
+    crawler = AbstractHttpCrawler.create_parsed_http_crawler_class(static_parser=parser)()
+
+
+    @crawler.router.default_handler
+    async def handler(context: ParsedHttpCrawlingContext[ProcessPoolParseResult]) -> None:
+        await context.push_data({'url': context.request.url, 'title': context.parsed_content.extracted['title']})
+        await context.enqueue_links()
+    ```
+    """
+
+    def __init__(
+        self,
+        parser: AbstractHttpParser[TParseResult, Any],
+        *,
+        extractors: Mapping[str, Callable[[TParseResult], Any]] | None = None,
+        link_selectors: Sequence[tuple[str, str]] = (('a', 'href'),),
+        match_selectors: Sequence[str] = (),
+        max_workers: int | None = None,
+        start_method: Literal['spawn', 'forkserver', 'fork'] = 'spawn',
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            parser: The parser used in the worker processes.
+            extractors: Functions computing values from the parsed document, by name. The values are available
+                in `ProcessPoolParseResult.extracted` and have to be picklable.
+            link_selectors: The selector and attribute pairs links can be extracted with, e.g. by `enqueue_links`.
+                The `<base>` element is always looked up, since `enqueue_links` needs it to resolve relative links.
+            match_selectors: The selectors `is_matching_selector` can be called with.
+            max_workers: The number of worker processes. Defaults to the number of CPUs.
+            start_method: The method used to start the worker processes, see the `multiprocessing` module.
+        """
+        link_selectors = tuple(link_selectors)
+        if ('base[href]', 'href') not in link_selectors:
+            link_selectors = (*link_selectors, ('base[href]', 'href'))
+
+        self._config = _WorkerConfig(
+            parser=parser,
+            link_selectors=link_selectors,
+            match_selectors=tuple(match_selectors),
+            extractors=dict(extractors or {}),
+        )
+        self._max_workers = max_workers
+        self._mp_context = multiprocessing.get_context(start_method)
+        self._executor: ProcessPoolExecutor | None = None
+
+        # Flag to indicate the context state.
+        self._active = False
+
+    @property
+    def active(self) -> bool:
+        """Indicate whether the context is active."""
+        return self._active
+
+    async def __aenter__(self) -> Self:
+        """Start the worker processes.
+
+        Raises:
+            RuntimeError: If the context manager is already active.
+        """
+        if self._active:
+            raise RuntimeError(f'The {self.__class__.__name__} is already active.')
+
+        self._get_executor()
+        self._active = True
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        """Stop the worker processes.
+
+        Raises:
+            RuntimeError: If the context manager is not active.
+        """
+        if not self._active:
+            raise RuntimeError(f'The {self.__class__.__name__} is not active.')
+
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+        self._active = False
+
+    @override
+    async def parse(self, response: HttpResponse) -> ProcessPoolParseResult:
+        buffered_response = _BufferedHttpResponse(
+            http_version=response.http_version,
+            status_code=response.status_code,
+            headers=response.headers,
+            _content=await response.read(),
+        )
+        return await self._parse_in_pool(buffered_response)
+
+    @override
+    async def parse_text(self, text: str) -> ProcessPoolParseResult:
+        buffered_response = _BufferedHttpResponse(
+            http_version='HTTP/1.1',
+            status_code=200,
+            headers=HttpHeaders({'content-type': 'text/html; charset=utf-8'}),
+            _content=text.encode('utf-8'),
+        )
+        return await self._parse_in_pool(buffered_response)
+
+    @override
+    async def select(self, parsed_content: ProcessPoolParseResult, selector: str) -> Sequence[object]:
+        raise NotImplementedError(
+            f'The {self.__class__.__name__} does not keep the parsed document, use extractors to get data from it.'
+        )
+
+    @override
+    def is_blocked(self, parsed_content: ProcessPoolParseResult) -> BlockedInfo:
+        return BlockedInfo(reason=parsed_content.blocked_reason)
+
+    @override
+    def is_matching_selector(self, parsed_content: ProcessPoolParseResult, selector: str) -> bool:
+        if selector not in self._config.match_selectors:
+            raise ValueError(f'The selector "{selector}" was not evaluated, add it to the match_selectors.')
+
+        return selector in parsed_content.matched_selectors
+
+    @override
+    def find_links(self, parsed_content: ProcessPoolParseResult, selector: str, attribute: str) -> Iterable[str]:
+        links = parsed_content.links.get((selector, attribute))
+        if links is None:
+            raise ValueError(
+                f'Links were not extracted with the selector "{selector}" and the attribute "{attribute}", '
+                'add them to the link_selectors.'
+            )
+
+        return links
+
+    async def _parse_in_pool(self, response: _BufferedHttpResponse) -> ProcessPoolParseResult:
+        executor = self._get_executor()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, _parse_in_worker, response)
+        except BrokenProcessPool:
+            # A dead worker breaks the whole pool. The responses in flight fail, they are retried by the crawler,
+            # but the pool is replaced, so that it does not fail all the following responses too.
+            if self._executor is executor:
+                self._executor = None
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=self._mp_context,
+                initializer=_initialize_worker,
+                initargs=(self._config,),
+            )
+
+        return self._executor
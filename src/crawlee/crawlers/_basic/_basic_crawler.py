@@ -10,6 +10,7 @@ import sys
 import threading
 import traceback
 from asyncio import CancelledError
+from collections import deque
 from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Sequence
 from contextlib import AsyncExitStack, suppress
 from datetime import timedelta
@@ -44,7 +45,8 @@ from crawlee._types import (
     SkippedReason,
 )
 from crawlee._utils.docs import docs_group
-from crawlee._utils.file import atomic_write, export_csv_to_stream, export_json_to_stream
+from crawlee._utils.file import atomic_write, export_csv_to_stream
+from crawlee._utils.free_threading import apply_free_threading_configuration
 from crawlee._utils.http import parse_retry_after_header
 from crawlee._utils.log import LoggerOnce
 from crawlee._utils.recurring_task import RecurringTask
@@ -57,6 +59,7 @@ from crawlee.errors import (
     ContextPipelineInterruptedError,
     HttpClientStatusCodeError,
     HttpStatusCodeError,
+    ProxyError,
     RequestCollisionError,
     RequestHandlerError,
     SessionError,
@@ -91,6 +94,7 @@ if TYPE_CHECKING:
         JsonSerializable,
         PushDataKwargs,
     )
+    from crawlee._utils.work_signal import WorkSignal
     from crawlee.configuration import Configuration
     from crawlee.events import EventManager
     from crawlee.http_clients import HttpClient, HttpResponse
@@ -391,6 +395,7 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
         )
 
         config = self._service_locator.get_configuration()
+        apply_free_threading_configuration(config)
 
         # Core components
         self._request_manager = request_manager
@@ -489,6 +494,8 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
         # Internal, not explicitly configurable components
         self._robots_txt_file_cache: LRUCache[str, RobotsTxtFile] = LRUCache(maxsize=1000)
         self._robots_txt_lock = asyncio.Lock()
+        self._prefetched_requests = deque[Request]()
+        self._concurrency_budget = concurrency_settings.concurrency_budget if concurrency_settings else None
         self._snapshotter = Snapshotter.from_config(config)
         self._autoscaled_pool = AutoscaledPool(
             system_status=SystemStatus(self._snapshotter),
@@ -496,7 +503,10 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
             is_finished_function=self.__is_finished_function,
             is_task_ready_function=self.__is_task_ready_function,
             run_task_function=self.__run_task_function,
+            get_work_signal_function=self.__get_work_signal_function,
         )
+        # Prefetch only as many requests as a worker runs in a row, the rest would wait locked in this process.
+        self._request_fetch_batch_size = self._autoscaled_pool.task_batch_size
         self._crawler_state_rec_task = RecurringTask(
             func=self._crawler_state_task,
             delay=status_message_logging_interval,
@@ -547,6 +557,10 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
         self._logger.info(f'Crawler.stop() was called with following reason: {reason}.')
         self._unexpected_stop = True
 
+        # Wake up the autoscaled pool if it is waiting for new requests, so that it notices the stop.
+        if self._request_manager is not None and (work_signal := self._request_manager.work_signal) is not None:
+            work_signal.notify()
+
     def _wrap_handler_with_error_context(
         self, handler: Callable[[TCrawlingContext | BasicCrawlingContext, Exception], Awaitable[T]]
     ) -> Callable[[TCrawlingContext | BasicCrawlingContext, Exception], Awaitable[T]]:
@@ -614,6 +628,22 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
             proxy_tier=None,
         )
 
+    def _record_proxy_outcome(
+        self, context: BasicCrawlingContext, outcome: Literal['success', 'error', 'blocked']
+    ) -> None:
+        """Report the outcome of a request to the proxy health tracker of the proxy configuration, if there is one."""
+        if self._proxy_configuration and (health_tracker := self._proxy_configuration.health_tracker):
+            health_tracker.record_outcome(
+                context.proxy_info.url if context.proxy_info else None, URL(context.request.url).host, outcome
+            )
+
+    def _record_proxy_latency(self, context: BasicCrawlingContext, latency: timedelta) -> None:
+        """Report the response latency of a request to the proxy health tracker, if there is one."""
+        if self._proxy_configuration and (health_tracker := self._proxy_configuration.health_tracker):
+            health_tracker.record_latency(
+                context.proxy_info.url if context.proxy_info else None, URL(context.request.url).host, latency
+            )
+
     async def get_request_manager(self) -> RequestManager:
         """Return the configured request manager. If none is configured, open and return the default request queue."""
         if not self._request_manager:
@@ -816,7 +846,10 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
             for context in contexts_to_enter:
                 await exit_stack.enter_async_context(context)
 
-            await self._autoscaled_pool.run()
+            try:
+                await self._autoscaled_pool.run()
+            finally:
+                await self.__reclaim_prefetched_requests()
 
     async def add_requests(
         self,
@@ -951,7 +984,7 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
         elif path.suffix == '.json':
             dst = StringIO()
             json_kwargs = cast('ExportDataJsonKwargs', additional_kwargs)
-            await export_json_to_stream(dataset.iterate_items(), dst, **json_kwargs)
+            await dataset.write_to_json(dst, **json_kwargs)
             await atomic_write(path, dst.getvalue())
         else:
             raise ValueError(f'Unsupported file extension: {path.suffix}')
@@ -1387,7 +1420,7 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
         for add_requests_call in result.add_requests_calls:
             await self._add_requests(context, **add_requests_call)
 
-        for push_data_call in result.push_data_calls:
+        for push_data_call in result.get_batched_push_data_calls():
             await self._push_data(**push_data_call)
 
         await self._commit_key_value_store_changes(result, get_kvs=self.get_key_value_store)
@@ -1427,23 +1460,106 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
             )
             return False
 
+        if self._prefetched_requests:
+            return True
+
+        if self._concurrency_budget is not None:
+            if self._concurrency_budget.has_ready(within_fair_share=False):
+                return True
+
+            # With a full buffer, a new request could not be set aside if its group is over budget too.
+            if self._concurrency_budget.is_buffer_full:
+                return False
+
         request_manager = await self.get_request_manager()
         return not await request_manager.is_empty()
 
-    async def __run_task_function(self) -> None:
-        request_manager = await self.get_request_manager()
+    async def __fetch_next_request(self, request_manager: RequestManager) -> Request | None:
+        """Fetch the next request to process within the concurrency budget, if there is one.
+
+        Requests of groups that are over their fair share are set aside, and the next request is fetched instead.
+        """
+        budget = self._concurrency_budget
+        if budget is None:
+            return await self.__fetch_next_unbudgeted_request(request_manager)
+
+        while True:
+            if (request := budget.pop_ready()) is not None:
+                return request
+
+            # Requests that were already prefetched are set aside even with a full buffer, so they are not lost.
+            if budget.is_buffer_full and not self._prefetched_requests:
+                break
 
-        request = await wait_for(
-            request_manager.fetch_next_request,
+            request = await self.__fetch_next_unbudgeted_request(request_manager)
+            if request is None:
+                break
+
+            if budget.try_acquire(request):
+                return request
+
+            budget.defer(request)
+
+        # No other group has a request to take the capacity, so the groups over their fair share may use it.
+        return budget.pop_ready(within_fair_share=False)
+
+    async def __fetch_next_unbudgeted_request(self, request_manager: RequestManager) -> Request | None:
+        """Fetch the next request to process, taking it from a locally prefetched batch if batching is enabled."""
+        if self._request_fetch_batch_size == 1:
+            return await self.__wait_for_fetch(request_manager.fetch_next_request)
+
+        if not self._prefetched_requests:
+            self._prefetched_requests.extend(
+                await self.__wait_for_fetch(
+                    partial(request_manager.fetch_next_requests, self._request_fetch_batch_size)
+                )
+            )
+
+        return self._prefetched_requests.popleft() if self._prefetched_requests else None
+
+    async def __wait_for_fetch(self, fetch: Callable[[], Awaitable[T]]) -> T:
+        return await wait_for(
+            fetch,
             timeout=self._internal_timeout,
             timeout_message=f'Fetching next request failed after {self._internal_timeout.total_seconds()} seconds',
             logger=self._logger,
             max_retries=3,
         )
 
+    async def __reclaim_prefetched_requests(self) -> None:
+        """Return requests that were prefetched or set aside but not processed (e.g. after a stop) to the manager."""
+        if self._concurrency_budget is not None:
+            self._prefetched_requests.extend(self._concurrency_budget.drain())
+
+        if not self._prefetched_requests:
+            return
+
+        request_manager = await self.get_request_manager()
+        while self._prefetched_requests:
+            await request_manager.reclaim_request(self._prefetched_requests.popleft())
+
+    async def __get_work_signal_function(self) -> WorkSignal | None:
+        request_manager = await self.get_request_manager()
+        return request_manager.work_signal
+
+    async def __run_task_function(self) -> None:
+        request_manager = await self.get_request_manager()
+
+        request = await self.__fetch_next_request(request_manager)
+
         if request is None:
             return
 
+        if self._concurrency_budget is None:
+            await self.__process_request(request, request_manager)
+            return
+
+        try:
+            await self.__process_request(request, request_manager)
+        finally:
+            self._concurrency_budget.release(request)
+
+    async def __process_request(self, request: Request, request_manager: RequestManager) -> None:
         if not (await self._is_allowed_based_on_robots_txt_file(request.url)):
             self._logger.warning(
                 f'Skipping request {request.url} ({request.unique_key}) because it is disallowed based on robots.txt'
@@ -1495,6 +1611,8 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
             if session and session.is_usable:
                 session.mark_good()
 
+            self._record_proxy_outcome(context, 'success')
+
             self._statistics.record_request_processing_finish(request.unique_key)
 
         except RequestCollisionError as request_error:
@@ -1516,6 +1634,8 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
             if not session:
                 raise RuntimeError('SessionError raised in a crawling context without a session') from session_error
 
+            self._record_proxy_outcome(context, 'error' if isinstance(session_error, ProxyError) else 'blocked')
+
             request.state = RequestState.ERROR_HANDLER
 
             if self._should_retry_request(context, session_error):
@@ -1567,6 +1687,12 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
                 'An exception occurred during the initialization of crawling context',
                 exc_info=initialization_error,
             )
+
+            # Failures before a response was received, such as connection errors and timeouts, count against
+            # the proxy. Failures of the later steps, such as error status codes, are up to the target website.
+            if request.state == RequestState.BEFORE_NAV:
+                self._record_proxy_outcome(context, 'error')
+
             await self._handle_request_error(context, initialization_error.wrapped_exception)
 
         except Exception as internal_error:
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import asyncio
 from typing import TYPE_CHECKING, Literal
 
 from bs4 import BeautifulSoup, Tag
 from typing_extensions import override
 
 from crawlee._utils.docs import docs_group
+from crawlee._utils.free_threading import run_cpu_bound
 from crawlee.crawlers._abstract_http import AbstractHttpParser
 
 if TYPE_CHECKING:
@@ -25,11 +25,11 @@ class BeautifulSoupParser(AbstractHttpParser[BeautifulSoup, Tag]):
     @override
     async def parse(self, response: HttpResponse) -> BeautifulSoup:
         body = await response.read()
-        return await asyncio.to_thread(BeautifulSoup, body, features=self._parser)
+        return await run_cpu_bound(BeautifulSoup, body, features=self._parser)
 
     @override
     async def parse_text(self, text: str) -> BeautifulSoup:
-        return await asyncio.to_thread(BeautifulSoup, text, features=self._parser)
+        return await run_cpu_bound(BeautifulSoup, text, features=self._parser)
 
     @override
     def is_matching_selector(self, parsed_content: Tag, selector: str) -> bool:
@@ -0,0 +1,3 @@
+from ._multiprocess_runner import MultiprocessCrawlerRunner
+
+__all__ = ['MultiprocessCrawlerRunner']
@@ -0,0 +1,450 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import multiprocessing
+import os
+import queue
+import secrets
+from datetime import timedelta
+from itertools import zip_longest
+from logging import getLogger
+from typing import TYPE_CHECKING, Literal
+
+from crawlee import service_locator
+from crawlee._utils.docs import docs_group
+from crawlee.statistics import FinalStatistics
+from crawlee.storage_clients._broker import BrokerStorageClient, run_storage_broker
+from crawlee.storages import Dataset, KeyValueStore, RequestQueue
+
+from ._worker import WorkerResult, WorkerSpec, run_worker
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+    from multiprocessing.queues import Queue
+    from multiprocessing.synchronize import Event
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from crawlee import Request
+    from crawlee.configuration import Configuration
+    from crawlee.crawlers import BasicCrawler
+    from crawlee.storage_clients import StorageClient
+
+logger = getLogger(__name__)
+
+
+@docs_group('Crawlers')
+class MultiprocessCrawlerRunner:
+    """Runs a crawler in several worker processes that share a request queue, a dataset and a key-value store.
+
+    A single crawler is limited to one CPU core by the event loop it runs in, so crawlers that spend much of their
+    time parsing or in the request handler cannot use a multi-core machine. The runner starts `worker_count`
+    processes, each of which creates its own crawler by calling `crawler_factory` and runs it with its own
+    `AutoscaledPool`. The crawlers share the default storages, so every request is processed by a single worker,
+    links enqueued by one worker are processed by any of them and all the results end up in the same dataset.
+
+    The storages are shared in one of two ways:
+
+    - Process-safe backends, such as the Redis or the SQL storage client, are accessed directly by every process.
+      Pass a `storage_client_factory` that creates the client, it is called once in every process.
+    - Other backends, such as the memory or the file system storage client, are served by a broker process, which
+      performs the storage operations for all the workers. The client given as `storage_client`, or the global
+      storage client by default, is used in the broker. It has to be picklable.
+
+    The storages are purged once, before the workers start, if the configuration says so. When the crawl is done,
+    the statistics of the workers are combined into one `FinalStatistics`, with the runtime of the whole run.
+    If any worker fails, or the run is interrupted or cancelled, all the workers are asked to stop, and those that
+    do not stop within `shutdown_timeout` are terminated, and killed if they do not exit after another
+    `shutdown_timeout`.
+
+    The worker processes are started with the `spawn` method by default, so the `crawler_factory` and the
+    `storage_client_factory` have to be picklable, e.g. functions defined at the module level, and the main module
+    has to be guarded by `if __name__ == '__main__'`. The crawlers should use the global configuration and storage
+    client, which the runner sets in every worker, rather than their own. Since other workers change the shared queue,
+    an idle crawler polls it for new requests, the same way it polls a queue stored in Redis or in an SQL database.
+
+    ### Usage
+
+    ```python
+    import asyncio
+
+    from crawlee.crawlers import MultiprocessCrawlerRunner, ParselCrawler, ParselCrawlingContext
+
+
+    def create_crawler() -> ParselCrawler:
+        crawler = ParselCrawler()
+
+        @crawler.router.default_handler
+        async def handler(context: ParselCrawlingContext) -> None:
+            await context.push_data({'url': context.request.url, 'title': context.selector.css('title::text').get()})
+            await context.enqueue_links()
+
+        return crawler
+
+
+    async def main() -> None:
+        runner = MultiprocessCrawlerRunner(create_crawler, worker_count=4)
+        statistics = await runner.run(['https://crawlee.dev'])
+
+
+    if __name__ == '__main__':
+        asyncio.run(main())
+    ```
+    """
+
+    def __init__(
+        self,
+        crawler_factory: Callable[[], BasicCrawler],
+        *,
+        worker_count: int | None = None,
+        storage_client: StorageClient | None = None,
+        storage_client_factory: Callable[[], StorageClient] | None = None,
+        configuration: Configuration | None = None,
+        start_method: Literal['spawn', 'forkserver', 'fork'] = 'spawn',
+        shutdown_timeout: timedelta = timedelta(seconds=30),
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            crawler_factory: Creates the crawler of a worker, called once in every worker process.
+            worker_count: The number of worker processes. Defaults to the number of CPUs.
+            storage_client: The storage client served to the workers by the broker process. Defaults to the global
+                storage client. Cannot be combined with `storage_client_factory`.
+            storage_client_factory: Creates a process-safe storage client, called once in every process. If set,
+                no broker is started and the workers access the storages directly.
+            configuration: The configuration used in the workers. Defaults to the global configuration.
+            start_method: The method used to start the processes, see the `multiprocessing` module.
+            shutdown_timeout: How long to wait for the workers to stop before terminating them.
+        """
+        if storage_client is not None and storage_client_factory is not None:
+            raise ValueError('Only one of storage_client and storage_client_factory can be provided')
+
+        worker_count = worker_count if worker_count is not None else os.cpu_count() or 1
+        if worker_count < 1:
+            raise ValueError('worker_count must be 1 or larger')
+
+        self._crawler_factory = crawler_factory
+        self._worker_count = worker_count
+        self._hosted_storage_client = storage_client
+        self._storage_client_factory = storage_client_factory
+        self._configuration = configuration
+        self._shutdown_timeout = shutdown_timeout
+        self._context = multiprocessing.get_context(start_method)
+
+        self._storage_client: StorageClient | None = None
+        self._broker_process: BaseProcess | None = None
+        self._broker_address: tuple[str, int] | None = None
+        self._broker_authkey: bytes | None = None
+        self._stop_event: Event | None = None
+
+        # Flag to indicate the context state.
+        self._active = False
+
+    @property
+    def active(self) -> bool:
+        """Indicate whether the context is active."""
+        return self._active
+
+    @property
+    def storage_client(self) -> StorageClient:
+        """The storage client the runner uses in its own process, e.g. to read the results of a run.
+
+        With a storage broker, the client only works while the runner context is active.
+        """
+        if self._storage_client is None:
+            raise RuntimeError(f'The {self.__class__.__name__} is not active.')
+
+        return self._storage_client
+
+    async def __aenter__(self) -> Self:
+        """Start the storage broker, if needed, and purge the storages.
+
+        Raises:
+            RuntimeError: If the context manager is already active.
+        """
+        if self._active:
+            raise RuntimeError(f'The {self.__class__.__name__} is already active.')
+
+        configuration = self._configuration or service_locator.get_configuration()
+        self._configuration = configuration
+
+        if self._storage_client_factory is not None:
+            self._storage_client = self._storage_client_factory()
+        else:
+            self._storage_client = await self._start_broker(configuration)
+
+        self._active = True
+
+        try:
+            # Opening the default storages purges them if needed, before any worker can use them.
+            await RequestQueue.open(configuration=configuration, storage_client=self._storage_client)
+            await Dataset.open(configuration=configuration, storage_client=self._storage_client)
+            await KeyValueStore.open(configuration=configuration, storage_client=self._storage_client)
+        except BaseException:
+            await self.__aexit__(None, None, None)
+            raise
+
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        """Stop the storage broker, if any.
+
+        Raises:
+            RuntimeError: If the context manager is not active.
+        """
+        if not self._active:
+            raise RuntimeError(f'The {self.__class__.__name__} is not active.')
+
+        if isinstance(self._storage_client, BrokerStorageClient):
+            await self._stop_broker(self._storage_client)
+
+        self._storage_client = None
+        self._active = False
+
+    async def run(self, requests: Sequence[str | Request] | None = None) -> FinalStatistics:
+        """Run the crawlers in the worker processes until all the requests are processed.
+
+        If the runner context is not active, it is entered for the duration of the run.
+
+        Args:
+            requests: The requests to be enqueued before the workers start.
+
+        Returns:
+            The statistics of all the workers combined.
+
+        Raises:
+            RuntimeError: If any of the workers failed.
+        """
+        if not self._active:
+            async with self:
+                return await self.run(requests)
+
+        if self._stop_event is not None:
+            raise RuntimeError(f'The {self.__class__.__name__} is already running.')
+
+        configuration = self._configuration or service_locator.get_configuration()
+        self._stop_event = self._context.Event()
+        requests_added = self._context.Event()
+        results: Queue[WorkerResult] = self._context.Queue()
+
+        workers = [
+            self._context.Process(
+                target=run_worker,
+                args=(
+                    WorkerSpec(
+                        index=index,
+                        crawler_factory=self._crawler_factory,
+                        configuration=configuration,
+                        requests=requests if index == 0 else None,
+                        broker_address=self._broker_address,
+                        broker_authkey=self._broker_authkey,
+                        storage_client_factory=self._storage_client_factory,
+                        requests_added=requests_added,
+                        stop_event=self._stop_event,
+                        results=results,
+                    ),
+                ),
+                name=f'crawlee-worker-{index}',
+            )
+            for index in range(self._worker_count)
+        ]
+
+        started_at = asyncio.get_running_loop().time()
+
+        try:
+            for worker in workers:
+                worker.start()
+
+            worker_results = await self._wait_for_workers(workers, results)
+        except BaseException:
+            self.stop()
+            await self._shut_down_workers(workers)
+            raise
+        finally:
+            self._stop_event = None
+
+        failures = [error for _, _, error in worker_results.values() if error is not None]
+        failures += [
+            f'The worker {worker.name} exited with code {worker.exitcode} without reporting a result.'
+            for index, worker in enumerate(workers)
+            if index not in worker_results
+        ]
+        if failures:
+            raise RuntimeError('Some of the crawler workers failed:\n' + '\n'.join(failures))
+
+        runtime = timedelta(seconds=asyncio.get_running_loop().time() - started_at)
+        return _combine_statistics(
+            [statistics for _, statistics, _ in worker_results.values() if statistics is not None],
+            runtime,
+        )
+
+    def stop(self) -> None:
+        """Ask all the workers to stop their crawlers, e.g. from another task while `run` is in progress."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    async def _wait_for_workers(
+        self,
+        workers: list[BaseProcess],
+        results: Queue[WorkerResult],
+    ) -> dict[int, WorkerResult]:
+        """Collect the results of the workers until all of them exit. Stop all of them once any fails."""
+        worker_results = dict[int, WorkerResult]()
+        loop = asyncio.get_running_loop()
+        deadline: float | None = None
+
+        while True:
+            # The queue has to be drained before the workers can exit, since they flush their results on exit.
+            try:
+                result = results.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                worker_results[result[0]] = result
+                if result[2] is not None:
+                    self.stop()
+                continue
+
+            if all(worker.exitcode is not None for worker in workers):
+                break
+
+            if any(worker.exitcode not in (None, 0) for worker in workers):
+                self.stop()
+
+            if self._stop_event is not None and self._stop_event.is_set():
+                deadline = deadline or loop.time() + self._shutdown_timeout.total_seconds()
+                if loop.time() >= deadline:
+                    await self._terminate_workers(workers)
+
+            await asyncio.sleep(0.1)
+
+        # A result may have arrived between the last check of the queue and the exit of the last worker.
+        while True:
+            try:
+                result = await asyncio.to_thread(results.get, timeout=0.1)
+            except queue.Empty:
+                return worker_results
+            worker_results[result[0]] = result
+
+    async def _shut_down_workers(self, workers: list[BaseProcess]) -> None:
+        """Wait for the workers asked to stop, and terminate those that do not stop in time."""
+        deadline = asyncio.get_running_loop().time() + self._shutdown_timeout.total_seconds()
+
+        while any(worker.is_alive() for worker in workers if worker.pid is not None):
+            if asyncio.get_running_loop().time() >= deadline:
+                break
+            await asyncio.sleep(0.1)
+
+        await self._terminate_workers(workers)
+
+    async def _terminate_workers(self, workers: list[BaseProcess]) -> None:
+        alive_workers = [worker for worker in workers if worker.pid is not None and worker.is_alive()]
+        for worker in alive_workers:
+            logger.warning(f'The worker {worker.name} did not stop in time, terminating it.')
+
+        await asyncio.gather(*(self._terminate_process(worker) for worker in alive_workers))
+
+    async def _terminate_process(self, process: BaseProcess) -> None:
+        """Terminate a process and wait for it to exit, killing it if it ignores the termination."""
+        timeout = self._shutdown_timeout.total_seconds()
+        process.terminate()
+        await asyncio.to_thread(process.join, timeout)
+
+        if process.is_alive():
+            logger.warning(f'The process {process.name} did not exit after termination, killing it.')
+            process.kill()
+            await asyncio.to_thread(process.join, timeout)
+
+    async def _start_broker(self, configuration: Configuration) -> BrokerStorageClient:
+        hosted_storage_client = self._hosted_storage_client or service_locator.get_storage_client()
+        authkey = secrets.token_bytes(32)
+        receiver, sender = self._context.Pipe(duplex=False)
+
+        process = self._context.Process(
+            target=run_storage_broker,
+            args=(hosted_storage_client, configuration, authkey, sender),
+            name='crawlee-storage-broker',
+        )
+        process.start()
+        sender.close()
+
+        try:
+            address = await asyncio.to_thread(_receive_broker_address, receiver, process)
+        except BaseException:
+            await self._terminate_process(process)
+            raise
+        finally:
+            receiver.close()
+
+        self._broker_process = process
+        self._broker_address = address
+        self._broker_authkey = authkey
+        return BrokerStorageClient(address=address, authkey=authkey)
+
+    async def _stop_broker(self, storage_client: BrokerStorageClient) -> None:
+        process = self._broker_process
+
+        try:
+            await storage_client.shutdown_broker()
+        except ConnectionError:
+            logger.warning('The storage broker could not be shut down gracefully.')
+
+        if process is not None:
+            await asyncio.to_thread(process.join, self._shutdown_timeout.total_seconds())
+            if process.is_alive():
+                logger.warning('The storage broker did not stop in time, terminating it.')
+                await self._terminate_process(process)
+
+        self._broker_process = None
+        self._broker_address = None
+        self._broker_authkey = None
+
+
+def _receive_broker_address(receiver: Connection, process: BaseProcess) -> tuple[str, int]:
+    """Wait for the broker process to report its address. Meant to run in a thread."""
+    while not receiver.poll(0.1):
+        if not process.is_alive():
+            raise RuntimeError(f'The storage broker exited with code {process.exitcode} before it started.')
+
+    return receiver.recv()
+
+
+def _combine_statistics(statistics: list[FinalStatistics], runtime: timedelta) -> FinalStatistics:
+    """Combine the statistics of the workers, as if they were collected by a single crawler running for `runtime`."""
+    requests_finished = sum(item.requests_finished for item in statistics)
+    requests_failed = sum(item.requests_failed for item in statistics)
+    total_minutes = runtime.total_seconds() / 60
+
+    def weighted_average(durations: list[tuple[timedelta | None, int]]) -> timedelta | None:
+        count = sum(weight for _, weight in durations)
+        if not count:
+            return None
+        return sum((duration * weight for duration, weight in durations if duration is not None), timedelta()) / count
+
+    return FinalStatistics(
+        requests_finished=requests_finished,
+        requests_failed=requests_failed,
+        retry_histogram=[
+            sum(counts) for counts in zip_longest(*(item.retry_histogram for item in statistics), fillvalue=0)
+        ],
+        request_avg_failed_duration=weighted_average(
+            [(item.request_avg_failed_duration, item.requests_failed) for item in statistics]
+        ),
+        request_avg_finished_duration=weighted_average(
+            [(item.request_avg_finished_duration, item.requests_finished) for item in statistics]
+        ),
+        requests_finished_per_minute=round(requests_finished / total_minutes) if total_minutes else 0,
+        requests_failed_per_minute=math.floor(requests_failed / total_minutes) if total_minutes else 0,
+        request_total_duration=sum((item.request_total_duration for item in statistics), timedelta()),
+        requests_total=requests_finished + requests_failed,
+        crawler_runtime=runtime,
+    )
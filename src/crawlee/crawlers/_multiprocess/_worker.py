@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import signal
+import traceback
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from crawlee import service_locator
+from crawlee.statistics import Statistics
+from crawlee.storage_clients._broker import BrokerStorageClient
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from multiprocessing.queues import Queue
+    from multiprocessing.synchronize import Event
+
+    from crawlee import Request
+    from crawlee.configuration import Configuration
+    from crawlee.crawlers import BasicCrawler
+    from crawlee.statistics import FinalStatistics
+    from crawlee.storage_clients import StorageClient
+
+STATISTICS_IDS_PER_WORKER = 1000
+"""The statistics created by a worker are numbered from its index times this, so their persistence keys differ."""
+
+WorkerResult = tuple[int, 'FinalStatistics | None', 'str | None']
+"""The index of a worker, the statistics of its run and the traceback of the error it failed with, if any."""
+
+
+@dataclass(frozen=True)
+class WorkerSpec:
+    """Everything a worker process needs to run its crawler. Sent to the worker, so it has to be picklable."""
+
+    index: int
+    crawler_factory: Callable[[], BasicCrawler]
+    configuration: Configuration
+    requests: Sequence[str | Request] | None
+    """The requests to add before the run, only given to the first worker."""
+
+    broker_address: tuple[str, int] | None
+    broker_authkey: bytes | None
+    storage_client_factory: Callable[[], StorageClient] | None
+
+    requests_added: Event
+    """Set by the first worker once the initial requests are in the queue, so the others do not find it empty."""
+
+    stop_event: Event
+    results: Queue[WorkerResult]
+
+
+def run_worker(spec: WorkerSpec) -> None:
+    """Run the crawler of a single worker and report its statistics. The target of the worker processes."""
+    # Until the crawler installs its own handler, interrupts are left to the parent, which stops all the workers.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    try:
+        statistics = asyncio.run(_run_worker(spec))
+    except BaseException:
+        spec.results.put((spec.index, None, traceback.format_exc()))
+    else:
+        spec.results.put((spec.index, statistics, None))
+
+
+async def _run_worker(spec: WorkerSpec) -> FinalStatistics | None:
+    # The runner purges the storages once before the workers start, the workers must not purge them again.
+    service_locator.set_configuration(spec.configuration.model_copy(update={'purge_on_start': False}))
+
+    storage_client: StorageClient
+    if spec.storage_client_factory is not None:
+        storage_client = spec.storage_client_factory()
+    elif spec.broker_address is not None and spec.broker_authkey is not None:
+        storage_client = BrokerStorageClient(address=spec.broker_address, authkey=spec.broker_authkey)
+    else:
+        raise RuntimeError('The worker has neither a storage broker nor a storage client factory.')
+
+    service_locator.set_storage_client(storage_client)
+    Statistics._start_ids_at(spec.index * STATISTICS_IDS_PER_WORKER)  # noqa: SLF001
+
+    crawler = spec.crawler_factory()
+    watcher = asyncio.create_task(_stop_when_requested(crawler, spec.stop_event))
+
+    try:
+        if spec.index == 0:
+            if spec.requests:
+                await crawler.add_requests(spec.requests, wait_for_all_requests_to_be_added=True)
+            spec.requests_added.set()
+        elif not await _wait_for_requests(spec.requests_added, spec.stop_event):
+            return None
+
+        return await crawler.run()
+    finally:
+        watcher.cancel()
+        if isinstance(storage_client, BrokerStorageClient):
+            await storage_client.close()
+
+
+async def _wait_for_requests(requests_added: Event, stop_event: Event) -> bool:
+    """Wait until the initial requests are added. Return False if the run was stopped in the meantime."""
+    while not requests_added.is_set():
+        if stop_event.is_set():
+            return False
+        await asyncio.sleep(0.1)
+
+    return True
+
+
+async def _stop_when_requested(crawler: BasicCrawler, stop_event: Event) -> None:
+    """Stop the crawler once the runner asks the workers to stop, or once the runner process exits."""
+    parent = multiprocessing.parent_process()
+
+    while not stop_event.is_set():
+        if parent is not None and not parent.is_alive():
+            crawler.stop('The process running the workers exited.')
+            return
+        await asyncio.sleep(0.5)
+
+    crawler.stop('The multiprocess crawler runner was stopped.')
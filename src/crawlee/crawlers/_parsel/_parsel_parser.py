@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import asyncio
 from typing import TYPE_CHECKING
 
 from parsel import Selector
 from typing_extensions import override
 
 from crawlee._utils.docs import docs_group
+from crawlee._utils.free_threading import run_cpu_bound
 from crawlee.crawlers._abstract_http import AbstractHttpParser
 
 if TYPE_CHECKING:
@@ -22,7 +22,7 @@ class ParselParser(AbstractHttpParser[Selector, Selector]):
     @override
     async def parse(self, response: HttpResponse) -> Selector:
         response_body = await response.read()
-        return await asyncio.to_thread(Selector, body=response_body)
+        return await run_cpu_bound(Selector, body=response_body)
 
     @override
     async def parse_text(self, text: str) -> Selector:
@@ -17,7 +17,7 @@ from crawlee._types import BasicCrawlingContext, ConcurrencySettings
 from crawlee._utils.blocked import RETRY_CSS_SELECTORS
 from crawlee._utils.docs import docs_group
 from crawlee._utils.robots import RobotsTxtFile
-from crawlee._utils.time import SharedTimeout
+from crawlee._utils.time import SharedTimeout, measure_time
 from crawlee._utils.urls import to_absolute_url_iterator
 from crawlee.browsers import BrowserPool
 from crawlee.crawlers._basic import BasicCrawler, BasicCrawlerOptions, ContextPipeline
@@ -395,10 +395,12 @@ class PlaywrightCrawler(
             await interceptor.register()
 
         try:
-            async with self._shared_navigation_timeouts[id(context.request)] as remaining_timeout:
-                response = await context.page.goto(
-                    context.request.url, timeout=remaining_timeout.total_seconds() * 1000, **context.goto_options
-                )
+            with measure_time() as timer:
+                async with self._shared_navigation_timeouts[id(context.request)] as remaining_timeout:
+                    response = await context.page.goto(
+                        context.request.url, timeout=remaining_timeout.total_seconds() * 1000, **context.goto_options
+                    )
+            self._record_proxy_latency(context, timedelta(seconds=timer.wall or 0))
             context.request.state = RequestState.AFTER_NAV
         except playwright.async_api.TimeoutError as exc:
             raise asyncio.TimeoutError from exc
@@ -1,5 +1,6 @@
 from ._event_manager import EventManager
 from ._local_event_manager import LocalEventManager
+from ._system_metrics_sampler import ProcfsSystemMetricsSampler, PsutilSystemMetricsSampler, SystemMetricsSampler
 from ._types import (
     Event,
     EventAbortingData,
@@ -24,4 +25,7 @@ __all__ = [
     'EventPersistStateData',
     'EventSystemInfoData',
     'LocalEventManager',
+    'ProcfsSystemMetricsSampler',
+    'PsutilSystemMetricsSampler',
+    'SystemMetricsSampler',
 ]
@@ -7,9 +7,9 @@ from typing import TYPE_CHECKING
 
 from crawlee._utils.docs import docs_group
 from crawlee._utils.recurring_task import RecurringTask
-from crawlee._utils.system import get_cpu_info, get_memory_info
 from crawlee.configuration import Configuration
 from crawlee.events._event_manager import EventManager, EventManagerOptions
+from crawlee.events._system_metrics_sampler import create_system_metrics_sampler
 from crawlee.events._types import Event, EventSystemInfoData
 
 if TYPE_CHECKING:
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 
     from typing_extensions import Self, Unpack
 
+    from crawlee.events._system_metrics_sampler import SystemMetricsSampler
+
 logger = getLogger(__name__)
 
 
@@ -32,6 +34,7 @@ class LocalEventManager(EventManager):
     def __init__(
         self,
         system_info_interval: timedelta = timedelta(seconds=1),
+        system_metrics_sampler: SystemMetricsSampler | None = None,
         **event_manager_options: Unpack[EventManagerOptions],
     ) -> None:
         """Initialize a new instance.
@@ -41,6 +44,8 @@ class LocalEventManager(EventManager):
 
         Args:
             system_info_interval: Interval at which `SystemInfo` events are emitted.
+            system_metrics_sampler: The sampler reading the CPU and memory usage. If not provided, the cheapest one
+                supported on the current system is used.
             event_manager_options: Additional options for the parent class.
         """
         super().__init__(**event_manager_options)
@@ -48,6 +53,9 @@ class LocalEventManager(EventManager):
         self._system_info_interval = system_info_interval
         """Interval between the emitted `SystemInfo` events."""
 
+        self._system_metrics_sampler = system_metrics_sampler or create_system_metrics_sampler()
+        """Sampler reading the CPU and memory usage reported in the `SystemInfo` events."""
+
         self._emit_system_info_event_rec_task = RecurringTask(
             func=self._emit_system_info_event,
             delay=self._system_info_interval,
@@ -98,11 +106,11 @@ class LocalEventManager(EventManager):
 
     async def _emit_system_info_event(self) -> None:
         """Emit a system info event with the current CPU and memory usage."""
-        # Both readings block the thread they run in - `get_cpu_info` even samples the CPU utilization over a short
-        # interval - so run them concurrently instead of one after the other.
+        # Both readings block the thread they run in - the psutil sampler even samples the CPU utilization over
+        # a short interval - so run them concurrently instead of one after the other.
         cpu_info, memory_info = await asyncio.gather(
-            asyncio.to_thread(get_cpu_info),
-            asyncio.to_thread(get_memory_info),
+            asyncio.to_thread(self._system_metrics_sampler.get_cpu_info),
+            asyncio.to_thread(self._system_metrics_sampler.get_memory_info),
         )
 
         event_data = EventSystemInfoData(cpu_info=cpu_info, memory_info=memory_info)
@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+import os
+import sys
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from logging import WARNING, getLogger
+from pathlib import Path
+from time import monotonic
+
+from typing_extensions import override
+
+from crawlee._utils.byte_size import ByteSize
+from crawlee._utils.docs import docs_group
+from crawlee._utils.log import LoggerOnce
+from crawlee._utils.system import CpuInfo, MemoryInfo, get_cpu_info, get_memory_info
+
+logger = getLogger(__name__)
+logger_once = LoggerOnce(logger)
+
+
+@docs_group('Event managers')
+class SystemMetricsSampler(ABC):
+    """Reads the CPU and memory usage reported by the `LocalEventManager` in the `SystemInfo` events.
+
+    The two readings are taken concurrently from worker threads, so implementations must not share mutable state
+    between them. A sampler may keep state between readings of the same kind, so a single instance should not be
+    shared by multiple event managers.
+    """
+
+    @abstractmethod
+    def get_cpu_info(self) -> CpuInfo:
+        """Read the current CPU usage."""
+
+    @abstractmethod
+    def get_memory_info(self) -> MemoryInfo:
+        """Read the current memory usage of the current process and its children."""
+
+
+@docs_group('Event managers')
+class PsutilSystemMetricsSampler(SystemMetricsSampler):
+    """Reads the system metrics using `psutil`.
+
+    It works on every platform, but each reading is relatively expensive - the CPU usage is sampled over 100 ms and
+    finding the child processes walks the whole process table of the system.
+    """
+
+    @override
+    def get_cpu_info(self) -> CpuInfo:
+        return get_cpu_info()
+
+    @override
+    def get_memory_info(self) -> MemoryInfo:
+        return get_memory_info()
+
+
+@docs_group('Event managers')
+class ProcfsSystemMetricsSampler(SystemMetricsSampler):
+    """Reads the system metrics from the Linux `/proc` file system and from cgroup v2 controllers.
+
+    The CPU usage is computed from the difference of the cumulative CPU time counters since the previous reading,
+    so it does not block to sample it. Inside a cgroup v2 with the CPU and memory controllers, which is the case in
+    most containers, the usage and the limits of the cgroup are used. Otherwise the system-wide counters from `/proc`
+    are used, as with `psutil`.
+
+    The child processes are found by following the `/proc/<pid>/task/<tid>/children` lists from the current process,
+    without walking the whole process table, and the set is reused for `children_refresh_interval`. Children started
+    in the meantime are only counted once the set is refreshed, while children that exit drop out right away.
+
+    If any reading fails, the sampler logs a warning and falls back to `PsutilSystemMetricsSampler` for it.
+    """
+
+    def __init__(
+        self,
+        *,
+        children_refresh_interval: timedelta = timedelta(seconds=5),
+        cgroup_path: Path | None = None,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            children_refresh_interval: How long the set of child processes is reused before it is looked up again.
+            cgroup_path: The directory of the cgroup v2 of the current process. If not provided, it is found in
+                `/proc/self/cgroup`.
+        """
+        self._children_refresh_interval = children_refresh_interval.total_seconds()
+        self._cgroup_path = cgroup_path or _find_cgroup_path()
+        self._page_size = os.sysconf('SC_PAGE_SIZE')
+        self._psutil_sampler = PsutilSystemMetricsSampler()
+        self._cpu_fallback = False
+        self._memory_fallback = False
+
+        self._child_pids: list[int] = []
+        self._children_refreshed_at: float | None = None
+
+        self._last_cpu_reading = self._read_cpu_times()
+        self._last_cpu_ratio = 0.0
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Check whether the metrics of the current process can be read from `/proc`."""
+        return (
+            sys.platform == 'linux'
+            and Path('/proc/stat').is_file()
+            and Path('/proc/self/statm').is_file()
+            # The lists of children are only available in kernels built with `CONFIG_PROC_CHILDREN`.
+            and Path(f'/proc/self/task/{os.getpid()}/children').is_file()
+        )
+
+    @property
+    def cgroup_path(self) -> Path | None:
+        """The directory of the cgroup v2 the usage and limits are read from, if any."""
+        return self._cgroup_path
+
+    @override
+    def get_cpu_info(self) -> CpuInfo:
+        if self._cpu_fallback:
+            return self._psutil_sampler.get_cpu_info()
+
+        try:
+            busy, capacity = reading = self._read_cpu_times()
+        except (OSError, ValueError):
+            logger_once.log(
+                'Unable to read the CPU usage from /proc or cgroup, falling back to psutil.',
+                key='procfs_cpu_unavailable',
+                level=WARNING,
+            )
+            self._cpu_fallback = True
+            return self._psutil_sampler.get_cpu_info()
+
+        last_busy, last_capacity = self._last_cpu_reading
+
+        # Readings taken too close to each other do not carry any information, so the previous ratio is reported.
+        if capacity > last_capacity:
+            self._last_cpu_ratio = min(max((busy - last_busy) / (capacity - last_capacity), 0.0), 1.0)
+            self._last_cpu_reading = reading
+
+        return CpuInfo(used_ratio=self._last_cpu_ratio)
+
+    @override
+    def get_memory_info(self) -> MemoryInfo:
+        if self._memory_fallback:
+            return self._psutil_sampler.get_memory_info()
+
+        try:
+            return self._read_memory_info()
+        except (OSError, ValueError):
+            logger_once.log(
+                'Unable to read the memory usage from /proc or cgroup, falling back to psutil.',
+                key='procfs_memory_unavailable',
+                level=WARNING,
+            )
+            self._memory_fallback = True
+            return self._psutil_sampler.get_memory_info()
+
+    def _read_cpu_times(self) -> tuple[float, float]:
+        """Return the CPU time used so far and the CPU time available so far, both in seconds."""
+        if self._cgroup_path is not None:
+            usage_usec = int(_read_key_values(self._cgroup_path / 'cpu.stat')['usage_usec'])
+            return usage_usec / 1_000_000, monotonic() * self._get_cgroup_cpu_count(self._cgroup_path)
+
+        # The first line sums the time spent by all CPUs in each state, in clock ticks.
+        with Path('/proc/stat').open() as file:
+            fields = [int(value) for value in file.readline().split()[1:9]]
+
+        # The idle and iowait states (the 4th and 5th fields) leave the CPU free for other work.
+        total = sum(fields)
+        return float(total - fields[3] - fields[4]), float(total)
+
+    def _read_memory_info(self) -> MemoryInfo:
+        current_size = self._read_process_memory(os.getpid())
+
+        for pid in self._get_child_pids():
+            current_size += self._read_child_memory(pid)
+
+        total_size, used_size = self._read_system_memory()
+
+        return MemoryInfo(
+            total_size=ByteSize(total_size),
+            current_size=ByteSize(current_size),
+            system_wide_used_size=ByteSize(used_size),
+        )
+
+    def _read_child_memory(self, pid: int) -> int:
+        """Return the memory used by a child process, or zero if the child cannot be measured at all."""
+        try:
+            return self._read_process_memory(pid)
+        except (FileNotFoundError, ProcessLookupError):
+            # A child that exits mid-measurement just drops out of the sum.
+            return 0
+        except OSError:
+            logger_once.log(
+                'Unable to read the memory usage of a child process, it is excluded from the estimate.',
+                key='procfs_child_unmeasurable',
+                level=WARNING,
+            )
+            return 0
+
+    def _read_process_memory(self, pid: int) -> int:
+        """Return the PSS of a process, or its RSS if the PSS is not available."""
+        try:
+            with Path(f'/proc/{pid}/smaps_rollup').open() as file:
+                for line in file:
+                    if line.startswith('Pss:'):
+                        pss = int(line.split()[1]) * 1024
+                        if pss > 0:
+                            return pss
+                        break
+        except PermissionError:
+            pass
+
+        with Path(f'/proc/{pid}/statm').open() as file:
+            return int(file.read().split()[1]) * self._page_size
+
+    def _read_system_memory(self) -> tuple[int, int]:
+        """Return the total memory available to the process and the memory used by all processes sharing it."""
+        meminfo = _read_key_values(Path('/proc/meminfo'))
+        total_size = int(meminfo['MemTotal'].split()[0]) * 1024
+        used_size = total_size - int(meminfo['MemAvailable'].split()[0]) * 1024
+
+        if self._cgroup_path is not None:
+            limit = (self._cgroup_path / 'memory.max').read_text().strip()
+            if limit != 'max' and int(limit) < total_size:
+                # The page cache is charged to the cgroup too, but the inactive part of it is reclaimed first.
+                current = int((self._cgroup_path / 'memory.current').read_text())
+                inactive_file = int(_read_key_values(self._cgroup_path / 'memory.stat').get('inactive_file', 0))
+                return int(limit), max(current - inactive_file, 0)
+
+        return total_size, used_size
+
+    def _get_child_pids(self) -> list[int]:
+        now = monotonic()
+        if self._children_refreshed_at is None or now - self._children_refreshed_at >= self._children_refresh_interval:
+            self._child_pids = _find_descendant_pids(os.getpid())
+            self._children_refreshed_at = now
+
+        return self._child_pids
+
+    @staticmethod
+    def _get_cgroup_cpu_count(cgroup_path: Path) -> float:
+        quota, period = (cgroup_path / 'cpu.max').read_text().split()
+        cpu_count = len(os.sched_getaffinity(0))
+
+        if quota == 'max':
+            return cpu_count
+
+        return min(int(quota) / int(period), cpu_count)
+
+
+def create_system_metrics_sampler() -> SystemMetricsSampler:
+    """Create the cheapest system metrics sampler supported on the current system."""
+    if ProcfsSystemMetricsSampler.is_supported():
+        try:
+            return ProcfsSystemMetricsSampler()
+        except (OSError, ValueError):
+            logger.debug('Unable to read the system metrics from /proc, falling back to psutil.', exc_info=True)
+
+    return PsutilSystemMetricsSampler()
+
+
+def _find_cgroup_path() -> Path | None:
+    """Find the cgroup v2 of the current process, if it has the CPU and memory controllers enabled."""
+    try:
+        lines = Path('/proc/self/cgroup').read_text().splitlines()
+    except OSError:
+        return None
+
+    for line in lines:
+        # A cgroup v2 is listed with an empty hierarchy ID and controller list.
+        if line.startswith('0::'):
+            path = Path('/sys/fs/cgroup') / line[3:].lstrip('/')
+            if all((path / name).is_file() for name in ('cpu.stat', 'cpu.max', 'memory.current', 'memory.max')):
+                return path
+
+    return None
+
+
+def _find_descendant_pids(pid: int) -> list[int]:
+    """Find the descendants of a process by following the lists of children of its threads."""
+    descendants: list[int] = []
+    pending = [pid]
+
+    while pending:
+        parent = pending.pop()
+        for tid in _list_threads(parent):
+            children = _read_children(parent, tid)
+            descendants.extend(children)
+            pending.extend(children)
+
+    return descendants
+
+
+def _list_threads(pid: int) -> list[str]:
+    """List the thread IDs of a process, or nothing if the process is gone."""
+    try:
+        return [entry.name for entry in Path(f'/proc/{pid}/task').iterdir()]
+    except (FileNotFoundError, ProcessLookupError):
+        return []
+
+
+def _read_children(pid: int, tid: str) -> list[int]:
+    """Read the IDs of the child processes started by a thread, or nothing if the thread is gone."""
+    try:
+        return [int(child) for child in Path(f'/proc/{pid}/task/{tid}/children').read_text().split()]
+    except (FileNotFoundError, ProcessLookupError):
+        return []
+
+
+def _read_key_values(path: Path) -> dict[str, str]:
+    """Read a file with a `key value` or `key: value` pair on each line."""
+    with path.open() as file:
+        return dict(line.replace(':', ' ', 1).split(maxsplit=1) for line in file if line.strip())
@@ -1,5 +1,7 @@
 from crawlee.otel.crawler_instrumentor import CrawlerInstrumentor
+from crawlee.otel.event_loop_instrumentor import EventLoopInstrumentor
 
 __all__ = [
     'CrawlerInstrumentor',
+    'EventLoopInstrumentor',
 ]
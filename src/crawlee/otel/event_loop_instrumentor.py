@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
+from opentelemetry.metrics import Observation, get_meter
+
+from crawlee._autoscaling import EventLoopMonitor
+from crawlee._utils.docs import docs_group
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from opentelemetry.metrics import CallbackOptions
+
+
+@docs_group('Other')
+class EventLoopInstrumentor(BaseInstrumentor):
+    """Helper class for exporting the statistics of `EventLoopMonitor` instances as OpenTelemetry metrics.
+
+    The following metrics are reported for every monitor, with the monitored event loop as the `event_loop.id`
+    attribute:
+
+    - `crawlee.event_loop.lag` - gauge of the recent event loop lag percentiles, with the `percentile` attribute.
+    - `crawlee.event_loop.slow_callback.count` - counter of slow callbacks, with the `code.location` attribute.
+    - `crawlee.event_loop.slow_callback.duration` - counter of the time for which slow callbacks blocked the loop,
+      with the `code.location` attribute.
+
+    Event loop monitoring of crawlers is enabled by the `event_loop_monitoring` configuration option.
+    """
+
+    def __init__(self, *, monitors: list[EventLoopMonitor] | None = None) -> None:
+        """Initialize the instrumentor.
+
+        Args:
+            monitors: The monitors to export the statistics of. If not provided, all active monitors are exported.
+        """
+        self._monitors = monitors
+        self._enabled = False
+
+    def instrumentation_dependencies(self) -> list[str]:
+        """Return a list of python packages with versions that will be instrumented."""
+        return ['crawlee']
+
+    def _get_monitors(self) -> Iterable[EventLoopMonitor]:
+        if not self._enabled:
+            return []
+
+        if self._monitors is not None:
+            return self._monitors
+
+        return list(EventLoopMonitor._monitors_by_loop.values())  # noqa: SLF001
+
+    def _observe_lag(self, _: CallbackOptions) -> Iterable[Observation]:
+        for monitor in self._get_monitors():
+            latency = monitor.get_latency_info()
+            attributes = {'event_loop.id': id(monitor)}
+
+            for percentile, value in (('p50', latency.p50), ('p90', latency.p90), ('p99', latency.p99)):
+                yield Observation(value.total_seconds(), {**attributes, 'percentile': percentile})
+
+            yield Observation(latency.max.total_seconds(), {**attributes, 'percentile': 'max'})
+
+    def _observe_slow_callback_count(self, _: CallbackOptions) -> Iterable[Observation]:
+        for monitor in self._get_monitors():
+            for info in monitor.get_slow_callbacks():
+                yield Observation(info.count, {'event_loop.id': id(monitor), 'code.location': info.location})
+
+    def _observe_slow_callback_duration(self, _: CallbackOptions) -> Iterable[Observation]:
+        for monitor in self._get_monitors():
+            for info in monitor.get_slow_callbacks():
+                yield Observation(
+                    info.total_duration.total_seconds(),
+                    {'event_loop.id': id(monitor), 'code.location': info.location},
+                )
+
+    def _instrument(self, **kwargs: Any) -> None:
+        meter = get_meter(__name__, meter_provider=kwargs.get('meter_provider'))
+
+        meter.create_observable_gauge(
+            'crawlee.event_loop.lag',
+            callbacks=[self._observe_lag],
+            unit='s',
+            description='Recent percentiles of the time by which callbacks ran later than scheduled.',
+        )
+        meter.create_observable_counter(
+            'crawlee.event_loop.slow_callback.count',
+            callbacks=[self._observe_slow_callback_count],
+            unit='{callback}',
+            description='Number of callbacks that blocked the event loop for longer than the threshold.',
+        )
+        meter.create_observable_counter(
+            'crawlee.event_loop.slow_callback.duration',
+            callbacks=[self._observe_slow_callback_duration],
+            unit='s',
+            description='Total time for which slow callbacks blocked the event loop.',
+        )
+        self._enabled = True
+
+    def _uninstrument(self, **_: Any) -> None:
+        # Observable instruments cannot be removed from a meter, so they just stop reporting.
+        self._enabled = False
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import inspect
+import random
+import time
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from datetime import timedelta
+from typing import TYPE_CHECKING, Literal
 
+from cachetools import LRUCache
 from more_itertools import flatten
 from pydantic import AnyHttpUrl, TypeAdapter
 from typing_extensions import Protocol
@@ -18,7 +22,7 @@ if TYPE_CHECKING:
 
     from crawlee import Request
 
-__all__ = ['ProxyConfiguration', 'ProxyInfo']
+__all__ = ['ProxyConfiguration', 'ProxyHealthTracker', 'ProxyInfo']
 
 
 @dataclass
@@ -46,7 +50,7 @@ class ProxyInfo:
 
     session_id: str | None = None
     """The identifier of the used proxy session, if used.
-    Using the same session ID guarantees getting the same proxy URL."""
+    Using the same session ID guarantees getting the same proxy URL, unless the health tracker ejects the proxy."""
 
     proxy_tier: int | None = None
     """The tier of the proxy."""
@@ -71,6 +75,7 @@ class ProxyConfiguration:
         proxy_urls: list[str | None] | None = None,
         new_url_function: _NewUrlFunction | None = None,
         tiered_proxy_urls: list[list[str | None]] | None = None,
+        health_tracker: ProxyHealthTracker | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -83,6 +88,10 @@ class ProxyConfiguration:
                 the selected tier will be rotated in a round-robin fashion.
             new_url_function: A function that returns a proxy URL for a given Request. This provides full control over
                 the proxy selection mechanism.
+            health_tracker: Tracks the latency and failures of the proxies and routes the requests to the healthy ones,
+                instead of rotating the proxies in a round-robin fashion. The crawlers report the outcomes of their
+                requests to it. A session keeps its proxy until the tracker ejects the proxy, then it gets another
+                one. Cannot be combined with `new_url_function`.
         """
         self._next_custom_url_index = 0
         self._used_proxy_urls = dict[str, URL | None]()
@@ -95,6 +104,9 @@ class ProxyConfiguration:
                 'must be specified (and non-empty).'
             )
 
+        if health_tracker is not None and new_url_function is not None:
+            raise ValueError('`health_tracker` cannot be combined with `new_url_function`.')
+
         self._proxy_urls = [self._create_url(url) for url in proxy_urls] if proxy_urls else []
         self._proxy_tier_tracker = (
             _ProxyTierTracker([[self._create_url(url) for url in tier] for tier in tiered_proxy_urls])
@@ -102,6 +114,12 @@ class ProxyConfiguration:
             else None
         )
         self._new_url_function = new_url_function
+        self._health_tracker = health_tracker
+
+    @property
+    def health_tracker(self) -> ProxyHealthTracker | None:
+        """The tracker of the proxy health used to route the requests, if any."""
+        return self._health_tracker
 
     def _create_url(self, url: str | None) -> URL | None:
         """Create URL from input string. None means that intentionally no proxy should be used."""
@@ -118,8 +136,8 @@ class ProxyConfiguration:
 
         Args:
             session_id: Session identifier. If provided, same proxy URL will be returned for
-                subsequent calls with this ID. Will be auto-generated for tiered proxies if
-                not provided.
+                subsequent calls with this ID, unless the health tracker ejects the proxy. Will be
+                auto-generated for tiered proxies if not provided.
             request: Request object used for proxy rotation and tier selection. Required for
                 tiered proxies to track retries and adjust tier accordingly.
             proxy_tier: Specific proxy tier to use. If not provided, will be automatically
@@ -163,8 +181,8 @@ class ProxyConfiguration:
 
         Args:
             session_id: Session identifier. If provided, same proxy URL will be returned for
-                subsequent calls with this ID. Will be auto-generated for tiered proxies if
-                not provided.
+                subsequent calls with this ID, unless the health tracker ejects the proxy. Will be
+                auto-generated for tiered proxies if not provided.
             request: Request object used for proxy rotation and tier selection. Required for
                 tiered proxies to track retries and adjust tier accordingly.
             proxy_tier: Specific proxy tier to use. If not provided, will be automatically
@@ -210,16 +228,274 @@ class ProxyConfiguration:
             raise RuntimeError('Invalid state')
 
         if session_id is None:
-            url = urls[self._next_custom_url_index % len(urls)]
-            self._next_custom_url_index += 1
-            return url, proxy_tier
+            return self._next_url(urls, request), proxy_tier
 
-        if session_id not in self._used_proxy_urls:
-            self._used_proxy_urls[session_id] = urls[self._next_custom_url_index % len(urls)]
-            self._next_custom_url_index += 1
+        # A session keeps its proxy, unless the proxy was ejected since. With the default session pool, every request
+        # has a session, so without this, the health tracker would only take part in binding the new sessions.
+        if session_id not in self._used_proxy_urls or self._is_ejected(self._used_proxy_urls[session_id], request):
+            self._used_proxy_urls[session_id] = self._next_url(urls, request)
 
         return self._used_proxy_urls[session_id], proxy_tier
 
+    def _next_url(self, urls: Sequence[URL | None], request: Request | None) -> URL | None:
+        if self._health_tracker is not None:
+            return self._health_tracker.pick_url(urls, URL(request.url).host if request else None)
+
+        url = urls[self._next_custom_url_index % len(urls)]
+        self._next_custom_url_index += 1
+        return url
+
+    def _is_ejected(self, url: URL | None, request: Request | None) -> bool:
+        """Check whether the health tracker ejected the proxy, either completely or for the domain of the request."""
+        if self._health_tracker is None:
+            return False
+
+        return self._health_tracker.is_ejected(
+            str(url) if url is not None else None, URL(request.url).host if request else None
+        )
+
+
+@dataclass
+class _ProxyHealth:
+    """Health statistics of a proxy, or of a proxy used for a single domain."""
+
+    latency: float | None = None
+    """Exponentially weighted moving average of the response latency in seconds."""
+
+    failure_rate: float = 0.0
+    """Exponentially weighted moving average of the failed requests, between 0 and 1."""
+
+    consecutive_failures: int = 0
+    """Failures since the last success or ejection."""
+
+    ejections: int = 0
+    """Ejections since the last success. Each one doubles the duration of the next one."""
+
+    ejected_until: float = 0.0
+    """The `time.monotonic` time at which the current ejection ends."""
+
+
+@docs_group('Configuration')
+class ProxyHealthTracker:
+    """Tracks the health of proxies and routes the requests of a `ProxyConfiguration` to the healthy ones.
+
+    The crawlers report the latency of every response and the outcome of every request made through a proxy - success,
+    error (the proxy failed or timed out) or blocked (the target website blocked the session). The tracker keeps
+    exponentially weighted moving averages of the latency and the failure rate of every proxy, and of every proxy for
+    every domain. Blocks only count against the proxy for the domain, since a proxy blocked by one website may work
+    well for others.
+
+    The score of a proxy is the expected time to a successful response, its latency divided by its success rate.
+    To pick a proxy for a request, two random proxies are compared and the one with the lower score wins (the power of
+    two choices). This sends most of the traffic to the fast and reliable proxies, but keeps probing the others, so
+    a proxy that recovers gets its traffic back.
+
+    A proxy that fails repeatedly in a row is ejected - it is not picked until the ejection ends, or unless all the
+    proxies are ejected. Each repeated ejection without a success in between lasts twice as long. The sessions bound
+    to an ejected proxy get another one.
+
+    ### Usage
+
+    ```python
+    from crawlee.proxy_configuration import ProxyConfiguration, ProxyHealthTracker
+
+    proxy_configuration = ProxyConfiguration(
+        proxy_urls=['http://proxy-1.com/', 'http://proxy-2.com/'],
+        health_tracker=ProxyHealthTracker(),
+    )
+    ```
+    """
+
+    _CHOICES = 2
+    """The number of random proxies compared to pick one."""
+
+    _MAX_RANDOM_DRAWS = 8
+    """How many random proxies are drawn to find the compared ones among those not ejected, before a full scan."""
+
+    _MIN_SUCCESS_RATE = 0.01
+    """The success rate used in the score of proxies that fail (almost) always, to keep the score finite."""
+
+    _DEFAULT_LATENCY = 1.0
+    """The latency in seconds assumed for proxies before any latency is recorded."""
+
+    def __init__(
+        self,
+        *,
+        smoothing: float = 0.2,
+        ejection_threshold: int = 3,
+        ejection_duration: timedelta = timedelta(seconds=30),
+        max_ejection_duration: timedelta = timedelta(minutes=10),
+        max_tracked_domains: int = 10_000,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            smoothing: The weight of the latest observation in the moving averages of the latency and failure rate,
+                between 0 and 1. Higher values react faster to changes, lower values are more stable.
+            ejection_threshold: The number of failures in a row after which a proxy is ejected.
+            ejection_duration: How long the first ejection of a proxy lasts.
+            max_ejection_duration: The upper limit of the ejection duration, which doubles with every repeated
+                ejection.
+            max_tracked_domains: The number of proxy and domain combinations tracked. The least recently used ones
+                are dropped when there are more.
+        """
+        if not 0 < smoothing <= 1:
+            raise ValueError(f'The smoothing must be between 0 (exclusive) and 1, got {smoothing}.')
+
+        if ejection_threshold < 1:
+            raise ValueError(f'The ejection threshold must be at least 1, got {ejection_threshold}.')
+
+        self._smoothing = smoothing
+        self._ejection_threshold = ejection_threshold
+        self._ejection_duration = ejection_duration.total_seconds()
+        self._max_ejection_duration = max_ejection_duration.total_seconds()
+
+        self._proxies = dict[str | None, _ProxyHealth]()
+        self._domain_proxies = LRUCache[tuple[str | None, str], _ProxyHealth](maxsize=max_tracked_domains)
+
+        # The moving average of the latency over all the proxies, assumed for proxies with no latency recorded yet.
+        self._mean_latency: float | None = None
+
+    def record_latency(self, proxy_url: str | None, domain: str | None, latency: timedelta) -> None:
+        """Record the time it took to get a response through a proxy.
+
+        Args:
+            proxy_url: The URL of the proxy, or `None` for a request made without a proxy.
+            domain: The domain of the requested URL, if known.
+            latency: The time from sending the request to receiving the response.
+        """
+        seconds = latency.total_seconds()
+        self._mean_latency = self._update_average(self._mean_latency, seconds)
+        for health in self._get_health(proxy_url, domain):
+            health.latency = self._update_average(health.latency, seconds)
+
+    def record_outcome(
+        self, proxy_url: str | None, domain: str | None, outcome: Literal['success', 'error', 'blocked']
+    ) -> None:
+        """Record the outcome of a request made through a proxy.
+
+        Args:
+            proxy_url: The URL of the proxy, or `None` for a request made without a proxy.
+            domain: The domain of the requested URL, if known.
+            outcome: `success` if the response was handled, `error` if the request failed before a response was
+                received and `blocked` if the response showed that the session was blocked.
+        """
+        now = time.monotonic()
+        health_records = self._get_health(proxy_url, domain)
+
+        # A block says something about the proxy and the website, not about the proxy as a whole.
+        if outcome == 'blocked' and domain is not None:
+            health_records = health_records[1:]
+
+        for health in health_records:
+            if outcome == 'success':
+                health.failure_rate = self._update_average(health.failure_rate, 0.0)
+                health.consecutive_failures = 0
+                health.ejections = 0
+                continue
+
+            health.failure_rate = self._update_average(health.failure_rate, 1.0)
+
+            # Failures of requests that were already in flight when the proxy was ejected do not extend the ejection.
+            if health.ejected_until > now:
+                continue
+
+            health.consecutive_failures += 1
+            if health.consecutive_failures >= self._ejection_threshold:
+                duration = min(self._ejection_duration * 2**health.ejections, self._max_ejection_duration)
+                health.ejected_until = now + duration
+                health.ejections += 1
+                health.consecutive_failures = 0
+
+    def get_score(self, proxy_url: str | None, domain: str | None = None) -> float:
+        """Get the expected time in seconds to a successful response through a proxy. Lower is better.
+
+        Args:
+            proxy_url: The URL of the proxy, or `None` for requests made without a proxy.
+            domain: The domain of the requested URL. If given, the statistics of the proxy for the domain are taken
+                into account.
+        """
+        proxy_health = self._proxies.get(proxy_url)
+        domain_health = self._domain_proxies.get((proxy_url, domain)) if domain is not None else None
+
+        latency = next(
+            (
+                health.latency
+                for health in (domain_health, proxy_health)
+                if health is not None and health.latency is not None
+            ),
+            self._mean_latency if self._mean_latency is not None else self._DEFAULT_LATENCY,
+        )
+        failure_rate = max(
+            proxy_health.failure_rate if proxy_health else 0.0,
+            domain_health.failure_rate if domain_health else 0.0,
+        )
+
+        return latency / max(1 - failure_rate, self._MIN_SUCCESS_RATE)
+
+    def is_ejected(self, proxy_url: str | None, domain: str | None = None) -> bool:
+        """Check whether a proxy is currently ejected, either completely or for the given domain."""
+        return self._get_ejected_until(proxy_url, domain) > time.monotonic()
+
+    def pick_url(self, urls: Sequence[URL | None], domain: str | None) -> URL | None:
+        """Pick the proxy for a request to the given domain.
+
+        Args:
+            urls: The proxy URLs to pick from. `None` stands for a connection without a proxy.
+            domain: The domain of the requested URL, if known.
+
+        Returns:
+            The picked proxy URL.
+        """
+        if len(urls) == 1:
+            return urls[0]
+
+        now = time.monotonic()
+        candidates = list[URL | None]()
+
+        for _ in range(self._MAX_RANDOM_DRAWS):
+            url = urls[int(random.random() * len(urls))]
+            if self._get_ejected_until(self._get_key(url), domain) <= now and url not in candidates:
+                candidates.append(url)
+                if len(candidates) == self._CHOICES:
+                    break
+        else:
+            # Most of the proxies are ejected, look for the rest of them.
+            available = [url for url in urls if self._get_ejected_until(self._get_key(url), domain) <= now]
+            if not available:
+                return min(urls, key=lambda url: self._get_ejected_until(self._get_key(url), domain))
+            candidates = random.sample(available, min(self._CHOICES, len(available)))
+
+        return min(candidates, key=lambda url: self.get_score(self._get_key(url), domain))
+
+    def _get_health(self, proxy_url: str | None, domain: str | None) -> list[_ProxyHealth]:
+        """Get the statistics of a proxy and of the proxy for the domain, creating them if necessary."""
+        proxy_health = self._proxies.setdefault(proxy_url, _ProxyHealth())
+        if domain is None:
+            return [proxy_health]
+
+        domain_health = self._domain_proxies.get((proxy_url, domain))
+        if domain_health is None:
+            domain_health = self._domain_proxies[proxy_url, domain] = _ProxyHealth()
+        return [proxy_health, domain_health]
+
+    def _get_ejected_until(self, proxy_url: str | None, domain: str | None) -> float:
+        proxy_health = self._proxies.get(proxy_url)
+        domain_health = self._domain_proxies.get((proxy_url, domain)) if domain is not None else None
+        return max(
+            proxy_health.ejected_until if proxy_health else 0.0,
+            domain_health.ejected_until if domain_health else 0.0,
+        )
+
+    def _update_average(self, average: float | None, value: float) -> float:
+        if average is None:
+            return value
+        return average + self._smoothing * (value - average)
+
+    @staticmethod
+    def _get_key(url: URL | None) -> str | None:
+        return str(url) if url is not None else None
+
 
 class _ProxyTierTracker:
     """Tracks the state of currently used proxy tiers and their error frequency for individual crawled domains."""
@@ -11,6 +11,7 @@ from typing_extensions import override
 
 from crawlee._request import Request
 from crawlee._utils.docs import docs_group
+from crawlee._utils.work_signal import WorkSignal
 from crawlee.request_loaders._request_loader import RequestLoader
 
 logger = getLogger(__name__)
@@ -89,6 +90,9 @@ class RequestList(RequestLoader):
 
         self._requests_lock: asyncio.Lock | None = None
 
+        self._work_signal = WorkSignal()
+        """Never notified. The requests are only read from the source when they are fetched, not in the background."""
+
     async def _get_state(self) -> RequestListState:
         # If state is already initialized, we are done
         if self._state.is_initialized:
@@ -144,6 +148,11 @@ class RequestList(RequestLoader):
     def name(self) -> str | None:
         return self._name
 
+    @property
+    @override
+    def work_signal(self) -> WorkSignal:
+        return self._work_signal
+
     @override
     async def get_handled_count(self) -> int:
         return self._handled_count
@@ -9,6 +9,7 @@ from crawlee._utils.docs import docs_group
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from crawlee._utils.work_signal import WorkSignal
     from crawlee.request_loaders import RequestManager, RequestManagerTandem
     from crawlee.storage_clients.models import ProcessedRequest
 
@@ -25,6 +26,15 @@ class RequestLoader(ABC):
         - Managing state information such as the total and handled request counts.
     """
 
+    @property
+    def work_signal(self) -> WorkSignal | None:
+        """A signal notified whenever new requests become available in the loader, if the loader supports it.
+
+        Consumers can wait for the signal instead of repeatedly polling `is_empty`. Loaders that return `None` have
+        to be polled.
+        """
+        return None
+
     @abstractmethod
     async def get_handled_count(self) -> int:
         """Get the number of requests in the loader that have been handled."""
@@ -49,6 +59,26 @@ class RequestLoader(ABC):
         should wait until a request appears.
         """
 
+    async def fetch_next_requests(self, count: int) -> list[Request]:
+        """Return up to `count` next requests to be processed.
+
+        Every returned request has to be marked as handled (or reclaimed, for request managers) just like a request
+        returned by `fetch_next_request`. The default implementation calls `fetch_next_request` until it gets `count`
+        requests or `None`.
+
+        Args:
+            count: The maximum number of requests to return.
+
+        Returns:
+            The requests, fewer than `count` (possibly none) if there are not enough requests available right now.
+        """
+        requests = list[Request]()
+
+        while len(requests) < count and (request := await self.fetch_next_request()) is not None:
+            requests.append(request)
+
+        return requests
+
     @abstractmethod
     async def mark_request_as_handled(self, request: Request) -> ProcessedRequest | None:
         """Mark a request as handled after a successful processing (or after giving up retrying)."""
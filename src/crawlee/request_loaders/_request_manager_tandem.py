@@ -7,12 +7,14 @@ from typing import TYPE_CHECKING
 from typing_extensions import override
 
 from crawlee._utils.docs import docs_group
+from crawlee._utils.work_signal import CombinedWorkSignal
 from crawlee.request_loaders import RequestManager
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from crawlee import Request
+    from crawlee._utils.work_signal import WorkSignal
     from crawlee.request_loaders import RequestLoader
     from crawlee.storage_clients.models import ProcessedRequest
 
@@ -32,6 +34,20 @@ class RequestManagerTandem(RequestManager):
         self._read_only_loader = request_loader
         self._read_write_manager = request_manager
 
+        # New work can come from both parts, so waiting for a notification only works if both of them notify.
+        loader_signal = request_loader.work_signal
+        manager_signal = request_manager.work_signal
+        self._work_signal = (
+            CombinedWorkSignal(loader_signal, manager_signal)
+            if loader_signal is not None and manager_signal is not None
+            else None
+        )
+
+    @property
+    @override
+    def work_signal(self) -> WorkSignal | None:
+        return self._work_signal
+
     @override
     async def get_handled_count(self) -> int:
         return await self._read_write_manager.get_handled_count()
@@ -23,6 +23,7 @@ from crawlee._utils.sitemap import (
     parse_sitemap,
 )
 from crawlee._utils.urls import filter_url
+from crawlee._utils.work_signal import WorkSignal
 from crawlee.request_loaders._request_loader import RequestLoader
 
 if TYPE_CHECKING:
@@ -175,8 +176,11 @@ class SitemapRequestLoader(RequestLoader):
             logger=logger,
         )
 
+        self._work_signal = WorkSignal()
+        """Notified whenever the background loading adds a URL to the queue and when the loading ends."""
+
         # Start background loading
-        self._loading_task = asyncio.create_task(self._load_sitemaps())
+        self._loading_task = self._start_loading_task()
 
     async def __aenter__(self) -> SitemapRequestLoader:
         """Enter the context manager."""
@@ -192,6 +196,11 @@ class SitemapRequestLoader(RequestLoader):
         """Exit the context manager."""
         await self.close()
 
+    @property
+    @override
+    def work_signal(self) -> WorkSignal:
+        return self._work_signal
+
     @override
     async def get_total_count(self) -> int:
         """Return the total number of URLs found so far."""
@@ -264,7 +273,7 @@ class SitemapRequestLoader(RequestLoader):
         """Start the sitemap loading process."""
         if self._loading_task and not self._loading_task.done():
             return
-        self._loading_task = asyncio.create_task(self._load_sitemaps())
+        self._loading_task = self._start_loading_task()
 
     async def abort_loading(self) -> None:
         """Abort the sitemap loading process."""
@@ -278,6 +287,12 @@ class SitemapRequestLoader(RequestLoader):
         await self.abort_loading()
         await self._state.teardown()
 
+    def _start_loading_task(self) -> asyncio.Task:
+        task = asyncio.create_task(self._load_sitemaps())
+        # The loader becomes finished when the loading ends, which consumers waiting for new URLs need to notice.
+        task.add_done_callback(lambda _: self._work_signal.notify())
+        return task
+
     async def _get_state(self) -> SitemapRequestLoaderState:
         """Initialize and return the current state."""
         if self._state.is_initialized:
@@ -427,6 +442,7 @@ class SitemapRequestLoader(RequestLoader):
                                     state.url_queue.append(url)
                                     state.current_sitemap_processed_urls.add(url)
                                     state.total_count += 1
+                                    self._work_signal.notify()
                                     if len(state.url_queue) >= self._max_buffer_size:
                                         # Notify that the queue is full
                                         self._queue_has_capacity.clear()
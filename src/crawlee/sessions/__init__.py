@@ -1,5 +1,22 @@
 from ._cookies import CookieParam, SessionCookies
 from ._session import Session
 from ._session_pool import SessionPool
+from ._session_selection import (
+    LeastRecentlyUsedSessionSelection,
+    LowestErrorScoreSessionSelection,
+    RandomSessionSelection,
+    SessionSelectionStrategy,
+    WeightedSessionSelection,
+)
 
-__all__ = ['CookieParam', 'Session', 'SessionCookies', 'SessionPool']
+__all__ = [
+    'CookieParam',
+    'LeastRecentlyUsedSessionSelection',
+    'LowestErrorScoreSessionSelection',
+    'RandomSessionSelection',
+    'Session',
+    'SessionCookies',
+    'SessionPool',
+    'SessionSelectionStrategy',
+    'WeightedSessionSelection',
+]
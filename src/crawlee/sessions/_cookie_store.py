@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import math
+import re
+import time
+from email.utils import mktime_tz, parsedate_tz
+from http.cookiejar import Cookie, CookieJar
+from typing import TYPE_CHECKING
+from urllib.parse import quote, urlsplit
+
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_SECURE_SCHEMES = frozenset({'https', 'wss'})
+
+_DEFAULT_PORT = '80'
+
+_PORT_PATTERN = re.compile(r':(\d+)$')
+
+_PATH_SAFE_CHARACTERS = "%/;:@&=+$,!~*'()"
+
+_ESCAPED_CHARACTER_PATTERN = re.compile(r'%[0-9a-fA-F][0-9a-fA-F]')
+
+_VALUE_ATTRIBUTES = frozenset({'version', 'expires', 'max-age', 'domain', 'path', 'port', 'comment', 'commenturl'})
+"""Cookie attributes that carry a value. Their names are case-insensitive."""
+
+_FLAG_ATTRIBUTES = frozenset({'discard', 'secure'})
+"""Cookie attributes that are set by their presence alone. Their names are case-insensitive."""
+
+_OPTIONAL_VALUE_ATTRIBUTES = frozenset({'port', 'comment', 'commenturl'})
+"""Value attributes that may appear without a value. A cookie with another value attribute missing is rejected."""
+
+
+class CookieStore(CookieJar):
+    """A cookie jar indexed for the cookie operations performed on every request of a session.
+
+    It is a regular `CookieJar` holding standard `Cookie` objects, so it can be handed to HTTP clients that accept
+    a jar. On top of that, it keeps the cookies in a dictionary indexed by their domain, and builds `Cookie` headers
+    and parses `Set-Cookie` headers directly, instead of going through the cookie policy with fake request and
+    response objects. Both follow the rules of the default policy of the standard library for Netscape cookies, so
+    the same cookies are accepted and sent as by a plain `CookieJar`.
+
+    The cookies that match a host are looked up in the index once and cached until a cookie that affects the `Cookie`
+    header changes. Cookies must not be modified in place once they are stored - store a modified copy instead.
+    """
+
+    _MAX_CACHED_HOSTS = 1_000
+    """The number of hosts whose matching cookies are cached. The cache is emptied when it grows larger."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.revision = 0
+        """Incremented whenever a cookie is stored or removed, so that views of the cookies can be cached."""
+
+        self._domains: dict[str, dict[tuple[str, str], Cookie]] = {}
+
+        # The cookies that may be sent to a host, as `(path, secure, ports, name=value)` tuples with the longest paths
+        # first. Keyed by the effective host name, the host with `.local` appended if it contains no dot.
+        self._host_cookies: dict[str, list[tuple[str, bool, list[str] | None, str]]] = {}
+
+        # A lower bound of the expiration times of the stored cookies.
+        self._next_expiration: float = math.inf
+
+    @override
+    def __len__(self) -> int:
+        return sum(len(cookies) for cookies in self._domains.values())
+
+    @override
+    def set_cookie(self, cookie: Cookie) -> None:
+        super().set_cookie(cookie)
+
+        cookies = self._domains.setdefault(cookie.domain, {})
+        key = (cookie.path, cookie.name)
+        previous = cookies.get(key)
+        cookies[key] = cookie
+
+        if cookie.expires is not None and cookie.expires < self._next_expiration:
+            self._next_expiration = cookie.expires
+
+        self.revision += 1
+        # Refreshing the expiration time of a cookie, the most common change, leaves the `Cookie` headers intact.
+        if previous is None or (previous.value, previous.secure, previous.port, previous.version) != (
+            cookie.value,
+            cookie.secure,
+            cookie.port,
+            cookie.version,
+        ):
+            self._host_cookies.clear()
+
+    @override
+    def clear(self, domain: str | None = None, path: str | None = None, name: str | None = None) -> None:
+        super().clear(domain, path, name)
+
+        if domain is None:
+            self._domains.clear()
+        elif path is None:
+            self._domains.pop(domain, None)
+        elif name is None:
+            cookies = self._domains.get(domain, {})
+            for key in [key for key in cookies if key[0] == path]:
+                del cookies[key]
+        else:
+            self._domains.get(domain, {}).pop((path, name), None)
+
+        self.revision += 1
+        self._host_cookies.clear()
+
+    @override
+    def clear_expired_cookies(self) -> None:
+        if time.time() < self._next_expiration:
+            return
+
+        super().clear_expired_cookies()
+        self._next_expiration = min(
+            (cookie.expires for cookie in self._iter_cookies() if cookie.expires is not None),
+            default=math.inf,
+        )
+
+    def get_cookie_header(self, url: str) -> str:
+        """Build the value of the `Cookie` header of a request to the given URL.
+
+        Expired cookies are removed from the store first.
+
+        Args:
+            url: The URL of the request.
+
+        Returns:
+            The header value, or an empty string if no stored cookie matches the URL.
+        """
+        if not self._domains:
+            return ''
+
+        self.clear_expired_cookies()
+
+        scheme, netloc, path, _, _ = urlsplit(url)
+        host, port = _split_netloc(netloc)
+        host_cookies = self._host_cookies.get(host)
+        if host_cookies is None:
+            host_cookies = self._find_host_cookies(host)
+        if not host_cookies:
+            return ''
+
+        request_path = _get_request_path(path)
+        secure = scheme in _SECURE_SCHEMES
+
+        return '; '.join(
+            name_value
+            for cookie_path, cookie_secure, cookie_ports, name_value in host_cookies
+            if (secure or not cookie_secure)
+            and (cookie_ports is None or port in cookie_ports)
+            and _path_matches(request_path, cookie_path)
+        )
+
+    def extract_cookies_from_headers(self, url: str, set_cookie_headers: Iterable[str]) -> None:
+        """Store the cookies from the `Set-Cookie` headers of a response to the given URL.
+
+        Cookies that the URL is not allowed to set are ignored, and cookies set to expire in the past are removed.
+
+        Args:
+            url: The URL of the response.
+            set_cookie_headers: Raw values of the `Set-Cookie` headers of the response.
+        """
+        _, netloc, path, _, _ = urlsplit(url)
+        host, port = _split_netloc(netloc)
+        request_path = _get_request_path(path)
+        now = int(time.time())
+
+        for header in set_cookie_headers:
+            cookie = self._parse_set_cookie(header, host, port, request_path, now)
+            if cookie is not None:
+                self.set_cookie(cookie)
+
+    def _iter_cookies(self) -> Iterator[Cookie]:
+        for cookies in self._domains.values():
+            yield from cookies.values()
+
+    def _find_host_cookies(self, host: str) -> list[tuple[str, bool, list[str] | None, str]]:
+        # A Netscape cookie matches a host if the host with a dot prepended ends with the domain of the cookie, with
+        # a dot prepended as well. Cookies without a domain match every host.
+        dotted_host = f'.{host}'
+        domains = dict.fromkeys([''])
+        for index, character in enumerate(dotted_host):
+            if character == '.':
+                domains[dotted_host[index:]] = None
+                domains[dotted_host[index + 1 :]] = None
+
+        cookies = [
+            cookie
+            for domain in domains
+            for cookie in self._domains.get(domain, {}).values()
+            # RFC 2965 cookies are never sent by the default policy.
+            if cookie.version == 0
+        ]
+        cookies.sort(key=lambda cookie: len(cookie.path), reverse=True)
+
+        host_cookies = [
+            (
+                cookie.path,
+                bool(cookie.secure),
+                cookie.port.split(',') if cookie.port else None,
+                cookie.name if cookie.value is None else f'{cookie.name}={cookie.value}',
+            )
+            for cookie in cookies
+        ]
+
+        if len(self._host_cookies) >= self._MAX_CACHED_HOSTS:
+            self._host_cookies.clear()
+        self._host_cookies[host] = host_cookies
+
+        return host_cookies
+
+    def _parse_set_cookie(self, header: str, host: str, port: str, request_path: str, now: int) -> Cookie | None:
+        """Parse a `Set-Cookie` header the way the default policy of `CookieJar` does for Netscape cookies.
+
+        Returns:
+            The cookie to store, or `None` if the header is invalid, the response is not allowed to set the cookie or
+            the cookie is already expired. An expired cookie is removed from the store.
+        """
+        name_value, *raw_attributes = header.split(';')
+        name, separator, value = name_value.partition('=')
+        name = name.strip()
+        if not name:
+            return None
+        value = value.strip() if separator else None
+
+        # Only the first occurrence of a known attribute counts, except for `Max-Age`, whose last occurrence does.
+        attributes: dict[str, str | None] = {}
+        rest: dict[str, str | None] = {}
+        max_age: int | None = None
+        for raw_attribute in raw_attributes:
+            key, separator, attribute_value = raw_attribute.partition('=')
+            key = key.strip()
+            if not key:
+                continue
+            attribute_value = attribute_value.strip() if separator else None
+
+            lowercase_key = key.lower()
+            if lowercase_key == 'max-age':
+                try:
+                    max_age = int(attribute_value or '')
+                except ValueError:
+                    return None
+            elif lowercase_key in _FLAG_ATTRIBUTES:
+                attributes.setdefault(lowercase_key, attribute_value)
+            elif lowercase_key in _VALUE_ATTRIBUTES:
+                if lowercase_key in attributes:
+                    continue
+                if lowercase_key == 'expires':
+                    # Invalid expiration times are ignored.
+                    if _parse_expires(attribute_value) is not None:
+                        attributes['expires'] = attribute_value
+                    continue
+                if attribute_value is None and lowercase_key not in _OPTIONAL_VALUE_ATTRIBUTES:
+                    return None
+                attributes[lowercase_key] = attribute_value
+            else:
+                # The case of unknown attributes, such as `HttpOnly` and `SameSite`, is preserved.
+                rest[key] = attribute_value
+
+        version = 0
+        if (raw_version := attributes.get('version')) is not None:
+            try:
+                version = int(_strip_quotes(raw_version))
+            except ValueError:
+                return None
+        # RFC 2109 cookies are treated as Netscape cookies, later versions are rejected.
+        rfc2109 = version == 1
+        if version > 1:
+            return None
+
+        # `Max-Age` takes precedence over `Expires`.
+        expires = now + max_age if max_age is not None else _parse_expires(attributes.get('expires'))
+
+        path = attributes.get('path')
+        path_specified = bool(path)
+        if path:
+            path = _escape_path(path)
+        else:
+            # The default path is the directory of the request path, without the trailing slash for Netscape cookies.
+            directory_end = request_path.rfind('/')
+            path = request_path[: directory_end + 1 if rfc2109 else directory_end] or '/'
+
+        domain = attributes.get('domain')
+        domain_specified = domain is not None
+        domain_initial_dot = False
+        if domain is None:
+            domain = host
+        else:
+            domain = domain.lower()
+            domain_initial_dot = domain.startswith('.')
+            if not domain_initial_dot:
+                domain = f'.{domain}'
+            if not _domain_allowed(domain, host):
+                return None
+
+        cookie_port: str | None = None
+        port_specified = 'port' in attributes
+        if port_specified:
+            cookie_port = attributes['port']
+            if cookie_port is None:
+                # The port attribute without a value restricts the cookie to the port of the response.
+                cookie_port, port_specified = port, False
+            else:
+                cookie_port = re.sub(r'\s+', '', cookie_port)
+                if not _port_allowed(cookie_port, port):
+                    return None
+
+        if expires is not None and expires <= now:
+            # An expiration time in the past is a request to delete the cookie.
+            if (path, name) in self._domains.get(domain, {}):
+                self.clear(domain, path, name)
+            return None
+
+        return Cookie(
+            version=0,
+            name=name,
+            value=value,
+            port=cookie_port,
+            port_specified=port_specified,
+            domain=domain,
+            domain_specified=domain_specified,
+            domain_initial_dot=domain_initial_dot,
+            path=path,
+            path_specified=path_specified,
+            secure='secure' in attributes,
+            expires=expires,
+            discard=expires is None or 'discard' in attributes,
+            comment=attributes.get('comment'),
+            comment_url=attributes.get('commenturl'),
+            rest=rest,
+            rfc2109=rfc2109,
+        )
+
+
+def _split_netloc(netloc: str) -> tuple[str, str]:
+    """Split the network location of a URL into the effective host name and the port used for cookie matching."""
+    host = netloc.rpartition('@')[2].lower()
+    port = _DEFAULT_PORT
+    if match := _PORT_PATTERN.search(host):
+        port = match.group(1)
+        host = host[: match.start()]
+    # Host names without a dot, such as `localhost`, are treated as local domains.
+    if '.' not in host:
+        host = f'{host}.local'
+    return host, port
+
+
+def _escape_path(path: str) -> str:
+    path = quote(path, safe=_PATH_SAFE_CHARACTERS)
+    if '%' in path:
+        path = _ESCAPED_CHARACTER_PATTERN.sub(lambda match: match.group(0).upper(), path)
+    return path
+
+
+def _get_request_path(path: str) -> str:
+    path = _escape_path(path)
+    return path if path.startswith('/') else f'/{path}'
+
+
+def _path_matches(request_path: str, cookie_path: str) -> bool:
+    if not request_path.startswith(cookie_path):
+        return False
+    return len(request_path) == len(cookie_path) or cookie_path.endswith('/') or request_path[len(cookie_path)] == '/'
+
+
+def _domain_allowed(domain: str, host: str) -> bool:
+    """Check whether a response from the host may set a cookie with the given dotted `Domain` attribute."""
+    undotted_domain = domain[1:]
+    if '.' not in undotted_domain and not host.endswith('.local'):
+        return False
+    return host.endswith((domain, f'{undotted_domain}.local')) or f'.{host}'.endswith(domain)
+
+
+def _port_allowed(cookie_port: str, port: str) -> bool:
+    """Check whether a response from the port may set a cookie restricted to the given comma-separated ports."""
+    for allowed_port in cookie_port.split(','):
+        try:
+            int(allowed_port)
+        except ValueError:
+            return False
+        if allowed_port == port:
+            return True
+    return False
+
+
+def _parse_expires(value: str | None) -> int | None:
+    if value is None:
+        return None
+    parsed = parsedate_tz(_strip_quotes(value))
+    if parsed is None:
+        return None
+    try:
+        return mktime_tz(parsed)
+    except (OverflowError, ValueError):
+        return None
+
+
+def _strip_quotes(text: str) -> str:
+    return text.removeprefix('"').removesuffix('"')
@@ -9,6 +9,7 @@ from urllib.request import Request as UrlRequest
 from typing_extensions import NotRequired, Required, TypedDict
 
 from crawlee._utils.docs import docs_group
+from crawlee.sessions._cookie_store import CookieStore
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -72,14 +73,30 @@ class PlaywrightCookieParam(TypedDict, total=False):
 
 @docs_group('Session management')
 class SessionCookies:
-    """Storage cookies for session with browser-compatible serialization and deserialization."""
+    """Storage cookies for session with browser-compatible serialization and deserialization.
+
+    The cookies are kept in a `CookieJar` indexed by domain, which builds the `Cookie` header of a request and parses
+    the `Set-Cookie` headers of a response without the overhead of the generic cookie policy machinery. The dictionary
+    and Playwright representations of the cookies are cached until the cookies change.
+
+    A `CookieJar` passed to the constructor is used as is, so the changes are visible to its other users. A plain
+    `CookieJar` goes through its own cookie policy and the representations of its cookies are not cached, because
+    the jar can change without `SessionCookies` knowing about it.
+    """
 
     def __init__(self, cookies: SessionCookies | CookieJar | dict[str, str] | list[CookieParam] | None = None) -> None:
+        self._cookie_dicts: list[CookieParam] = []
+        self._cookie_dicts_revision = -1
+        self._playwright_cookies: list[PlaywrightCookieParam] = []
+        self._playwright_cookies_revision = -1
+
+        self._jar: CookieJar
+
         if isinstance(cookies, CookieJar):
             self._jar = cookies
             return
 
-        self._jar = CookieJar()
+        self._jar = CookieStore()
 
         if isinstance(cookies, list):
             for item in cookies:
@@ -201,7 +218,7 @@ class SessionCookies:
 
     def get_cookies_as_dicts(self) -> list[CookieParam]:
         """Convert cookies to a list with `CookieParam` dicts."""
-        return [self._convert_cookie_to_dict(cookie) for cookie in self.jar]
+        return [cookie_dict.copy() for cookie_dict in self._get_cookie_dicts()]
 
     def store_cookie(self, cookie: Cookie) -> None:
         """Store a Cookie object in the session cookie jar.
@@ -242,6 +259,9 @@ class SessionCookies:
         Returns:
             The `Cookie` header value, or an empty string if no stored cookie matches the URL.
         """
+        if isinstance(self._jar, CookieStore):
+            return self._jar.get_cookie_header(url)
+
         # `UrlRequest` is only used as a carrier of the URL and headers for the jar, it never opens a connection.
         url_request = UrlRequest(url)  # noqa: S310
         self._jar.add_cookie_header(url_request)
@@ -257,13 +277,22 @@ class SessionCookies:
             url: The URL of the response carrying the headers.
             set_cookie_headers: Raw values of the `Set-Cookie` response headers.
         """
-        response = _SetCookieResponse(set_cookie_headers)
-        self._jar.extract_cookies(response, UrlRequest(url))  # noqa: S310 # ty: ignore[invalid-argument-type]
+        if isinstance(self._jar, CookieStore):
+            self._jar.extract_cookies_from_headers(url, set_cookie_headers)
+        else:
+            response = _SetCookieResponse(set_cookie_headers)
+            self._jar.extract_cookies(response, UrlRequest(url))  # noqa: S310 # ty: ignore[invalid-argument-type]
         self._jar.clear_expired_cookies()
 
     def get_cookies_as_playwright_format(self) -> list[PlaywrightCookieParam]:
         """Get cookies in playwright format."""
-        return [self._to_playwright(cookie) for cookie in self.get_cookies_as_dicts()]
+        if not isinstance(self._jar, CookieStore):
+            return [self._to_playwright(cookie) for cookie in self._get_cookie_dicts()]
+
+        if self._playwright_cookies_revision != self._jar.revision:
+            self._playwright_cookies = [self._to_playwright(cookie) for cookie in self._get_cookie_dicts()]
+            self._playwright_cookies_revision = self._jar.revision
+        return [cookie.copy() for cookie in self._playwright_cookies]
 
     def set_cookies_from_playwright_format(self, pw_cookies: list[PlaywrightCookieParam]) -> None:
         """Set cookies from playwright format."""
@@ -277,6 +306,16 @@ class SessionCookies:
         cookie_dicts = self.get_cookies_as_dicts()
         return self.__class__(deepcopy(cookie_dicts, memo))
 
+    def _get_cookie_dicts(self) -> list[CookieParam]:
+        """Get the cached dictionary representations of the cookies, rebuilding them if the cookies changed."""
+        if not isinstance(self._jar, CookieStore):
+            return [self._convert_cookie_to_dict(cookie) for cookie in self._jar]
+
+        if self._cookie_dicts_revision != self._jar.revision:
+            self._cookie_dicts = [self._convert_cookie_to_dict(cookie) for cookie in self._jar]
+            self._cookie_dicts_revision = self._jar.revision
+        return self._cookie_dicts
+
     def __len__(self) -> int:
         return len(self._jar)
 
@@ -290,7 +329,7 @@ class SessionCookies:
         raise KeyError(f"Cookie '{name}' not found")
 
     def __iter__(self) -> Iterator[CookieParam]:
-        return (self._convert_cookie_to_dict(cookie) for cookie in self._jar)
+        return iter(self.get_cookies_as_dicts())
 
     def __repr__(self) -> str:
         cookies_str: str = ', '.join(
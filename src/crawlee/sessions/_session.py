@@ -4,14 +4,14 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 from logging import getLogger
-from typing import TYPE_CHECKING, ClassVar, Literal, overload
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, overload
 
 from crawlee._utils.crypto import crypto_random_object_id
 from crawlee._utils.docs import docs_group
 from crawlee.sessions._cookies import CookieParam, SessionCookies
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, MutableMapping
+    from collections.abc import Callable, Mapping, MutableMapping
     from http.cookiejar import CookieJar
 
     from crawlee._types import JsonSerializable
@@ -75,6 +75,9 @@ class Session:
         self._cookies = SessionCookies(cookies) or SessionCookies()
         self._blocked_status_codes = set(blocked_status_codes or self._DEFAULT_BLOCKED_STATUS_CODES)
 
+        # Set by the `SessionPool` that uses the session, to learn about the changes of its error score and usage.
+        self._on_update: Callable[[Session], None] | None = None
+
     @classmethod
     def from_model(cls, model: SessionModel) -> Session:
         """Initialize a new instance from a `SessionModel`."""
@@ -85,6 +88,10 @@ class Session:
         """Get a string representation."""
         return f'<{self.__class__.__name__} {self.get_state(as_dict=False)}>'
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the state for pickling and copying, without the reference to the session pool."""
+        return {**self.__dict__, '_on_update': None}
+
     def __eq__(self, other: object) -> bool:
         """Compare two sessions for equality."""
         if not isinstance(other, Session):
@@ -200,6 +207,8 @@ class Session:
         # Retire the session if it is not usable anymore
         if not self.is_usable:
             self.retire()
+        elif self._on_update:
+            self._on_update(self)
 
     def mark_bad(self) -> None:
         """Mark the session as bad after an unsuccessful session usage."""
@@ -209,6 +218,8 @@ class Session:
         # Retire the session if it is not usable anymore
         if not self.is_usable:
             self.retire()
+        elif self._on_update:
+            self._on_update(self)
 
     def retire(self) -> None:
         """Retire the session by setting the error score to the maximum value.
@@ -220,6 +231,9 @@ class Session:
         """
         self._error_score += self._max_error_score
 
+        if self._on_update:
+            self._on_update(self)
+
     def is_blocked_status_code(
         self,
         *,
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import heapq
+import random
+from itertools import count
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from crawlee.sessions import Session
+
+
+class SessionIndex:
+    """An index of sessions that picks a random session in constant time.
+
+    The sessions are kept in a list, and their positions in the list in a dictionary, so a random session is picked
+    and a session is removed in constant time - the removed session is swapped with the last one.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: list[Session] = []
+        self._positions = dict[str, int]()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._positions
+
+    def add(self, session: Session) -> None:
+        """Add a session to the index, replacing an indexed session with the same ID."""
+        position = self._positions.get(session.id)
+        if position is None:
+            self._positions[session.id] = len(self._sessions)
+            self._sessions.append(session)
+        else:
+            self._sessions[position] = session
+
+    def remove(self, session_id: str) -> Session | None:
+        """Remove a session from the index.
+
+        Returns:
+            The removed session, or `None` if no session with the ID is indexed.
+        """
+        position = self._positions.pop(session_id, None)
+        if position is None:
+            return None
+
+        session = self._sessions[position]
+        last_session = self._sessions.pop()
+        if last_session is not session:
+            self._sessions[position] = last_session
+            self._positions[last_session.id] = position
+
+        return session
+
+    def pick_random(self) -> Session | None:
+        """Pick a random session from the index, or return `None` if it is empty."""
+        if not self._sessions:
+            return None
+        # Faster than `random.randrange`, which matters at thousands of picks per second.
+        return self._sessions[int(random.random() * len(self._sessions))]
+
+    def clear(self) -> None:
+        """Remove all the sessions from the index."""
+        self._sessions.clear()
+        self._positions.clear()
+
+
+class SessionExpirationQueue:
+    """The sessions tracked by a `SessionPool`, ordered by their expiration time.
+
+    The expiration times are kept in a heap, which lets `remove_expired` find the expired sessions without going
+    through all the sessions. Sessions that become unusable by being used (blocked or used up) stay in the queue
+    until they are removed.
+    """
+
+    _HEAP_COMPACTION_RATIO = 2
+    """How many times the heap may outgrow the queue before its stale entries are dropped."""
+
+    def __init__(self) -> None:
+        self._sessions: dict[str, Session] = {}
+
+        # Entries of removed sessions are left in the heap and skipped when they come up.
+        self._heap: list[tuple[float, int, Session]] = []
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._sessions
+
+    def add(self, session: Session) -> None:
+        """Add a session to the queue, replacing a queued session with the same ID."""
+        self._sessions[session.id] = session
+        heapq.heappush(self._heap, (session.expires_at.timestamp(), next(self._sequence), session))
+        if len(self._heap) > self._HEAP_COMPACTION_RATIO * len(self._sessions) + 16:
+            self._compact_heap()
+
+    def get(self, session_id: str) -> Session | None:
+        """Get a queued session by its ID, or `None` if no session with the ID is queued."""
+        return self._sessions.get(session_id)
+
+    def remove(self, session_id: str) -> Session | None:
+        """Remove a session from the queue.
+
+        Returns:
+            The removed session, or `None` if no session with the ID is queued.
+        """
+        return self._sessions.pop(session_id, None)
+
+    def remove_expired(self, now: float) -> list[Session]:
+        """Remove the sessions that expire at `now` (a POSIX timestamp) or earlier from the queue.
+
+        Returns:
+            The removed sessions.
+        """
+        expired: list[Session] = []
+        heap = self._heap
+
+        while heap and heap[0][0] <= now:
+            _, _, session = heapq.heappop(heap)
+            if self._sessions.get(session.id) is session:
+                del self._sessions[session.id]
+                expired.append(session)
+
+        return expired
+
+    def clear(self) -> None:
+        """Remove all the sessions from the queue."""
+        self._sessions.clear()
+        self._heap.clear()
+
+    def _compact_heap(self) -> None:
+        self._heap = [entry for entry in self._heap if self._sessions.get(entry[2].id) is entry[2]]
+        heapq.heapify(self._heap)
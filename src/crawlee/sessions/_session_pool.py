@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import random
+import time
 from collections.abc import Callable
 from logging import getLogger
 from typing import TYPE_CHECKING, Literal, overload
@@ -13,11 +13,14 @@ from crawlee._utils.docs import docs_group
 from crawlee._utils.recoverable_state import RecoverableState
 from crawlee.sessions import Session
 from crawlee.sessions._models import SessionPoolModel
+from crawlee.sessions._session_index import SessionExpirationQueue
+from crawlee.sessions._session_selection import RandomSessionSelection
 
 if TYPE_CHECKING:
     from types import TracebackType
 
     from crawlee.events import EventManager
+    from crawlee.sessions._session_selection import SessionSelectionStrategy
 
 logger = getLogger(__name__)
 
@@ -43,6 +46,8 @@ class SessionPool:
         persistence_enabled: bool = False,
         persist_state_kvs_name: str | None = None,
         persist_state_key: str = 'CRAWLEE_SESSION_POOL_STATE',
+        session_selection: SessionSelectionStrategy | None = None,
+        incremental_persistence: bool = False,
     ) -> None:
         """Initialize a new instance.
 
@@ -57,6 +62,11 @@ class SessionPool:
             persistence_enabled: Flag to enable or disable state persistence of the pool.
             persist_state_kvs_name: The name of the `KeyValueStore` used for state persistence.
             persist_state_key: The key under which the session pool's state is stored in the `KeyValueStore`.
+            session_selection: Decides which of the usable sessions `get_session` returns. If None,
+                a `RandomSessionSelection` is used, which picks a session uniformly at random.
+            incremental_persistence: Persist only the sessions that changed since the last persist, instead of
+                the whole pool. The sessions are persisted after they are marked as good or bad, so the changes of
+                their cookies made in between are persisted with them.
         """
         if event_manager:
             service_locator.set_event_manager(event_manager)
@@ -70,6 +80,7 @@ class SessionPool:
             persistence_enabled=persistence_enabled,
             persist_state_kvs_name=persist_state_kvs_name,
             persist_state_key=persist_state_key or 'CRAWLEE_SESSION_POOL_STATE',
+            incremental_persistence=incremental_persistence,
         )
 
         self._max_pool_size = max_pool_size
@@ -77,6 +88,15 @@ class SessionPool:
         self._create_session_function = create_session_function
         self._persistence_enabled = persistence_enabled
 
+        # The usable sessions out of `sessions` of the state. The selection picks the sessions for `get_session`,
+        # the expiration queue finds the sessions that expired.
+        self._session_selection = session_selection or RandomSessionSelection()
+        self._usable_sessions = SessionExpirationQueue()
+
+        # The sessions of the state that are no longer usable. They stay in the state, counted by
+        # `retired_session_count`, until `get_session` replaces them with new sessions.
+        self._retired_sessions: dict[str, Session] = {}
+
         if self._create_session_function and self._session_settings:
             raise ValueError('Both `create_session_settings` and `create_session_function` cannot be provided.')
 
@@ -120,6 +140,8 @@ class SessionPool:
 
         state = await self._state.initialize()
         state.max_pool_size = self._max_pool_size
+        self._state.mark_dirty('max_pool_size')
+        self._rebuild_usable_sessions()
         self._remove_retired_sessions()
 
         if not state.sessions:
@@ -175,25 +197,35 @@ class SessionPool:
             logger.warning(f'Session with ID {session.id} already exists in the pool.')
             return
         state.sessions[session.id] = session
+        self._state.mark_dirty('sessions', session.id)
+
+        if session.is_usable:
+            self._track_session(session)
+        else:
+            self._retired_sessions[session.id] = session
 
     @ensure_context
     async def get_session(self) -> Session:
-        """Retrieve a random session from the pool.
+        """Retrieve a session from the pool, chosen by the session selection strategy of the pool.
 
-        This method first ensures the session pool is at its maximum capacity. If the random session is not usable,
-        retired sessions are removed and a new session is created and returned.
+        This method first removes the sessions that are no longer usable and ensures the session pool is at its
+        maximum capacity. If the selected session is not usable, it is removed and a new session is created and
+        returned.
 
         Returns:
             The session object.
         """
+        self._retire_expired_sessions()
+        self._remove_retired_sessions()
         await self._fill_sessions_to_max()
-        session = self._get_random_session()
+        session = self._select_session()
 
-        if session.is_usable:
+        if session is not None and session.is_usable:
             return session
 
-        # If the random session is not usable, clean up and create a new session
-        self._remove_retired_sessions()
+        # If the selected session is not usable, remove it and create a new session
+        if session is not None:
+            self._remove_session(session)
         return await self._create_new_session()
 
     @ensure_context
@@ -225,6 +257,8 @@ class SessionPool:
     async def reset_store(self) -> None:
         """Reset the KVS where the pool state is persisted."""
         await self._state.reset()
+        self._rebuild_usable_sessions()
+        self._remove_retired_sessions()
 
     async def _create_new_session(self) -> Session:
         """Create a new session, add it to the pool and return it."""
@@ -233,6 +267,8 @@ class SessionPool:
         else:
             new_session = Session(**self._session_settings)
         self._state.current_value.sessions[new_session.id] = new_session
+        self._state.mark_dirty('sessions', new_session.id)
+        self._track_session(new_session)
         return new_session
 
     async def _fill_sessions_to_max(self) -> None:
@@ -240,14 +276,69 @@ class SessionPool:
         for _ in range(self._max_pool_size - self.session_count):
             await self._create_new_session()
 
-    def _get_random_session(self) -> Session:
-        """Get a random session from the pool."""
-        state = self._state.current_value
-        if not state.sessions:
-            raise ValueError('No sessions available in the pool.')
-        return random.choice(list(state.sessions.values()))
+    def _select_session(self) -> Session | None:
+        """Select a session out of the usable sessions of the pool."""
+        return self._session_selection.select()
+
+    def _remove_session(self, session: Session) -> None:
+        """Remove a session from the pool."""
+        self._untrack_session(session)
+        sessions = self._state.current_value.sessions
+        if sessions.get(session.id) is session:
+            del sessions[session.id]
+            self._state.mark_dirty('sessions', session.id)
+
+    def _retire_expired_sessions(self) -> None:
+        """Stop selecting the sessions that have expired since the last call."""
+        for session in self._usable_sessions.remove_expired(time.time()):
+            self._untrack_session(session)
+            self._retired_sessions[session.id] = session
+
+    def _track_session(self, session: Session) -> None:
+        """Start selecting a usable session and following its updates."""
+        session._on_update = self._on_session_update  # noqa: SLF001
+        self._usable_sessions.add(session)
+        self._session_selection.add(session)
+
+    def _untrack_session(self, session: Session) -> None:
+        """Stop selecting a session and following its updates."""
+        session._on_update = None  # noqa: SLF001
+        if self._usable_sessions.get(session.id) is session:
+            self._usable_sessions.remove(session.id)
+            self._session_selection.remove(session.id)
+
+    def _on_session_update(self, session: Session) -> None:
+        """Update the selection after a session was marked as good or bad, or stop selecting it once it is retired."""
+        if self._usable_sessions.get(session.id) is not session:
+            return
+
+        self._state.mark_dirty('sessions', session.id)
+        if session.is_usable:
+            self._session_selection.update(session)
+            return
+
+        self._untrack_session(session)
+        self._retired_sessions[session.id] = session
 
     def _remove_retired_sessions(self) -> None:
-        """Remove all sessions from the pool that are no longer usable."""
-        state = self._state.current_value
-        state.sessions = {session.id: session for session in state.sessions.values() if session.is_usable}
+        """Remove the sessions that are no longer usable from the pool."""
+        sessions = self._state.current_value.sessions
+        removed_session_ids = [
+            session_id for session_id, session in self._retired_sessions.items() if sessions.get(session_id) is session
+        ]
+        for session_id in removed_session_ids:
+            del sessions[session_id]
+        if removed_session_ids:
+            self._state.mark_dirty('sessions', *removed_session_ids)
+        self._retired_sessions.clear()
+
+    def _rebuild_usable_sessions(self) -> None:
+        """Index the usable sessions of the current state, after the state is loaded or reset."""
+        self._usable_sessions.clear()
+        self._session_selection.clear()
+        self._retired_sessions.clear()
+        for session in self._state.current_value.sessions.values():
+            if session.is_usable:
+                self._track_session(session)
+            else:
+                self._retired_sessions[session.id] = session
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import heapq
+import math
+import random
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from itertools import count
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from crawlee._utils.docs import docs_group
+from crawlee.sessions._session_index import SessionIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from crawlee.sessions._session import Session
+
+
+@docs_group('Session management')
+class SessionSelectionStrategy(ABC):
+    """Decides which of the usable sessions of a `SessionPool` is returned by `get_session`.
+
+    The pool tells the strategy about every session it starts or stops using, and calls `update` whenever one of its
+    sessions is marked as good or bad. The strategy only ever holds usable sessions - the pool removes a session from
+    the strategy as soon as it is retired. The pool calls the strategy from the event loop only, so the strategies do
+    not need to be thread-safe, but a single instance should not be shared by multiple pools.
+    """
+
+    @abstractmethod
+    def add(self, session: Session) -> None:
+        """Start selecting from a session, replacing a session with the same ID.
+
+        Args:
+            session: The usable session to add.
+        """
+
+    @abstractmethod
+    def remove(self, session_id: str) -> None:
+        """Stop selecting a session. Unknown IDs are ignored.
+
+        Args:
+            session_id: The ID of the session to remove.
+        """
+
+    def update(self, session: Session) -> None:  # noqa: B027
+        """Notify the strategy that the error score or usage count of one of its sessions changed.
+
+        Args:
+            session: The session that was marked as good or bad.
+        """
+
+    @abstractmethod
+    def select(self) -> Session | None:
+        """Select the session for the next request.
+
+        Returns:
+            The selected session, or `None` if the strategy holds no sessions.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all the sessions from the strategy."""
+
+
+@docs_group('Session management')
+class RandomSessionSelection(SessionSelectionStrategy):
+    """Selects a session uniformly at random, regardless of its error score or usage count.
+
+    This is the default strategy. Both selecting and updating a session take constant time.
+    """
+
+    def __init__(self) -> None:
+        self._sessions = SessionIndex()
+
+    @override
+    def add(self, session: Session) -> None:
+        self._sessions.add(session)
+
+    @override
+    def remove(self, session_id: str) -> None:
+        self._sessions.remove(session_id)
+
+    @override
+    def select(self) -> Session | None:
+        return self._sessions.pick_random()
+
+    @override
+    def clear(self) -> None:
+        self._sessions.clear()
+
+
+@docs_group('Session management')
+class LeastRecentlyUsedSessionSelection(SessionSelectionStrategy):
+    """Selects the session that was selected the longest time ago, new sessions first.
+
+    This rotates through all the sessions in turns, which spreads the requests evenly over them and gives every
+    session the longest possible time between two requests. Selecting a session takes constant time.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+
+    @override
+    def add(self, session: Session) -> None:
+        self._sessions[session.id] = session
+        self._sessions.move_to_end(session.id, last=False)
+
+    @override
+    def remove(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    @override
+    def select(self) -> Session | None:
+        if not self._sessions:
+            return None
+        session = next(iter(self._sessions.values()))
+        self._sessions.move_to_end(session.id)
+        return session
+
+    @override
+    def clear(self) -> None:
+        self._sessions.clear()
+
+
+@docs_group('Session management')
+class LowestErrorScoreSessionSelection(SessionSelectionStrategy):
+    """Selects the session with the lowest error score.
+
+    Sessions with the same error score are selected in turns - the one that was selected the longest time ago goes
+    first, and new sessions go last, so concurrent requests do not all get the same session before any of them
+    finishes. A session that failed is only selected again after all the sessions with a lower error score. Such
+    sessions are not retired though, they keep their place in the pool until they expire, so this strategy works best
+    with large pools or a low `max_error_score` of the sessions.
+
+    The sessions are kept in a heap, so selecting and updating a session take logarithmic time.
+    """
+
+    _HEAP_COMPACTION_RATIO = 2
+    """How many times the heap may outgrow the number of sessions before its stale entries are dropped."""
+
+    def __init__(self) -> None:
+        # The current heap entry of every session. Replaced entries are left in the heap and skipped.
+        self._entries: dict[str, tuple[float, int, int, Session]] = {}
+        self._heap: list[tuple[float, int, int, Session]] = []
+        self._sequence = count()
+
+    @override
+    def add(self, session: Session) -> None:
+        self._push(session, next(self._sequence))
+
+    @override
+    def remove(self, session_id: str) -> None:
+        self._entries.pop(session_id, None)
+
+    @override
+    def update(self, session: Session) -> None:
+        entry = self._entries.get(session.id)
+        if entry is not None:
+            self._push(session, entry[1])
+
+    @override
+    def select(self) -> Session | None:
+        heap = self._heap
+        while heap and self._entries.get(heap[0][3].id) is not heap[0]:
+            heapq.heappop(heap)
+
+        if not heap:
+            return None
+
+        session = heap[0][3]
+        self._push(session, next(self._sequence))
+        return session
+
+    @override
+    def clear(self) -> None:
+        self._entries.clear()
+        self._heap.clear()
+
+    def _push(self, session: Session, selected_at: int) -> None:
+        # The sequence number of the push breaks the ties between the entries of the same session.
+        entry = (session.error_score, selected_at, next(self._sequence), session)
+        self._entries[session.id] = entry
+        heapq.heappush(self._heap, entry)
+
+        if len(self._heap) > self._HEAP_COMPACTION_RATIO * len(self._entries) + 16:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+
+def _default_session_weight(session: Session) -> float:
+    return math.sqrt(1 + session.usage_count) / (1 + session.error_score) ** 6
+
+
+@docs_group('Session management')
+class WeightedSessionSelection(SessionSelectionStrategy):
+    """Selects a session at random, with a probability proportional to its weight.
+
+    By default, the weight falls steeply with the error score and grows slowly with the usage count, so sessions that
+    failed recently are selected rarely and sessions that keep working are preferred to untried ones. No session is
+    starved completely - a failing session still gets an occasional request, which either lets it recover or gets it
+    retired, instead of leaving it in the pool.
+
+    The weights are kept in a Fenwick tree, so selecting a session and updating its weight when it is marked as good
+    or bad take logarithmic time.
+    """
+
+    _REBUILD_INTERVAL = 10_000
+    """The number of weight updates after which the tree is rebuilt, to drop accumulated floating-point errors."""
+
+    def __init__(self, weight_function: Callable[[Session], float] | None = None) -> None:
+        """Initialize a new instance.
+
+        Args:
+            weight_function: Computes the weight of a session from its state, e.g. the error score and usage count.
+                It must return a positive number. If None, the default weight function is used.
+        """
+        self._weight_function = weight_function or _default_session_weight
+
+        # Sessions occupy slots. The slots of removed sessions are reused by the sessions added later.
+        self._sessions: list[Session | None] = []
+        self._weights: list[float] = []
+        self._slots = dict[str, int]()
+        self._free_slots: list[int] = []
+
+        # A Fenwick tree over the weights of the slots, indexed from 1.
+        self._tree = [0.0]
+        self._total_weight = 0.0
+        self._updates_until_rebuild = self._REBUILD_INTERVAL
+
+    @override
+    def add(self, session: Session) -> None:
+        slot = self._slots.get(session.id)
+        if slot is None:
+            slot = self._free_slots.pop() if self._free_slots else self._allocate_slot()
+            self._slots[session.id] = slot
+        self._sessions[slot] = session
+        self._set_weight(slot, self._compute_weight(session))
+
+    @override
+    def remove(self, session_id: str) -> None:
+        slot = self._slots.pop(session_id, None)
+        if slot is None:
+            return
+        self._sessions[slot] = None
+        self._set_weight(slot, 0.0)
+        self._free_slots.append(slot)
+
+    @override
+    def update(self, session: Session) -> None:
+        slot = self._slots.get(session.id)
+        if slot is not None:
+            self._set_weight(slot, self._compute_weight(session))
+
+    @override
+    def select(self) -> Session | None:
+        if not self._slots:
+            return None
+
+        session = self._find_session(random.random() * self._total_weight)
+        if session is None:
+            # The floating-point errors of the incremental updates pointed outside the occupied slots.
+            self._rebuild()
+            session = self._find_session(random.random() * self._total_weight)
+
+        return session or self._sessions[next(iter(self._slots.values()))]
+
+    @override
+    def clear(self) -> None:
+        self._sessions.clear()
+        self._weights.clear()
+        self._slots.clear()
+        self._free_slots.clear()
+        self._tree = [0.0]
+        self._total_weight = 0.0
+
+    def _compute_weight(self, session: Session) -> float:
+        weight = self._weight_function(session)
+        if not weight > 0:
+            raise ValueError(f'The weight of a session must be positive, got {weight} for session {session.id}.')
+        return weight
+
+    def _allocate_slot(self) -> int:
+        # Double the number of slots, which makes the growth amortized constant time.
+        size = len(self._sessions)
+        capacity = max(16, 2 * size)
+        self._sessions.extend([None] * (capacity - size))
+        self._weights.extend([0.0] * (capacity - size))
+        self._free_slots.extend(range(capacity - 1, size, -1))
+        self._rebuild()
+        return size
+
+    def _set_weight(self, slot: int, weight: float) -> None:
+        delta = weight - self._weights[slot]
+        self._weights[slot] = weight
+        self._total_weight += delta
+
+        tree = self._tree
+        index = slot + 1
+        while index < len(tree):
+            tree[index] += delta
+            index += index & -index
+
+        self._updates_until_rebuild -= 1
+        if self._updates_until_rebuild <= 0:
+            self._rebuild()
+
+    def _find_session(self, target: float) -> Session | None:
+        """Find the session in the first slot at which the cumulative weight exceeds the target."""
+        tree = self._tree
+        size = len(tree) - 1
+        position = 0
+        step = 1 << (size.bit_length() - 1)
+
+        while step:
+            next_position = position + step
+            if next_position <= size and tree[next_position] <= target:
+                position = next_position
+                target -= tree[next_position]
+            step >>= 1
+
+        return self._sessions[position] if position < size else None
+
+    def _rebuild(self) -> None:
+        tree = [0.0, *self._weights]
+        for index in range(1, len(tree)):
+            parent = index + (index & -index)
+            if parent < len(tree):
+                tree[parent] += tree[index]
+
+        self._tree = tree
+        self._total_weight = sum(self._weights)
+        self._updates_until_rebuild = self._REBUILD_INTERVAL
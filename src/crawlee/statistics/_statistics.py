@@ -110,6 +110,15 @@ class Statistics(Generic[TStatisticsState]):
         # Flag to indicate the context state.
         self._active = False
 
+    @classmethod
+    def _start_ids_at(cls, first_id: int) -> None:
+        """Make the IDs of the instances created from now on start at `first_id`.
+
+        Processes that share a key-value store use this to keep the default persistence keys of their statistics from
+        colliding.
+        """
+        Statistics.__next_id = first_id
+
     def replace_state_model(self, state_model: type[TNewStatisticsState]) -> Statistics[TNewStatisticsState]:
         """Create near copy of the `Statistics` with replaced `state_model`."""
         new_statistics: Statistics[TNewStatisticsState] = Statistics(
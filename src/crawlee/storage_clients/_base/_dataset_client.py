@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
@@ -24,6 +25,15 @@ class DatasetClient(ABC):
     This abstract class defines the interface that all specific dataset clients must implement.
     """
 
+    @property
+    def has_stdlib_json_records(self) -> bool:
+        """Whether `iterate_raw_items` hands out stored records in the compact form of the standard library `json`.
+
+        Such records can be copied to a JSON export as they are. For other clients, serializing the items returned by
+        `iterate_items` is cheaper than producing records and re-encoding them.
+        """
+        return False
+
     @abstractmethod
     async def get_metadata(self) -> DatasetMetadata:
         """Get the metadata of the dataset."""
@@ -93,6 +103,22 @@ class DatasetClient(ABC):
         if False:
             yield {}
 
+    async def iterate_raw_items(
+        self,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+        desc: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """Iterate over the dataset items as UTF-8 encoded JSON records, without any transformation.
+
+        The backend method for the `Dataset.iterate_raw_items` call. The default implementation serializes the items
+        returned by `iterate_items`, clients that store items as JSON can override it to hand out the stored records
+        without parsing them.
+        """
+        async for item in self.iterate_items(offset=offset, limit=limit, desc=desc):
+            yield json.dumps(item, ensure_ascii=False).encode('utf-8')
+
     @staticmethod
     def _is_sequence_of_items(
         data: Sequence[Mapping[str, JsonSerializable]] | Mapping[str, JsonSerializable],
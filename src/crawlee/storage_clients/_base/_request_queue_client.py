@@ -17,6 +17,15 @@ class RequestQueueClient(ABC):
     client, like a memory storage client.
     """
 
+    @property
+    def has_local_changes_only(self) -> bool:
+        """Whether every change to the queue is made through this client, in the current process.
+
+        `RequestQueue` then knows about all new work and consumers can wait for its `work_signal`. Queues that other
+        processes can change, such as those stored in Redis or in an SQL database, have to be polled instead.
+        """
+        return False
+
     @abstractmethod
     async def get_metadata(self) -> RequestQueueMetadata:
         """Get the metadata of the request queue."""
@@ -85,6 +94,26 @@ class RequestQueueClient(ABC):
             The request or `None` if there are no more pending requests.
         """
 
+    async def fetch_next_requests(self, count: int) -> list[Request]:
+        """Return up to `count` next requests in the queue to be processed.
+
+        Each returned request is in progress, exactly as if it was returned by `fetch_next_request`. The default
+        implementation calls `fetch_next_request` repeatedly, subclasses can override it to fetch the whole batch
+        in a single operation.
+
+        Args:
+            count: The maximum number of requests to return.
+
+        Returns:
+            The requests, fewer than `count` (possibly none) if there are not enough pending requests.
+        """
+        requests: list[Request] = []
+
+        while len(requests) < count and (request := await self.fetch_next_request()) is not None:
+            requests.append(request)
+
+        return requests
+
     @abstractmethod
     async def mark_request_as_handled(self, request: Request) -> ProcessedRequest | None:
         """Mark a request as handled after successful processing.
@@ -0,0 +1,14 @@
+from ._dataset_client import BrokerDatasetClient
+from ._key_value_store_client import BrokerKeyValueStoreClient
+from ._request_queue_client import BrokerRequestQueueClient
+from ._storage_broker import StorageBroker, run_storage_broker
+from ._storage_client import BrokerStorageClient
+
+__all__ = [
+    'BrokerDatasetClient',
+    'BrokerKeyValueStoreClient',
+    'BrokerRequestQueueClient',
+    'BrokerStorageClient',
+    'StorageBroker',
+    'run_storage_broker',
+]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from ._protocol import answer_challenge, read_message, write_message
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from ._protocol import StorageType
+
+
+class BrokerConnection:
+    """A connection to a `StorageBroker`, shared by all the storage clients of a `BrokerStorageClient`.
+
+    The connection is opened lazily by the first call. Calls from concurrent tasks are multiplexed over it, every
+    call is answered by a message with the same call ID. A connection belongs to the event loop it was opened in,
+    a call from another event loop opens a new one.
+    """
+
+    def __init__(self, address: tuple[str, int], authkey: bytes) -> None:
+        self._address = address
+        self._authkey = authkey
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._connect_lock: asyncio.Lock | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._pending_calls = dict[int, 'asyncio.Future[Any]']()
+        self._call_ids = itertools.count()
+
+    async def call(self, operation: str, *arguments: Any) -> Any:
+        """Perform an operation in the broker and return its result, or raise the error it failed with."""
+        writer = await self._ensure_connected()
+
+        call_id = next(self._call_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending_calls[call_id] = future
+
+        try:
+            write_message(writer, (call_id, operation, arguments))
+            await writer.drain()
+            return await future
+        finally:
+            self._pending_calls.pop(call_id, None)
+
+    async def call_storage(
+        self, storage_type: StorageType, storage_id: str, method: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Call a method of the storage client of an open storage in the broker."""
+        return await self.call('call', storage_type, storage_id, method, args, kwargs)
+
+    async def iterate_storage(
+        self,
+        storage_type: StorageType,
+        storage_id: str,
+        method: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the items of an async iterator returned by a method of the storage client in the broker."""
+        iterator_id = await self.call('iterate', storage_type, storage_id, method, kwargs)
+        exhausted = False
+
+        try:
+            while not exhausted:
+                items, exhausted = await self.call('next', iterator_id)
+                for item in items:
+                    yield item
+        finally:
+            if not exhausted:
+                with suppress(ConnectionError):
+                    await self.call('close_iterator', iterator_id)
+
+    async def close(self) -> None:
+        """Close the connection. A later call opens a new one."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reader_task
+            self._reader_task = None
+
+        if self._writer is not None:
+            self._writer.close()
+            with suppress(ConnectionError):
+                await self._writer.wait_closed()
+            self._writer = None
+
+        self._fail_pending_calls(ConnectionError('The connection to the storage broker was closed.'))
+        self._loop = None
+        self._connect_lock = None
+
+    async def _ensure_connected(self) -> asyncio.StreamWriter:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._connect_lock is None:
+            # The connection was opened in an event loop that is no longer used, e.g. by a previous `asyncio.run`.
+            self._loop = loop
+            self._connect_lock = asyncio.Lock()
+            self._writer = None
+            self._reader_task = None
+
+        if self._writer is not None:
+            return self._writer
+
+        async with self._connect_lock:
+            if self._writer is None:
+                reader, writer = await asyncio.open_connection(*self._address)
+                try:
+                    await answer_challenge(reader, writer, self._authkey)
+                except ConnectionError:
+                    writer.close()
+                    raise
+                self._reader_task = asyncio.create_task(self._read_responses(reader))
+                self._writer = writer
+
+            return self._writer
+
+    async def _read_responses(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                call_id, success, result = await read_message(reader)
+                future = self._pending_calls.get(call_id)
+                if future is None or future.done():
+                    continue
+
+                if success:
+                    future.set_result(result)
+                else:
+                    future.set_exception(result)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            if self._writer is not None:
+                self._writer.close()
+            self._writer = None
+            self._fail_pending_calls(ConnectionError('The connection to the storage broker was lost.'))
+
+    def _fail_pending_calls(self, error: Exception) -> None:
+        for future in self._pending_calls.values():
+            if not future.done():
+                future.set_exception(error)
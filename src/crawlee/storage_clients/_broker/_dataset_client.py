@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from crawlee.storage_clients._base import DatasetClient
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping, Sequence
+
+    from crawlee._types import JsonSerializable
+    from crawlee.storage_clients.models import DatasetItemsListPage, DatasetMetadata
+
+    from ._connection import BrokerConnection
+
+
+class BrokerDatasetClient(DatasetClient):
+    """Dataset client that forwards every operation to a dataset served by a `StorageBroker`.
+
+    Items are iterated in chunks, so iterating over a large dataset does not need a round trip per item.
+    """
+
+    def __init__(self, *, connection: BrokerConnection, id: str) -> None:
+        """Initialize a new instance.
+
+        Preferably use the `BrokerStorageClient.create_dataset_client` method to create a new instance.
+        """
+        self._connection = connection
+        self._id = id
+
+    @override
+    async def get_metadata(self) -> DatasetMetadata:
+        return await self._connection.call_storage('dataset', self._id, 'get_metadata')
+
+    @override
+    async def drop(self) -> None:
+        await self._connection.call('drop', 'dataset', self._id)
+
+    @override
+    async def purge(self) -> None:
+        await self._connection.call_storage('dataset', self._id, 'purge')
+
+    @override
+    async def push_data(self, data: Sequence[Mapping[str, JsonSerializable]] | Mapping[str, JsonSerializable]) -> None:
+        await self._connection.call_storage('dataset', self._id, 'push_data', data)
+
+    @override
+    async def get_data(
+        self,
+        *,
+        offset: int = 0,
+        limit: int | None = 999_999_999_999,
+        clean: bool = False,
+        desc: bool = False,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        unwind: list[str] | None = None,
+        skip_empty: bool = False,
+        skip_hidden: bool = False,
+        flatten: list[str] | None = None,
+        view: str | None = None,
+    ) -> DatasetItemsListPage:
+        return await self._connection.call_storage(
+            'dataset',
+            self._id,
+            'get_data',
+            offset=offset,
+            limit=limit,
+            clean=clean,
+            desc=desc,
+            fields=fields,
+            omit=omit,
+            unwind=unwind,
+            skip_empty=skip_empty,
+            skip_hidden=skip_hidden,
+            flatten=flatten,
+            view=view,
+        )
+
+    @override
+    async def iterate_items(
+        self,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+        clean: bool = False,
+        desc: bool = False,
+        fields: list[str] | None = None,
+        omit: list[str] | None = None,
+        unwind: list[str] | None = None,
+        skip_empty: bool = False,
+        skip_hidden: bool = False,
+    ) -> AsyncIterator[Mapping[str, JsonSerializable]]:
+        async for item in self._connection.iterate_storage(
+            'dataset',
+            self._id,
+            'iterate_items',
+            offset=offset,
+            limit=limit,
+            clean=clean,
+            desc=desc,
+            fields=fields,
+            omit=omit,
+            unwind=unwind,
+            skip_empty=skip_empty,
+            skip_hidden=skip_hidden,
+        ):
+            yield item
+
+    @override
+    async def iterate_raw_items(
+        self,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+        desc: bool = False,
+    ) -> AsyncIterator[bytes]:
+        async for item in self._connection.iterate_storage(
+            'dataset',
+            self._id,
+            'iterate_raw_items',
+            offset=offset,
+            limit=limit,
+            desc=desc,
+        ):
+            yield item
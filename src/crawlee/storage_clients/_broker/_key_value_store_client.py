@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import override
+
+from crawlee.storage_clients._base import KeyValueStoreClient
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from crawlee.storage_clients.models import (
+        KeyValueStoreMetadata,
+        KeyValueStoreRecord,
+        KeyValueStoreRecordMetadata,
+    )
+
+    from ._connection import BrokerConnection
+
+
+class BrokerKeyValueStoreClient(KeyValueStoreClient):
+    """Key-value store client that forwards every operation to a key-value store served by a `StorageBroker`.
+
+    Values have to be picklable to be sent to the broker, which holds for all the values a key-value store can
+    serialize.
+    """
+
+    def __init__(self, *, connection: BrokerConnection, id: str) -> None:
+        """Initialize a new instance.
+
+        Preferably use the `BrokerStorageClient.create_kvs_client` method to create a new instance.
+        """
+        self._connection = connection
+        self._id = id
+
+    @override
+    async def get_metadata(self) -> KeyValueStoreMetadata:
+        return await self._connection.call_storage('kvs', self._id, 'get_metadata')
+
+    @override
+    async def drop(self) -> None:
+        await self._connection.call('drop', 'kvs', self._id)
+
+    @override
+    async def purge(self) -> None:
+        await self._connection.call_storage('kvs', self._id, 'purge')
+
+    @override
+    async def get_value(self, *, key: str) -> KeyValueStoreRecord | None:
+        return await self._connection.call_storage('kvs', self._id, 'get_value', key=key)
+
+    @override
+    async def set_value(self, *, key: str, value: Any, content_type: str | None = None) -> None:
+        await self._connection.call_storage(
+            'kvs', self._id, 'set_value', key=key, value=value, content_type=content_type
+        )
+
+    @override
+    async def delete_value(self, *, key: str) -> None:
+        await self._connection.call_storage('kvs', self._id, 'delete_value', key=key)
+
+    @override
+    async def iterate_keys(
+        self,
+        *,
+        exclusive_start_key: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[KeyValueStoreRecordMetadata]:
+        async for key in self._connection.iterate_storage(
+            'kvs',
+            self._id,
+            'iterate_keys',
+            exclusive_start_key=exclusive_start_key,
+            limit=limit,
+        ):
+            yield key
+
+    @override
+    async def get_public_url(self, *, key: str) -> str:
+        return await self._connection.call_storage('kvs', self._id, 'get_public_url', key=key)
+
+    @override
+    async def record_exists(self, *, key: str) -> bool:
+        return await self._connection.call_storage('kvs', self._id, 'record_exists', key=key)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import pickle
+import secrets
+import struct
+from typing import Any, Literal
+
+StorageType = Literal['dataset', 'kvs', 'rq']
+
+FRAME_HEADER = struct.Struct('!I')
+"""Each message is a pickled object, preceded by its length as a 4-byte unsigned integer."""
+
+MAX_MESSAGE_SIZE = 1 << 30
+"""The largest message in bytes that can be sent or received. Larger frames close the connection."""
+
+AUTH_CHALLENGE_SIZE = 32
+"""The size in bytes of the random challenges exchanged when a connection is opened."""
+
+AUTH_TIMEOUT = 10.0
+"""How long the broker waits for a connecting client to authenticate, in seconds."""
+
+_AUTH_DIGEST = hashlib.sha256
+_AUTH_DIGEST_SIZE = _AUTH_DIGEST().digest_size
+
+ITERATOR_CHUNK_SIZE = 1000
+"""The number of items sent in one message when iterating over a storage."""
+
+ALLOWED_METHODS: dict[StorageType, frozenset[str]] = {
+    'dataset': frozenset({'get_metadata', 'purge', 'push_data', 'get_data'}),
+    'kvs': frozenset(
+        {'get_metadata', 'purge', 'get_value', 'set_value', 'delete_value', 'get_public_url', 'record_exists'}
+    ),
+    'rq': frozenset(
+        {
+            'get_metadata',
+            'purge',
+            'add_batch_of_requests',
+            'get_request',
+            'fetch_next_request',
+            'fetch_next_requests',
+            'mark_request_as_handled',
+            'reclaim_request',
+            'is_empty',
+            'is_finished',
+        }
+    ),
+}
+"""The storage client methods that can be called through the broker, by storage type."""
+
+ALLOWED_ITERATORS: dict[StorageType, frozenset[str]] = {
+    'dataset': frozenset({'iterate_items', 'iterate_raw_items'}),
+    'kvs': frozenset({'iterate_keys'}),
+    'rq': frozenset(),
+}
+"""The storage client methods returning async iterators that can be called through the broker, by storage type."""
+
+
+async def deliver_challenge(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, authkey: bytes) -> bool:
+    """Authenticate the client on the other end of a connection accepted by the broker.
+
+    The broker sends a random challenge, the client answers with its HMAC keyed by the `authkey` and with a challenge
+    of its own, which the broker answers only if the client proved it knows the key. Only raw bytes of a fixed size
+    are exchanged, nothing is unpickled before the client is authenticated.
+
+    Returns:
+        Whether the client is authenticated. The broker should close the connection otherwise.
+    """
+    challenge = secrets.token_bytes(AUTH_CHALLENGE_SIZE)
+    writer.write(challenge)
+    await writer.drain()
+
+    answer = await reader.readexactly(_AUTH_DIGEST_SIZE + AUTH_CHALLENGE_SIZE)
+    digest, client_challenge = answer[:_AUTH_DIGEST_SIZE], answer[_AUTH_DIGEST_SIZE:]
+    if not hmac.compare_digest(digest, _get_digest(authkey, b'client', challenge)):
+        return False
+
+    writer.write(_get_digest(authkey, b'broker', client_challenge))
+    await writer.drain()
+    return True
+
+
+async def answer_challenge(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, authkey: bytes) -> None:
+    """Authenticate a connection opened by a client to the broker, and the broker to the client.
+
+    Raises:
+        ConnectionError: If the broker rejected the `authkey` or does not know it.
+    """
+    try:
+        challenge = await reader.readexactly(AUTH_CHALLENGE_SIZE)
+        client_challenge = secrets.token_bytes(AUTH_CHALLENGE_SIZE)
+        writer.write(_get_digest(authkey, b'client', challenge) + client_challenge)
+        await writer.drain()
+        digest = await reader.readexactly(_AUTH_DIGEST_SIZE)
+    except asyncio.IncompleteReadError as error:
+        raise ConnectionError('The storage broker rejected the authentication key.') from error
+
+    if not hmac.compare_digest(digest, _get_digest(authkey, b'broker', client_challenge)):
+        raise ConnectionError('The storage broker failed to authenticate.')
+
+
+def _get_digest(authkey: bytes, role: bytes, challenge: bytes) -> bytes:
+    # The role keeps the answer of one side from being replayed as the answer of the other one.
+    return hmac.new(authkey, role + challenge, _AUTH_DIGEST).digest()
+
+
+async def read_message(reader: asyncio.StreamReader) -> Any:
+    """Read a single message from the stream.
+
+    Raises:
+        ValueError: If the frame is larger than `MAX_MESSAGE_SIZE`.
+    """
+    (size,) = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+    if size > MAX_MESSAGE_SIZE:
+        raise ValueError(f'The message size {size} exceeds the limit of {MAX_MESSAGE_SIZE} bytes.')
+    return pickle.loads(await reader.readexactly(size))
+
+
+def write_message(writer: asyncio.StreamWriter, message: Any) -> None:
+    """Write a single message to the stream. The caller is responsible for draining the writer.
+
+    Raises:
+        ValueError: If the pickled message is larger than `MAX_MESSAGE_SIZE`. Nothing is written then.
+    """
+    payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(payload) > MAX_MESSAGE_SIZE:
+        raise ValueError(f'The message size {len(payload)} exceeds the limit of {MAX_MESSAGE_SIZE} bytes.')
+    writer.write(FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def make_picklable_error(error: BaseException) -> BaseException:
+    """Return the error itself if it survives pickling, or a `RuntimeError` describing it otherwise."""
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:
+        return RuntimeError(f'{type(error).__name__}: {error}')
+
+    return error
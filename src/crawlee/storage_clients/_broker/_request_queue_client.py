@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from crawlee.storage_clients._base import RequestQueueClient
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from crawlee import Request
+    from crawlee.storage_clients.models import AddRequestsResponse, ProcessedRequest, RequestQueueMetadata
+
+    from ._connection import BrokerConnection
+
+
+class BrokerRequestQueueClient(RequestQueueClient):
+    """Request queue client that forwards every operation to a request queue served by a `StorageBroker`.
+
+    All the processes connected to the broker share the queue, and a request fetched by one of them is in progress
+    until that process marks it as handled or reclaims it, so every request is processed by a single process.
+    """
+
+    def __init__(self, *, connection: BrokerConnection, id: str) -> None:
+        """Initialize a new instance.
+
+        Preferably use the `BrokerStorageClient.create_rq_client` method to create a new instance.
+        """
+        self._connection = connection
+        self._id = id
+
+    @override
+    async def get_metadata(self) -> RequestQueueMetadata:
+        return await self._connection.call_storage('rq', self._id, 'get_metadata')
+
+    @override
+    async def drop(self) -> None:
+        await self._connection.call('drop', 'rq', self._id)
+
+    @override
+    async def purge(self) -> None:
+        await self._connection.call_storage('rq', self._id, 'purge')
+
+    @override
+    async def add_batch_of_requests(
+        self,
+        requests: Sequence[Request],
+        *,
+        forefront: bool = False,
+    ) -> AddRequestsResponse:
+        return await self._connection.call_storage(
+            'rq', self._id, 'add_batch_of_requests', list(requests), forefront=forefront
+        )
+
+    @override
+    async def get_request(self, unique_key: str) -> Request | None:
+        return await self._connection.call_storage('rq', self._id, 'get_request', unique_key)
+
+    @override
+    async def fetch_next_request(self) -> Request | None:
+        return await self._connection.call_storage('rq', self._id, 'fetch_next_request')
+
+    @override
+    async def fetch_next_requests(self, count: int) -> list[Request]:
+        return await self._connection.call_storage('rq', self._id, 'fetch_next_requests', count)
+
+    @override
+    async def mark_request_as_handled(self, request: Request) -> ProcessedRequest | None:
+        # The broker works on a copy of the request, so the timestamp is set here for the caller to see it.
+        if not request.was_already_handled:
+            request.handled_at = datetime.now(timezone.utc)
+
+        return await self._connection.call_storage('rq', self._id, 'mark_request_as_handled', request)
+
+    @override
+    async def reclaim_request(
+        self,
+        request: Request,
+        *,
+        forefront: bool = False,
+    ) -> ProcessedRequest | None:
+        return await self._connection.call_storage('rq', self._id, 'reclaim_request', request, forefront=forefront)
+
+    @override
+    async def is_empty(self) -> bool:
+        return await self._connection.call_storage('rq', self._id, 'is_empty')
+
+    @override
+    async def is_finished(self) -> bool:
+        return await self._connection.call_storage('rq', self._id, 'is_finished')
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import multiprocessing
+import signal
+from contextlib import suppress
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+from crawlee import service_locator
+from crawlee.storages import Dataset, KeyValueStore, RequestQueue
+
+from ._protocol import (
+    ALLOWED_ITERATORS,
+    ALLOWED_METHODS,
+    AUTH_TIMEOUT,
+    ITERATOR_CHUNK_SIZE,
+    StorageType,
+    deliver_challenge,
+    make_picklable_error,
+    read_message,
+    write_message,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from multiprocessing.connection import Connection
+
+    from crawlee.configuration import Configuration
+    from crawlee.storage_clients import StorageClient
+    from crawlee.storages._base import Storage
+
+logger = getLogger(__name__)
+
+_STORAGE_CLASSES: dict[StorageType, type[Dataset | KeyValueStore | RequestQueue]] = {
+    'dataset': Dataset,
+    'kvs': KeyValueStore,
+    'rq': RequestQueue,
+}
+
+
+class StorageBroker:
+    """Serves the storages of a storage client to other processes over a local TCP connection.
+
+    The broker lets crawlers running in several processes share storages of a backend that only works within a single
+    process, such as the memory or the file system storage client. The processes access the storages through
+    a `BrokerStorageClient`, which forwards every operation to the broker, where it is performed on the storage opened
+    with the served storage client. Storages are opened through the storage classes, so every process gets the same
+    instance for the same ID, name or alias, and an unnamed storage is purged only when it is first opened.
+
+    Every connection starts with a challenge-response authentication based on the `authkey`, so other users of the
+    machine cannot access the storages. Nothing the client sends is unpickled before it is authenticated.
+    """
+
+    def __init__(self, storage_client: StorageClient, *, configuration: Configuration, authkey: bytes) -> None:
+        """Initialize a new instance.
+
+        Args:
+            storage_client: The storage client whose storages are served.
+            configuration: The configuration the storages are opened with.
+            authkey: The secret the connecting processes have to present.
+        """
+        self._storage_client = storage_client
+        self._configuration = configuration
+        self._authkey = authkey
+
+        self._server: asyncio.Server | None = None
+        self._closed = asyncio.Event()
+        self._storages = dict[tuple[StorageType, str], 'Storage']()
+        self._iterators = dict[int, 'AsyncIterator[Any]']()
+        self._iterator_ids = itertools.count()
+        self._connections = dict[asyncio.StreamWriter, asyncio.Task]()
+        """The writers of the open connections and the tasks handling them."""
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """The host and port the broker listens on."""
+        if self._server is None:
+            raise RuntimeError('The storage broker is not running.')
+
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return host, port
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> tuple[str, int]:
+        """Start listening for connections.
+
+        Args:
+            host: The host to listen on.
+            port: The port to listen on. By default, a free port is picked.
+
+        Returns:
+            The host and port the broker listens on.
+        """
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self._closed.clear()
+        return self.address
+
+    async def stop(self) -> None:
+        """Stop accepting connections and close the existing ones."""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+
+        connections = list(self._connections.items())
+        for writer, _ in connections:
+            writer.close()
+        await asyncio.gather(*(task for _, task in connections), return_exceptions=True)
+
+        self._closed.set()
+
+    async def wait_closed(self) -> None:
+        """Wait until the broker is stopped, either by `stop` or by a client asking it to shut down."""
+        await self._closed.wait()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        tasks = set[asyncio.Task]()
+        current_task = asyncio.current_task()
+        if current_task is not None:
+            self._connections[writer] = current_task
+
+        try:
+            try:
+                authenticated = await asyncio.wait_for(deliver_challenge(reader, writer, self._authkey), AUTH_TIMEOUT)
+            except asyncio.TimeoutError:
+                authenticated = False
+
+            if not authenticated:
+                logger.warning('Rejected a storage broker connection that failed to authenticate.')
+                return
+
+            while True:
+                call_id, operation, arguments = await read_message(reader)
+                task = asyncio.create_task(self._handle_call(writer, call_id, operation, arguments))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ValueError:
+            logger.warning('Closed a storage broker connection that sent a message over the size limit.')
+        finally:
+            self._connections.pop(writer, None)
+            for task in tasks:
+                task.cancel()
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _handle_call(
+        self,
+        writer: asyncio.StreamWriter,
+        call_id: int,
+        operation: str,
+        arguments: tuple[Any, ...],
+    ) -> None:
+        try:
+            result = await self._dispatch(operation, arguments)
+        except Exception as error:
+            write_message(writer, (call_id, False, make_picklable_error(error)))
+        else:
+            try:
+                write_message(writer, (call_id, True, result))
+            except ValueError as error:
+                write_message(writer, (call_id, False, error))
+
+        with suppress(ConnectionError):
+            await writer.drain()
+
+    async def _dispatch(self, operation: str, arguments: tuple[Any, ...]) -> Any:
+        if operation == 'open':
+            return await self._open(*arguments)
+
+        if operation == 'call':
+            storage_type, storage_id, method, args, kwargs = arguments
+            if method not in ALLOWED_METHODS[storage_type]:
+                raise ValueError(f'Method "{method}" cannot be called through the storage broker.')
+            client = self._get_storage(storage_type, storage_id)._client  # noqa: SLF001
+            return await getattr(client, method)(*args, **kwargs)
+
+        if operation == 'drop':
+            storage_type, storage_id = arguments
+            storage = self._storages.pop((storage_type, storage_id), None)
+            if storage is not None:
+                await storage.drop()
+            return None
+
+        if operation == 'iterate':
+            storage_type, storage_id, method, kwargs = arguments
+            if method not in ALLOWED_ITERATORS[storage_type]:
+                raise ValueError(f'Method "{method}" cannot be called through the storage broker.')
+            client = self._get_storage(storage_type, storage_id)._client  # noqa: SLF001
+            iterator_id = next(self._iterator_ids)
+            self._iterators[iterator_id] = getattr(client, method)(**kwargs)
+            return iterator_id
+
+        if operation == 'next':
+            return await self._next_chunk(*arguments)
+
+        if operation == 'close_iterator':
+            (iterator_id,) = arguments
+            iterator = self._iterators.pop(iterator_id, None)
+            if iterator is not None and hasattr(iterator, 'aclose'):
+                await iterator.aclose()
+            return None
+
+        if operation == 'shutdown':
+            # The reply has to go out before the connections are closed.
+            asyncio.get_running_loop().call_soon(lambda: asyncio.ensure_future(self.stop()))
+            return None
+
+        raise ValueError(f'Unknown storage broker operation "{operation}".')
+
+    async def _open(self, storage_type: StorageType, id: str | None, name: str | None, alias: str | None) -> str:
+        storage = await _STORAGE_CLASSES[storage_type].open(
+            id=id,
+            name=name,
+            alias=alias,
+            configuration=self._configuration,
+            storage_client=self._storage_client,
+        )
+        self._storages[storage_type, storage.id] = storage
+        return storage.id
+
+    def _get_storage(self, storage_type: StorageType, storage_id: str) -> Storage:
+        storage = self._storages.get((storage_type, storage_id))
+        if storage is None:
+            raise ValueError(f'The storage "{storage_id}" is not open in the storage broker.')
+        return storage
+
+    async def _next_chunk(self, iterator_id: int) -> tuple[list[Any], bool]:
+        """Return the next items of an iterator, and whether the iterator is exhausted."""
+        iterator = self._iterators[iterator_id]
+        items = list[Any]()
+
+        try:
+            while len(items) < ITERATOR_CHUNK_SIZE:
+                items.append(await anext(iterator))
+        except StopAsyncIteration:
+            del self._iterators[iterator_id]
+            return items, True
+
+        return items, False
+
+
+def run_storage_broker(
+    storage_client: StorageClient,
+    configuration: Configuration,
+    authkey: bytes,
+    connection: Connection,
+) -> None:
+    """Run a storage broker in the current process until it is shut down.
+
+    This is the target of the broker process. The address of the broker is sent through the `connection` once it
+    accepts connections. The broker stops when a client asks it to, or when its parent process exits.
+    """
+    # Interrupts are handled by the parent process, which shuts the broker down once the workers are done.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    asyncio.run(_serve_storage_broker(storage_client, configuration, authkey, connection))
+
+
+async def _serve_storage_broker(
+    storage_client: StorageClient,
+    configuration: Configuration,
+    authkey: bytes,
+    connection: Connection,
+) -> None:
+    service_locator.set_configuration(configuration)
+    service_locator.set_storage_client(storage_client)
+    broker = StorageBroker(storage_client, configuration=configuration, authkey=authkey)
+
+    # The event manager emits the persistence events some storages rely on to flush their state.
+    async with service_locator.get_event_manager():
+        connection.send(await broker.start())
+        watchdog = asyncio.create_task(_stop_with_parent(broker))
+        try:
+            await broker.wait_closed()
+        finally:
+            watchdog.cancel()
+            await broker.stop()
+
+
+async def _stop_with_parent(broker: StorageBroker) -> None:
+    parent = multiprocessing.parent_process()
+    if parent is None:
+        return
+
+    while parent.is_alive():
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(broker.wait_closed(), timeout=1)
+            return
+
+    logger.warning('The parent of the storage broker exited, shutting down.')
+    await broker.stop()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from crawlee._utils.docs import docs_group
+from crawlee.storage_clients._base import StorageClient
+
+from ._connection import BrokerConnection
+from ._dataset_client import BrokerDatasetClient
+from ._key_value_store_client import BrokerKeyValueStoreClient
+from ._request_queue_client import BrokerRequestQueueClient
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from crawlee.configuration import Configuration
+
+
+@docs_group('Storage clients')
+class BrokerStorageClient(StorageClient):
+    """Storage client that accesses the storages served by a `StorageBroker` running in another process.
+
+    This storage client lets crawlers in several processes share storages of a backend that only works within
+    a single process, such as the memory or the file system storage client. Every operation is forwarded to the broker
+    over a local TCP connection and performed there, so the storages behave as if all the crawlers ran in the broker
+    process. It is used by the `MultiprocessCrawlerRunner`, which starts the broker and connects its workers to it.
+
+    Storages opened through this client are purged by the broker, according to the configuration the broker was
+    started with, when any process opens them for the first time. The `configuration` passed to the methods of this
+    client is not sent to the broker.
+    """
+
+    def __init__(self, *, address: tuple[str, int], authkey: bytes) -> None:
+        """Initialize a new instance.
+
+        Args:
+            address: The host and port the broker listens on.
+            authkey: The secret the broker was started with.
+        """
+        self._address = address
+        self._connection = BrokerConnection(address, authkey)
+
+    @override
+    def get_storage_client_cache_key(self, configuration: Configuration) -> Hashable:
+        return (super().get_storage_client_cache_key(configuration), self._address)
+
+    @override
+    async def create_dataset_client(
+        self,
+        *,
+        id: str | None = None,
+        name: str | None = None,
+        alias: str | None = None,
+        configuration: Configuration | None = None,
+    ) -> BrokerDatasetClient:
+        storage_id = await self._connection.call('open', 'dataset', id, name, alias)
+        return BrokerDatasetClient(connection=self._connection, id=storage_id)
+
+    @override
+    async def create_kvs_client(
+        self,
+        *,
+        id: str | None = None,
+        name: str | None = None,
+        alias: str | None = None,
+        configuration: Configuration | None = None,
+    ) -> BrokerKeyValueStoreClient:
+        storage_id = await self._connection.call('open', 'kvs', id, name, alias)
+        return BrokerKeyValueStoreClient(connection=self._connection, id=storage_id)
+
+    @override
+    async def create_rq_client(
+        self,
+        *,
+        id: str | None = None,
+        name: str | None = None,
+        alias: str | None = None,
+        configuration: Configuration | None = None,
+    ) -> BrokerRequestQueueClient:
+        storage_id = await self._connection.call('open', 'rq', id, name, alias)
+        return BrokerRequestQueueClient(connection=self._connection, id=storage_id)
+
+    async def shutdown_broker(self) -> None:
+        """Ask the broker to stop serving the storages and close the connection to it."""
+        await self._connection.call('shutdown')
+        await self._connection.close()
+
+    async def close(self) -> None:
+        """Close the connection to the broker. The broker keeps serving the storages to other processes."""
+        await self._connection.close()
@@ -7,7 +7,7 @@ from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
 from logging import getLogger
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import ValidationError
 from typing_extensions import Self, override
@@ -15,11 +15,15 @@ from typing_extensions import Self, override
 from crawlee._consts import METADATA_FILENAME
 from crawlee._types import JsonSerializable
 from crawlee._utils.crypto import crypto_random_object_id
-from crawlee._utils.file import atomic_write, json_dumps, validate_subdirectory
+from crawlee._utils.file import atomic_write, atomic_write_many, json_dumps, validate_subdirectory
+from crawlee._utils.free_threading import run_cpu_bound
+from crawlee._utils.json_codec import JsonCodec, StdlibJsonCodec, get_json_codec
 from crawlee._utils.raise_if_too_many_kwargs import raise_if_too_many_kwargs
 from crawlee.storage_clients._base import DatasetClient
 from crawlee.storage_clients.models import DatasetItemsListPage, DatasetMetadata
 
+from ._dataset_segments import DatasetSegments
+
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
@@ -44,6 +48,12 @@ class FileSystemDatasetClient(DatasetClient):
 
     This implementation is ideal for long-running crawlers where data persistence is important,
     and for development environments where you want to easily inspect the collected data between runs.
+
+    With the `'jsonl'` storage format, items are instead appended as lines to segmented JSON Lines files in the
+    `segments` subdirectory of the dataset (see `DatasetSegments`). Pushing items then becomes a single append per
+    batch, and reads with `offset` and `limit` seek directly to the requested items using a sparse offset index, which
+    makes this format a better fit for datasets with millions of items. The storage format of an existing dataset
+    cannot be changed, items stored in the other format are not visible to the client.
     """
 
     _STORAGE_SUBDIR = 'datasets'
@@ -55,12 +65,20 @@ class FileSystemDatasetClient(DatasetClient):
     _ITEM_FILENAME_DIGITS = 9
     """Number of digits used for the dataset item file names (e.g., 000000019.json)."""
 
+    _SEGMENTS_SUBDIR = 'segments'
+    """The name of the subdirectory holding the segment files when the `'jsonl'` storage format is used."""
+
+    _ITERATE_CHUNK_SIZE = 1_000
+    """Number of items read at once by `iterate_items` when the `'jsonl'` storage format is used."""
+
     def __init__(
         self,
         *,
         metadata: DatasetMetadata,
         path_to_dataset: Path,
         lock: asyncio.Lock,
+        segments: DatasetSegments | None = None,
+        json_codec: JsonCodec | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -74,6 +92,17 @@ class FileSystemDatasetClient(DatasetClient):
         self._lock = lock
         """A lock to ensure that only one operation is performed at a time."""
 
+        self._segments = segments
+        """Segmented storage of the items, `None` if each item is stored in its own JSON file."""
+
+        self._json_codec = json_codec or get_json_codec()
+        """The codec used to encode and decode the items."""
+
+    @property
+    @override
+    def has_stdlib_json_records(self) -> bool:
+        return self._segments is not None and isinstance(self._json_codec, StdlibJsonCodec)
+
     @override
     async def get_metadata(self) -> DatasetMetadata:
         return self._metadata
@@ -96,6 +125,7 @@ class FileSystemDatasetClient(DatasetClient):
         name: str | None,
         alias: str | None,
         configuration: Configuration,
+        storage_format: Literal['json', 'jsonl'] = 'json',
     ) -> Self:
         """Open or create a file system dataset client.
 
@@ -108,6 +138,9 @@ class FileSystemDatasetClient(DatasetClient):
             name: The name of the dataset for named (global scope) storages.
             alias: The alias of the dataset for unnamed (run scope) storages.
             configuration: The configuration object containing storage directory settings.
+            storage_format: How the items are stored. Options are:
+                - 'json': Each item is stored in its own JSON file.
+                - 'jsonl': Items are appended to segmented JSON Lines files with a sparse offset index.
 
         Returns:
             An instance for the opened or created storage client.
@@ -120,6 +153,7 @@ class FileSystemDatasetClient(DatasetClient):
         raise_if_too_many_kwargs(id=id, name=name, alias=alias)
 
         dataset_base_path = Path(configuration.storage_dir) / cls._STORAGE_SUBDIR
+        json_codec = get_json_codec(configuration.json_codec)
 
         if not dataset_base_path.exists():
             await asyncio.to_thread(dataset_base_path.mkdir, parents=True, exist_ok=True)
@@ -145,7 +179,12 @@ class FileSystemDatasetClient(DatasetClient):
                                 metadata=metadata,
                                 path_to_dataset=dataset_base_path / dataset_dir,
                                 lock=asyncio.Lock(),
+                                segments=await cls._open_segments(
+                                    dataset_base_path / dataset_dir, storage_format, json_codec
+                                ),
+                                json_codec=json_codec,
                             )
+                            client._reconcile_item_count()
                             await client._update_metadata(update_accessed_at=True)
                             found = True
                             break
@@ -178,7 +217,10 @@ class FileSystemDatasetClient(DatasetClient):
                     metadata=metadata,
                     path_to_dataset=path_to_dataset,
                     lock=asyncio.Lock(),
+                    segments=await cls._open_segments(path_to_dataset, storage_format, json_codec),
+                    json_codec=json_codec,
                 )
+                client._reconcile_item_count()
 
                 await client._update_metadata(update_accessed_at=True)
 
@@ -197,7 +239,10 @@ class FileSystemDatasetClient(DatasetClient):
                     metadata=metadata,
                     path_to_dataset=path_to_dataset,
                     lock=asyncio.Lock(),
+                    segments=await cls._open_segments(path_to_dataset, storage_format, json_codec),
+                    json_codec=json_codec,
                 )
+                client._reconcile_item_count()
                 await client._update_metadata()
 
         return client
@@ -205,14 +250,20 @@ class FileSystemDatasetClient(DatasetClient):
     @override
     async def drop(self) -> None:
         async with self._lock:
+            if self._segments is not None:
+                await self._segments.close()
+
             if self.path_to_dataset.exists():
                 await asyncio.to_thread(shutil.rmtree, self.path_to_dataset)
 
     @override
     async def purge(self) -> None:
         async with self._lock:
-            for file_path in await self._get_sorted_data_files():
-                await asyncio.to_thread(file_path.unlink, missing_ok=True)
+            if self._segments is not None:
+                await self._segments.purge()
+            else:
+                for file_path in await self._get_sorted_data_files():
+                    await asyncio.to_thread(file_path.unlink, missing_ok=True)
 
             await self._update_metadata(
                 update_accessed_at=True,
@@ -225,9 +276,13 @@ class FileSystemDatasetClient(DatasetClient):
         async with self._lock:
             new_item_count = self._metadata.item_count
             items = data if isinstance(data, Sequence) else [data]
-            for item in items:
-                new_item_count += 1
-                await self._push_item(item, new_item_count)
+
+            if self._segments is not None:
+                await self._segments.append(items)
+                new_item_count = self._segments.item_count
+            else:
+                await self._push_items(items, first_item_id=new_item_count + 1)
+                new_item_count += len(items)
 
             # now update metadata under the same lock
             await self._update_metadata(
@@ -282,6 +337,11 @@ class FileSystemDatasetClient(DatasetClient):
                 items=[],
             )
 
+        if self._segments is not None:
+            return await self._get_data_from_segments(
+                self._segments, offset=offset, limit=limit, desc=desc, skip_empty=skip_empty
+            )
+
         # Get the list of sorted data files.
         async with self._lock:
             try:
@@ -305,14 +365,14 @@ class FileSystemDatasetClient(DatasetClient):
         items = list[Mapping[str, JsonSerializable]]()
         for file_path in selected_files:
             try:
-                file_content = await asyncio.to_thread(file_path.read_text, encoding='utf-8')
+                file_content = await asyncio.to_thread(file_path.read_bytes)
             except FileNotFoundError:
                 logger.warning(f'File disappeared during iterate_items(): {file_path}, skipping')
                 continue
 
             try:
-                item = json.loads(file_content)
-            except json.JSONDecodeError:
+                item = self._json_codec.decode(file_content)
+            except ValueError:
                 logger.exception(f'Corrupt JSON in {file_path}, skipping')
                 continue
 
@@ -370,6 +430,16 @@ class FileSystemDatasetClient(DatasetClient):
             logger.warning(f'Dataset directory not found: {self.path_to_dataset}')
             return
 
+        if self._segments is not None:
+            async for item in self._iterate_segments(
+                self._segments, offset=offset, limit=limit, desc=desc, skip_empty=skip_empty
+            ):
+                yield item
+
+            async with self._lock:
+                await self._update_metadata(update_accessed_at=True)
+            return
+
         # Get the list of sorted data files.
         async with self._lock:
             try:
@@ -389,14 +459,14 @@ class FileSystemDatasetClient(DatasetClient):
         # Iterate over each data file, reading and yielding its parsed content.
         for file_path in selected_files:
             try:
-                file_content = await asyncio.to_thread(file_path.read_text, encoding='utf-8')
+                file_content = await asyncio.to_thread(file_path.read_bytes)
             except FileNotFoundError:
                 logger.warning(f'File disappeared during iterate_items(): {file_path}, skipping')
                 continue
 
             try:
-                item = json.loads(file_content)
-            except json.JSONDecodeError:
+                item = self._json_codec.decode(file_content)
+            except ValueError:
                 logger.exception(f'Corrupt JSON in {file_path}, skipping')
                 continue
 
@@ -409,6 +479,137 @@ class FileSystemDatasetClient(DatasetClient):
         async with self._lock:
             await self._update_metadata(update_accessed_at=True)
 
+    @classmethod
+    async def _open_segments(
+        cls, path_to_dataset: Path, storage_format: Literal['json', 'jsonl'], json_codec: JsonCodec
+    ) -> DatasetSegments | None:
+        """Open the segments of the dataset if the `'jsonl'` storage format is used.
+
+        Args:
+            path_to_dataset: The path to the dataset directory.
+            storage_format: The storage format of the dataset.
+            json_codec: The codec used to encode and decode the items.
+
+        Returns:
+            The opened segments, or `None` for the `'json'` storage format.
+        """
+        if storage_format == 'json':
+            return None
+        return await DatasetSegments.open(
+            path_to_segments=path_to_dataset / cls._SEGMENTS_SUBDIR, json_codec=json_codec
+        )
+
+    def _reconcile_item_count(self) -> None:
+        """Align the item count in the metadata with the segments, which may differ after a crash."""
+        if self._segments is not None and self._segments.item_count != self._metadata.item_count:
+            logger.warning(
+                f'Item count of dataset {self._metadata.id} in the metadata ({self._metadata.item_count}) differs '
+                f'from the stored items ({self._segments.item_count}), using the latter.'
+            )
+            self._metadata.item_count = self._segments.item_count
+
+    @staticmethod
+    def _get_item_range(total: int, offset: int, limit: int | None, *, desc: bool) -> tuple[int, int]:
+        """Translate `offset` and `limit` into an ascending range of item positions."""
+        count = max(total - offset, 0) if limit is None else max(min(limit, total - offset), 0)
+        if desc:
+            return total - offset - count, total - offset
+        return offset, offset + count
+
+    async def _get_data_from_segments(
+        self,
+        segments: DatasetSegments,
+        *,
+        offset: int,
+        limit: int | None,
+        desc: bool,
+        skip_empty: bool,
+    ) -> DatasetItemsListPage:
+        """Read a page of items from the segments with a seek and a sequential read."""
+        total = segments.item_count
+        start, stop = self._get_item_range(total, offset, limit, desc=desc)
+
+        try:
+            items = await segments.read(start, stop)
+        except FileNotFoundError:
+            # directory was dropped mid-check
+            return DatasetItemsListPage(count=0, offset=offset, limit=limit or 0, total=0, desc=desc, items=[])
+
+        if desc:
+            items.reverse()
+
+        # Skip empty items if requested.
+        if skip_empty:
+            items = [item for item in items if item]
+
+        async with self._lock:
+            await self._update_metadata(update_accessed_at=True)
+
+        return DatasetItemsListPage(
+            count=len(items),
+            offset=offset,
+            limit=limit or total - offset,
+            total=total,
+            desc=desc,
+            items=items,
+        )
+
+    async def _iterate_segments(
+        self,
+        segments: DatasetSegments,
+        *,
+        offset: int,
+        limit: int | None,
+        desc: bool,
+        skip_empty: bool,
+    ) -> AsyncIterator[Mapping[str, JsonSerializable]]:
+        """Stream items from the segments, reading them in chunks of `_ITERATE_CHUNK_SIZE` items."""
+        start, stop = self._get_item_range(segments.item_count, offset, limit, desc=desc)
+        chunk_starts = range(start, stop, self._ITERATE_CHUNK_SIZE)
+
+        for chunk_start in reversed(chunk_starts) if desc else chunk_starts:
+            try:
+                items = await segments.read(chunk_start, min(chunk_start + self._ITERATE_CHUNK_SIZE, stop))
+            except FileNotFoundError:
+                return
+
+            if desc:
+                items.reverse()
+
+            for item in items:
+                # Skip empty items if requested.
+                if skip_empty and not item:
+                    continue
+                yield item
+
+    @override
+    async def iterate_raw_items(
+        self,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+        desc: bool = False,
+    ) -> AsyncIterator[bytes]:
+        if self._segments is None:
+            async for record in super().iterate_raw_items(offset=offset, limit=limit, desc=desc):
+                yield record
+            return
+
+        start, stop = self._get_item_range(self._segments.item_count, offset, limit, desc=desc)
+        chunk_starts = range(start, stop, self._ITERATE_CHUNK_SIZE)
+
+        for chunk_start in reversed(chunk_starts) if desc else chunk_starts:
+            try:
+                records = await self._segments.read_raw(chunk_start, min(chunk_start + self._ITERATE_CHUNK_SIZE, stop))
+            except FileNotFoundError:
+                return
+
+            for record in reversed(records) if desc else records:
+                yield record
+
+        async with self._lock:
+            await self._update_metadata(update_accessed_at=True)
+
     async def _update_metadata(
         self,
         *,
@@ -439,26 +640,30 @@ class FileSystemDatasetClient(DatasetClient):
         data = await json_dumps(self._metadata.model_dump())
         await atomic_write(self.path_to_metadata, data)
 
-    async def _push_item(self, item: Mapping[str, JsonSerializable], item_id: int) -> None:
-        """Push a single item to the dataset.
+    async def _push_items(self, items: Sequence[Mapping[str, JsonSerializable]], *, first_item_id: int) -> None:
+        """Push a batch of items to the dataset.
 
-        This method writes the item as a JSON file with a zero-padded numeric filename
-        that reflects its position in the dataset sequence.
+        Each item is written as a JSON file with a zero-padded numeric filename that reflects its position in the
+        dataset sequence. The whole batch is serialized in one worker thread call and written in another one.
 
         Args:
-            item: The data item to add to the dataset.
-            item_id: The sequential ID to use for this item's filename.
+            items: The data items to add to the dataset.
+            first_item_id: The sequential ID to use for the filename of the first item.
         """
-        # Generate the filename for the new item using zero-padded numbering.
-        filename = f'{str(item_id).zfill(self._ITEM_FILENAME_DIGITS)}.json'
-        file_path = self.path_to_dataset / filename
+        if not items:
+            return
 
         # Ensure the dataset directory exists.
         await asyncio.to_thread(self.path_to_dataset.mkdir, parents=True, exist_ok=True)
 
-        # Dump the serialized item to the file.
-        data = await json_dumps(item)
-        await atomic_write(file_path, data)
+        # Dump the serialized items to the files named by zero-padded numbering.
+        data = await run_cpu_bound(self._json_codec.encode_many, items, indent=True)
+        await atomic_write_many(
+            [
+                (self.path_to_dataset / f'{str(item_id).zfill(self._ITEM_FILENAME_DIGITS)}.json', item_data)
+                for item_id, item_data in enumerate(data, start=first_item_id)
+            ]
+        )
 
     async def _get_sorted_data_files(self) -> list[Path]:
         """Retrieve and return a sorted list of data files in the dataset directory.
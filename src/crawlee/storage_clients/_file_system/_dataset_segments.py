@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import mmap
+from bisect import bisect_right
+from dataclasses import asdict, dataclass, field
+from logging import getLogger
+from typing import TYPE_CHECKING, BinaryIO
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from pathlib import Path
+
+    from crawlee._types import JsonSerializable
+    from crawlee._utils.json_codec import JsonCodec
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class _Segment:
+    """Description of a single segment file of the dataset."""
+
+    first_item: int
+    """Zero-based position of the first item of the segment within the dataset."""
+
+    item_count: int = 0
+    """Number of items stored in the segment."""
+
+    size: int = 0
+    """Size of the segment file in bytes."""
+
+    offsets: list[int] = field(default_factory=list)
+    """Sparse index: byte offsets of every `_INDEX_STRIDE`-th item of the segment."""
+
+
+class DatasetSegments:
+    """Segmented JSON Lines storage of dataset items, used by the `FileSystemDatasetClient`.
+
+    Items are appended as single lines to the active segment file, which is sealed and replaced by a new one once
+    it grows over `_SEGMENT_MAX_BYTES`. Each segment keeps a sparse index with the byte offset of every
+    `_INDEX_STRIDE`-th item, so reading from an arbitrary position costs one seek and a short sequential scan instead
+    of opening one file per item. The index of the sealed segments is stored on disk, the active segment is scanned
+    when the dataset is opened.
+
+    The segments are stored in a directory with the following structure:
+
+    ```
+    {SEGMENTS_DIR}/000000001.jsonl
+    {SEGMENTS_DIR}/000052817.jsonl
+    {SEGMENTS_DIR}/index.json
+    ```
+
+    Each segment file is named after the ID of its first item, matching the file names of the item-per-file format.
+    Appends are not safe for concurrent use, callers are expected to serialize them. Reads may run concurrently with
+    appends, they only see the items that were fully written when the read started.
+    """
+
+    _SEGMENT_SUFFIX = '.jsonl'
+    """File suffix of the segment files."""
+
+    _INDEX_FILENAME = 'index.json'
+    """The name of the file with the index of the sealed segments."""
+
+    _INDEX_VERSION = 1
+    """Version of the index file format."""
+
+    _SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+    """Size after which the active segment is sealed and a new one is started."""
+
+    _INDEX_STRIDE = 256
+    """Number of items between two consecutive entries of the sparse offset index."""
+
+    _ITEM_FILENAME_DIGITS = 9
+    """Number of digits used for the segment file names."""
+
+    def __init__(self, *, path_to_segments: Path, json_codec: JsonCodec) -> None:
+        """Initialize a new instance.
+
+        Preferably use the `DatasetSegments.open` class method to create a new instance.
+        """
+        self._path_to_segments = path_to_segments
+        """The full path to the segments directory."""
+
+        self._json_codec = json_codec
+        """The codec used to encode and decode the items."""
+
+        self._segments = list[_Segment]()
+        """All segments ordered by their first item, the last one is the active segment."""
+
+        self._active_file: BinaryIO | None = None
+        """Lazily opened append handle of the active segment."""
+
+    @classmethod
+    async def open(cls, *, path_to_segments: Path, json_codec: JsonCodec) -> DatasetSegments:
+        """Open the segments in the given directory, creating it if it does not exist.
+
+        Args:
+            path_to_segments: The path to the segments directory.
+            json_codec: The codec used to encode and decode the items.
+
+        Returns:
+            The opened segments with their index loaded.
+        """
+        segments = cls(path_to_segments=path_to_segments, json_codec=json_codec)
+        await asyncio.to_thread(segments._load)
+        return segments
+
+    @property
+    def path_to_segments(self) -> Path:
+        """The full path to the segments directory."""
+        return self._path_to_segments
+
+    @property
+    def item_count(self) -> int:
+        """Total number of items stored in the segments."""
+        if not self._segments:
+            return 0
+        last = self._segments[-1]
+        return last.first_item + last.item_count
+
+    async def append(self, items: Sequence[Mapping[str, JsonSerializable]]) -> None:
+        """Serialize the items and append them to the active segment, with a single write per segment.
+
+        Args:
+            items: The items to append.
+        """
+        if items:
+            await asyncio.to_thread(self._append, items)
+
+    async def read(self, start: int, stop: int) -> list[Mapping[str, JsonSerializable]]:
+        """Read the items at positions `start` (inclusive) to `stop` (exclusive), in ascending order.
+
+        Args:
+            start: Zero-based position of the first item to read.
+            stop: Zero-based position after the last item to read.
+
+        Returns:
+            The parsed items. Corrupt records are skipped with a warning.
+        """
+        stop = min(stop, self.item_count)
+        if start >= stop:
+            return []
+        return await asyncio.to_thread(self._read_items, start, stop)
+
+    async def read_raw(self, start: int, stop: int) -> list[bytes]:
+        """Read the stored JSON records of the items at positions `start` to `stop`, without parsing them.
+
+        Args:
+            start: Zero-based position of the first item to read.
+            stop: Zero-based position after the last item to read.
+
+        Returns:
+            The UTF-8 encoded JSON records, in ascending order.
+        """
+        stop = min(stop, self.item_count)
+        if start >= stop:
+            return []
+        return await asyncio.to_thread(self._read_records, start, stop)
+
+    async def purge(self) -> None:
+        """Remove all segments and the index."""
+        await asyncio.to_thread(self._purge)
+
+    async def close(self) -> None:
+        """Close the open file handles."""
+        await asyncio.to_thread(self._close_active_file)
+
+    def _segment_path(self, segment: _Segment) -> Path:
+        return (
+            self._path_to_segments
+            / f'{str(segment.first_item + 1).zfill(self._ITEM_FILENAME_DIGITS)}{self._SEGMENT_SUFFIX}'
+        )
+
+    def _load(self) -> None:
+        """Load the index of the sealed segments and scan the segments it does not cover."""
+        self._path_to_segments.mkdir(parents=True, exist_ok=True)
+
+        existing = sorted(
+            int(path.stem) - 1
+            for path in self._path_to_segments.glob(f'*{self._SEGMENT_SUFFIX}')
+            if path.stem.isdigit() and int(path.stem) > 0
+        )
+        sealed = self._read_index(set(existing))
+
+        # The segments after the indexed ones (normally only the active one) are scanned to rebuild their index.
+        self._segments = sealed
+        next_item = sealed[-1].first_item + sealed[-1].item_count if sealed else 0
+        for first_item in existing:
+            if first_item < next_item:
+                continue
+            if first_item != next_item:
+                logger.warning(f'Gap in dataset segments in {self._path_to_segments}, ignoring the items after it.')
+                break
+            segment = self._scan_segment(first_item, is_last=first_item == existing[-1])
+            self._segments.append(segment)
+            next_item += segment.item_count
+
+    def _read_index(self, existing: set[int]) -> list[_Segment]:
+        path_to_index = self._path_to_segments / self._INDEX_FILENAME
+        if not path_to_index.exists():
+            return []
+
+        try:
+            index = json.loads(path_to_index.read_text(encoding='utf-8'))
+            if index['version'] != self._INDEX_VERSION:
+                raise ValueError(f'Unsupported index version {index["version"]}')  # noqa: TRY301
+            segments = [_Segment(**segment) for segment in index['segments']]
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+            logger.warning(f'Invalid dataset segment index in {self._path_to_segments}, rebuilding it: {exc!s}')
+            return []
+
+        expected_first_item = 0
+        for segment in segments:
+            if segment.first_item != expected_first_item or segment.first_item not in existing:
+                logger.warning(f'Dataset segment index in {self._path_to_segments} is out of date, rebuilding it.')
+                return []
+            expected_first_item += segment.item_count
+
+        return segments
+
+    def _scan_segment(self, first_item: int, *, is_last: bool) -> _Segment:
+        """Rebuild the description of a segment by reading it."""
+        segment = _Segment(first_item=first_item)
+        path = self._segment_path(segment)
+
+        with path.open('rb') as file:
+            while line := file.readline():
+                if not line.endswith(b'\n'):
+                    break
+                if segment.item_count % self._INDEX_STRIDE == 0:
+                    segment.offsets.append(segment.size)
+                segment.item_count += 1
+                segment.size += len(line)
+
+        # An item without the trailing newline is a torn write from a crash, cut it off so appends stay aligned.
+        if path.stat().st_size > segment.size:
+            if is_last:
+                logger.warning(f'Truncating incomplete item at offset {segment.size} of {path}.')
+                with path.open('r+b') as file:
+                    file.truncate(segment.size)
+            else:
+                logger.warning(f'Ignoring incomplete item at offset {segment.size} of {path}.')
+
+        return segment
+
+    def _write_index(self) -> None:
+        """Atomically write the index of the sealed segments."""
+        index = {
+            'version': self._INDEX_VERSION,
+            'segments': [asdict(segment) for segment in self._segments[:-1]],
+        }
+        path_to_index = self._path_to_segments / self._INDEX_FILENAME
+        path_to_tmp = path_to_index.with_name(f'{self._INDEX_FILENAME}.tmp')
+        path_to_tmp.write_text(json.dumps(index, separators=(',', ':')), encoding='utf-8')
+        path_to_tmp.replace(path_to_index)
+
+    def _append(self, items: Sequence[Mapping[str, JsonSerializable]]) -> None:
+        lines = [line + b'\n' for line in self._json_codec.encode_many(items)]
+
+        if not self._segments:
+            self._segments.append(_Segment(first_item=0))
+
+        # Large batches are split at segment boundaries, every part is written to its segment at once.
+        batch = list[bytes]()
+        batch_size = self._segments[-1].size
+        for line in lines:
+            if batch_size and batch_size + len(line) > self._SEGMENT_MAX_BYTES:
+                self._write_lines(batch)
+                self._rotate()
+                batch = []
+                batch_size = 0
+            batch.append(line)
+            batch_size += len(line)
+
+        self._write_lines(batch)
+
+    def _rotate(self) -> None:
+        """Seal the active segment, start a new one and persist the index of the sealed segments."""
+        self._close_active_file()
+        active = self._segments[-1]
+        self._segments.append(_Segment(first_item=active.first_item + active.item_count))
+        self._write_index()
+
+    def _write_lines(self, lines: list[bytes]) -> None:
+        """Write the lines to the active segment and update its description."""
+        if not lines:
+            return
+
+        active = self._segments[-1]
+        if self._active_file is None:
+            self._path_to_segments.mkdir(parents=True, exist_ok=True)
+            self._active_file = self._segment_path(active).open('ab')
+
+        self._active_file.write(b''.join(lines))
+        self._active_file.flush()
+
+        # The segment description is updated only after the write, so concurrent reads never see partial items.
+        offsets = list[int]()
+        size = active.size
+        for position, line in enumerate(lines, start=active.item_count):
+            if position % self._INDEX_STRIDE == 0:
+                offsets.append(size)
+            size += len(line)
+
+        active.offsets.extend(offsets)
+        active.size = size
+        active.item_count += len(lines)
+
+    def _read_records(self, start: int, stop: int) -> list[bytes]:
+        """Read the raw records of the items at positions `start` to `stop`, without the trailing newlines."""
+        records = list[bytes]()
+        segment_index = bisect_right([segment.first_item for segment in self._segments], start) - 1
+        position = start
+
+        while position < stop and segment_index < len(self._segments):
+            segment = self._segments[segment_index]
+            segment_stop = min(stop, segment.first_item + segment.item_count)
+            records.extend(
+                self._read_segment_records(segment, position - segment.first_item, segment_stop - segment.first_item)
+            )
+            position = segment_stop
+            segment_index += 1
+
+        return records
+
+    def _read_segment_records(self, segment: _Segment, start: int, stop: int) -> list[bytes]:
+        """Read the records `start` to `stop` (local to the segment) from a memory map of the segment file.
+
+        The boundaries of the range are located with the sparse index and a scan for newlines in the mapped file,
+        and the whole range is then copied out with a single slice. Only the size known to the index is mapped, so
+        items appended concurrently are never visible.
+        """
+        with (
+            self._segment_path(segment).open('rb') as file,
+            mmap.mmap(file.fileno(), segment.size, access=mmap.ACCESS_READ) as mapped,
+        ):
+            begin = self._find_record(mapped, segment, start)
+            end = segment.size if stop == segment.item_count else self._find_record(mapped, segment, stop)
+            # The range ends with a newline, so the split yields one empty trailing element.
+            return mapped[begin:end].split(b'\n')[:-1]
+
+    def _find_record(self, mapped: mmap.mmap, segment: _Segment, local: int) -> int:
+        """Find the byte offset of the record at the given position local to the segment."""
+        anchor = local // self._INDEX_STRIDE
+        offset = segment.offsets[anchor]
+        for _ in range(local - anchor * self._INDEX_STRIDE):
+            offset = mapped.find(b'\n', offset) + 1
+        return offset
+
+    def _read_items(self, start: int, stop: int) -> list[Mapping[str, JsonSerializable]]:
+        records = self._read_records(start, stop)
+        parsed = (self._parse_line(record, position) for position, record in enumerate(records, start=start))
+        return [item for item in parsed if item is not None]
+
+    def _parse_line(self, line: bytes, position: int) -> Mapping[str, JsonSerializable] | None:
+        try:
+            return self._json_codec.decode(line)
+        except ValueError:
+            logger.exception(f'Corrupt JSON of item {position + 1} in {self._path_to_segments}, skipping')
+            return None
+
+    def _purge(self) -> None:
+        self._close_active_file()
+
+        for segment in self._segments:
+            self._segment_path(segment).unlink(missing_ok=True)
+        (self._path_to_segments / self._INDEX_FILENAME).unlink(missing_ok=True)
+
+        self._segments.clear()
+
+    def _close_active_file(self) -> None:
+        if self._active_file is not None:
+            self._active_file.close()
+            self._active_file = None
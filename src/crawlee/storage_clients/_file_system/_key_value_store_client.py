@@ -16,6 +16,8 @@ from typing_extensions import Self, override
 from crawlee._consts import METADATA_FILENAME
 from crawlee._utils.crypto import crypto_random_object_id
 from crawlee._utils.file import atomic_write, infer_mime_type, json_dumps, validate_subdirectory
+from crawlee._utils.free_threading import run_cpu_bound
+from crawlee._utils.json_codec import JsonCodec, get_json_codec
 from crawlee._utils.raise_if_too_many_kwargs import raise_if_too_many_kwargs
 from crawlee.storage_clients._base import KeyValueStoreClient
 from crawlee.storage_clients.models import KeyValueStoreMetadata, KeyValueStoreRecord, KeyValueStoreRecordMetadata
@@ -59,6 +61,7 @@ class FileSystemKeyValueStoreClient(KeyValueStoreClient):
         metadata: KeyValueStoreMetadata,
         path_to_kvs: Path,
         lock: asyncio.Lock,
+        json_codec: JsonCodec | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -72,6 +75,9 @@ class FileSystemKeyValueStoreClient(KeyValueStoreClient):
         self._lock = lock
         """A lock to ensure that only one operation is performed at a time."""
 
+        self._json_codec = json_codec or get_json_codec()
+        """The codec used to encode and decode the JSON values."""
+
     @override
     async def get_metadata(self) -> KeyValueStoreMetadata:
         return self._metadata
@@ -143,6 +149,7 @@ class FileSystemKeyValueStoreClient(KeyValueStoreClient):
                                 metadata=metadata,
                                 path_to_kvs=kvs_base_path / kvs_dir,
                                 lock=asyncio.Lock(),
+                                json_codec=get_json_codec(configuration.json_codec),
                             )
                             await client._update_metadata(update_accessed_at=True)
                             found = True
@@ -176,6 +183,7 @@ class FileSystemKeyValueStoreClient(KeyValueStoreClient):
                     metadata=metadata,
                     path_to_kvs=path_to_kvs,
                     lock=asyncio.Lock(),
+                    json_codec=get_json_codec(configuration.json_codec),
                 )
 
                 await client._update_metadata(update_accessed_at=True)
@@ -194,6 +202,7 @@ class FileSystemKeyValueStoreClient(KeyValueStoreClient):
                     metadata=metadata,
                     path_to_kvs=path_to_kvs,
                     lock=asyncio.Lock(),
+                    json_codec=get_json_codec(configuration.json_codec),
                 )
                 await client._update_metadata()
 
@@ -273,8 +282,8 @@ class FileSystemKeyValueStoreClient(KeyValueStoreClient):
         # Handle JSON values
         elif 'application/json' in metadata.content_type:
             try:
-                value = json.loads(value_bytes.decode('utf-8'))
-            except (json.JSONDecodeError, UnicodeDecodeError):
+                value = self._json_codec.decode(value_bytes)
+            except ValueError:
                 logger.warning(f'Failed to decode JSON value for key "{key}"')
                 return None
         # Handle text values
@@ -309,7 +318,7 @@ class FileSystemKeyValueStoreClient(KeyValueStoreClient):
 
             # Serialize the value to bytes.
             if 'application/json' in content_type:
-                value_bytes = (await json_dumps(value)).encode('utf-8')
+                value_bytes = await run_cpu_bound(self._json_codec.encode, value, indent=True)
             elif isinstance(value, str):
                 value_bytes = value.encode('utf-8')
             elif isinstance(value, (bytes, bytearray)):
@@ -0,0 +1,510 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from logging import getLogger
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
+
+from crawlee import Request
+from crawlee._utils.request_codec import decode_request, decode_request_summary, encode_request
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from pathlib import Path
+
+    from crawlee._utils.json_codec import JsonCodec
+
+logger = getLogger(__name__)
+
+
+class _LogEntry(NamedTuple):
+    """Location of the latest record of a request in the log."""
+
+    segment: int
+    """Number of the segment file holding the record."""
+
+    offset: int
+    """Byte offset of the record within the segment file."""
+
+    length: int
+    """Length of the record in bytes, including the trailing newline."""
+
+    handled: bool
+    """Whether the record describes an already handled request."""
+
+
+class _IndexSnapshot(NamedTuple):
+    """The index at a position in the log, to be written to disk."""
+
+    generation: int
+    """Sequence number of the snapshot, a snapshot never replaces the index written from a newer one."""
+
+    segment: int
+    """Number of the active segment at the time of the snapshot."""
+
+    offset: int
+    """Size of the active segment at the time of the snapshot, the log is replayed from this position."""
+
+    entries: dict[str, _LogEntry]
+    """Copy of the index."""
+
+
+class RequestLog:
+    """Segmented append-only log of request records, used by the `FileSystemRequestQueueClient`.
+
+    Every state change of a request (add, mark as handled, reclaim) appends one line with the compact record of the
+    full request (see `encode_request`) to the active segment file. An in-memory index maps each unique key to the
+    location of its latest record, so older records of the same request become garbage that is periodically dropped
+    by compaction. The index is checkpointed to disk, so reopening the log only replays the records written after
+    the last checkpoint instead of reading every request. Writing the index takes time proportional to its size, so
+    the checkpoints are spaced in proportion to it and written in the background, after `append` returns.
+
+    The log is stored in a directory with the following structure:
+
+    ```
+    {LOG_DIR}/00000000.jsonl
+    {LOG_DIR}/00000001.jsonl
+    {LOG_DIR}/index.json
+    ```
+
+    The class is not safe for concurrent use, callers are expected to serialize access to it.
+    """
+
+    _SEGMENT_SUFFIX = '.jsonl'
+    """File suffix of the segment files."""
+
+    _INDEX_FILENAME = 'index.json'
+    """The name of the index checkpoint file."""
+
+    _INDEX_VERSION = 1
+    """Version of the index file format."""
+
+    _SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+    """Size after which the active segment is closed and a new one is started."""
+
+    _CHECKPOINT_INTERVAL = 10_000
+    """Minimum number of appended records after which the index is checkpointed to disk."""
+
+    _CHECKPOINT_INDEX_RATIO = 0.25
+    """Number of appended records after which the index is checkpointed, relative to the size of the index. Keeps
+    the cost of the checkpoints per appended record constant, while the replay on reopen stays a fraction of it."""
+
+    _COMPACTION_MIN_BYTES = 64 * 1024 * 1024
+    """Minimum total size of the segments before compaction is considered."""
+
+    _COMPACTION_MAX_GARBAGE_RATIO = 0.5
+    """Fraction of the total log size taken by superseded records that triggers compaction."""
+
+    def __init__(self, *, path_to_log: Path, json_codec: JsonCodec) -> None:
+        """Initialize a new instance.
+
+        Preferably use the `RequestLog.open` class method to create a new instance.
+        """
+        self._path_to_log = path_to_log
+        """The full path to the log directory."""
+
+        self._json_codec = json_codec
+        """The codec used to encode and decode the request records."""
+
+        self._entries = dict[str, _LogEntry]()
+        """Index mapping unique keys to the location of their latest record."""
+
+        self._segment_sizes = dict[int, int]()
+        """Sizes of all segment files in bytes, keyed by segment number."""
+
+        self._live_bytes = 0
+        """Total size of the records referenced by the index."""
+
+        self._active_segment = 0
+        """Number of the segment that new records are appended to."""
+
+        self._active_file: BinaryIO | None = None
+        """Lazily opened append handle of the active segment."""
+
+        self._records_since_checkpoint = 0
+        """Number of records appended since the last snapshot of the index."""
+
+        self._snapshot_generation = 0
+        """Generation of the latest snapshot of the index."""
+
+        self._written_generation = 0
+        """Generation of the snapshot the index on disk was written from."""
+
+        self._index_write_lock = threading.Lock()
+        """Serializes the index writes of the background checkpoints and of compaction."""
+
+        self._checkpoint_task: asyncio.Task[None] | None = None
+        """The background write of the latest checkpoint, if there is one."""
+
+    @classmethod
+    async def open(cls, *, path_to_log: Path, json_codec: JsonCodec) -> RequestLog:
+        """Open the log in the given directory, creating it if it does not exist.
+
+        Args:
+            path_to_log: The path to the log directory.
+            json_codec: The codec used to encode and decode the request records.
+
+        Returns:
+            The opened log with its index loaded.
+        """
+        request_log = cls(path_to_log=path_to_log, json_codec=json_codec)
+        await asyncio.to_thread(request_log._load)
+        return request_log
+
+    @property
+    def path_to_log(self) -> Path:
+        """The full path to the log directory."""
+        return self._path_to_log
+
+    def __contains__(self, unique_key: str) -> bool:
+        return unique_key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def iter_requests(self) -> Iterator[tuple[str, bool]]:
+        """Iterate over the unique keys of all requests in the log, along with their handled status."""
+        for unique_key, entry in self._entries.items():
+            yield unique_key, entry.handled
+
+    async def append(self, requests: Sequence[Request]) -> None:
+        """Append the current version of the given requests to the log in a single write.
+
+        If a checkpoint is due, the index is written by a background task, which does not hold up the caller.
+
+        Args:
+            requests: The requests to write.
+        """
+        if not requests:
+            return
+
+        # Only one checkpoint is written at a time, a due checkpoint waits for the next append otherwise.
+        can_checkpoint = self._checkpoint_task is None or self._checkpoint_task.done()
+        snapshot = await asyncio.to_thread(self._append, requests, can_checkpoint=can_checkpoint)
+        if snapshot is not None:
+            self._checkpoint_task = asyncio.create_task(self._write_checkpoint(snapshot))
+
+    async def read(self, unique_keys: Iterable[str]) -> dict[str, Request]:
+        """Read the latest version of the given requests.
+
+        Args:
+            unique_keys: Unique keys of the requests to read.
+
+        Returns:
+            A mapping of unique keys to the requests that were found and could be parsed.
+        """
+        entries = {unique_key: self._entries[unique_key] for unique_key in unique_keys if unique_key in self._entries}
+        if not entries:
+            return {}
+        return await asyncio.to_thread(self._read, entries)
+
+    async def checkpoint(self) -> None:
+        """Write the index to disk, so that the next open does not have to replay the log."""
+        await self._wait_for_checkpoint()
+        await asyncio.to_thread(lambda: self._write_index(self._take_snapshot()))
+
+    async def purge(self) -> None:
+        """Remove all records and the index from the log."""
+        await self._wait_for_checkpoint()
+        await asyncio.to_thread(self._purge)
+
+    async def close(self) -> None:
+        """Wait for the checkpoint in progress and close the open file handles of the log."""
+        await self._wait_for_checkpoint()
+        await asyncio.to_thread(self._close_active_file)
+
+    async def _write_checkpoint(self, snapshot: _IndexSnapshot) -> None:
+        try:
+            await asyncio.to_thread(self._write_index, snapshot)
+        except Exception:
+            logger.exception(f'Failed to checkpoint the request log index in {self._path_to_log}.')
+
+    async def _wait_for_checkpoint(self) -> None:
+        if self._checkpoint_task is not None:
+            await self._checkpoint_task
+            self._checkpoint_task = None
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._path_to_log / f'{segment:08d}{self._SEGMENT_SUFFIX}'
+
+    def _list_segments(self) -> list[int]:
+        return sorted(
+            int(path.stem) for path in self._path_to_log.glob(f'*{self._SEGMENT_SUFFIX}') if path.stem.isdigit()
+        )
+
+    def _set_entry(self, unique_key: str, entry: _LogEntry) -> None:
+        previous = self._entries.get(unique_key)
+        if previous is not None:
+            self._live_bytes -= previous.length
+        self._entries[unique_key] = entry
+        self._live_bytes += entry.length
+
+    def _load(self) -> None:
+        """Load the index checkpoint and replay the records written after it."""
+        self._path_to_log.mkdir(parents=True, exist_ok=True)
+        segments = self._list_segments()
+        checkpoint_segment, checkpoint_offset = self._read_index(set(segments))
+
+        for segment in segments:
+            if segment < checkpoint_segment:
+                continue
+            start = checkpoint_offset if segment == checkpoint_segment else 0
+            self._replay_segment(segment, start, is_last=segment == segments[-1])
+
+        self._segment_sizes = {segment: self._segment_path(segment).stat().st_size for segment in segments}
+        self._active_segment = segments[-1] if segments else 0
+
+        # Segments without any live record were superseded (e.g. by a compaction interrupted before cleanup).
+        live_segments = {entry.segment for entry in self._entries.values()}
+        for segment in segments:
+            if segment != self._active_segment and segment not in live_segments:
+                self._segment_path(segment).unlink(missing_ok=True)
+                del self._segment_sizes[segment]
+
+    def _read_index(self, existing_segments: set[int]) -> tuple[int, int]:
+        """Load the index checkpoint, if there is a valid one.
+
+        Returns:
+            The segment and offset from which the log must be replayed.
+        """
+        path_to_index = self._path_to_log / self._INDEX_FILENAME
+        if not path_to_index.exists():
+            return 0, 0
+
+        try:
+            index = json.loads(path_to_index.read_text(encoding='utf-8'))
+            if index['version'] != self._INDEX_VERSION:
+                raise ValueError(f'Unsupported index version {index["version"]}')  # noqa: TRY301
+            checkpoint_segment, checkpoint_offset = index['checkpoint']
+            entries = {
+                unique_key: _LogEntry(segment, offset, length, bool(handled))
+                for unique_key, (segment, offset, length, handled) in index['entries'].items()
+            }
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+            logger.warning(f'Invalid request log index in {self._path_to_log}, replaying the whole log: {exc!s}')
+            return 0, 0
+
+        if any(entry.segment not in existing_segments for entry in entries.values()):
+            logger.warning(f'Request log index in {self._path_to_log} references missing segments, replaying the log.')
+            return 0, 0
+
+        for unique_key, entry in entries.items():
+            self._set_entry(unique_key, entry)
+
+        return checkpoint_segment, checkpoint_offset
+
+    def _replay_segment(self, segment: int, start: int, *, is_last: bool) -> None:
+        """Add the records of a segment, starting at the given offset, to the index."""
+        path = self._segment_path(segment)
+        with path.open('rb') as file:
+            file.seek(start)
+            data = file.read()
+
+        offset = start
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b'\n'):
+                break
+            try:
+                unique_key, handled = decode_request_summary(line, self._json_codec)
+                self._set_entry(unique_key, _LogEntry(segment, offset, len(line), handled))
+            except ValueError as exc:
+                logger.warning(f'Skipping invalid record at offset {offset} of {path}: {exc!s}')
+            offset += len(line)
+
+        # A record without the trailing newline is a torn write from a crash, cut it off so appends stay aligned.
+        if offset < start + len(data):
+            if is_last:
+                logger.warning(f'Truncating incomplete record at offset {offset} of {path}.')
+                with path.open('r+b') as file:
+                    file.truncate(offset)
+            else:
+                logger.warning(f'Ignoring incomplete record at offset {offset} of {path}.')
+
+    def _append(self, requests: Sequence[Request], *, can_checkpoint: bool) -> _IndexSnapshot | None:
+        """Append the records of the requests, returning a snapshot of the index if a checkpoint is due."""
+        records = [encode_request(request, self._json_codec) + b'\n' for request in requests]
+        payload = b''.join(records)
+
+        active_size = self._segment_sizes.get(self._active_segment, 0)
+        if active_size and active_size + len(payload) > self._SEGMENT_MAX_BYTES:
+            self._close_active_file()
+            self._active_segment += 1
+            active_size = 0
+
+        if self._active_file is None:
+            self._path_to_log.mkdir(parents=True, exist_ok=True)
+            self._active_file = self._segment_path(self._active_segment).open('ab')
+
+        self._active_file.write(payload)
+        self._active_file.flush()
+
+        offset = active_size
+        for request, record in zip(requests, records, strict=True):
+            self._set_entry(
+                request.unique_key,
+                _LogEntry(self._active_segment, offset, len(record), request.handled_at is not None),
+            )
+            offset += len(record)
+
+        self._segment_sizes[self._active_segment] = offset
+        self._records_since_checkpoint += len(records)
+
+        if self._needs_compaction():
+            self._compact()
+        elif can_checkpoint and self._records_since_checkpoint >= max(
+            self._CHECKPOINT_INTERVAL, self._CHECKPOINT_INDEX_RATIO * len(self._entries)
+        ):
+            return self._take_snapshot()
+
+        return None
+
+    def _read(self, entries: dict[str, _LogEntry]) -> dict[str, Request]:
+        if self._active_file is not None:
+            self._active_file.flush()
+
+        requests = dict[str, Request]()
+        by_segment = sorted(entries.items(), key=lambda item: (item[1].segment, item[1].offset))
+        current_segment: int | None = None
+        file: BinaryIO | None = None
+
+        try:
+            for unique_key, entry in by_segment:
+                if entry.segment != current_segment:
+                    if file is not None:
+                        file.close()
+                    file = self._segment_path(entry.segment).open('rb')
+                    current_segment = entry.segment
+
+                if file is None:
+                    continue
+
+                file.seek(entry.offset)
+                record = file.read(entry.length)
+                try:
+                    requests[unique_key] = decode_request(record, self._json_codec)
+                except ValueError as exc:
+                    logger.warning(f'Failed to validate record of request "{unique_key}": {exc!s}')
+        finally:
+            if file is not None:
+                file.close()
+
+        return requests
+
+    def _needs_compaction(self) -> bool:
+        total_bytes = sum(self._segment_sizes.values())
+        if total_bytes < self._COMPACTION_MIN_BYTES:
+            return False
+        return (total_bytes - self._live_bytes) / total_bytes > self._COMPACTION_MAX_GARBAGE_RATIO
+
+    def _compact(self) -> None:
+        """Rewrite the live records into new segments and drop the old ones.
+
+        The new segments are written first and the old ones are removed only after the index pointing to the new
+        segments is on disk. If the process crashes in between, the next open replays the new segments on top of the
+        old index and removes the superseded segments then.
+        """
+        self._close_active_file()
+        old_segments = list(self._segment_sizes)
+        old_entries = self._entries
+
+        self._entries = {}
+        self._live_bytes = 0
+        self._segment_sizes = {}
+        self._active_segment = max(old_segments, default=-1) + 1
+
+        by_location = sorted(old_entries.items(), key=lambda item: (item[1].segment, item[1].offset))
+        current_segment: int | None = None
+        source: BinaryIO | None = None
+        target = self._segment_path(self._active_segment).open('ab')
+        target_size = 0
+
+        try:
+            for unique_key, entry in by_location:
+                if entry.segment != current_segment:
+                    if source is not None:
+                        source.close()
+                    source = self._segment_path(entry.segment).open('rb')
+                    current_segment = entry.segment
+
+                if source is None:
+                    continue
+
+                source.seek(entry.offset)
+                record = source.read(entry.length)
+
+                if target_size and target_size + len(record) > self._SEGMENT_MAX_BYTES:
+                    target.close()
+                    self._segment_sizes[self._active_segment] = target_size
+                    self._active_segment += 1
+                    target = self._segment_path(self._active_segment).open('ab')
+                    target_size = 0
+
+                target.write(record)
+                self._set_entry(unique_key, entry._replace(segment=self._active_segment, offset=target_size))
+                target_size += len(record)
+        finally:
+            if source is not None:
+                source.close()
+            target.close()
+
+        self._segment_sizes[self._active_segment] = target_size
+        self._write_index(self._take_snapshot())
+
+        for segment in old_segments:
+            self._segment_path(segment).unlink(missing_ok=True)
+
+    def _take_snapshot(self) -> _IndexSnapshot:
+        """Copy the index, along with the log position it is valid for."""
+        if self._active_file is not None:
+            self._active_file.flush()
+
+        self._snapshot_generation += 1
+        self._records_since_checkpoint = 0
+        return _IndexSnapshot(
+            generation=self._snapshot_generation,
+            segment=self._active_segment,
+            offset=self._segment_sizes.get(self._active_segment, 0),
+            entries=dict(self._entries),
+        )
+
+    def _write_index(self, snapshot: _IndexSnapshot) -> None:
+        """Atomically write an index snapshot, unless the index on disk was written from a newer one."""
+        # The entries are tuples, which are encoded as `[segment, offset, length, handled]` arrays.
+        index = json.dumps(
+            {
+                'version': self._INDEX_VERSION,
+                'checkpoint': [snapshot.segment, snapshot.offset],
+                'entries': snapshot.entries,
+            },
+            ensure_ascii=False,
+            separators=(',', ':'),
+        )
+
+        with self._index_write_lock:
+            if snapshot.generation < self._written_generation:
+                return
+
+            path_to_index = self._path_to_log / self._INDEX_FILENAME
+            path_to_tmp = path_to_index.with_name(f'{self._INDEX_FILENAME}.tmp')
+            path_to_tmp.write_text(index, encoding='utf-8')
+            path_to_tmp.replace(path_to_index)
+            self._written_generation = snapshot.generation
+
+    def _purge(self) -> None:
+        self._close_active_file()
+
+        for segment in list(self._segment_sizes):
+            self._segment_path(segment).unlink(missing_ok=True)
+        (self._path_to_log / self._INDEX_FILENAME).unlink(missing_ok=True)
+
+        self._entries.clear()
+        self._segment_sizes.clear()
+        self._live_bytes = 0
+        self._active_segment = 0
+        self._records_since_checkpoint = 0
+
+    def _close_active_file(self) -> None:
+        if self._active_file is not None:
+            self._active_file.close()
+            self._active_file = None
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import shutil
 from collections import deque
-from datetime import datetime, timezone
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
 from hashlib import sha256
 from logging import getLogger
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from pydantic import BaseModel, ValidationError
 from typing_extensions import Self, override
@@ -17,8 +19,11 @@ from crawlee import Request
 from crawlee._consts import METADATA_FILENAME
 from crawlee._utils.crypto import crypto_random_object_id
 from crawlee._utils.file import atomic_write, json_dumps, validate_subdirectory
+from crawlee._utils.free_threading import run_cpu_bound
+from crawlee._utils.json_codec import JsonCodec, get_json_codec
 from crawlee._utils.raise_if_too_many_kwargs import raise_if_too_many_kwargs
 from crawlee._utils.recoverable_state import RecoverableState
+from crawlee.events._types import Event, EventPersistStateData
 from crawlee.storage_clients._base import RequestQueueClient
 from crawlee.storage_clients.models import (
     AddRequestsResponse,
@@ -27,6 +32,8 @@ from crawlee.storage_clients.models import (
     UnprocessedRequest,
 )
 
+from ._request_log import RequestLog
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
@@ -58,6 +65,85 @@ class RequestQueueState(BaseModel):
     """Set of request unique keys that have been handled."""
 
 
+class _PendingRequestIndex:
+    """Ordered index of the pending requests of a `FileSystemRequestQueueClient`.
+
+    Forefront and regular requests are kept in two heaps keyed by their sequence numbers, so that taking the next
+    `n` pending requests costs `O(n log N)` instead of sorting the whole queue. Entries are never removed eagerly.
+    An entry becomes stale once the state maps its unique key to a different sequence number, or once the request
+    is in progress or handled, and stale entries are dropped when they reach the top of a heap.
+    """
+
+    def __init__(self) -> None:
+        self._forefront = list[tuple[int, str]]()
+        """Heap of forefront requests, keyed by negated sequence numbers to fetch the newest first (LIFO)."""
+
+        self._regular = list[tuple[int, str]]()
+        """Heap of regular requests, keyed by sequence numbers to fetch the oldest first (FIFO)."""
+
+    def rebuild(self, state: RequestQueueState) -> None:
+        """Build the index from scratch out of the given state."""
+        self._forefront = [
+            (-sequence_number, unique_key) for unique_key, sequence_number in state.forefront_requests.items()
+        ]
+        self._regular = [
+            (sequence_number, unique_key) for unique_key, sequence_number in state.regular_requests.items()
+        ]
+        heapq.heapify(self._forefront)
+        heapq.heapify(self._regular)
+
+    def clear(self) -> None:
+        """Remove all entries from the index."""
+        self._forefront.clear()
+        self._regular.clear()
+
+    def push(self, unique_key: str, state: RequestQueueState) -> None:
+        """Index a request at the position currently assigned to it by the state."""
+        if (sequence_number := state.forefront_requests.get(unique_key)) is not None:
+            heapq.heappush(self._forefront, (-sequence_number, unique_key))
+        elif (sequence_number := state.regular_requests.get(unique_key)) is not None:
+            heapq.heappush(self._regular, (sequence_number, unique_key))
+
+    def pop_pending(self, state: RequestQueueState, limit: int) -> list[str]:
+        """Remove and return the unique keys of up to `limit` pending requests, in the order they should be fetched."""
+        unique_keys = list[str]()
+        seen = set[str]()
+
+        for heap, mapping, sign in (
+            (self._forefront, state.forefront_requests, -1),
+            (self._regular, state.regular_requests, 1),
+        ):
+            while heap and len(unique_keys) < limit:
+                key, unique_key = heapq.heappop(heap)
+                if unique_key not in seen and self._is_pending(unique_key, sign * key, mapping, state):
+                    seen.add(unique_key)
+                    unique_keys.append(unique_key)
+
+        return unique_keys
+
+    def has_pending(self, state: RequestQueueState) -> bool:
+        """Check whether any indexed request is pending, dropping the stale entries on the way."""
+        for heap, mapping, sign in (
+            (self._forefront, state.forefront_requests, -1),
+            (self._regular, state.regular_requests, 1),
+        ):
+            while heap:
+                key, unique_key = heap[0]
+                if self._is_pending(unique_key, sign * key, mapping, state):
+                    return True
+                heapq.heappop(heap)
+
+        return False
+
+    @staticmethod
+    def _is_pending(unique_key: str, sequence_number: int, mapping: dict[str, int], state: RequestQueueState) -> bool:
+        return (
+            mapping.get(unique_key) == sequence_number
+            and unique_key not in state.in_progress_requests
+            and unique_key not in state.handled_requests
+        )
+
+
 class FileSystemRequestQueueClient(RequestQueueClient):
     """A file system implementation of the request queue client.
 
@@ -76,6 +162,18 @@ class FileSystemRequestQueueClient(RequestQueueClient):
 
     This implementation is ideal for long-running crawlers where persistence is important and for situations
     where you need to resume crawling after process termination.
+
+    With the `'log'` storage format, requests are instead appended to segmented log files in the `requests_log`
+    subdirectory of the queue (see `RequestLog`). Adding requests and marking them as handled then become sequential
+    appends instead of a file rewrite per request, and the number of files no longer grows with the queue size, which
+    makes this format a better fit for queues with millions of requests. The storage format of an existing queue
+    cannot be changed, requests stored in the other format are not visible to the client.
+
+    With a write-behind interval set, marking requests as handled and reclaiming them only updates the in-memory
+    state, and the updated requests and metadata are written in one batch at most one interval later, on every
+    `PERSIST_STATE` event (including the final one emitted on shutdown), or once too many writes are pending. The
+    recoverable state remains the source of truth for handled and pending requests, so recovery after a crash is
+    as reliable as without write-behind.
     """
 
     _STORAGE_SUBDIR = 'request_queues'
@@ -87,6 +185,18 @@ class FileSystemRequestQueueClient(RequestQueueClient):
     _MAX_REQUESTS_IN_CACHE = 100_000
     """Maximum number of requests to keep in cache for faster access."""
 
+    _READ_CONCURRENCY = 16
+    """Maximum number of threads reading request files in parallel."""
+
+    _PREFETCH_THRESHOLD = 10_000
+    """Number of cached requests below which the next window of requests is prefetched in the background."""
+
+    _WRITE_BEHIND_MAX_PENDING = 1_000
+    """Number of buffered request writes that triggers an immediate flush in the write-behind mode."""
+
+    _REQUEST_LOG_SUBDIR = 'requests_log'
+    """The name of the subdirectory holding the request log when the `'log'` storage format is used."""
+
     def __init__(
         self,
         *,
@@ -94,6 +204,9 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         path_to_rq: Path,
         lock: asyncio.Lock,
         recoverable_state: RecoverableState[RequestQueueState],
+        request_log: RequestLog | None = None,
+        write_behind_interval: timedelta | None = None,
+        json_codec: JsonCodec | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -113,12 +226,50 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         self._request_cache_needs_refresh = True
         """Flag indicating whether the cache needs to be refreshed from filesystem."""
 
+        self._pending_index = _PendingRequestIndex()
+        """Ordered index of the pending requests that are not in the cache, used to refill the cache."""
+
+        self._prefetch_task: asyncio.Task[dict[str, Request]] | None = None
+        """Background task reading the requests expected to be needed by the next cache refresh."""
+
+        self._prefetch_keys = set[str]()
+        """Unique keys of the prefetched requests whose stored version has not changed since the prefetch started."""
+
         self._is_empty_cache: bool | None = None
         """Cache for is_empty result: None means unknown, True/False is cached state."""
 
         self._state = recoverable_state
         """Recoverable state to maintain request ordering, in-progress status, and handled status."""
 
+        self._request_log = request_log
+        """Append-only log storing the requests, `None` if each request is stored in its own JSON file."""
+
+        self._write_behind_interval = write_behind_interval
+        """Maximum delay of buffered writes, `None` if every state transition is written immediately."""
+
+        self._pending_writes = dict[str, Request]()
+        """Latest versions of the requests that still have to be written, by unique key."""
+
+        self._metadata_write_pending = False
+        """Whether the metadata changed since it was last written."""
+
+        self._flush_task: asyncio.Task[None] | None = None
+        """Task flushing the buffered writes once the write-behind interval elapses."""
+
+        self._json_codec = json_codec or get_json_codec()
+        """The codec used to encode and decode the request files."""
+
+        if self._write_behind_interval is not None:
+            # Import here to avoid circular imports.
+            from crawlee import service_locator  # noqa: PLC0415
+
+            service_locator.get_event_manager().on(event=Event.PERSIST_STATE, listener=self._flush_on_persist_state)
+
+    @property
+    @override
+    def has_local_changes_only(self) -> bool:
+        return True
+
     @override
     async def get_metadata(self) -> RequestQueueMetadata:
         return self._metadata
@@ -134,7 +285,13 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         return self.path_to_rq / METADATA_FILENAME
 
     @classmethod
-    async def _create_recoverable_state(cls, id: str, configuration: Configuration) -> RecoverableState:
+    async def _create_recoverable_state(
+        cls,
+        id: str,
+        configuration: Configuration,
+        *,
+        incremental_persistence: bool = False,
+    ) -> RecoverableState:
         async def kvs_factory() -> KeyValueStore:
             from crawlee.storage_clients import FileSystemStorageClient  # noqa: PLC0415 avoid circular import
             from crawlee.storages import KeyValueStore  # noqa: PLC0415 avoid circular import
@@ -147,6 +304,7 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             persist_state_kvs_factory=kvs_factory,
             persistence_enabled=True,
             logger=logger,
+            incremental_persistence=incremental_persistence,
         )
 
     @classmethod
@@ -157,6 +315,9 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         name: str | None,
         alias: str | None,
         configuration: Configuration,
+        storage_format: Literal['json', 'log'] = 'json',
+        write_behind_interval: timedelta | None = None,
+        incremental_state_persistence: bool = False,
     ) -> Self:
         """Open or create a file system request queue client.
 
@@ -169,6 +330,14 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             name: The name of the request queue for named (global scope) storages.
             alias: The alias of the request queue for unnamed (run scope) storages.
             configuration: The configuration object containing storage directory settings.
+            storage_format: How the requests are stored. Options are:
+                - 'json': Each request is stored in its own JSON file.
+                - 'log': Requests are appended to segmented log files with an on-disk index.
+            write_behind_interval: If set, writes caused by marking requests as handled and by reclaiming them are
+                buffered and flushed at most this long after they happen.
+            incremental_state_persistence: If set, the queue state (the sequence numbers of the pending requests and
+                the unique keys of the handled ones) is persisted incrementally - only the changed keys are written
+                on each persist, to a journal that is periodically compacted into a full snapshot.
 
         Returns:
             An instance for the opened or created storage client.
@@ -181,6 +350,7 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         raise_if_too_many_kwargs(id=id, name=name, alias=alias)
 
         rq_base_path = Path(configuration.storage_dir) / cls._STORAGE_SUBDIR
+        json_codec = get_json_codec(configuration.json_codec)
 
         if not rq_base_path.exists():
             await asyncio.to_thread(rq_base_path.mkdir, parents=True, exist_ok=True)
@@ -208,8 +378,15 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                                 path_to_rq=rq_base_path / rq_dir,
                                 lock=asyncio.Lock(),
                                 recoverable_state=await cls._create_recoverable_state(
-                                    id=id, configuration=configuration
+                                    id=id,
+                                    configuration=configuration,
+                                    incremental_persistence=incremental_state_persistence,
+                                ),
+                                request_log=await cls._open_request_log(
+                                    rq_base_path / rq_dir, storage_format, json_codec
                                 ),
+                                write_behind_interval=write_behind_interval,
+                                json_codec=json_codec,
                             )
                             await client._state.initialize()
                             await client._discover_existing_requests()
@@ -245,7 +422,14 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                     metadata=metadata,
                     path_to_rq=path_to_rq,
                     lock=asyncio.Lock(),
-                    recoverable_state=await cls._create_recoverable_state(id=metadata.id, configuration=configuration),
+                    recoverable_state=await cls._create_recoverable_state(
+                        id=metadata.id,
+                        configuration=configuration,
+                        incremental_persistence=incremental_state_persistence,
+                    ),
+                    request_log=await cls._open_request_log(path_to_rq, storage_format, json_codec),
+                    write_behind_interval=write_behind_interval,
+                    json_codec=json_codec,
                 )
 
                 await client._state.initialize()
@@ -270,7 +454,14 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                     metadata=metadata,
                     path_to_rq=path_to_rq,
                     lock=asyncio.Lock(),
-                    recoverable_state=await cls._create_recoverable_state(id=metadata.id, configuration=configuration),
+                    recoverable_state=await cls._create_recoverable_state(
+                        id=metadata.id,
+                        configuration=configuration,
+                        incremental_persistence=incremental_state_persistence,
+                    ),
+                    request_log=await cls._open_request_log(path_to_rq, storage_format, json_codec),
+                    write_behind_interval=write_behind_interval,
+                    json_codec=json_codec,
                 )
                 await client._state.initialize()
                 await client._update_metadata()
@@ -280,6 +471,20 @@ class FileSystemRequestQueueClient(RequestQueueClient):
     @override
     async def drop(self) -> None:
         async with self._lock:
+            await self._cancel_prefetch()
+            self._discard_pending_writes()
+
+            if self._write_behind_interval is not None:
+                # Import here to avoid circular imports.
+                from crawlee import service_locator  # noqa: PLC0415
+
+                service_locator.get_event_manager().off(
+                    event=Event.PERSIST_STATE, listener=self._flush_on_persist_state
+                )
+
+            if self._request_log is not None:
+                await self._request_log.close()
+
             # Remove the RQ dir recursively if it exists.
             if self.path_to_rq.exists():
                 await asyncio.to_thread(shutil.rmtree, self.path_to_rq)
@@ -288,6 +493,7 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             await self._state.reset()
             await self._state.teardown()
             self._request_cache.clear()
+            self._pending_index.clear()
             self._request_cache_needs_refresh = True
 
             # Invalidate is_empty cache.
@@ -296,14 +502,21 @@ class FileSystemRequestQueueClient(RequestQueueClient):
     @override
     async def purge(self) -> None:
         async with self._lock:
-            request_files = await self._get_request_files(self.path_to_rq)
+            await self._cancel_prefetch()
+            self._discard_pending_writes()
 
-            for file_path in request_files:
-                await asyncio.to_thread(file_path.unlink, missing_ok=True)
+            if self._request_log is not None:
+                await self._request_log.purge()
+            else:
+                request_files = await self._get_request_files(self.path_to_rq)
+
+                for file_path in request_files:
+                    await asyncio.to_thread(file_path.unlink, missing_ok=True)
 
             # Clear recoverable state
             await self._state.reset()
             self._request_cache.clear()
+            self._pending_index.clear()
             self._request_cache_needs_refresh = True
 
             await self._update_metadata(
@@ -336,6 +549,7 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                 return unique_key in state.forefront_requests or unique_key in state.regular_requests
 
             requests_to_enqueue = {}
+            new_requests = list[Request]()
 
             # Determine which requests can be added or are modified.
             for request in requests:
@@ -369,20 +583,22 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             for request in requests_to_enqueue.values():
                 # If the request is not already in the RQ, this is a new request.
                 if not is_in_queue(request.unique_key):
-                    request_path = self._get_request_path(request.unique_key)
                     # Add sequence number to ensure FIFO ordering using state.
                     if forefront:
                         sequence_number = state.forefront_sequence_counter
                         state.forefront_sequence_counter += 1
                         state.forefront_requests[request.unique_key] = sequence_number
+                        self._state.mark_dirty('forefront_sequence_counter')
+                        self._state.mark_dirty('forefront_requests', request.unique_key)
                     else:
                         sequence_number = state.sequence_counter
                         state.sequence_counter += 1
                         state.regular_requests[request.unique_key] = sequence_number
+                        self._state.mark_dirty('sequence_counter')
+                        self._state.mark_dirty('regular_requests', request.unique_key)
 
-                    # Save the clean request without extra fields
-                    request_data = await json_dumps(request.model_dump())
-                    await atomic_write(request_path, request_data)
+                    self._pending_index.push(request.unique_key, state)
+                    new_requests.append(request)
 
                     # A new forefront request belongs to the very front of the queue, so it can go straight
                     # to the cache without a full refresh, unless the cache is at capacity or a refresh is
@@ -412,10 +628,14 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                     # If the request is among `regular`, remove it from its current position.
                     if request.unique_key in state.regular_requests:
                         state.regular_requests.pop(request.unique_key)
+                        self._state.mark_dirty('regular_requests', request.unique_key)
 
                     # If the request is already in `forefront`, we just need to update its position.
                     state.forefront_requests[request.unique_key] = state.forefront_sequence_counter
                     state.forefront_sequence_counter += 1
+                    self._state.mark_dirty('forefront_sequence_counter')
+                    self._state.mark_dirty('forefront_requests', request.unique_key)
+                    self._pending_index.push(request.unique_key, state)
 
                     # The request may already sit elsewhere in the cache, so its position must be recomputed.
                     self._request_cache_needs_refresh = True
@@ -438,6 +658,8 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                         )
                     )
 
+            await self._write_requests(new_requests)
+
             await self._update_metadata(
                 update_modified_at=True,
                 update_accessed_at=True,
@@ -456,8 +678,7 @@ class FileSystemRequestQueueClient(RequestQueueClient):
     @override
     async def get_request(self, unique_key: str) -> Request | None:
         async with self._lock:
-            request_path = self._get_request_path(unique_key)
-            request = await self._parse_request_file(request_path)
+            request = await self._read_request(unique_key)
 
             if request is None:
                 logger.warning(f'Request with unique key "{unique_key}" not found in the queue.')
@@ -469,27 +690,20 @@ class FileSystemRequestQueueClient(RequestQueueClient):
     @override
     async def fetch_next_request(self) -> Request | None:
         async with self._lock:
-            # Refresh cache if needed or if it's empty.
-            if self._request_cache_needs_refresh or not self._request_cache:
-                await self._refresh_cache()
-
-            next_request: Request | None = None
-            state = self._state.current_value
-
-            # Fetch from the front of the deque (forefront requests are at the beginning).
-            while self._request_cache and next_request is None:
-                candidate = self._request_cache.popleft()
+            next_request = await self._pop_next_request()
+            self._start_prefetch_if_needed()
+            return next_request
 
-                # Skip requests that are already in progress, however this should not happen.
-                if candidate.unique_key not in state.in_progress_requests:
-                    next_request = candidate
+    @override
+    async def fetch_next_requests(self, count: int) -> list[Request]:
+        async with self._lock:
+            requests = list[Request]()
 
-            if next_request is not None:
-                state.in_progress_requests.add(next_request.unique_key)
-                # `in_progress_requests` is updated, so we need to invalidate the `is_empty` cache.
-                self._is_empty_cache = None
+            while len(requests) < count and (next_request := await self._pop_next_request()) is not None:
+                requests.append(next_request)
 
-            return next_request
+            self._start_prefetch_if_needed()
+            return requests
 
     @override
     async def mark_request_as_handled(self, request: Request) -> ProcessedRequest | None:
@@ -506,15 +720,12 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             if request.handled_at is None:
                 request.handled_at = datetime.now(timezone.utc)
 
-            # Dump the updated request to the file.
-            request_path = self._get_request_path(request.unique_key)
-
-            if not await asyncio.to_thread(request_path.exists):
+            if not await self._request_exists(request.unique_key):
                 logger.warning(f'Request file for {request.unique_key} does not exist, cannot mark as handled.')
                 return None
 
-            request_data = await json_dumps(request.model_dump())
-            await atomic_write(request_path, request_data)
+            # Dump the updated request to the storage.
+            await self._write_request_transition(request)
 
             # Update state: remove from in-progress and pending, and add to handled. Dropping the key from
             # the pending mappings keeps them (and the persisted state) sized by the backlog rather than by
@@ -523,6 +734,8 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             state.forefront_requests.pop(request.unique_key, None)
             state.regular_requests.pop(request.unique_key, None)
             state.handled_requests.add(request.unique_key)
+            for field in ('in_progress_requests', 'forefront_requests', 'regular_requests', 'handled_requests'):
+                self._state.mark_dirty(field, request.unique_key)
 
             # Update RQ metadata.
             await self._update_metadata(
@@ -530,6 +743,7 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                 update_accessed_at=True,
                 new_handled_request_count=self._metadata.handled_request_count + 1,
                 new_pending_request_count=self._metadata.pending_request_count - 1,
+                defer_write=True,
             )
 
             return ProcessedRequest(
@@ -554,9 +768,7 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                 logger.info(f'Reclaiming request {request.unique_key} that is not in progress.')
                 return None
 
-            request_path = self._get_request_path(request.unique_key)
-
-            if not await asyncio.to_thread(request_path.exists):
+            if not await self._request_exists(request.unique_key):
                 logger.warning(f'Request file for {request.unique_key} does not exist, cannot reclaim.')
                 return None
 
@@ -567,24 +779,30 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                 sequence_number = state.forefront_sequence_counter
                 state.forefront_sequence_counter += 1
                 state.forefront_requests[request.unique_key] = sequence_number
+                self._state.mark_dirty('forefront_sequence_counter')
             else:
                 # Remove from forefront requests if it was there
                 state.forefront_requests.pop(request.unique_key, None)
                 sequence_number = state.sequence_counter
                 state.sequence_counter += 1
                 state.regular_requests[request.unique_key] = sequence_number
+                self._state.mark_dirty('sequence_counter')
+            self._state.mark_dirty('forefront_requests', request.unique_key)
+            self._state.mark_dirty('regular_requests', request.unique_key)
 
-            # Save the clean request without extra fields
-            request_data = await json_dumps(request.model_dump())
-            await atomic_write(request_path, request_data)
+            self._pending_index.push(request.unique_key, state)
+            self._prefetch_keys.discard(request.unique_key)
+            await self._write_request_transition(request)
 
             # Remove from in-progress.
             state.in_progress_requests.discard(request.unique_key)
+            self._state.mark_dirty('in_progress_requests', request.unique_key)
 
             # Update RQ metadata.
             await self._update_metadata(
                 update_modified_at=True,
                 update_accessed_at=True,
+                defer_write=True,
             )
 
             # Add the request back to the cache.
@@ -620,14 +838,8 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             # Fallback: check state for unhandled requests.
             await self._update_metadata(update_accessed_at=True)
 
-            # Check pending requests in state.
-            queue_requests = (
-                set(state.forefront_requests.keys()) | set(state.regular_requests.keys())
-            ) - state.in_progress_requests
-
-            pending_requests = queue_requests - state.handled_requests
-
-            if pending_requests:
+            # Check pending requests in the index, every pending request outside of the cache is indexed.
+            if self._pending_index.has_pending(state):
                 self._is_empty_cache = False
                 return False
 
@@ -659,6 +871,157 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         """
         return self.path_to_rq / f'{self._get_file_base_name_from_unique_key(unique_key)}.json'
 
+    @classmethod
+    async def _open_request_log(
+        cls, path_to_rq: Path, storage_format: Literal['json', 'log'], json_codec: JsonCodec
+    ) -> RequestLog | None:
+        """Open the request log of the queue if the `'log'` storage format is used.
+
+        Args:
+            path_to_rq: The path to the request queue directory.
+            storage_format: The storage format of the queue.
+            json_codec: The codec used to encode and decode the request records.
+
+        Returns:
+            The opened request log, or `None` for the `'json'` storage format.
+        """
+        if storage_format == 'json':
+            return None
+        return await RequestLog.open(path_to_log=path_to_rq / cls._REQUEST_LOG_SUBDIR, json_codec=json_codec)
+
+    async def _write_requests(self, requests: Sequence[Request]) -> None:
+        """Persist the current version of the given requests.
+
+        With the request log, the whole batch is appended in a single write, otherwise each request file is
+        rewritten.
+
+        Args:
+            requests: The requests to persist.
+        """
+        if self._request_log is not None:
+            await self._request_log.append(requests)
+            return
+
+        for request in requests:
+            # Save the clean request without extra fields
+            request_data = await run_cpu_bound(self._json_codec.encode, request.model_dump(), indent=True)
+            await atomic_write(self._get_request_path(request.unique_key), request_data)
+
+    async def _write_request_transition(self, request: Request) -> None:
+        """Persist a request whose state changed, buffering the write in the write-behind mode.
+
+        Args:
+            request: The request to persist.
+        """
+        if self._write_behind_interval is None:
+            await self._write_requests([request])
+            return
+
+        # Buffered versions of the same request are coalesced, only the latest one is written.
+        self._pending_writes[request.unique_key] = request
+
+        if len(self._pending_writes) >= self._WRITE_BEHIND_MAX_PENDING:
+            await self._flush_pending_writes()
+        else:
+            self._schedule_flush()
+
+    async def _flush_pending_writes(self) -> None:
+        """Write all buffered requests in one batch, followed by the metadata. Must be called with the lock held."""
+        if self._pending_writes:
+            await self._write_requests(list(self._pending_writes.values()))
+            self._pending_writes.clear()
+
+        if self._metadata_write_pending:
+            await self._write_metadata()
+
+    def _schedule_flush(self) -> None:
+        """Make sure the buffered writes are flushed once the write-behind interval elapses."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+
+    async def _flush_after_interval(self) -> None:
+        if self._write_behind_interval is None:
+            return
+
+        await asyncio.sleep(self._write_behind_interval.total_seconds())
+
+        async with self._lock:
+            try:
+                await self._flush_pending_writes()
+            except Exception:
+                # The current task is still running, so the retry has to be scheduled unconditionally.
+                logger.exception('Failed to flush buffered request queue writes, retrying after the interval.')
+                self._flush_task = asyncio.create_task(self._flush_after_interval())
+
+    async def _flush_on_persist_state(self, event_data: EventPersistStateData) -> None:
+        """Flush the buffered writes when the state is persisted, including the final persist on shutdown."""
+        logger.debug(f'Flushing buffered request queue writes (event_data={event_data}).')
+        async with self._lock:
+            await self._flush_pending_writes()
+
+    def _discard_pending_writes(self) -> None:
+        """Drop the buffered writes, used when the queue is purged or dropped."""
+        self._pending_writes.clear()
+        self._metadata_write_pending = False
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+    async def _read_request(self, unique_key: str) -> Request | None:
+        """Read a single request from the storage.
+
+        Args:
+            unique_key: Unique key of the request.
+
+        Returns:
+            The request, or `None` if it is not stored or could not be parsed.
+        """
+        if unique_key in self._pending_writes:
+            return self._pending_writes[unique_key]
+        if self._request_log is not None:
+            return (await self._request_log.read([unique_key])).get(unique_key)
+        return await self._parse_request_file(self._get_request_path(unique_key))
+
+    async def _read_requests(self, unique_keys: Sequence[str]) -> dict[str, Request]:
+        """Read multiple requests from the storage in a single batch.
+
+        Requests that are missing or cannot be parsed are skipped with a warning.
+
+        Args:
+            unique_keys: Unique keys of the requests.
+
+        Returns:
+            A mapping of unique keys to the requests that could be read.
+        """
+        buffered = {key: self._pending_writes[key] for key in unique_keys if key in self._pending_writes}
+        unique_keys_to_read = [unique_key for unique_key in unique_keys if unique_key not in buffered]
+
+        if self._request_log is not None:
+            found = await self._request_log.read(unique_keys_to_read)
+        else:
+            parsed = await self._parse_request_files(
+                [self._get_request_path(unique_key) for unique_key in unique_keys_to_read]
+            )
+            found = {
+                unique_key: request
+                for unique_key, request in zip(unique_keys_to_read, parsed, strict=True)
+                if request is not None
+            }
+
+        found.update(buffered)
+
+        for unique_key in unique_keys:
+            if unique_key not in found:
+                logger.warning(f'Request file for "{unique_key}" is missing or invalid, skipping.')
+
+        return found
+
+    async def _request_exists(self, unique_key: str) -> bool:
+        """Check whether a request is present in the storage."""
+        if self._request_log is not None:
+            return unique_key in self._request_log
+        return await asyncio.to_thread(self._get_request_path(unique_key).exists)
+
     async def _update_metadata(
         self,
         *,
@@ -668,6 +1031,7 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         update_had_multiple_clients: bool = False,
         update_accessed_at: bool = False,
         update_modified_at: bool = False,
+        defer_write: bool = False,
     ) -> None:
         """Update the dataset metadata file with current information.
 
@@ -678,6 +1042,8 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             update_had_multiple_clients: If True, set had_multiple_clients to True.
             update_accessed_at: If True, update the `accessed_at` timestamp to the current time.
             update_modified_at: If True, update the `modified_at` timestamp to the current time.
+            defer_write: If True and the write-behind mode is enabled, only update the metadata in memory and leave
+                writing the file to the next flush.
         """
         # Always create a new timestamp to ensure it's truly updated
         now = datetime.now(timezone.utc)
@@ -702,6 +1068,17 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         if update_had_multiple_clients:
             self._metadata.had_multiple_clients = True
 
+        if defer_write and self._write_behind_interval is not None:
+            self._metadata_write_pending = True
+            self._schedule_flush()
+            return
+
+        await self._write_metadata()
+
+    async def _write_metadata(self) -> None:
+        """Write the current metadata to the metadata file."""
+        self._metadata_write_pending = False
+
         # Ensure the parent directory for the metadata file exists.
         await asyncio.to_thread(self.path_to_metadata.parent.mkdir, parents=True, exist_ok=True)
 
@@ -709,42 +1086,114 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         data = await json_dumps(self._metadata.model_dump())
         await atomic_write(self.path_to_metadata, data)
 
+    async def _pop_next_request(self) -> Request | None:
+        """Take the next request from the cache and mark it as in progress. Must be called with the lock held."""
+        # Refresh cache if needed or if it's empty.
+        if self._request_cache_needs_refresh or not self._request_cache:
+            await self._refresh_cache()
+
+        next_request: Request | None = None
+        state = self._state.current_value
+
+        # Fetch from the front of the deque (forefront requests are at the beginning).
+        while self._request_cache and next_request is None:
+            candidate = self._request_cache.popleft()
+
+            # Skip requests that are already in progress, however this should not happen.
+            if candidate.unique_key not in state.in_progress_requests:
+                next_request = candidate
+
+        if next_request is not None:
+            state.in_progress_requests.add(next_request.unique_key)
+            self._state.mark_dirty('in_progress_requests', next_request.unique_key)
+            # `in_progress_requests` is updated, so we need to invalidate the `is_empty` cache.
+            self._is_empty_cache = None
+
+        return next_request
+
     async def _refresh_cache(self) -> None:
         """Refresh the request cache from the filesystem.
 
         This method loads up to `_MAX_REQUESTS_IN_CACHE` requests from the filesystem, prioritizing forefront
-        requests and maintaining proper ordering. Only requests that are pending according to the state are
-        read, so files of already handled or in-progress requests are not touched at all.
+        requests and maintaining proper ordering. The pending requests are taken from an incrementally maintained
+        index, so a refresh costs time proportional to the cache size rather than to the queue size, and files of
+        already handled or in-progress requests are not touched at all.
         """
-        self._request_cache.clear()
         state = self._state.current_value
 
-        def is_pending(unique_key: str) -> bool:
-            return unique_key not in state.handled_requests and unique_key not in state.in_progress_requests
+        # Requests still in the cache are not necessarily indexed, return them to the index before discarding it.
+        for request in self._request_cache:
+            self._pending_index.push(request.unique_key, state)
+        self._request_cache.clear()
+
+        prefetched = await self._take_prefetched_requests()
 
         # Forefront requests are fetched newest first (LIFO), regular requests oldest first (FIFO).
-        forefront_keys = sorted(
-            filter(is_pending, state.forefront_requests),
-            key=lambda unique_key: state.forefront_requests[unique_key],
-            reverse=True,
-        )
-        regular_keys = sorted(
-            filter(is_pending, state.regular_requests),
-            key=lambda unique_key: state.regular_requests[unique_key],
-        )
+        unique_keys = self._pending_index.pop_pending(state, self._MAX_REQUESTS_IN_CACHE)
+        loaded = await self._read_requests([unique_key for unique_key in unique_keys if unique_key not in prefetched])
 
-        for unique_key in forefront_keys + regular_keys:
-            if len(self._request_cache) >= self._MAX_REQUESTS_IN_CACHE:
-                break
+        for unique_key in unique_keys:
+            request = prefetched.get(unique_key) or loaded.get(unique_key)
+            if request is not None:
+                self._request_cache.append(request)
 
-            request = await self._parse_request_file(self._get_request_path(unique_key))
-            if request is None:
-                logger.warning(f'Request file for "{unique_key}" is missing or invalid, skipping.')
-                continue
+        self._request_cache_needs_refresh = False
 
-            self._request_cache.append(request)
+    def _start_prefetch_if_needed(self) -> None:
+        """Start reading the next window of pending requests in the background once the cache runs low.
 
-        self._request_cache_needs_refresh = False
+        The prefetched requests stay in the pending index, the next cache refresh takes them from the index as usual
+        and only skips reading the ones that were prefetched. Prefetching is used only with the `'json'` storage
+        format, the request log reads a whole window with a few sequential reads anyway.
+        """
+        if (
+            self._request_log is not None
+            or self._prefetch_task is not None
+            or self._request_cache_needs_refresh
+            or len(self._request_cache) > self._PREFETCH_THRESHOLD
+        ):
+            return
+
+        state = self._state.current_value
+        unique_keys = self._pending_index.pop_pending(state, self._MAX_REQUESTS_IN_CACHE)
+        if not unique_keys:
+            return
+
+        for unique_key in unique_keys:
+            self._pending_index.push(unique_key, state)
+
+        self._prefetch_keys = set(unique_keys)
+        self._prefetch_task = asyncio.create_task(self._prefetch_requests(unique_keys))
+
+    async def _prefetch_requests(self, unique_keys: list[str]) -> dict[str, Request]:
+        """Read the given requests, without warning about the missing ones."""
+        parsed = await self._parse_request_files([self._get_request_path(unique_key) for unique_key in unique_keys])
+        return {unique_key: request for unique_key, request in zip(unique_keys, parsed, strict=True) if request}
+
+    async def _take_prefetched_requests(self) -> dict[str, Request]:
+        """Wait for the running prefetch and return the prefetched requests that are still up to date."""
+        if self._prefetch_task is None:
+            return {}
+
+        task, self._prefetch_task = self._prefetch_task, None
+        try:
+            prefetched = await task
+        except OSError as exc:
+            logger.warning(f'Failed to prefetch requests, reading them again: {exc!s}')
+            return {}
+
+        fresh = {unique_key: request for unique_key, request in prefetched.items() if unique_key in self._prefetch_keys}
+        self._prefetch_keys.clear()
+        return fresh
+
+    async def _cancel_prefetch(self) -> None:
+        """Cancel the running prefetch, if any."""
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+            with suppress(asyncio.CancelledError, OSError):
+                await self._prefetch_task
+            self._prefetch_task = None
+        self._prefetch_keys.clear()
 
     @classmethod
     async def _get_request_files(cls, path_to_rq: Path) -> list[Path]:
@@ -767,8 +1216,7 @@ class FileSystemRequestQueueClient(RequestQueueClient):
 
         return list(filtered)
 
-    @classmethod
-    async def _parse_request_file(cls, file_path: Path) -> Request | None:
+    async def _parse_request_file(self, file_path: Path) -> Request | None:
         """Parse a request file and return the `Request` object.
 
         Args:
@@ -779,15 +1227,15 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         """
         # Read the request file in a thread to avoid blocking the event loop.
         try:
-            file_content = await asyncio.to_thread(file_path.read_text, encoding='utf-8')
+            file_content = await asyncio.to_thread(file_path.read_bytes)
         except FileNotFoundError:
             logger.warning(f'Request file "{file_path}" not found.')
             return None
 
         # Parse the file content as JSON.
         try:
-            parsed = json.loads(file_content)
-        except json.JSONDecodeError as exc:
+            parsed = self._json_codec.decode(file_content)
+        except ValueError as exc:
             logger.warning(f'Failed to parse request file {file_path}: {exc!s}')
             return None
 
@@ -798,13 +1246,59 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             logger.warning(f'Failed to validate request file {file_path}: {exc!s}')
             return None
 
+    @classmethod
+    async def _parse_request_files(cls, file_paths: Sequence[Path]) -> list[Request | None]:
+        """Parse multiple request files and return the `Request` objects.
+
+        The files are read in parallel by up to `_READ_CONCURRENCY` threads, each reading a contiguous chunk of the
+        files, and the contents are then validated in a single pass in another thread, so that neither the reads nor
+        the validation block the event loop.
+
+        Args:
+            file_paths: The paths to the request files.
+
+        Returns:
+            The parsed `Request` objects in the order of the paths, with `None` for the files that could not be read
+            or parsed.
+        """
+        if not file_paths:
+            return []
+
+        def read_file(file_path: Path) -> bytes | None:
+            try:
+                return file_path.read_bytes()
+            except FileNotFoundError:
+                logger.warning(f'Request file "{file_path}" not found.')
+                return None
+
+        def read_chunk(chunk: Sequence[Path]) -> list[bytes | None]:
+            return [read_file(file_path) for file_path in chunk]
+
+        def validate(contents: list[bytes | None]) -> list[Request | None]:
+            requests = list[Request | None]()
+            for file_path, content in zip(file_paths, contents, strict=True):
+                if content is None:
+                    requests.append(None)
+                    continue
+                try:
+                    requests.append(Request.model_validate_json(content))
+                except ValidationError as exc:
+                    logger.warning(f'Failed to validate request file {file_path}: {exc!s}')
+                    requests.append(None)
+            return requests
+
+        chunk_size = -(-len(file_paths) // cls._READ_CONCURRENCY)
+        chunks = [file_paths[i : i + chunk_size] for i in range(0, len(file_paths), chunk_size)]
+        chunk_contents = await asyncio.gather(*(asyncio.to_thread(read_chunk, chunk) for chunk in chunks))
+
+        return await asyncio.to_thread(validate, [content for contents in chunk_contents for content in contents])
+
     async def _discover_existing_requests(self) -> None:
         """Discover and load existing requests into the state when opening an existing request queue.
 
         On recovery after a crash, any requests that were previously in-progress are reclaimed as pending,
         since there is no active processing after a restart.
         """
-        request_files = await self._get_request_files(self.path_to_rq)
         state = self._state.current_value
 
         if state.in_progress_requests:
@@ -812,22 +1306,33 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                 f'Reclaiming {len(state.in_progress_requests)} in-progress request(s) from previous run.',
             )
             state.in_progress_requests.clear()
+            self._state.mark_dirty('in_progress_requests')
 
-        for request_file in request_files:
-            request = await self._parse_request_file(request_file)
-            if request is None:
-                continue
-
+        for unique_key, is_handled in await self._get_stored_requests():
             # Already handled requests are tracked only for deduplication, not as pending work.
-            if request.handled_at is not None:
-                state.handled_requests.add(request.unique_key)
+            if is_handled:
+                state.handled_requests.add(unique_key)
+                self._state.mark_dirty('handled_requests', unique_key)
 
             # Add pending request to state as regular request (assign sequence numbers)
-            elif (
-                request.unique_key not in state.regular_requests and request.unique_key not in state.forefront_requests
-            ):
-                state.regular_requests[request.unique_key] = state.sequence_counter
+            elif unique_key not in state.regular_requests and unique_key not in state.forefront_requests:
+                state.regular_requests[unique_key] = state.sequence_counter
                 state.sequence_counter += 1
+                self._state.mark_dirty('regular_requests', unique_key)
+                self._state.mark_dirty('sequence_counter')
+
+        self._pending_index.rebuild(state)
+
+    async def _get_stored_requests(self) -> list[tuple[str, bool]]:
+        """List the unique keys of all stored requests along with their handled status.
+
+        The request log answers from its index, so only the request files of the `'json'` storage format are read.
+        """
+        if self._request_log is not None:
+            return list(self._request_log.iter_requests())
+
+        requests = await self._parse_request_files(await self._get_request_files(self.path_to_rq))
+        return [(request.unique_key, request.handled_at is not None) for request in requests if request is not None]
 
     @staticmethod
     def _get_file_base_name_from_unique_key(unique_key: str) -> str:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from typing_extensions import override
 
@@ -14,6 +14,7 @@ from ._request_queue_client import FileSystemRequestQueueClient
 
 if TYPE_CHECKING:
     from collections.abc import Hashable
+    from datetime import timedelta
 
 
 @docs_group('Storage clients')
@@ -34,10 +35,50 @@ class FileSystemStorageClient(StorageClient):
     Use it only when running a single crawler process at a time.
     """
 
+    def __init__(
+        self,
+        *,
+        dataset_storage_format: Literal['json', 'jsonl'] = 'json',
+        queue_storage_format: Literal['json', 'log'] = 'json',
+        queue_write_behind_interval: timedelta | None = None,
+        queue_incremental_state_persistence: bool = False,
+    ) -> None:
+        """Initialize the file system storage client.
+
+        Args:
+            dataset_storage_format: How datasets store their items. Options are:
+                - 'json': Each item is stored in its own JSON file, which is easy to inspect.
+                - 'jsonl': Items are appended to segmented JSON Lines files with a sparse offset index, so pushing
+                    and paginating stay fast for datasets with millions of items.
+            queue_storage_format: How request queues store their requests. Options are:
+                - 'json': Each request is stored in its own JSON file, which is easy to inspect.
+                - 'log': Requests are appended to segmented log files that are periodically compacted, with an
+                    on-disk index for fast reopening. Recommended for queues with millions of requests.
+            queue_write_behind_interval: If set, request queues buffer the writes caused by marking requests as handled
+                and reclaiming them, and flush them in batches at most this long after they happen, on every
+                `PERSIST_STATE` event and on shutdown. Useful at high concurrency, where every worker otherwise waits
+                for its own disk writes.
+            queue_incremental_state_persistence: If set, request queues persist only the changes of their state
+                (pending, in-progress and handled requests) on every `PERSIST_STATE` event, to a journal that is
+                periodically compacted, instead of rewriting the whole state. Useful for queues with millions
+                of requests.
+        """
+        self._dataset_storage_format = dataset_storage_format
+        self._queue_storage_format = queue_storage_format
+        self._queue_write_behind_interval = queue_write_behind_interval
+        self._queue_incremental_state_persistence = queue_incremental_state_persistence
+
     @override
     def get_storage_client_cache_key(self, configuration: Configuration) -> Hashable:
         # Even different client instances should return same storage if the storage_dir is the same.
-        return super().get_storage_client_cache_key(configuration), configuration.storage_dir
+        return (
+            super().get_storage_client_cache_key(configuration),
+            configuration.storage_dir,
+            self._dataset_storage_format,
+            self._queue_storage_format,
+            self._queue_write_behind_interval,
+            self._queue_incremental_state_persistence,
+        )
 
     @override
     async def create_dataset_client(
@@ -49,7 +90,13 @@ class FileSystemStorageClient(StorageClient):
         configuration: Configuration | None = None,
     ) -> FileSystemDatasetClient:
         configuration = configuration or Configuration.get_global_configuration()
-        client = await FileSystemDatasetClient.open(id=id, name=name, alias=alias, configuration=configuration)
+        client = await FileSystemDatasetClient.open(
+            id=id,
+            name=name,
+            alias=alias,
+            configuration=configuration,
+            storage_format=self._dataset_storage_format,
+        )
         await self._purge_if_needed(client, configuration)
         return client
 
@@ -77,6 +124,14 @@ class FileSystemStorageClient(StorageClient):
         configuration: Configuration | None = None,
     ) -> FileSystemRequestQueueClient:
         configuration = configuration or Configuration.get_global_configuration()
-        client = await FileSystemRequestQueueClient.open(id=id, name=name, alias=alias, configuration=configuration)
+        client = await FileSystemRequestQueueClient.open(
+            id=id,
+            name=name,
+            alias=alias,
+            configuration=configuration,
+            storage_format=self._queue_storage_format,
+            write_behind_interval=self._queue_write_behind_interval,
+            incremental_state_persistence=self._queue_incremental_state_persistence,
+        )
         await self._purge_if_needed(client, configuration)
         return client
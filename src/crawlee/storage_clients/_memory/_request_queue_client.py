@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from datetime import datetime, timezone
+from hashlib import sha256
 from logging import getLogger
 from typing import TYPE_CHECKING
 
@@ -10,6 +11,7 @@ from typing_extensions import Self, override
 from crawlee import Request
 from crawlee._utils.crypto import crypto_random_object_id
 from crawlee._utils.raise_if_too_many_kwargs import raise_if_too_many_kwargs
+from crawlee._utils.request_codec import decode_request, encode_request
 from crawlee.storage_clients._base import RequestQueueClient
 from crawlee.storage_clients.models import AddRequestsResponse, ProcessedRequest, RequestQueueMetadata
 
@@ -28,12 +30,21 @@ class MemoryRequestQueueClient(RequestQueueClient):
 
     This client provides fast access to request data but is limited by available memory and does not support
     data sharing across different processes.
+
+    In the compact mode, pending requests are kept as compact records (see `encode_request`) that are turned back
+    into `Request` objects only when fetched, and handled requests are reduced to a hash of their unique key, which
+    is all the deduplication needs. This cuts the memory used by long crawls by an order of magnitude, at the cost
+    of encoding every added request and of `get_request` returning `None` for handled requests.
     """
 
+    _UNIQUE_KEY_HASH_BYTES = 16
+    """Number of bytes of the SHA-256 digest kept for the unique keys of handled requests in the compact mode."""
+
     def __init__(
         self,
         *,
         metadata: RequestQueueMetadata,
+        compact: bool = False,
     ) -> None:
         """Initialize a new instance.
 
@@ -41,22 +52,33 @@ class MemoryRequestQueueClient(RequestQueueClient):
         """
         self._metadata = metadata
 
+        self._compact = compact
+        """Whether pending requests are stored as compact records and handled requests as unique key hashes."""
+
         # The three stores below are keyed by unique key and disjoint - a request known to the queue lives in
         # exactly one of them, so together they also serve as the lookup by unique key.
 
-        self._pending_requests = OrderedDict[str, Request]()
+        self._pending_requests = OrderedDict[str, Request | bytes]()
         """Pending requests are those that have been added to the queue but not yet fetched for processing.
 
         Ordered from the front of the queue to its end, which keeps both fetching and repositioning a request
-        to the forefront O(1).
+        to the forefront O(1). Stored as compact records in the compact mode.
         """
 
         self._handled_requests = dict[str, Request]()
         """Handled requests are those that have been processed and marked as handled."""
 
+        self._handled_unique_key_hashes = set[int]()
+        """Unique key hashes of the handled requests, used instead of `_handled_requests` in the compact mode."""
+
         self._in_progress_requests = dict[str, Request]()
         """In-progress requests are those that have been fetched but not yet marked as handled or reclaimed."""
 
+    @property
+    @override
+    def has_local_changes_only(self) -> bool:
+        return True
+
     @override
     async def get_metadata(self) -> RequestQueueMetadata:
         return self._metadata
@@ -68,6 +90,7 @@ class MemoryRequestQueueClient(RequestQueueClient):
         id: str | None,
         name: str | None,
         alias: str | None,
+        compact: bool = False,
     ) -> Self:
         """Open or create a new memory request queue client.
 
@@ -82,6 +105,7 @@ class MemoryRequestQueueClient(RequestQueueClient):
             id: The ID of the request queue. If not provided, a random ID will be generated.
             name: The name of the request queue for named (global scope) storages.
             alias: The alias of the request queue for unnamed (run scope) storages.
+            compact: Whether to store pending requests as compact records and handled requests as unique key hashes.
 
         Returns:
             An instance for the opened or created storage client.
@@ -108,12 +132,13 @@ class MemoryRequestQueueClient(RequestQueueClient):
             total_request_count=0,
         )
 
-        return cls(metadata=metadata)
+        return cls(metadata=metadata, compact=compact)
 
     @override
     async def drop(self) -> None:
         self._pending_requests.clear()
         self._handled_requests.clear()
+        self._handled_unique_key_hashes.clear()
         self._in_progress_requests.clear()
 
         await self._update_metadata(
@@ -128,6 +153,7 @@ class MemoryRequestQueueClient(RequestQueueClient):
     async def purge(self) -> None:
         self._pending_requests.clear()
         self._handled_requests.clear()
+        self._handled_unique_key_hashes.clear()
         self._in_progress_requests.clear()
 
         await self._update_metadata(
@@ -151,7 +177,7 @@ class MemoryRequestQueueClient(RequestQueueClient):
 
         for request in requests:
             # Check which of the stores, if any, the request is already in.
-            was_already_handled = request.unique_key in self._handled_requests
+            was_already_handled = self._is_handled(request.unique_key)
             is_in_progress = request.unique_key in self._in_progress_requests
             was_already_present = was_already_handled or is_in_progress or request.unique_key in self._pending_requests
 
@@ -181,7 +207,7 @@ class MemoryRequestQueueClient(RequestQueueClient):
             # originally enqueued object: the incoming duplicate is typically a freshly built one that lost the
             # state accumulated so far (e.g. `retry_count`).
             if not was_already_present:
-                self._pending_requests[request.unique_key] = request
+                self._pending_requests[request.unique_key] = self._pack(request)
                 new_total_request_count += 1
                 new_pending_request_count += 1
 
@@ -214,20 +240,20 @@ class MemoryRequestQueueClient(RequestQueueClient):
         if not self._pending_requests:
             return None
 
-        _, request = self._pending_requests.popitem(last=False)
+        return self._pop_next_request()
 
-        # Mark as in progress.
-        self._in_progress_requests[request.unique_key] = request
-        return request
+    @override
+    async def fetch_next_requests(self, count: int) -> list[Request]:
+        return [self._pop_next_request() for _ in range(min(count, len(self._pending_requests)))]
 
     @override
     async def get_request(self, unique_key: str) -> Request | None:
         await self._update_metadata(update_accessed_at=True)
-        return (
-            self._pending_requests.get(unique_key)
-            or self._in_progress_requests.get(unique_key)
-            or self._handled_requests.get(unique_key)
-        )
+
+        if (packed_request := self._pending_requests.get(unique_key)) is not None:
+            return self._unpack(packed_request)
+
+        return self._in_progress_requests.get(unique_key) or self._handled_requests.get(unique_key)
 
     @override
     async def mark_request_as_handled(self, request: Request) -> ProcessedRequest | None:
@@ -240,7 +266,10 @@ class MemoryRequestQueueClient(RequestQueueClient):
             request.handled_at = datetime.now(timezone.utc)
 
         # Move request to handled storage.
-        self._handled_requests[request.unique_key] = request
+        if self._compact:
+            self._handled_unique_key_hashes.add(self._hash_unique_key(request.unique_key))
+        else:
+            self._handled_requests[request.unique_key] = request
 
         # Remove from in-progress.
         del self._in_progress_requests[request.unique_key]
@@ -274,7 +303,7 @@ class MemoryRequestQueueClient(RequestQueueClient):
 
         # Add the request back to the pending queue. Unlike a re-add, a reclaim carries the state accumulated
         # while the request was in progress, so the reclaimed object supersedes the one that was fetched.
-        self._pending_requests[request.unique_key] = request
+        self._pending_requests[request.unique_key] = self._pack(request)
         if forefront:
             self._pending_requests.move_to_end(request.unique_key, last=False)
 
@@ -299,6 +328,35 @@ class MemoryRequestQueueClient(RequestQueueClient):
         # Queue is finished if it is empty and there are no in-progress requests.
         return await self.is_empty() and len(self._in_progress_requests) == 0
 
+    def _is_handled(self, unique_key: str) -> bool:
+        """Check whether the request with the given unique key has been handled."""
+        if self._compact:
+            return self._hash_unique_key(unique_key) in self._handled_unique_key_hashes
+        return unique_key in self._handled_requests
+
+    def _pop_next_request(self) -> Request:
+        """Move the first pending request to the in-progress requests and return it."""
+        _, packed_request = self._pending_requests.popitem(last=False)
+        request = self._unpack(packed_request)
+
+        # Mark as in progress.
+        self._in_progress_requests[request.unique_key] = request
+        return request
+
+    def _pack(self, request: Request) -> Request | bytes:
+        """Convert a request to the form in which it is stored in the pending requests."""
+        return encode_request(request) if self._compact else request
+
+    @staticmethod
+    def _unpack(packed_request: Request | bytes) -> Request:
+        """Convert a stored pending request back to a `Request`."""
+        return decode_request(packed_request) if isinstance(packed_request, bytes) else packed_request
+
+    @classmethod
+    def _hash_unique_key(cls, unique_key: str) -> int:
+        """Compute the hash under which a handled request is remembered in the compact mode."""
+        return int.from_bytes(sha256(unique_key.encode('utf-8')).digest()[: cls._UNIQUE_KEY_HASH_BYTES], 'big')
+
     async def _update_metadata(
         self,
         *,
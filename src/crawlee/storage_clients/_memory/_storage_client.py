@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import override
 
 from crawlee._utils.docs import docs_group
@@ -10,6 +12,9 @@ from ._dataset_client import MemoryDatasetClient
 from ._key_value_store_client import MemoryKeyValueStoreClient
 from ._request_queue_client import MemoryRequestQueueClient
 
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
 
 @docs_group('Storage clients')
 class MemoryStorageClient(StorageClient):
@@ -27,6 +32,20 @@ class MemoryStorageClient(StorageClient):
     operations where persistence is not required.
     """
 
+    def __init__(self, *, compact_queues: bool = False) -> None:
+        """Initialize the memory storage client.
+
+        Args:
+            compact_queues: If set, request queues keep pending requests as compact records and remember handled
+                requests only by a hash of their unique key. This makes crawls with millions of requests fit in
+                a fraction of the memory, but handled requests can no longer be retrieved with `get_request`.
+        """
+        self._compact_queues = compact_queues
+
+    @override
+    def get_storage_client_cache_key(self, configuration: Configuration) -> Hashable:
+        return (super().get_storage_client_cache_key(configuration), self._compact_queues)
+
     @override
     async def create_dataset_client(
         self,
@@ -65,6 +84,6 @@ class MemoryStorageClient(StorageClient):
         configuration: Configuration | None = None,
     ) -> MemoryRequestQueueClient:
         configuration = configuration or Configuration.get_global_configuration()
-        client = await MemoryRequestQueueClient.open(id=id, name=name, alias=alias)
+        client = await MemoryRequestQueueClient.open(id=id, name=name, alias=alias, compact=self._compact_queues)
         await self._purge_if_needed(client, configuration)
         return client
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from logging import getLogger
 from typing import TYPE_CHECKING, Any
 
@@ -8,6 +7,7 @@ from redis.exceptions import RedisError
 from typing_extensions import override
 
 from crawlee._utils.file import infer_mime_type
+from crawlee._utils.json_codec import JsonCodec, get_json_codec
 from crawlee._utils.retry import retry_on_error
 from crawlee.storage_clients._base import KeyValueStoreClient
 from crawlee.storage_clients.models import KeyValueStoreMetadata, KeyValueStoreRecord, KeyValueStoreRecordMetadata
@@ -51,13 +51,16 @@ class RedisKeyValueStoreClient(KeyValueStoreClient, RedisClientMixin):
     _CLIENT_TYPE = 'Key-value store'
     """Human-readable client type for error messages."""
 
-    def __init__(self, storage_name: str, storage_id: str, redis: Redis) -> None:
+    def __init__(self, storage_name: str, storage_id: str, redis: Redis, json_codec: JsonCodec | None = None) -> None:
         """Initialize a new instance.
 
         Preferably use the `RedisKeyValueStoreClient.open` class method to create a new instance.
         """
         super().__init__(storage_name=storage_name, storage_id=storage_id, redis=redis)
 
+        self._json_codec = json_codec or get_json_codec()
+        """The codec used to encode and decode the JSON values."""
+
     @property
     def _items_key(self) -> str:
         """Return the Redis key for the items of KVS."""
@@ -76,6 +79,7 @@ class RedisKeyValueStoreClient(KeyValueStoreClient, RedisClientMixin):
         name: str | None,
         alias: str | None,
         redis: Redis,
+        json_codec: JsonCodec | None = None,
     ) -> RedisKeyValueStoreClient:
         """Open or create a new Redis key-value store client.
 
@@ -88,6 +92,7 @@ class RedisKeyValueStoreClient(KeyValueStoreClient, RedisClientMixin):
             name: The name of the key-value store for named (global scope) storages.
             alias: The alias of the key-value store for unnamed (run scope) storages.
             redis: Redis client instance.
+            json_codec: The codec used to encode and decode the JSON values, the standard library one by default.
 
         Returns:
             An instance for the opened or created storage client.
@@ -99,7 +104,7 @@ class RedisKeyValueStoreClient(KeyValueStoreClient, RedisClientMixin):
             redis=redis,
             metadata_model=KeyValueStoreMetadata,
             extra_metadata_fields={},
-            instance_kwargs={},
+            instance_kwargs={'json_codec': json_codec},
         )
 
     @retry_on_error(RedisError)
@@ -132,7 +137,7 @@ class RedisKeyValueStoreClient(KeyValueStoreClient, RedisClientMixin):
 
             # Serialize the value to bytes.
             if 'application/json' in content_type:
-                value_bytes = json.dumps(value, default=str, ensure_ascii=False).encode('utf-8')
+                value_bytes = self._json_codec.encode(value)
             elif isinstance(value, str):
                 value_bytes = value.encode('utf-8')
             elif isinstance(value, (bytes, bytearray)):
@@ -188,8 +193,8 @@ class RedisKeyValueStoreClient(KeyValueStoreClient, RedisClientMixin):
         # Handle JSON values
         if 'application/json' in metadata_item.content_type:
             try:
-                value = json.loads(value_bytes.decode('utf-8'))
-            except (json.JSONDecodeError, UnicodeDecodeError):
+                value = self._json_codec.decode(value_bytes)
+            except ValueError:
                 logger.warning(f'Failed to decode JSON value for key "{key}"')
                 return None
         # Handle text values
@@ -9,8 +9,9 @@ from typing import TYPE_CHECKING, Any, Literal
 from redis.exceptions import RedisError
 from typing_extensions import NotRequired, override
 
-from crawlee import Request
 from crawlee._utils.crypto import crypto_random_object_id
+from crawlee._utils.json_codec import JsonCodec, get_json_codec
+from crawlee._utils.request_codec import decode_request, encode_request
 from crawlee._utils.retry import retry_on_error
 from crawlee.storage_clients._base import RequestQueueClient
 from crawlee.storage_clients.models import AddRequestsResponse, ProcessedRequest, RequestQueueMetadata
@@ -25,6 +26,8 @@ if TYPE_CHECKING:
     from redis.asyncio.client import Pipeline
     from redis.commands.core import AsyncScript
 
+    from crawlee import Request
+
 logger = getLogger(__name__)
 
 
@@ -93,6 +96,8 @@ class RedisRequestQueueClient(RequestQueueClient, RedisClientMixin):
         redis: Redis,
         dedup_strategy: Literal['default', 'bloom'] = 'default',
         bloom_error_rate: float = 1e-7,
+        *,
+        json_codec: JsonCodec | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -106,6 +111,9 @@ class RedisRequestQueueClient(RequestQueueClient, RedisClientMixin):
         self._bloom_error_rate = bloom_error_rate
         """Desired false positive rate for Bloom filters."""
 
+        self._json_codec = json_codec or get_json_codec()
+        """The codec used to encode and decode the request records."""
+
         self._pending_fetch_cache: deque[Request] = deque()
         """Cache for requests: ordered by sequence number."""
 
@@ -172,6 +180,7 @@ class RedisRequestQueueClient(RequestQueueClient, RedisClientMixin):
         redis: Redis,
         dedup_strategy: Literal['default', 'bloom'] = 'default',
         bloom_error_rate: float = 1e-7,
+        json_codec: JsonCodec | None = None,
     ) -> RedisRequestQueueClient:
         """Open or create a new Redis request queue client.
 
@@ -190,6 +199,7 @@ class RedisRequestQueueClient(RequestQueueClient, RedisClientMixin):
                     this approach, there is a possibility 1e-7 that requests will be skipped in the queue.
             bloom_error_rate: Desired false positive rate for Bloom filter deduplication. Only relevant if
                 `dedup_strategy` is set to 'bloom'.
+            json_codec: The codec used to encode and decode the request records, the standard library one by default.
 
         Returns:
             An instance for the opened or created storage client.
@@ -206,7 +216,11 @@ class RedisRequestQueueClient(RequestQueueClient, RedisClientMixin):
                 'pending_request_count': 0,
                 'total_request_count': 0,
             },
-            instance_kwargs={'dedup_strategy': dedup_strategy, 'bloom_error_rate': bloom_error_rate},
+            instance_kwargs={
+                'dedup_strategy': dedup_strategy,
+                'bloom_error_rate': bloom_error_rate,
+                'json_codec': json_codec,
+            },
         )
 
     @retry_on_error(RedisError)
@@ -310,7 +324,7 @@ class RedisRequestQueueClient(RequestQueueClient, RedisClientMixin):
             request = requests_by_unique_key[unique_key]
 
             new_unique_keys.append(unique_key)
-            new_request_data[unique_key] = request.model_dump_json()
+            new_request_data[unique_key] = encode_request(request, self._json_codec).decode()
 
         if new_unique_keys:
             # Add new requests to the queue atomically, get back which were actually added
@@ -377,7 +391,7 @@ class RedisRequestQueueClient(RequestQueueClient, RedisClientMixin):
         if not requests_json:
             return None
 
-        requests = [Request.model_validate_json(req_json) for req_json in requests_json]
+        requests = [decode_request(req_json, self._json_codec) for req_json in requests_json]
 
         self._pending_fetch_cache.extend(requests[1:])
 
@@ -389,7 +403,7 @@ class RedisRequestQueueClient(RequestQueueClient, RedisClientMixin):
         request_data = await await_redis_response(self._redis.hget(self._data_key, unique_key))
 
         if isinstance(request_data, (str, bytes, bytearray)):
-            return Request.model_validate_json(request_data)
+            return decode_request(request_data, self._json_codec)
 
         return None
 
@@ -417,7 +431,9 @@ class RedisRequestQueueClient(RequestQueueClient, RedisClientMixin):
                 elif self._dedup_strategy == 'bloom':
                     await await_redis_response(pipe.bf().add(self._handled_filter_key, request.unique_key))
 
-                await await_redis_response(pipe.hset(self._data_key, request.unique_key, request.model_dump_json()))
+                await await_redis_response(
+                    pipe.hset(self._data_key, request.unique_key, encode_request(request, self._json_codec))
+                )
 
                 await self._update_metadata(
                     pipe,
@@ -473,11 +489,15 @@ class RedisRequestQueueClient(RequestQueueClient, RedisClientMixin):
                         f'{{"client_id":"{self.client_key}","blocked_until_timestamp":{blocked_until_timestamp}}}',
                     )
                 )
-                await await_redis_response(pipe.hset(self._data_key, request.unique_key, request.model_dump_json()))
+                await await_redis_response(
+                    pipe.hset(self._data_key, request.unique_key, encode_request(request, self._json_codec))
+                )
                 self._pending_fetch_cache.appendleft(request)
             else:
                 await await_redis_response(pipe.rpush(self._queue_key, request.unique_key))
-                await await_redis_response(pipe.hset(self._data_key, request.unique_key, request.model_dump_json()))
+                await await_redis_response(
+                    pipe.hset(self._data_key, request.unique_key, encode_request(request, self._json_codec))
+                )
                 await await_redis_response(pipe.hdel(self._in_progress_key, request.unique_key))
             await self._update_metadata(
                 pipe,
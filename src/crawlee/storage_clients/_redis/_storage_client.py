@@ -7,6 +7,7 @@ from redis.asyncio import Redis
 from typing_extensions import override
 
 from crawlee._utils.docs import docs_group
+from crawlee._utils.json_codec import get_json_codec
 from crawlee.configuration import Configuration
 from crawlee.storage_clients._base import StorageClient
 
@@ -120,6 +121,7 @@ class RedisStorageClient(StorageClient):
             name=name,
             alias=alias,
             redis=self._redis,
+            json_codec=get_json_codec(configuration.json_codec),
         )
 
         await self._purge_if_needed(client, configuration)
@@ -143,6 +145,7 @@ class RedisStorageClient(StorageClient):
             redis=self._redis,
             dedup_strategy=self._queue_dedup_strategy,
             bloom_error_rate=self._queue_bloom_error_rate,
+            json_codec=get_json_codec(configuration.json_codec),
         )
 
         await self._purge_if_needed(client, configuration)
@@ -90,6 +90,7 @@ class SqlClientMixin(ABC):
         metadata_model: type[DatasetMetadata | KeyValueStoreMetadata | RequestQueueMetadata],
         session: AsyncSession,
         extra_metadata_fields: dict[str, Any],
+        instance_kwargs: dict[str, Any],
     ) -> Self:
         """Open existing storage or create new one.
 
@@ -103,6 +104,7 @@ class SqlClientMixin(ABC):
             metadata_model: Pydantic model for metadata validation.
             session: Active database session.
             extra_metadata_fields: Storage-specific metadata fields.
+            instance_kwargs: Additional arguments for the client constructor.
         """
         orm_metadata: DatasetMetadataDb | KeyValueStoreMetadataDb | RequestQueueMetadataDb | None = None
         if id:
@@ -115,7 +117,7 @@ class SqlClientMixin(ABC):
             orm_metadata = result.scalar_one_or_none()
 
         if orm_metadata:
-            client = cls(id=orm_metadata.id, storage_client=storage_client)
+            client = cls(id=orm_metadata.id, storage_client=storage_client, **instance_kwargs)
             await client._add_buffer_record(session)
             # Ensure any pending buffer updates are processed
             await client._process_buffers()
@@ -129,7 +131,7 @@ class SqlClientMixin(ABC):
                 modified_at=now,
                 **extra_metadata_fields,
             )
-            client = cls(id=metadata.id, storage_client=storage_client)
+            client = cls(id=metadata.id, storage_client=storage_client, **instance_kwargs)
             session.add(cls._METADATA_TABLE(**metadata.model_dump(), internal_name=internal_name))
 
         return client
@@ -144,6 +146,7 @@ class SqlClientMixin(ABC):
         storage_client: SqlStorageClient,
         metadata_model: type[DatasetMetadata | KeyValueStoreMetadata | RequestQueueMetadata],
         extra_metadata_fields: dict[str, Any],
+        instance_kwargs: dict[str, Any] | None = None,
     ) -> Self:
         """Safely open storage with transaction handling.
 
@@ -154,7 +157,10 @@ class SqlClientMixin(ABC):
             storage_client: SQL storage client instance.
             metadata_model: Pydantic model for metadata validation.
             extra_metadata_fields: Storage-specific metadata fields.
+            instance_kwargs: Additional arguments for the client constructor.
         """
+        instance_kwargs = instance_kwargs or {}
+
         # Validate input parameters.
         specified_params = sum(1 for param in [id, name, alias] if param is not None)
         if specified_params > 1:
@@ -172,6 +178,7 @@ class SqlClientMixin(ABC):
                     metadata_model=metadata_model,
                     session=session,
                     extra_metadata_fields=extra_metadata_fields,
+                    instance_kwargs=instance_kwargs,
                 )
                 await session.commit()
             except SQLAlchemyError:
@@ -188,7 +195,7 @@ class SqlClientMixin(ABC):
                 if not orm_metadata:
                     raise ValueError(f'{cls._CLIENT_TYPE} with Name "{internal_name}" not found.') from None
 
-                client = cls(id=orm_metadata.id, storage_client=storage_client)
+                client = cls(id=orm_metadata.id, storage_client=storage_client, **instance_kwargs)
 
         return client
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, cast
@@ -11,6 +10,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from typing_extensions import Self, override
 
 from crawlee._utils.file import infer_mime_type
+from crawlee._utils.json_codec import JsonCodec, get_json_codec
 from crawlee._utils.retry import retry_on_error
 from crawlee.storage_clients._base import KeyValueStoreClient
 from crawlee.storage_clients.models import (
@@ -76,6 +76,7 @@ class SqlKeyValueStoreClient(KeyValueStoreClient, SqlClientMixin):
         *,
         storage_client: SqlStorageClient,
         id: str,
+        json_codec: JsonCodec | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -83,6 +84,9 @@ class SqlKeyValueStoreClient(KeyValueStoreClient, SqlClientMixin):
         """
         super().__init__(id=id, storage_client=storage_client)
 
+        self._json_codec = json_codec or get_json_codec()
+        """The codec used to encode and decode the JSON values."""
+
     @classmethod
     async def open(
         cls,
@@ -91,6 +95,7 @@ class SqlKeyValueStoreClient(KeyValueStoreClient, SqlClientMixin):
         name: str | None,
         alias: str | None,
         storage_client: SqlStorageClient,
+        json_codec: JsonCodec | None = None,
     ) -> Self:
         """Open or create a SQL key-value store client.
 
@@ -103,6 +108,7 @@ class SqlKeyValueStoreClient(KeyValueStoreClient, SqlClientMixin):
             name: The name of the key-value store for named (global scope) storages.
             alias: The alias of the key-value store for unnamed (run scope) storages.
             storage_client: The SQL storage client used to access the database.
+            json_codec: The codec used to encode and decode the JSON values, the standard library one by default.
 
         Returns:
             An instance for the opened or created storage client.
@@ -117,6 +123,7 @@ class SqlKeyValueStoreClient(KeyValueStoreClient, SqlClientMixin):
             storage_client=storage_client,
             metadata_model=KeyValueStoreMetadata,
             extra_metadata_fields={},
+            instance_kwargs={'json_codec': json_codec},
         )
 
     @retry_on_error(SQLAlchemyError)
@@ -156,7 +163,7 @@ class SqlKeyValueStoreClient(KeyValueStoreClient, SqlClientMixin):
 
             # Serialize the value to bytes.
             if 'application/json' in content_type:
-                value_bytes = json.dumps(value, default=str, ensure_ascii=False).encode('utf-8')
+                value_bytes = self._json_codec.encode(value)
             elif isinstance(value, str):
                 value_bytes = value.encode('utf-8')
             elif isinstance(value, (bytes, bytearray)):
@@ -211,8 +218,8 @@ class SqlKeyValueStoreClient(KeyValueStoreClient, SqlClientMixin):
         # Handle JSON values
         elif 'application/json' in record_db.content_type:
             try:
-                value = json.loads(value_bytes.decode('utf-8'))
-            except (json.JSONDecodeError, UnicodeDecodeError):
+                value = self._json_codec.decode(value_bytes)
+            except ValueError:
                 logger.warning(f'Failed to decode JSON value for key "{key}"')
                 return None
         # Handle text values
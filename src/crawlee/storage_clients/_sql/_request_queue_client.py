@@ -12,8 +12,9 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import load_only
 from typing_extensions import NotRequired, Self, override
 
-from crawlee import Request
 from crawlee._utils.crypto import crypto_random_object_id
+from crawlee._utils.json_codec import JsonCodec, get_json_codec
+from crawlee._utils.request_codec import decode_request, encode_request
 from crawlee._utils.retry import retry_on_error
 from crawlee.storage_clients._base import RequestQueueClient
 from crawlee.storage_clients.models import (
@@ -32,6 +33,8 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
     from sqlalchemy.sql import ColumnElement
 
+    from crawlee import Request
+
     from ._storage_client import SqlStorageClient
 
 
@@ -105,6 +108,7 @@ class SqlRequestQueueClient(RequestQueueClient, SqlClientMixin):
         *,
         id: str,
         storage_client: SqlStorageClient,
+        json_codec: JsonCodec | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -121,6 +125,9 @@ class SqlRequestQueueClient(RequestQueueClient, SqlClientMixin):
         self._had_multiple_clients = False
         """Indicates whether the queue has been accessed by multiple clients."""
 
+        self._json_codec = json_codec or get_json_codec()
+        """The codec used to encode and decode the request records."""
+
     @classmethod
     async def open(
         cls,
@@ -129,6 +136,7 @@ class SqlRequestQueueClient(RequestQueueClient, SqlClientMixin):
         name: str | None,
         alias: str | None,
         storage_client: SqlStorageClient,
+        json_codec: JsonCodec | None = None,
     ) -> Self:
         """Open an existing request queue or create a new one.
 
@@ -141,6 +149,7 @@ class SqlRequestQueueClient(RequestQueueClient, SqlClientMixin):
             name: The name of the request queue for named (global scope) storages.
             alias: The alias of the request queue for unnamed (run scope) storages.
             storage_client: The SQL storage client used to access the database.
+            json_codec: The codec used to encode and decode the request records, the standard library one by default.
 
         Returns:
             An instance for the opened or created request queue.
@@ -160,6 +169,7 @@ class SqlRequestQueueClient(RequestQueueClient, SqlClientMixin):
                 'pending_request_count': 0,
                 'total_request_count': 0,
             },
+            instance_kwargs={'json_codec': json_codec},
         )
 
     @retry_on_error(SQLAlchemyError)
@@ -260,7 +270,7 @@ class SqlRequestQueueClient(RequestQueueClient, SqlClientMixin):
                     value = {
                         'request_id': request_id,
                         'request_queue_id': self._id,
-                        'data': request.model_dump_json(),
+                        'data': encode_request(request, self._json_codec).decode(),
                         'is_handled': False,
                     }
                     if forefront:
@@ -306,7 +316,7 @@ class SqlRequestQueueClient(RequestQueueClient, SqlClientMixin):
                                 'request_queue_id': self._id,
                                 'request_id': request_id,
                                 'sequence_number': state.forefront_sequence_counter,
-                                'data': request.model_dump_json(),
+                                'data': encode_request(request, self._json_codec).decode(),
                                 'is_handled': False,
                             }
                         )
@@ -412,7 +422,7 @@ class SqlRequestQueueClient(RequestQueueClient, SqlClientMixin):
 
             await self._add_buffer_record(session)
 
-        return Request.model_validate_json(request_db.data)
+        return decode_request(request_db.data, self._json_codec)
 
     @retry_on_error(SQLAlchemyError)
     @override
@@ -493,7 +503,7 @@ class SqlRequestQueueClient(RequestQueueClient, SqlClientMixin):
         if not requests_db:
             return None
 
-        requests = [Request.model_validate_json(r.data) for r in requests_db if r.request_id in blocked_ids]
+        requests = [decode_request(r.data, self._json_codec) for r in requests_db if r.request_id in blocked_ids]
 
         if not requests:
             return None
@@ -515,7 +525,12 @@ class SqlRequestQueueClient(RequestQueueClient, SqlClientMixin):
         stmt = (
             update(self._ITEM_TABLE)
             .where(self._ITEM_TABLE.request_queue_id == self._id, self._ITEM_TABLE.request_id == request_id)
-            .values(is_handled=True, time_blocked_until=None, client_key=None, data=request.model_dump_json())
+            .values(
+                is_handled=True,
+                time_blocked_until=None,
+                client_key=None,
+                data=encode_request(request, self._json_codec).decode(),
+            )
         )
         async with self.get_session(with_simple_commit=True) as session:
             result = await session.execute(stmt)
@@ -562,7 +577,7 @@ class SqlRequestQueueClient(RequestQueueClient, SqlClientMixin):
                     sequence_number=new_sequence,
                     time_blocked_until=block_until,
                     client_key=self.client_key,
-                    data=request.model_dump_json(),
+                    data=encode_request(request, self._json_codec).decode(),
                 )
             else:
                 new_sequence = state.sequence_counter
@@ -571,7 +586,7 @@ class SqlRequestQueueClient(RequestQueueClient, SqlClientMixin):
                     sequence_number=new_sequence,
                     time_blocked_until=None,
                     client_key=None,
-                    data=request.model_dump_json(),
+                    data=encode_request(request, self._json_codec).decode(),
                 )
 
             result = await session.execute(stmt)
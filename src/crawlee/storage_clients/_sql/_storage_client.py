@@ -12,6 +12,7 @@ from sqlalchemy.sql import insert, select
 from typing_extensions import override
 
 from crawlee._utils.docs import docs_group
+from crawlee._utils.json_codec import get_json_codec
 from crawlee.configuration import Configuration
 from crawlee.storage_clients._base import StorageClient
 
@@ -213,6 +214,7 @@ class SqlStorageClient(StorageClient):
             name=name,
             alias=alias,
             storage_client=self,
+            json_codec=get_json_codec(configuration.json_codec),
         )
 
         await self._purge_if_needed(client, configuration)
@@ -235,6 +237,7 @@ class SqlStorageClient(StorageClient):
             name=name,
             alias=alias,
             storage_client=self,
+            json_codec=get_json_codec(configuration.json_codec),
         )
 
         await self._purge_if_needed(client, configuration)
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import logging
 from io import StringIO
-from typing import TYPE_CHECKING, overload
+from typing import TYPE_CHECKING, TextIO, overload
 
 from typing_extensions import override
 
 from crawlee import service_locator
 from crawlee._utils.docs import docs_group
-from crawlee._utils.file import export_csv_to_stream, export_json_to_stream
+from crawlee._utils.file import export_csv_to_stream, export_json_records_to_stream, export_json_to_stream
 
 from ._base import Storage
 from ._key_value_store import KeyValueStore
@@ -142,6 +142,9 @@ class Dataset(Storage):
         whose JSON representation is smaller than 9MB, and each item of a passed array is subject to the
         same per-item limit (the array itself may be of any size).
 
+        An array of objects is stored as a single batch, which is considerably cheaper than pushing the objects
+        one by one.
+
         Args:
             data: A JSON serializable data structure to be stored in the dataset.
         """
@@ -246,6 +249,29 @@ class Dataset(Storage):
         ):
             yield item
 
+    async def iterate_raw_items(
+        self,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+        desc: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """Iterate over the dataset items as UTF-8 encoded JSON records.
+
+        Unlike `iterate_items`, the items are not parsed into dictionaries when the storage client keeps them as
+        JSON records, which makes this the cheaper option for streaming items somewhere in their JSON form.
+
+        Args:
+            offset: Skips the specified number of items at the start.
+            limit: The maximum number of items to retrieve. Unlimited if None.
+            desc: Set to True to sort results in descending order.
+
+        Yields:
+            An asynchronous iterator of JSON records, one per dataset item.
+        """
+        async for record in self._client.iterate_raw_items(offset=offset, limit=limit, desc=desc):
+            yield record
+
     async def list_items(
         self,
         *,
@@ -367,7 +393,22 @@ class Dataset(Storage):
             await export_csv_to_stream(self.iterate_items(), dst, collect_all_keys=collect_all_keys, **kwargs)
             await kvs.set_value(key, dst.getvalue(), 'text/csv')
         elif content_type == 'json':
-            await export_json_to_stream(self.iterate_items(), dst, **kwargs)
+            await self.write_to_json(dst, **kwargs)
             await kvs.set_value(key, dst.getvalue(), 'application/json')
         else:
             raise ValueError('Unsupported content type, expecting CSV or JSON')
+
+    async def write_to_json(self, dst: TextIO, **kwargs: Unpack[ExportDataJsonKwargs]) -> None:
+        """Write the entire dataset to a text stream as a JSON array.
+
+        The output is the same as that of `json.dump` with the given arguments. Without them, the items are copied
+        to the stream as the JSON records of the storage client, if it keeps them in the form `json.dump` writes them.
+
+        Args:
+            dst: The text stream to write to.
+            kwargs: Additional parameters for `json.dump`.
+        """
+        if not kwargs and self._client.has_stdlib_json_records:
+            await export_json_records_to_stream(self.iterate_raw_items(), dst)
+        else:
+            await export_json_to_stream(self.iterate_items(), dst, **kwargs)
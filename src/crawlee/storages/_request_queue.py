@@ -10,6 +10,7 @@ from typing_extensions import override
 from crawlee import Request, service_locator
 from crawlee._utils.docs import docs_group
 from crawlee._utils.wait import wait_for_all_tasks_to_finish
+from crawlee._utils.work_signal import WorkSignal
 from crawlee.request_loaders import RequestManager
 from crawlee.storage_clients.models import AddRequestsResponse
 
@@ -91,6 +92,9 @@ class RequestQueue(Storage, RequestManager):
         self._add_requests_tasks = list[asyncio.Task]()
         """A list of tasks for adding requests to the queue."""
 
+        self._work_signal = WorkSignal()
+        """Notified whenever requests are added or reclaimed and when a background add task finishes."""
+
     @property
     @override
     def id(self) -> str:
@@ -101,6 +105,12 @@ class RequestQueue(Storage, RequestManager):
     def name(self) -> str | None:
         return self._name
 
+    @property
+    @override
+    def work_signal(self) -> WorkSignal | None:
+        # Requests added by other processes would not notify the signal, so queues they can change are polled.
+        return self._work_signal if self._client.has_local_changes_only else None
+
     @override
     async def get_metadata(self) -> RequestQueueMetadata:
         return await self._client.get_metadata()
@@ -238,7 +248,7 @@ class RequestQueue(Storage, RequestManager):
         )
 
         self._add_requests_tasks.append(remaining_batches_task)
-        remaining_batches_task.add_done_callback(lambda _: self._add_requests_tasks.remove(remaining_batches_task))
+        remaining_batches_task.add_done_callback(self._on_add_requests_task_done)
 
         # Wait for all tasks to finish if requested
         if wait_for_all_requests_to_be_added:
@@ -265,6 +275,21 @@ class RequestQueue(Storage, RequestManager):
         """
         return await self._client.fetch_next_request()
 
+    @override
+    async def fetch_next_requests(self, count: int) -> list[Request]:
+        """Return up to `count` next requests in the queue to be processed.
+
+        This is a batched variant of `RequestQueue.fetch_next_request` - each returned request needs to be marked
+        as handled or reclaimed, and fewer requests (possibly none) are returned if there are not enough pending.
+
+        Args:
+            count: The maximum number of requests to return.
+
+        Returns:
+            The requests to process.
+        """
+        return await self._client.fetch_next_requests(count)
+
     async def get_request(self, unique_key: str) -> Request | None:
         """Retrieve a specific request from the queue by its ID.
 
@@ -311,7 +336,9 @@ class RequestQueue(Storage, RequestManager):
         Returns:
             Information about the queue operation.
         """
-        return await self._client.reclaim_request(request, forefront=forefront)
+        processed_request = await self._client.reclaim_request(request, forefront=forefront)
+        self._work_signal.notify()
+        return processed_request
 
     async def is_empty(self) -> bool:
         """Check if the request queue is empty.
@@ -344,6 +371,11 @@ class RequestQueue(Storage, RequestManager):
 
         return False
 
+    def _on_add_requests_task_done(self, task: asyncio.Task) -> None:
+        self._add_requests_tasks.remove(task)
+        # The queue may have become finished, consumers waiting for new requests need to check that.
+        self._work_signal.notify()
+
     async def _process_batch(
         self,
         batch: Sequence[Request],
@@ -363,6 +395,7 @@ class RequestQueue(Storage, RequestManager):
 
         request_count = len(batch) - len(response.unprocessed_requests)
         if request_count:
+            self._work_signal.notify()
             logger.debug(
                 f'Added {request_count} requests to the queue. Processed requests: {response.processed_requests}'
             )
@@ -15,6 +15,7 @@ from crawlee._autoscaling import AutoscaledPool, SystemStatus
 from crawlee._autoscaling._types import LoadRatioInfo, SystemInfo
 from crawlee._types import ConcurrencySettings
 from crawlee._utils.time import measure_time
+from crawlee._utils.work_signal import WorkSignal
 from tests.unit.utils import poll_until_condition
 
 if TYPE_CHECKING:
@@ -360,3 +361,108 @@ async def test_allows_multiple_run_calls(system_status: SystemStatus | Mock) ->
 
     await pool.run()
     assert done_count == 4
+
+
+async def test_work_signal_wakes_up_pool(system_status: SystemStatus | Mock) -> None:
+    work_signal = WorkSignal()
+    pending = list[float]()
+    delays = list[float]()
+
+    async def run() -> None:
+        # The pool may start more tasks than there are pending items before the first one takes its item.
+        if pending:
+            delays.append(asyncio.get_running_loop().time() - pending.pop())
+
+    pool = AutoscaledPool(
+        system_status=system_status,
+        run_task_function=run,
+        is_task_ready_function=lambda: future(bool(pending)),
+        is_finished_function=lambda: future(len(delays) >= 3),
+        get_work_signal_function=lambda: future(work_signal),
+    )
+
+    pool_run_task = asyncio.create_task(pool.run())
+
+    for _ in range(3):
+        await asyncio.sleep(0.05)
+        pending.append(asyncio.get_running_loop().time())
+        work_signal.notify()
+
+    await asyncio.wait_for(pool_run_task, timeout=1)
+
+    # Without the notification, the pool would only notice the new work once its poll interval elapses.
+    assert len(delays) == 3
+    assert max(delays) < 0.1
+
+
+async def test_saturated_pool_does_not_poll_with_work_signal(system_status: SystemStatus | Mock) -> None:
+    work_signal = WorkSignal()
+    release = asyncio.Event()
+    finished = False
+    is_finished_calls = 0
+    is_task_ready_calls = 0
+
+    async def run() -> None:
+        await release.wait()
+
+    async def is_finished() -> bool:
+        nonlocal is_finished_calls
+        is_finished_calls += 1
+        return finished
+
+    async def is_task_ready() -> bool:
+        nonlocal is_task_ready_calls
+        is_task_ready_calls += 1
+        return not finished
+
+    pool = AutoscaledPool(
+        system_status=system_status,
+        run_task_function=run,
+        is_task_ready_function=is_task_ready,
+        is_finished_function=is_finished,
+        get_work_signal_function=lambda: future(work_signal),
+        concurrency_settings=ConcurrencySettings(min_concurrency=2, desired_concurrency=2, max_concurrency=2),
+    )
+
+    pool_run_task = asyncio.create_task(pool.run())
+    await poll_until_condition(lambda: pool.current_concurrency == 2)
+
+    calls_when_saturated = (is_finished_calls, is_task_ready_calls)
+    for _ in range(10):
+        work_signal.notify()
+        await asyncio.sleep(0.1)
+
+    assert (is_finished_calls, is_task_ready_calls) == calls_when_saturated
+
+    finished = True
+    release.set()
+    await asyncio.wait_for(pool_run_task, timeout=1)
+
+
+async def test_worker_runs_task_batches(system_status: SystemStatus | Mock) -> None:
+    done_count = 0
+    worker_tasks = set[asyncio.Task | None]()
+
+    async def run() -> None:
+        nonlocal done_count
+        worker_tasks.add(asyncio.current_task())
+        done_count += 1
+        await asyncio.sleep(0)
+
+    pool = AutoscaledPool(
+        system_status=system_status,
+        run_task_function=run,
+        is_task_ready_function=lambda: future(done_count < 20),
+        is_finished_function=lambda: future(done_count >= 20),
+        concurrency_settings=ConcurrencySettings(
+            min_concurrency=1,
+            desired_concurrency=1,
+            max_concurrency=1,
+            task_batch_size=5,
+        ),
+    )
+
+    await pool.run()
+
+    assert done_count == 20
+    assert len(worker_tasks) == 4
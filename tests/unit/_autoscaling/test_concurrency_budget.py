@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pytest
+
+from crawlee import Request
+from crawlee._autoscaling import ConcurrencyBudget
+
+
+def make_requests(host: str, count: int) -> list[Request]:
+    return [Request.from_url(f'https://{host}/{i}') for i in range(count)]
+
+
+def test_per_key_limits() -> None:
+    budget = ConcurrencyBudget(max_concurrency_per_key=2, max_concurrency_by_key={'slow.com': 1})
+    fast, slow = make_requests('fast.com', 3), make_requests('slow.com', 2)
+
+    assert [budget.try_acquire(request) for request in fast] == [True, True, False]
+    assert [budget.try_acquire(request) for request in slow] == [True, False]
+    assert budget.get_in_progress_by_key() == {'fast.com': 2, 'slow.com': 1}
+
+    budget.release(fast[0])
+    budget.release(fast[0])
+    assert budget.try_acquire(fast[2])
+    assert budget.get_in_progress_by_key() == {'fast.com': 2, 'slow.com': 1}
+
+
+def test_requests_without_key_are_not_limited() -> None:
+    budget = ConcurrencyBudget(key_function=lambda request: request.label, max_concurrency_per_key=1)
+
+    assert all(budget.try_acquire(request) for request in make_requests('example.com', 5))
+    assert budget.get_in_progress_by_key() == {}
+
+    with pytest.raises(ValueError, match='belong to a group'):
+        budget.defer(Request.from_url('https://example.com'))
+
+
+def test_fair_share_between_keys() -> None:
+    budget = ConcurrencyBudget(max_concurrency_per_key=3)
+    budget.total_concurrency = 6
+    slow, fast = make_requests('slow.com', 6), make_requests('fast.com', 3)
+
+    # Even a single domain leaves a share for the domains further down the queue.
+    assert all(budget.try_acquire(request) for request in slow[:3])
+    assert not budget.try_acquire(slow[3])
+    budget.defer(slow[3])
+
+    # Once another domain is active, the shares are split between the two and the one kept for others.
+    assert budget.try_acquire(fast[0])
+    assert budget.try_acquire(fast[1])
+    assert not budget.try_acquire(fast[2])
+    budget.defer(fast[2])
+    assert budget.buffered_count == 2
+    assert budget.get_in_progress_by_key() == {'slow.com': 3, 'fast.com': 2}
+
+    # Set aside requests go as soon as their group is back within its share.
+    budget.release(slow[0])
+    assert budget.pop_ready() is None
+    budget.release(slow[1])
+    assert budget.pop_ready() is slow[3]
+    budget.release(fast[0])
+    assert budget.pop_ready() is fast[2]
+    assert budget.get_in_progress_by_key() == {'slow.com': 2, 'fast.com': 2}
+
+    # Beyond the fair share, a group can still use the spare capacity up to its own limit.
+    budget.defer(slow[4])
+    budget.defer(slow[5])
+    assert not budget.has_ready()
+    assert budget.has_ready(within_fair_share=False)
+    assert budget.pop_ready(within_fair_share=False) is slow[4]
+    assert budget.pop_ready(within_fair_share=False) is None
+    assert budget.buffered_count == 1
+
+
+def test_buffer_limit_and_drain() -> None:
+    budget = ConcurrencyBudget(max_concurrency_per_key=1, max_buffered_requests=2)
+    requests = make_requests('example.com', 3)
+
+    assert budget.try_acquire(requests[0])
+    for request in requests[1:]:
+        assert not budget.try_acquire(request)
+        budget.defer(request)
+
+    assert budget.is_buffer_full
+    assert budget.drain() == requests[1:]
+    assert not budget.is_buffer_full
+    assert budget.pop_ready() is None
+
+
+def test_invalid_budget_arguments() -> None:
+    with pytest.raises(ValueError, match='max_concurrency_per_key'):
+        ConcurrencyBudget(max_concurrency_per_key=0)
+
+    with pytest.raises(ValueError, match='max_concurrency_by_key'):
+        ConcurrencyBudget(max_concurrency_by_key={'example.com': 0})
+
+    with pytest.raises(ValueError, match='max_buffered_requests'):
+        ConcurrencyBudget(max_buffered_requests=0)
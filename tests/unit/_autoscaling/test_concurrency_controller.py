@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from crawlee._autoscaling import (
+    AimdConcurrencyController,
+    AutoscaledPool,
+    ConcurrencyController,
+    StepConcurrencyController,
+    SystemStatus,
+    ThroughputConcurrencyController,
+)
+from crawlee._autoscaling._types import ConcurrencyStatus, LoadRatioInfo, SystemInfo
+from crawlee._types import ConcurrencySettings
+from tests.unit.utils import poll_until_condition
+
+
+def get_system_info(cpu_ratio: float = 0.0) -> SystemInfo:
+    idle = LoadRatioInfo(limit_ratio=0.2, actual_ratio=0.0)
+    return SystemInfo(
+        cpu_info=LoadRatioInfo(limit_ratio=0.4, actual_ratio=cpu_ratio),
+        memory_info=idle,
+        event_loop_info=idle,
+        client_info=idle,
+    )
+
+
+def get_status(
+    desired_concurrency: int,
+    *,
+    cpu_ratio: float = 0.0,
+    current_concurrency: int | None = None,
+    finished_task_count: int = 0,
+) -> ConcurrencyStatus:
+    return ConcurrencyStatus(
+        desired_concurrency=desired_concurrency,
+        current_concurrency=desired_concurrency if current_concurrency is None else current_concurrency,
+        min_concurrency=1,
+        max_concurrency=1000,
+        system_info=get_system_info(cpu_ratio),
+        finished_task_count=finished_task_count,
+        interval=timedelta(seconds=10),
+    )
+
+
+def test_system_info_overload_ratio() -> None:
+    assert get_system_info(0.2).max_overload_ratio == pytest.approx(0.5)
+    assert get_system_info(0.8).max_overload_ratio == pytest.approx(2)
+    assert LoadRatioInfo(limit_ratio=0, actual_ratio=0.1).overload_ratio == float('inf')
+
+
+def test_step_controller() -> None:
+    controller = StepConcurrencyController()
+
+    assert controller.get_desired_concurrency(get_status(40)) == 42
+    assert controller.get_desired_concurrency(get_status(40, current_concurrency=10)) == 40
+    assert controller.get_desired_concurrency(get_status(40, cpu_ratio=1.0)) == 38
+
+
+def test_aimd_controller_slow_start_then_additive_increase() -> None:
+    controller = AimdConcurrencyController()
+
+    assert controller.get_desired_concurrency(get_status(1)) == 2
+    assert controller.get_desired_concurrency(get_status(32)) == 64
+    assert controller.get_desired_concurrency(get_status(32, current_concurrency=8)) == 32
+
+    # A slight overload cuts the concurrency a little and ends the slow start.
+    assert controller.get_desired_concurrency(get_status(64, cpu_ratio=0.5)) == 57
+    assert controller.get_desired_concurrency(get_status(57)) == 58
+
+    # A heavy overload cuts it by the multiplicative decrease at most.
+    assert controller.get_desired_concurrency(get_status(58, cpu_ratio=1.0)) == 36
+    assert controller.get_desired_concurrency(get_status(2, cpu_ratio=1.0)) == 1
+
+
+def test_throughput_controller_turns_around_when_throughput_stops_growing() -> None:
+    controller = ThroughputConcurrencyController()
+
+    # Throughput doubles with the concurrency, so the controller keeps doubling it.
+    assert controller.get_desired_concurrency(get_status(10, finished_task_count=100)) == 20
+    assert controller.get_desired_concurrency(get_status(20, finished_task_count=200)) == 40
+
+    # Doubling the concurrency barely helped, so it turns around with half the step.
+    assert controller.get_desired_concurrency(get_status(40, finished_task_count=220)) == 20
+
+    # Going down costs throughput in proportion, so it turns around again.
+    assert controller.get_desired_concurrency(get_status(20, finished_task_count=110)) == 25
+
+    # An overloaded system always makes it back off.
+    assert controller.get_desired_concurrency(get_status(25, cpu_ratio=1.0, finished_task_count=130)) == 21
+
+
+def test_invalid_controller_arguments() -> None:
+    with pytest.raises(ValueError, match='multiplicative_decrease'):
+        AimdConcurrencyController(multiplicative_decrease=1.5)
+
+    with pytest.raises(ValueError, match='min_step_ratio'):
+        ThroughputConcurrencyController(min_step_ratio=0)
+
+
+async def test_pool_uses_concurrency_controller(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FixedConcurrencyController(ConcurrencyController):
+        def __init__(self) -> None:
+            self.statuses = list[ConcurrencyStatus]()
+
+        def get_desired_concurrency(self, status: ConcurrencyStatus) -> int:
+            self.statuses.append(status)
+            return 1000
+
+    async def run() -> None:
+        await asyncio.sleep(0.01)
+
+    system_status = Mock(spec=SystemStatus)
+    system_status.get_historical_system_info.return_value = get_system_info()
+    monkeypatch.setattr(AutoscaledPool, '_AUTOSCALE_INTERVAL', timedelta(seconds=0.1))
+
+    controller = FixedConcurrencyController()
+    pool = AutoscaledPool(
+        system_status=system_status,
+        run_task_function=run,
+        is_task_ready_function=AsyncMock(return_value=True),
+        is_finished_function=AsyncMock(return_value=False),
+        concurrency_settings=ConcurrencySettings(
+            min_concurrency=1,
+            desired_concurrency=1,
+            max_concurrency=8,
+            concurrency_controller=controller,
+        ),
+    )
+
+    pool_run_task = asyncio.create_task(pool.run())
+    try:
+        # The returned value is clamped to the maximum concurrency.
+        assert await poll_until_condition(lambda: pool.desired_concurrency == 8, timeout=5.0)
+        assert await poll_until_condition(lambda: len(controller.statuses) >= 2, timeout=5.0)
+        assert any(status.finished_task_count > 0 for status in controller.statuses)
+        assert all(status.throughput >= 0 for status in controller.statuses)
+    finally:
+        pool_run_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await pool_run_task
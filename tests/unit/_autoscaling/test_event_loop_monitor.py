@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+
+from crawlee._autoscaling import EventLoopMonitor, Snapshotter, SystemStatus
+from crawlee.configuration import Configuration
+
+
+def block_event_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def blocking_handler() -> None:
+    await asyncio.sleep(0)
+    block_event_loop(0.06)
+
+
+async def test_slow_callbacks_are_attributed_to_the_blocking_coroutine() -> None:
+    async with EventLoopMonitor(slow_callback_threshold=timedelta(milliseconds=50)) as monitor:
+        await asyncio.create_task(blocking_handler())
+        await asyncio.sleep(0.01)
+
+    slow_callbacks = monitor.get_slow_callbacks()
+    assert len(slow_callbacks) == 1
+    assert slow_callbacks[0].location.startswith('blocking_handler (')
+    assert slow_callbacks[0].count == 1
+    assert slow_callbacks[0].max_duration >= timedelta(milliseconds=60)
+    assert monitor.callback_duration_histogram.max >= timedelta(milliseconds=60)
+
+
+async def test_lag_is_measured() -> None:
+    async with EventLoopMonitor(probe_interval=timedelta(milliseconds=10)) as monitor:
+        timer = asyncio.get_running_loop().create_future()
+        asyncio.get_running_loop().call_later(0.01, timer.set_result, None)
+        block_event_loop(0.06)
+        await timer
+
+    latency = monitor.get_latency_info()
+    assert latency.count > 0
+    assert latency.max >= timedelta(milliseconds=40)
+    assert monitor.take_max_lag() >= timedelta(milliseconds=40)
+    assert monitor.take_max_lag() == timedelta()
+
+
+@pytest.mark.parametrize('instrument_callbacks', [True, False])
+async def test_probe_measures_lag(*, instrument_callbacks: bool) -> None:
+    async with EventLoopMonitor(
+        probe_interval=timedelta(milliseconds=10),
+        instrument_callbacks=instrument_callbacks,
+    ) as monitor:
+        await asyncio.sleep(0.005)
+        block_event_loop(0.03)
+        await asyncio.sleep(0.05)
+
+    assert monitor.lag_histogram.count > 0
+    assert monitor.lag_histogram.max >= timedelta(milliseconds=15)
+    assert monitor.get_latency_info(recent=False).max == monitor.lag_histogram.max
+
+
+async def test_handle_run_is_restored() -> None:
+    original_handle_run = asyncio.Handle._run
+
+    monitor = EventLoopMonitor()
+    monitor.start()
+    assert asyncio.Handle._run is not original_handle_run
+
+    with pytest.raises(RuntimeError, match='already monitoring'):
+        EventLoopMonitor().start()
+
+    monitor.stop()
+    assert asyncio.Handle._run is original_handle_run
+    assert not monitor.active
+
+
+async def test_snapshotter_uses_event_loop_monitor() -> None:
+    config = Configuration(event_loop_monitoring=True, max_event_loop_delay=timedelta(milliseconds=20))
+
+    async with Snapshotter.from_config(config) as snapshotter:
+        monitor = snapshotter.event_loop_monitor
+        assert monitor is not None
+        assert monitor.active
+
+        timer = asyncio.get_running_loop().create_future()
+        asyncio.get_running_loop().call_later(0.01, timer.set_result, None)
+        block_event_loop(0.1)
+        await timer
+
+        await snapshotter._snapshot_event_loop()
+        assert snapshotter.get_event_loop_sample()[-1].is_overloaded
+
+        system_info = SystemStatus(snapshotter).get_current_system_info()
+        assert system_info.event_loop_latency is not None
+        assert system_info.event_loop_latency.max >= timedelta(milliseconds=80)
+
+    assert not monitor.active
+
+
+async def test_snapshotter_without_event_loop_monitor() -> None:
+    async with Snapshotter.from_config(Configuration()) as snapshotter:
+        assert snapshotter.event_loop_monitor is None
+        assert snapshotter.get_event_loop_latency() is None
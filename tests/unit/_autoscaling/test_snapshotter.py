@@ -20,7 +20,7 @@ from crawlee._autoscaling._types import (
     CpuSnapshot,
     MemorySnapshot,
 )
-from crawlee._autoscaling.snapshotter import SortedSnapshotList
+from crawlee._autoscaling.snapshotter import SnapshotBuffer
 from crawlee._utils.byte_size import ByteSize
 from crawlee._utils.system import CpuInfo, MemoryInfo, get_memory_info
 from crawlee.configuration import Configuration
@@ -357,8 +357,8 @@ async def test_snapshots_time_ordered(snapshotter: Snapshotter, event_manager: L
 
 
 def test_sorted_snapshot_list_add_maintains_order() -> None:
-    """Test that SortedSnapshotList.add method maintains sorted order by created_at with multiple items."""
-    sorted_list = SortedSnapshotList[CpuSnapshot]()
+    """Test that SnapshotBuffer.add method maintains sorted order by created_at with multiple items."""
+    sorted_list = SnapshotBuffer[CpuSnapshot]()
 
     # Create snapshots with different timestamps (more items to test binary search better)
     now = datetime.now(timezone.utc)
@@ -387,6 +387,42 @@ def test_sorted_snapshot_list_add_maintains_order() -> None:
             assert prev_time <= curr_time, f'Items at indices {i - 1} and {i} are not in chronological order'
 
 
+def test_snapshot_buffer_overloaded_ratio() -> None:
+    buffer = SnapshotBuffer[CpuSnapshot]()
+    now = datetime.now(timezone.utc)
+    assert buffer.get_overloaded_ratio() == 0
+
+    # The time between two snapshots is attributed to the later one.
+    for seconds, used_ratio in [(0, 0.1), (1, 0.9), (3, 0.1), (4, 0.9), (8, 0.9)]:
+        buffer.add(CpuSnapshot(used_ratio=used_ratio, max_used_ratio=0.5, created_at=now + timedelta(seconds=seconds)))
+
+    assert buffer.get_overloaded_ratio() == pytest.approx(6 / 8)
+    assert buffer.get_overloaded_ratio(timedelta(seconds=7)) == pytest.approx(5 / 7)
+    assert buffer.get_overloaded_ratio(timedelta(seconds=1)) == 1
+
+    # A snapshot inserted out of order rebuilds the running totals.
+    buffer.add(CpuSnapshot(used_ratio=0.1, max_used_ratio=0.5, created_at=now + timedelta(seconds=6)))
+    assert buffer.get_overloaded_ratio() == pytest.approx(4 / 8)
+    assert buffer.get_overloaded_ratio(timedelta(seconds=7)) == pytest.approx(3 / 7)
+
+    buffer.remove_older_than(now + timedelta(seconds=4))
+    assert len(buffer) == 3
+    assert buffer.get_overloaded_ratio() == pytest.approx(2 / 4)
+
+
+def test_snapshot_buffer_drops_oldest_snapshots_when_full() -> None:
+    buffer = SnapshotBuffer[CpuSnapshot](capacity=3)
+    now = datetime.now(timezone.utc)
+
+    for seconds in range(5):
+        buffer.add(CpuSnapshot(used_ratio=seconds % 2, max_used_ratio=0.5, created_at=now + timedelta(seconds=seconds)))
+        assert buffer.get_overloaded_ratio(timedelta(seconds=10)) == buffer.get_overloaded_ratio()
+
+    assert [snapshot.created_at for snapshot in buffer] == [now + timedelta(seconds=seconds) for seconds in (2, 3, 4)]
+    assert buffer.get_sample(timedelta(seconds=1)) == list(buffer[1:])
+    assert buffer.get_overloaded_ratio() == pytest.approx(1 / 2)
+
+
 @pytest.mark.parametrize('dynamic_memory', [True, False])
 async def test_dynamic_memory(
     *,
@@ -44,7 +44,7 @@ async def test_start_stop_lifecycle() -> None:
 
 def test_cpu_is_overloaded(snapshotter: Snapshotter, now: datetime) -> None:
     system_status = SystemStatus(snapshotter, cpu_overload_threshold=0.5)
-    system_status._snapshotter._cpu_snapshots = Snapshotter._get_sorted_list_by_created_at(
+    system_status._snapshotter._cpu_snapshots = Snapshotter._create_snapshot_buffer(
         [
             CpuSnapshot(used_ratio=0.6, max_used_ratio=0.75, created_at=now - timedelta(minutes=3)),
             CpuSnapshot(used_ratio=0.7, max_used_ratio=0.75, created_at=now - timedelta(minutes=2)),
@@ -60,7 +60,7 @@ def test_cpu_is_overloaded(snapshotter: Snapshotter, now: datetime) -> None:
 
 def test_cpu_is_not_overloaded(snapshotter: Snapshotter, now: datetime) -> None:
     system_status = SystemStatus(snapshotter, cpu_overload_threshold=0.5)
-    system_status._snapshotter._cpu_snapshots = Snapshotter._get_sorted_list_by_created_at(
+    system_status._snapshotter._cpu_snapshots = Snapshotter._create_snapshot_buffer(
         [
             CpuSnapshot(used_ratio=0.7, max_used_ratio=0.75, created_at=now - timedelta(minutes=3)),
             CpuSnapshot(used_ratio=0.8, max_used_ratio=0.75, created_at=now - timedelta(minutes=2)),
@@ -85,7 +85,7 @@ def test_get_system_info(snapshotter: Snapshotter, now: datetime) -> None:
     )
 
     # Add CPU snapshots
-    system_status._snapshotter._cpu_snapshots = Snapshotter._get_sorted_list_by_created_at(
+    system_status._snapshotter._cpu_snapshots = Snapshotter._create_snapshot_buffer(
         [
             CpuSnapshot(used_ratio=0.6, max_used_ratio=0.75, created_at=now - timedelta(minutes=3)),
             CpuSnapshot(used_ratio=0.7, max_used_ratio=0.75, created_at=now - timedelta(minutes=2)),
@@ -95,7 +95,7 @@ def test_get_system_info(snapshotter: Snapshotter, now: datetime) -> None:
     )
 
     # Add memory snapshots
-    system_status._snapshotter._memory_snapshots = Snapshotter._get_sorted_list_by_created_at(
+    system_status._snapshotter._memory_snapshots = Snapshotter._create_snapshot_buffer(
         [
             MemorySnapshot(
                 current_size=ByteSize.from_gb(4),
@@ -133,7 +133,7 @@ def test_get_system_info(snapshotter: Snapshotter, now: datetime) -> None:
     )
 
     # Add event loop snapshots
-    system_status._snapshotter._event_loop_snapshots = Snapshotter._get_sorted_list_by_created_at(
+    system_status._snapshotter._event_loop_snapshots = Snapshotter._create_snapshot_buffer(
         [
             EventLoopSnapshot(
                 delay=timedelta(milliseconds=700),
@@ -159,7 +159,7 @@ def test_get_system_info(snapshotter: Snapshotter, now: datetime) -> None:
     )
 
     # Add client snapshots
-    system_status._snapshotter._client_snapshots = Snapshotter._get_sorted_list_by_created_at(
+    system_status._snapshotter._client_snapshots = Snapshotter._create_snapshot_buffer(
         [
             ClientSnapshot(error_count=1, new_error_count=1, max_error_count=2, created_at=now - timedelta(minutes=3)),
             ClientSnapshot(error_count=2, new_error_count=1, max_error_count=2, created_at=now - timedelta(minutes=2)),
@@ -201,7 +201,7 @@ def test_client_overloaded(
         client_overload_threshold=client_overload_threshold,
     )
 
-    system_status._snapshotter._client_snapshots = Snapshotter._get_sorted_list_by_created_at(
+    system_status._snapshotter._client_snapshots = Snapshotter._create_snapshot_buffer(
         [
             ClientSnapshot(error_count=1, new_error_count=1, max_error_count=0, created_at=now - timedelta(minutes=3)),
             ClientSnapshot(error_count=2, new_error_count=1, max_error_count=0, created_at=now - timedelta(minutes=2)),
@@ -223,7 +223,7 @@ def test_memory_overloaded_system_wide(snapshotter: Snapshotter, now: datetime)
     )
 
     # Add memory snapshots with system-wide memory usage above threshold (97%)
-    system_status._snapshotter._memory_snapshots = Snapshotter._get_sorted_list_by_created_at(
+    system_status._snapshotter._memory_snapshots = Snapshotter._create_snapshot_buffer(
         [
             MemorySnapshot(
                 current_size=ByteSize.from_gb(1),  # Process memory is low
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from io import StringIO
 from typing import TYPE_CHECKING, cast
 
 import pytest
 
-from crawlee._utils.file import export_csv_to_stream, json_dumps, validate_subdirectory
+from crawlee._utils.file import (
+    atomic_write_many,
+    export_csv_to_stream,
+    export_json_records_to_stream,
+    json_dumps,
+    validate_subdirectory,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Mapping
@@ -23,6 +30,13 @@ async def test_json_dumps() -> None:
     assert await json_dumps(datetime(2022, 1, 1, tzinfo=timezone.utc)) == '"2022-01-01 00:00:00+00:00"'
 
 
+async def test_atomic_write_many(tmp_path: Path) -> None:
+    await atomic_write_many([(tmp_path / 'a.json', '{"a": 1}'), (tmp_path / 'b.bin', b'\x00\x01')])
+
+    assert (tmp_path / 'a.json').read_text() == '{"a": 1}'
+    assert (tmp_path / 'b.bin').read_bytes() == b'\x00\x01'
+
+
 async def async_iter(
     items: list[Mapping[str, JsonSerializable]],
 ) -> AsyncIterator[Mapping[str, JsonSerializable]]:
@@ -30,6 +44,23 @@ async def async_iter(
         yield item
 
 
+async def test_export_json_records_to_stream_matches_json_dump() -> None:
+    """The records must be joined into the exact output of `json.dump` with its default options."""
+    items: list[Mapping[str, JsonSerializable]] = [{'name': 'Alice', 'age': 30}, {'name': 'Zoë'}, {}]
+
+    async def records(items: list[Mapping[str, JsonSerializable]]) -> AsyncIterator[bytes]:
+        for item in items:
+            yield json.dumps(item, ensure_ascii=False).encode('utf-8')
+
+    dst = StringIO()
+    await export_json_records_to_stream(records(items), dst)
+    assert dst.getvalue() == json.dumps(items)
+
+    dst = StringIO()
+    await export_json_records_to_stream(records([]), dst)
+    assert dst.getvalue() == '[]'
+
+
 async def test_export_csv_to_stream_keeps_columns_aligned_for_heterogeneous_items() -> None:
     """Values must be written under their own header column even when items have different key orders/sets."""
     dst = StringIO()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+import pytest
+
+from crawlee._utils.free_threading import (
+    _get_executor,
+    apply_free_threading_configuration,
+    configure_free_threading,
+    is_free_threading_enabled,
+    is_gil_enabled,
+    run_cpu_bound,
+)
+from crawlee.configuration import Configuration
+from crawlee.crawlers import BasicCrawler
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+request_label = ContextVar[str]('request_label', default='')
+
+
+@pytest.fixture(autouse=True)
+def _reset_free_threading() -> Iterator[None]:
+    yield
+    configure_free_threading()
+
+
+def get_thread_name_and_label() -> tuple[str, str]:
+    # Keep the thread busy for a while, so the concurrent calls cannot all run in the same thread.
+    time.sleep(0.05)
+    return threading.current_thread().name, request_label.get()
+
+
+async def test_run_cpu_bound_in_sized_thread_pool() -> None:
+    configure_free_threading(enabled=True, max_workers=2)
+    assert is_free_threading_enabled()
+
+    request_label.set('detail')
+    results = await asyncio.gather(*(run_cpu_bound(get_thread_name_and_label) for _ in range(6)))
+
+    thread_names = {thread_name for thread_name, _ in results}
+    assert all(thread_name.startswith('crawlee_cpu') for thread_name in thread_names)
+    assert len(thread_names) == 2
+    # The context variables of the caller are available in the pool, like with `asyncio.to_thread`.
+    assert {label for _, label in results} == {'detail'}
+
+
+async def test_run_cpu_bound_without_free_threading() -> None:
+    configure_free_threading(enabled=False)
+    assert not is_free_threading_enabled()
+
+    request_label.set('detail')
+    thread_name, label = await run_cpu_bound(get_thread_name_and_label)
+
+    assert not thread_name.startswith('crawlee_cpu')
+    assert thread_name != threading.current_thread().name
+    assert label == 'detail'
+
+
+def test_configure_free_threading() -> None:
+    configure_free_threading(enabled=None)
+    assert is_free_threading_enabled() is not is_gil_enabled()
+
+    with pytest.raises(ValueError, match='max_workers'):
+        configure_free_threading(enabled=True, max_workers=0)
+
+
+def test_configuration_applies_only_explicit_settings() -> None:
+    configure_free_threading(enabled=True, max_workers=2)
+    executor = _get_executor()
+
+    apply_free_threading_configuration(Configuration())
+    assert is_free_threading_enabled()
+    assert _get_executor() is executor
+
+    apply_free_threading_configuration(Configuration(free_threading=False))
+    assert not is_free_threading_enabled()
+    assert _get_executor() is executor
+
+    apply_free_threading_configuration(Configuration(cpu_thread_pool_size=3))
+    assert _get_executor() is not executor
+
+
+def test_crawler_with_default_configuration_keeps_free_threading_settings() -> None:
+    configure_free_threading(enabled=True, max_workers=2)
+    executor = _get_executor()
+
+    BasicCrawler()
+    BasicCrawler(configuration=Configuration())
+
+    assert is_free_threading_enabled()
+    assert _get_executor() is executor
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from crawlee._utils.histogram import LatencyHistogram
+
+
+def test_percentiles_are_within_relative_error() -> None:
+    histogram = LatencyHistogram()
+    for millis in range(1, 1001):
+        histogram.record(millis / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.max == timedelta(seconds=1)
+    assert histogram.mean == timedelta(microseconds=500_500)
+
+    for percentile in (1, 50, 90, 99, 100):
+        expected = timedelta(milliseconds=10 * percentile)
+        assert histogram.get_percentile(percentile) == pytest.approx(expected, rel=1 / 64)
+
+
+def test_small_values_are_exact() -> None:
+    histogram = LatencyHistogram()
+    for micros in (1, 2, 3, 127):
+        histogram.record(micros / 1_000_000)
+
+    assert histogram.get_percentile(50) == timedelta(microseconds=2)
+    assert histogram.get_percentile(100) == timedelta(microseconds=127)
+
+
+def test_out_of_range_values_are_clamped() -> None:
+    histogram = LatencyHistogram(max_value=timedelta(seconds=1))
+    histogram.record(-1)
+    histogram.record(10)
+
+    assert histogram.get_percentile(0) == timedelta()
+    assert histogram.max == timedelta(seconds=1)
+
+
+def test_empty_histogram() -> None:
+    histogram = LatencyHistogram()
+
+    assert histogram.get_percentile(99) == timedelta()
+    assert histogram.mean == timedelta()
+
+    with pytest.raises(ValueError, match='percentile'):
+        histogram.get_percentile(101)
+
+
+def test_merge_and_reset() -> None:
+    first = LatencyHistogram()
+    second = LatencyHistogram()
+    first.record(0.001)
+    second.record(0.003)
+
+    first.merge(second)
+    assert first.count == 2
+    assert first.max == timedelta(milliseconds=3)
+
+    first.reset()
+    assert first.count == 0
+    assert first.total == timedelta()
+
+    with pytest.raises(ValueError, match='max_value'):
+        first.merge(LatencyHistogram(max_value=timedelta(seconds=1)))
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from crawlee._utils.json_codec import JsonCodecName, StdlibJsonCodec, get_json_codec
+
+
+def test_stdlib_codec_matches_json_dumps() -> None:
+    codec = StdlibJsonCodec()
+    obj = {'key': 'välue', 'list': [1, 2.5, None], 'date': datetime(2022, 1, 1, tzinfo=timezone.utc)}
+
+    assert codec.encode(obj) == json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+    assert codec.encode(obj, indent=True) == json.dumps(obj, ensure_ascii=False, indent=2, default=str).encode('utf-8')
+    assert codec.encode_many([obj, 'string']) == [codec.encode(obj), b'"string"']
+
+
+@pytest.mark.parametrize('name', ['json', 'orjson', 'msgspec'])
+def test_codec_roundtrip(name: JsonCodecName) -> None:
+    try:
+        codec = get_json_codec(name)
+    except ImportError:
+        pytest.skip(f'The {name!r} package is not installed.')
+
+    obj = {'key': 'välue', 'nested': {'list': [1, 2.5, True, None]}}
+
+    assert codec.name == name
+    assert codec.decode(codec.encode(obj)) == obj
+    assert codec.decode(codec.encode(obj, indent=True)) == obj
+    assert json.loads(codec.encode(obj, indent=True)) == obj
+    assert codec.decode(codec.encode(obj).decode('utf-8')) == obj
+
+    with pytest.raises(ValueError, match=r'.+'):
+        codec.decode(b'{"key": ')
+
+
+def test_get_json_codec() -> None:
+    assert get_json_codec() is get_json_codec('json')
+    assert get_json_codec('auto').name in {'json', 'orjson', 'msgspec'}
+
+    with pytest.raises(ValueError, match='Unknown JSON codec'):
+        get_json_codec('yaml')  # ty: ignore[invalid-argument-type]
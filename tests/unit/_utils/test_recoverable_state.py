@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import logging
+
+from pydantic import BaseModel, Field
+
+from crawlee._utils.recoverable_state import RecoverableState
+from crawlee.storage_clients import MemoryStorageClient
+from crawlee.storages import KeyValueStore
+
+PERSIST_STATE_KEY = 'TEST_STATE'
+
+
+class _State(BaseModel):
+    counter: int = Field(default=0, alias='theCounter')
+    items: dict[str, int] = {}
+    seen: set[str] = set()
+
+
+def _create_state(kvs: KeyValueStore, **kwargs: int) -> RecoverableState[_State]:
+    async def kvs_factory() -> KeyValueStore:
+        return kvs
+
+    return RecoverableState(
+        default_state=_State(),
+        persist_state_key=PERSIST_STATE_KEY,
+        persistence_enabled='explicit_only',
+        persist_state_kvs_factory=kvs_factory,
+        logger=logging.getLogger(__name__),
+        incremental_persistence=True,
+        **kwargs,
+    )
+
+
+async def test_incremental_persistence() -> None:
+    kvs = await KeyValueStore.open(storage_client=MemoryStorageClient())
+    recoverable_state = _create_state(kvs)
+    state = await recoverable_state.initialize()
+
+    state.items['a'] = 1
+    state.seen.add('a')
+    await recoverable_state.persist_state()
+
+    state.counter = 5
+    state.items['b'] = 2
+    del state.items['a']
+    state.seen.update({'b', 'c'})
+    state.seen.discard('a')
+    recoverable_state.mark_dirty('counter')
+    recoverable_state.mark_dirty('items', 'a', 'b')
+    recoverable_state.mark_dirty('seen', 'a', 'b', 'c')
+    await recoverable_state.persist_state()
+
+    # Only the changes are written, the snapshot still holds the state from the first persist.
+    snapshot = await kvs.get_value(PERSIST_STATE_KEY)
+    assert snapshot['items'] == {'a': 1}
+    assert recoverable_state._journal_length == 1
+
+    # Changes that are not reported are not persisted until the next snapshot.
+    state.items['unreported'] = 3
+
+    restored = await _create_state(kvs).initialize()
+    assert restored.counter == 5
+    assert restored.items == {'b': 2}
+    assert restored.seen == {'b', 'c'}
+
+
+async def test_journal_compaction() -> None:
+    kvs = await KeyValueStore.open(storage_client=MemoryStorageClient())
+    recoverable_state = _create_state(kvs, max_journal_entries=2)
+    state = await recoverable_state.initialize()
+    await recoverable_state.persist_state()
+
+    for i in range(3):
+        state.items[str(i)] = i
+        recoverable_state.mark_dirty('items', str(i))
+        await recoverable_state.persist_state()
+
+    # The third persist wrote a new snapshot and dropped the journal of the previous one.
+    assert recoverable_state._journal_length == 0
+    assert [record.key async for record in kvs.iterate_keys()] == [PERSIST_STATE_KEY]
+
+    restored = await _create_state(kvs).initialize()
+    assert restored.items == {'0': 0, '1': 1, '2': 2}
+
+    state.items['3'] = 3
+    recoverable_state.mark_dirty('items', '3')
+    await recoverable_state.persist_state()
+    await recoverable_state.reset()
+    assert await kvs.get_value(PERSIST_STATE_KEY) is None
+    assert [record.key async for record in kvs.iterate_keys()] == [PERSIST_STATE_KEY]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from crawlee import Request
+from crawlee._request import RequestState
+from crawlee._utils.json_codec import JsonCodecName, get_json_codec
+from crawlee._utils.request_codec import decode_request, decode_request_summary, encode_request
+
+
+@pytest.fixture
+def request_() -> Request:
+    request = Request.from_url(
+        'https://example.com/path?q=1',
+        method='POST',
+        headers={'Accept': 'text/html'},
+        payload='{"key": "välue"}',
+        label='DETAIL',
+        user_data={'custom': [1, 2]},
+        max_retries=3,
+        enqueue_strategy='same-domain',
+    )
+    request.state = RequestState.DONE
+    request.crawl_depth = 2
+    request.retry_count = 1
+    request.loaded_url = 'https://example.com/redirected'
+    request.handled_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return request
+
+
+@pytest.mark.parametrize('codec_name', ['json', 'orjson', 'msgspec'])
+def test_roundtrip(request_: Request, codec_name: JsonCodecName) -> None:
+    try:
+        codec = get_json_codec(codec_name)
+    except ImportError:
+        pytest.skip(f'The {codec_name!r} package is not installed.')
+
+    decoded = decode_request(encode_request(request_, codec), codec)
+
+    assert decoded.model_dump() == request_.model_dump()
+    assert decoded.label == 'DETAIL'
+    assert decoded.state == RequestState.DONE
+    assert decoded.max_retries == 3
+    assert decoded.headers['accept'] == 'text/html'
+    assert decoded.payload == '{"key": "välue"}'.encode()
+
+
+def test_record_is_compact(request_: Request) -> None:
+    record = encode_request(request_)
+
+    assert record.startswith(b'[1,')
+    assert len(record) < len(request_.model_dump_json())
+
+
+def test_decodes_model_json(request_: Request) -> None:
+    decoded = decode_request(request_.model_dump_json())
+    assert decoded.model_dump() == request_.model_dump()
+
+
+def test_decode_summary(request_: Request) -> None:
+    pending = Request.from_url('https://example.com/pending')
+
+    assert decode_request_summary(encode_request(request_)) == ('https://example.com/path?q=1', True)
+    assert decode_request_summary(encode_request(pending)) == ('https://example.com/pending', False)
+    assert decode_request_summary(pending.model_dump_json()) == ('https://example.com/pending', False)
+
+
+def test_invalid_records(request_: Request) -> None:
+    record = encode_request(request_)
+
+    with pytest.raises(ValueError, match='version'):
+        decode_request(b'[2' + record[2:])
+
+    with pytest.raises(ValueError, match='number of fields'):
+        decode_request(b'[1, "https://example.com"]')
+
+    with pytest.raises(ValueError, match=r'.+'):
+        decode_request(record[:-5])
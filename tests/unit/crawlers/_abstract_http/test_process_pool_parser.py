@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from crawlee.crawlers import (
+    AbstractHttpCrawler,
+    ParsedHttpCrawlingContext,
+    ProcessPoolParser,
+    ProcessPoolParseResult,
+)
+from crawlee.crawlers._parsel._parsel_parser import ParselParser
+
+if TYPE_CHECKING:
+    from parsel import Selector
+    from yarl import URL
+
+    from crawlee.http_clients._base import HttpClient
+
+# The worker processes are spawned, so the extractors have to be importable module-level functions.
+
+
+def get_title(selector: Selector) -> str | None:
+    return selector.css('title::text').get()
+
+
+def get_title_or_crash(selector: Selector) -> str | None:
+    title = get_title(selector)
+    if title == 'crash':
+        # Die like a worker killed for running out of memory or crashed in a native extension.
+        os._exit(1)
+    return title
+
+
+async def test_parse_text() -> None:
+    parser = ProcessPoolParser(
+        ParselParser(),
+        extractors={'title': get_title},
+        match_selectors=['div.item', 'table'],
+        max_workers=1,
+    )
+
+    async with parser:
+        result = await parser.parse_text(
+            '<html><head><title>Hello</title></head>'
+            '<body><div class="item"><a href="/a">A</a><a href="https://b.com">B</a></div></body></html>'
+        )
+
+    assert result.extracted == {'title': 'Hello'}
+    assert list(parser.find_links(result, 'a', 'href')) == ['/a', 'https://b.com']
+    assert list(parser.find_links(result, 'base[href]', 'href')) == []
+    assert parser.is_matching_selector(result, 'div.item')
+    assert not parser.is_matching_selector(result, 'table')
+    assert parser.is_blocked(result).reason == ''
+
+    with pytest.raises(ValueError, match='match_selectors'):
+        parser.is_matching_selector(result, 'span')
+
+    with pytest.raises(ValueError, match='link_selectors'):
+        parser.find_links(result, 'img', 'src')
+
+    with pytest.raises(NotImplementedError):
+        await parser.select(result, 'a')
+
+    assert not parser.active
+
+
+async def test_is_blocked() -> None:
+    async with ProcessPoolParser(ParselParser(), max_workers=1) as parser:
+        result = await parser.parse_text('<html><body><iframe src="Test_Incapsula_Resource"></iframe></body></html>')
+
+    assert 'Incapsula' in parser.is_blocked(result).reason
+
+
+async def test_recovers_from_dead_worker() -> None:
+    async with ProcessPoolParser(ParselParser(), extractors={'title': get_title_or_crash}, max_workers=1) as parser:
+        result = await parser.parse_text('<html><head><title>before</title></head></html>')
+        assert result.extracted == {'title': 'before'}
+
+        with pytest.raises(BrokenProcessPool):
+            await parser.parse_text('<html><head><title>crash</title></head></html>')
+
+        # The broken pool is replaced, so the following documents are parsed again.
+        for _ in range(3):
+            result = await parser.parse_text('<html><head><title>after</title></head></html>')
+            assert result.extracted == {'title': 'after'}
+
+
+async def test_crawler_with_process_pool_parser(server_url: URL, http_client: HttpClient) -> None:
+    parser = ProcessPoolParser(ParselParser(), extractors={'title': get_title}, max_workers=1)
+    crawler = AbstractHttpCrawler.create_parsed_http_crawler_class(static_parser=parser)(http_client=http_client)
+    visit = mock.Mock()
+
+    @crawler.router.default_handler
+    async def request_handler(context: ParsedHttpCrawlingContext[ProcessPoolParseResult]) -> None:
+        visit(context.request.url, context.parsed_content.extracted['title'])
+        await context.enqueue_links()
+
+    await crawler.run([str(server_url / 'start_enqueue')])
+
+    visited = {call.args[0] for call in visit.mock_calls}
+    assert visited == {
+        str(server_url / 'start_enqueue'),
+        str(server_url / 'sub_index'),
+        str(server_url / 'page_1'),
+        str(server_url / 'page_2'),
+        str(server_url / 'page_3'),
+        str(server_url / 'page_4'),
+        str(server_url / 'base_page'),
+        str(server_url / 'base_subpath/page_5'),
+    }
+    assert mock.call(str(server_url / 'start_enqueue'), 'Hello') in visit.mock_calls
+
+    # The worker processes are stopped together with the crawler.
+    assert not parser.active
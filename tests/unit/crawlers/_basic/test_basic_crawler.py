@@ -20,6 +20,7 @@ from unittest.mock import ANY, AsyncMock, Mock, call, patch
 import pytest
 
 from crawlee import ConcurrencySettings, Glob, service_locator
+from crawlee._autoscaling import ConcurrencyBudget
 from crawlee._log_config import CrawleeLogFormatter
 from crawlee._request import Request, RequestState
 from crawlee._types import BasicCrawlingContext, EnqueueLinksKwargs, HttpMethod
@@ -28,6 +29,7 @@ from crawlee.configuration import Configuration
 from crawlee.crawlers import BasicCrawler
 from crawlee.errors import RequestCollisionError, SessionError, UserDefinedErrorHandlerError
 from crawlee.events import Event, EventCrawlerStatusData, LocalEventManager
+from crawlee.proxy_configuration import ProxyConfiguration, ProxyHealthTracker
 from crawlee.request_loaders import RequestList, RequestManagerTandem, ThrottlingRequestManager
 from crawlee.sessions import Session, SessionPool
 from crawlee.statistics import FinalStatistics, StatisticsState
@@ -852,6 +854,32 @@ async def test_context_push_and_get_data() -> None:
     assert stats.requests_finished == 1
 
 
+async def test_context_push_data_is_committed_in_one_batch_per_dataset() -> None:
+    crawler = BasicCrawler()
+    default_dataset = await Dataset.open()
+    other_dataset = await Dataset.open(name='other-dataset')
+
+    @crawler.router.default_handler
+    async def handler(context: BasicCrawlingContext) -> None:
+        await context.push_data({'id': 0})
+        await context.push_data([{'id': 1}, {'id': 2}], dataset_name='other-dataset')
+        await context.push_data([{'id': 3}, {'id': 4}])
+        await context.push_data({'id': 5}, dataset_name='other-dataset')
+
+    with (
+        patch.object(default_dataset, 'push_data', wraps=default_dataset.push_data) as default_push_data,
+        patch.object(other_dataset, 'push_data', wraps=other_dataset.push_data) as other_push_data,
+    ):
+        await crawler.run(['http://test.io/1'])
+
+    default_push_data.assert_called_once_with([{'id': 0}, {'id': 3}, {'id': 4}])
+    other_push_data.assert_called_once_with([{'id': 1}, {'id': 2}, {'id': 5}])
+    assert (await default_dataset.get_data()).items == [{'id': 0}, {'id': 3}, {'id': 4}]
+    assert (await other_dataset.get_data()).items == [{'id': 1}, {'id': 2}, {'id': 5}]
+
+    await other_dataset.drop()
+
+
 async def test_context_push_and_get_data_handler_error() -> None:
     crawler = BasicCrawler()
 
@@ -1366,6 +1394,85 @@ async def test_logs_final_statistics(
         assert record.crawler_runtime == 300.0
 
 
+async def test_batched_request_fetching() -> None:
+    """Test that requests fetched in batches are all processed and unprocessed ones are reclaimed after a stop."""
+    start_urls = [f'http://test.io/{i}' for i in range(10)]
+    processed_urls = []
+
+    crawler = BasicCrawler(
+        concurrency_settings=ConcurrencySettings(desired_concurrency=1, max_concurrency=1, task_batch_size=4),
+    )
+
+    @crawler.router.default_handler
+    async def handler(context: BasicCrawlingContext) -> None:
+        processed_urls.append(context.request.url)
+        if context.request.url == start_urls[5]:
+            crawler.stop()
+
+    await crawler.run(start_urls)
+
+    assert processed_urls == start_urls[:6]
+
+    # The rest of the second batch went back to the queue, so nothing is lost.
+    request_manager = await crawler.get_request_manager()
+    assert await request_manager.get_handled_count() == 6
+    remaining = await request_manager.fetch_next_requests(10)
+    assert sorted(request.url for request in remaining) == sorted(start_urls[6:])
+
+
+async def test_no_batched_request_fetching_with_task_rate_limit() -> None:
+    """Test that a rate-limited crawler does not keep fetched requests waiting for their turn to start."""
+    crawler = BasicCrawler(
+        concurrency_settings=ConcurrencySettings(max_tasks_per_minute=6000, task_batch_size=4),
+    )
+
+    @crawler.router.default_handler
+    async def handler(context: BasicCrawlingContext) -> None:
+        pass
+
+    fetch_next_requests = RequestQueue.fetch_next_requests
+    with patch.object(
+        RequestQueue, 'fetch_next_requests', autospec=True, side_effect=fetch_next_requests
+    ) as fetch_batch:
+        stats = await crawler.run([f'http://test.io/{i}' for i in range(5)])
+
+    assert stats.requests_finished == 5
+    fetch_batch.assert_not_called()
+
+
+async def test_concurrency_budget_limits_domains() -> None:
+    """Test that a slow domain at the front of the queue does not keep requests to other domains waiting."""
+    slow_urls = [f'http://slow.io/{i}' for i in range(6)]
+    fast_urls = [f'http://fast.io/{i}' for i in range(6)]
+    in_progress = Counter[str]()
+    max_in_progress = Counter[str]()
+    finished_urls = []
+
+    crawler = BasicCrawler(
+        concurrency_settings=ConcurrencySettings(
+            desired_concurrency=4,
+            max_concurrency=4,
+            concurrency_budget=ConcurrencyBudget(max_concurrency_by_key={'slow.io': 1}),
+        ),
+    )
+
+    @crawler.router.default_handler
+    async def handler(context: BasicCrawlingContext) -> None:
+        host = context.request.url.split('/')[2]
+        in_progress[host] += 1
+        max_in_progress[host] = max(max_in_progress[host], in_progress[host])
+        await asyncio.sleep(0.2 if host == 'slow.io' else 0.01)
+        in_progress[host] -= 1
+        finished_urls.append(context.request.url)
+
+    await crawler.run(slow_urls + fast_urls)
+
+    assert sorted(finished_urls) == sorted(slow_urls + fast_urls)
+    assert max_in_progress['slow.io'] == 1
+    # The fast domain is done while the slow one still has most of its requests left.
+    assert set(finished_urls[:6]) >= set(fast_urls[:4])
+
+
 async def test_crawler_manual_stop() -> None:
     """Test that no new requests are handled after crawler.stop() is called."""
     start_urls = [
@@ -1868,6 +1975,30 @@ async def test_handles_session_error_in_failed_request_handler() -> None:
     assert set(requests) == handler_requests
 
 
+async def test_reports_proxy_outcomes_to_health_tracker() -> None:
+    health_tracker = ProxyHealthTracker()
+    crawler = BasicCrawler(
+        proxy_configuration=ProxyConfiguration(proxy_urls=['http://proxy:1111'], health_tracker=health_tracker),
+        max_session_rotations=0,
+    )
+
+    @crawler.router.default_handler
+    async def handler(context: BasicCrawlingContext) -> None:
+        if 'blocked' in context.request.url:
+            raise SessionError('blocked')
+
+    with patch.object(health_tracker, 'record_outcome', wraps=health_tracker.record_outcome) as record_outcome:
+        await crawler.run(['https://a.placeholder.com', 'https://blocked.placeholder.com'])
+
+    assert sorted(record_outcome.call_args_list) == [
+        call('http://proxy:1111', 'a.placeholder.com', 'success'),
+        call('http://proxy:1111', 'blocked.placeholder.com', 'blocked'),
+    ]
+    assert health_tracker.get_score('http://proxy:1111', 'blocked.placeholder.com') > health_tracker.get_score(
+        'http://proxy:1111', 'a.placeholder.com'
+    )
+
+
 async def test_lock_with_get_robots_txt_file_for_url(server_url: URL) -> None:
     crawler = BasicCrawler(respect_robots_txt_file=True)
 
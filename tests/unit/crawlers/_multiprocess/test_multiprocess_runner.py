@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import signal
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from crawlee.configuration import Configuration
+from crawlee.crawlers import BasicCrawler, BasicCrawlingContext, MultiprocessCrawlerRunner
+from crawlee.storage_clients import MemoryStorageClient
+from crawlee.storages import Dataset
+
+if TYPE_CHECKING:
+    from multiprocessing.synchronize import Event
+
+# The worker processes are spawned, so the crawler factories have to be importable module-level functions.
+
+
+def create_crawler() -> BasicCrawler:
+    crawler = BasicCrawler(configure_logging=False)
+
+    @crawler.router.default_handler
+    async def handler(context: BasicCrawlingContext) -> None:
+        index = int(context.request.url.rsplit('/', 1)[1])
+        await context.push_data({'url': context.request.url, 'pid': os.getpid()})
+
+        # Every worker may enqueue requests that any other worker then processes.
+        if index < 10:
+            await context.add_requests([f'https://example.com/{index + 10}'])
+
+    return crawler
+
+
+def create_failing_crawler() -> BasicCrawler:
+    raise RuntimeError('Could not create the crawler')
+
+
+def ignore_termination(ready: Event) -> None:
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    ready.set()
+    time.sleep(60)
+
+
+async def test_workers_share_request_queue_and_dataset() -> None:
+    runner = MultiprocessCrawlerRunner(
+        create_crawler,
+        worker_count=2,
+        storage_client=MemoryStorageClient(),
+        configuration=Configuration(purge_on_start=True),
+    )
+
+    async with runner:
+        statistics = await runner.run([f'https://example.com/{index}' for index in range(10)])
+
+        dataset = await Dataset.open(storage_client=runner.storage_client)
+        items = (await dataset.get_data()).items
+
+    urls = [item['url'] for item in items]
+    assert sorted(urls) == sorted(f'https://example.com/{index}' for index in range(20))
+
+    assert statistics.requests_finished == 20
+    assert statistics.requests_failed == 0
+    assert statistics.requests_total == 20
+    assert statistics.retry_histogram == [20]
+    assert statistics.crawler_runtime > timedelta(0)
+
+
+async def test_failing_worker_stops_run() -> None:
+    runner = MultiprocessCrawlerRunner(
+        create_failing_crawler,
+        worker_count=2,
+        storage_client=MemoryStorageClient(),
+        shutdown_timeout=timedelta(seconds=10),
+    )
+
+    with pytest.raises(RuntimeError, match='Could not create the crawler'):
+        await runner.run(['https://example.com/0'])
+
+    assert not runner.active
+
+
+async def test_process_ignoring_termination_is_killed() -> None:
+    runner = MultiprocessCrawlerRunner(create_crawler, shutdown_timeout=timedelta(seconds=0.5))
+    context = multiprocessing.get_context('spawn')
+    ready = context.Event()
+    process = context.Process(target=ignore_termination, args=(ready,))
+    process.start()
+    assert await asyncio.to_thread(ready.wait, 30)
+
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.05)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    started_at = time.monotonic()
+    await runner._terminate_process(process)
+    ticker.cancel()
+
+    assert not process.is_alive()
+    assert time.monotonic() - started_at < 10
+    # The event loop kept running while the process was being waited for.
+    assert ticks >= 5
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match='worker_count'):
+        MultiprocessCrawlerRunner(create_crawler, worker_count=0)
+
+    with pytest.raises(ValueError, match='storage_client_factory'):
+        MultiprocessCrawlerRunner(
+            create_crawler,
+            storage_client=MemoryStorageClient(),
+            storage_client_factory=MemoryStorageClient,
+        )
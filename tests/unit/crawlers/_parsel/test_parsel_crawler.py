@@ -7,6 +7,7 @@ from unittest import mock
 import pytest
 
 from crawlee import ConcurrencySettings, Glob, HttpHeaders, Request, RequestTransformAction, SkippedReason
+from crawlee.configuration import Configuration
 from crawlee.crawlers import ParselCrawler
 from crawlee.storages import RequestQueue
 
@@ -353,6 +354,38 @@ async def test_on_skipped_request(server_url: URL, http_client: HttpClient) -> N
     skip.assert_has_calls(expected_skip_calls, any_order=True)
 
 
+async def test_free_threading_mode(server_url: URL, http_client: HttpClient) -> None:
+    configuration = Configuration(free_threading=True, cpu_thread_pool_size=2)
+    crawler = ParselCrawler(http_client=http_client, configuration=configuration, respect_robots_txt_file=True)
+    visit = mock.Mock()
+    skip = mock.Mock()
+
+    @crawler.router.default_handler
+    async def request_handler(context: ParselCrawlingContext) -> None:
+        visit(context.request.url)
+        await context.enqueue_links()
+
+    @crawler.on_skipped_request
+    async def skipped_hook(url: str, _reason: SkippedReason) -> None:
+        skip(url)
+
+    await crawler.run([str(server_url / 'start_enqueue')])
+
+    # Parsing and link filtering run in the CPU thread pool, with the same results.
+    assert {call.args[0] for call in visit.mock_calls} == {
+        str(server_url / 'start_enqueue'),
+        str(server_url / 'sub_index'),
+        str(server_url / 'base_page'),
+        str(server_url / 'base_subpath/page_5'),
+    }
+    assert {call.args[0] for call in skip.mock_calls} == {
+        str(server_url / 'page_1'),
+        str(server_url / 'page_2'),
+        str(server_url / 'page_3'),
+        str(server_url / 'page_4'),
+    }
+
+
 async def test_extract_links(server_url: URL, http_client: HttpClient) -> None:
     crawler = ParselCrawler(http_client=http_client)
     extracted_links: list[str] = []
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import psutil
+import pytest
+
+from crawlee.events import ProcfsSystemMetricsSampler, PsutilSystemMetricsSampler
+from crawlee.events._system_metrics_sampler import create_system_metrics_sampler
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+requires_procfs = pytest.mark.skipif(
+    not ProcfsSystemMetricsSampler.is_supported(),
+    reason='The metrics cannot be read from /proc on this system.',
+)
+
+
+def write_cgroup(
+    path: Path, *, usage_usec: int, cpu_max: str = '200000 100000', memory_max: str = '1073741824'
+) -> None:
+    path.mkdir(exist_ok=True)
+    (path / 'cpu.stat').write_text(f'usage_usec {usage_usec}\nuser_usec {usage_usec}\nsystem_usec 0\n')
+    (path / 'cpu.max').write_text(f'{cpu_max}\n')
+    (path / 'memory.current').write_text('314572800\n')
+    (path / 'memory.max').write_text(f'{memory_max}\n')
+    (path / 'memory.stat').write_text('anon 104857600\nfile 209715200\ninactive_file 104857600\n')
+
+
+def test_create_system_metrics_sampler() -> None:
+    sampler = create_system_metrics_sampler()
+    expected_type = (
+        ProcfsSystemMetricsSampler if ProcfsSystemMetricsSampler.is_supported() else PsutilSystemMetricsSampler
+    )
+    assert isinstance(sampler, expected_type)
+
+
+@requires_procfs
+def test_procfs_sampler_matches_psutil() -> None:
+    sampler = ProcfsSystemMetricsSampler()
+    # The system-wide counters are compared, even when running in a cgroup.
+    sampler._cgroup_path = None
+    sampler._last_cpu_reading = sampler._read_cpu_times()
+
+    memory_info = sampler.get_memory_info()
+    psutil_memory = psutil.virtual_memory()
+
+    assert memory_info.total_size.bytes == psutil_memory.total
+    # The PSS of the process is never above its RSS, and at least the interpreter itself has to be resident.
+    assert 0 < memory_info.current_size.bytes <= psutil.Process().memory_info().rss
+    assert memory_info.system_wide_used_size.bytes == pytest.approx(
+        psutil_memory.total - psutil_memory.available, rel=0.1
+    )
+
+    # The CPU usage is computed from the counters since the previous reading, so it does not block.
+    started_at = time.perf_counter()
+    cpu_info = sampler.get_cpu_info()
+    assert time.perf_counter() - started_at < 0.05
+    assert 0 <= cpu_info.used_ratio <= 1
+
+
+@requires_procfs
+def test_procfs_sampler_reads_cgroup(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr('os.sched_getaffinity', lambda _: set(range(8)), raising=False)
+    clock = iter([100.0, 101.0, 101.0])
+    monkeypatch.setattr('crawlee.events._system_metrics_sampler.monotonic', lambda: next(clock))
+
+    write_cgroup(tmp_path, usage_usec=10_000_000)
+    sampler = ProcfsSystemMetricsSampler(cgroup_path=tmp_path)
+    assert sampler.cgroup_path == tmp_path
+
+    # Half a second of CPU time in a second of wall time, out of the two CPUs allowed by the quota.
+    write_cgroup(tmp_path, usage_usec=10_500_000)
+    assert sampler.get_cpu_info().used_ratio == pytest.approx(0.25)
+
+    memory_info = sampler.get_memory_info()
+    assert memory_info.total_size.bytes == 1024**3
+    # The inactive page cache is not counted towards the working set.
+    assert memory_info.system_wide_used_size.bytes == 200 * 1024**2
+
+
+def test_procfs_sampler_uses_system_memory_without_cgroup_limit(tmp_path: Path) -> None:
+    write_cgroup(tmp_path, usage_usec=0, cpu_max='max 100000', memory_max='max')
+    sampler = ProcfsSystemMetricsSampler(cgroup_path=tmp_path)
+
+    assert sampler.get_memory_info().total_size.bytes == psutil.virtual_memory().total
+
+
+def test_procfs_sampler_falls_back_to_psutil(tmp_path: Path) -> None:
+    write_cgroup(tmp_path, usage_usec=0)
+    sampler = ProcfsSystemMetricsSampler(cgroup_path=tmp_path)
+
+    (tmp_path / 'cpu.stat').unlink()
+    (tmp_path / 'memory.max').unlink()
+
+    assert 0 <= sampler.get_cpu_info().used_ratio <= 1
+    assert sampler.get_memory_info().total_size.bytes == psutil.virtual_memory().total
+
+
+@requires_procfs
+def test_procfs_sampler_caches_child_processes() -> None:
+    sampler = ProcfsSystemMetricsSampler(children_refresh_interval=timedelta(hours=1))
+    baseline = sampler.get_memory_info().current_size
+
+    child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+    try:
+        # The child started after the set of children was cached, so it is not counted yet.
+        assert child.pid not in sampler._get_child_pids()
+
+        sampler._children_refreshed_at = None
+        assert child.pid in sampler._get_child_pids()
+        assert sampler.get_memory_info().current_size > baseline
+    finally:
+        child.kill()
+        child.wait()
+
+    # A child that exited just drops out of the sum.
+    sampler.get_memory_info()
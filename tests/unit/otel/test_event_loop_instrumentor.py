@@ -0,0 +1,50 @@
+import asyncio
+import time
+from datetime import timedelta
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from crawlee._autoscaling import EventLoopMonitor
+from crawlee.otel import EventLoopInstrumentor
+
+
+def block_event_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def blocking_handler() -> None:
+    await asyncio.sleep(0)
+    block_event_loop(0.06)
+
+
+async def test_event_loop_instrumentor_exports_monitor_statistics() -> None:
+    reader = InMemoryMetricReader()
+    instrumentor = EventLoopInstrumentor()
+    instrumentor.instrument(meter_provider=MeterProvider(metric_readers=[reader]))
+
+    try:
+        async with EventLoopMonitor(slow_callback_threshold=timedelta(milliseconds=50)):
+            await asyncio.create_task(blocking_handler())
+            await asyncio.sleep(0.15)
+            metrics_data = reader.get_metrics_data()
+    finally:
+        instrumentor.uninstrument()
+
+    assert metrics_data is not None
+    metrics = {
+        metric.name: metric
+        for resource_metrics in metrics_data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+    lag_points = metrics['crawlee.event_loop.lag'].data.data_points
+    assert {point.attributes['percentile'] for point in lag_points} == {'p50', 'p90', 'p99', 'max'}
+
+    (count_point,) = metrics['crawlee.event_loop.slow_callback.count'].data.data_points
+    assert count_point.value == 1
+    assert str(count_point.attributes['code.location']).startswith('blocking_handler (')
+
+    (duration_point,) = metrics['crawlee.event_loop.slow_callback.duration'].data.data_points
+    assert duration_point.value >= 0.06
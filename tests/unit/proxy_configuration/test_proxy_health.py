@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from datetime import timedelta
+
+import pytest
+from yarl import URL
+
+from crawlee import Request
+from crawlee.proxy_configuration import ProxyConfiguration, ProxyHealthTracker
+
+_PROXY_URLS = [URL('http://proxy:1111'), URL('http://proxy:2222'), URL('http://proxy:3333')]
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Replace `time.monotonic` with a clock that the test moves forward by changing the only item of the list."""
+    now = [1000.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_prefers_faster_proxy() -> None:
+    tracker = ProxyHealthTracker()
+    for url, latency in zip(_PROXY_URLS, [0.1, 1.0, 2.0], strict=True):
+        tracker.record_latency(str(url), 'example.com', timedelta(seconds=latency))
+
+    picks = Counter(tracker.pick_url(_PROXY_URLS, 'example.com') for _ in range(1000))
+
+    # With two random choices, the fastest proxy wins every comparison it takes part in.
+    assert picks[_PROXY_URLS[0]] > picks[_PROXY_URLS[1]] > picks[_PROXY_URLS[2]]
+    assert picks[_PROXY_URLS[0]] > 500
+
+
+def test_failures_increase_score() -> None:
+    tracker = ProxyHealthTracker()
+    tracker.record_latency('http://proxy:1111', None, timedelta(seconds=1))
+    tracker.record_latency('http://proxy:2222', None, timedelta(seconds=1))
+
+    tracker.record_outcome('http://proxy:1111', None, 'success')
+    tracker.record_outcome('http://proxy:2222', None, 'blocked')
+
+    assert tracker.get_score('http://proxy:2222') > tracker.get_score('http://proxy:1111')
+
+
+def test_ejects_failing_proxy(clock: list[float]) -> None:
+    tracker = ProxyHealthTracker(ejection_threshold=2, ejection_duration=timedelta(seconds=10))
+    failing_url = str(_PROXY_URLS[0])
+
+    tracker.record_outcome(failing_url, None, 'error')
+    assert not tracker.is_ejected(failing_url)
+
+    tracker.record_outcome(failing_url, None, 'error')
+    assert tracker.is_ejected(failing_url)
+    assert all(tracker.pick_url(_PROXY_URLS, None) != _PROXY_URLS[0] for _ in range(100))
+
+    clock[0] += 11
+    assert not tracker.is_ejected(failing_url)
+
+    # Repeated ejections without a success in between last twice as long.
+    tracker.record_outcome(failing_url, None, 'error')
+    tracker.record_outcome(failing_url, None, 'error')
+    clock[0] += 11
+    assert tracker.is_ejected(failing_url)
+    clock[0] += 10
+    assert not tracker.is_ejected(failing_url)
+
+    # A success resets the ejection duration.
+    tracker.record_outcome(failing_url, None, 'success')
+    tracker.record_outcome(failing_url, None, 'error')
+    tracker.record_outcome(failing_url, None, 'error')
+    clock[0] += 11
+    assert not tracker.is_ejected(failing_url)
+
+
+def test_ejection_for_domain_keeps_proxy_for_other_domains(clock: list[float]) -> None:  # noqa: ARG001
+    tracker = ProxyHealthTracker(ejection_threshold=1)
+    tracker.record_outcome(str(_PROXY_URLS[0]), 'blocking.com', 'blocked')
+
+    assert tracker.is_ejected(str(_PROXY_URLS[0]), 'blocking.com')
+    assert not tracker.is_ejected(str(_PROXY_URLS[0]), 'example.com')
+    assert not tracker.is_ejected(str(_PROXY_URLS[0]))
+
+
+def test_picks_proxy_ejected_for_shortest_time_when_all_are_ejected(clock: list[float]) -> None:
+    tracker = ProxyHealthTracker(ejection_threshold=1, ejection_duration=timedelta(seconds=10))
+    for url in reversed(_PROXY_URLS):
+        tracker.record_outcome(str(url), None, 'error')
+        clock[0] += 1
+
+    assert tracker.pick_url(_PROXY_URLS, None) == _PROXY_URLS[-1]
+
+
+def test_validates_arguments() -> None:
+    with pytest.raises(ValueError, match='smoothing'):
+        ProxyHealthTracker(smoothing=0)
+
+    with pytest.raises(ValueError, match='ejection threshold'):
+        ProxyHealthTracker(ejection_threshold=0)
+
+    with pytest.raises(ValueError, match='new_url_function'):
+        ProxyConfiguration(
+            new_url_function=lambda session_id=None, request=None: None,  # noqa: ARG005
+            health_tracker=ProxyHealthTracker(),
+        )
+
+
+async def test_proxy_configuration_avoids_ejected_proxy() -> None:
+    tracker = ProxyHealthTracker(ejection_threshold=1, ejection_duration=timedelta(minutes=1))
+    config = ProxyConfiguration(proxy_urls=[str(url) for url in _PROXY_URLS], health_tracker=tracker)
+    request = Request.from_url('https://example.com/')
+
+    tracker.record_outcome(str(_PROXY_URLS[0]), 'example.com', 'blocked')
+
+    for _ in range(50):
+        proxy_info = await config.new_proxy_info(None, request, None)
+        assert proxy_info is not None
+        assert proxy_info.url != str(_PROXY_URLS[0])
+
+    # The proxy is only ejected for the domain where it was blocked.
+    other_request = Request.from_url('https://crawlee.dev/')
+    urls = set[str]()
+    for _ in range(50):
+        proxy_info = await config.new_proxy_info(None, other_request, None)
+        assert proxy_info is not None
+        urls.add(proxy_info.url)
+    assert str(_PROXY_URLS[0]) in urls
+
+
+async def test_proxy_configuration_keeps_proxy_of_session() -> None:
+    tracker = ProxyHealthTracker()
+    config = ProxyConfiguration(proxy_urls=[str(url) for url in _PROXY_URLS], health_tracker=tracker)
+
+    proxy_info = await config.new_proxy_info('session', None, None)
+    assert proxy_info is not None
+
+    tracker.record_latency(proxy_info.url, None, timedelta(seconds=10))
+
+    for _ in range(10):
+        assert await config.new_proxy_info('session', None, None) == proxy_info
+
+
+async def test_proxy_configuration_replaces_ejected_proxy_of_session(clock: list[float]) -> None:  # noqa: ARG001
+    tracker = ProxyHealthTracker(ejection_threshold=1)
+    config = ProxyConfiguration(proxy_urls=[str(url) for url in _PROXY_URLS], health_tracker=tracker)
+    request = Request.from_url('https://example.com/')
+
+    proxy_info = await config.new_proxy_info('session', request, None)
+    assert proxy_info is not None
+
+    # A timeout before the response counts as an error, which ejects the proxy of the session.
+    tracker.record_outcome(proxy_info.url, 'example.com', 'error')
+
+    new_proxy_info = await config.new_proxy_info('session', request, None)
+    assert new_proxy_info is not None
+    assert new_proxy_info.url != proxy_info.url
+
+    # The session keeps the new proxy.
+    for _ in range(10):
+        assert await config.new_proxy_info('session', request, None) == new_proxy_info
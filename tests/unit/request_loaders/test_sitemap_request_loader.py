@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import gzip
 from contextlib import asynccontextmanager
@@ -212,6 +213,24 @@ async def test_is_empty_does_not_depend_on_fetch_next_request(server_url: URL, h
     assert await poll_until_condition(sitemap_loader.is_finished)
 
 
+async def test_work_signal_notified_on_new_urls(server_url: URL, http_client: HttpClient) -> None:
+    """The loader notifies its work signal for every URL it loads and once the loading ends."""
+    sitemap_url = (server_url / 'sitemap.xml').with_query(
+        base64=encode_base64(get_basic_sitemap(url=server_url).encode())
+    )
+    sitemap_loader = SitemapRequestLoader([str(sitemap_url)], http_client=http_client, enqueue_strategy='all')
+
+    while not await sitemap_loader.is_finished():
+        generation = sitemap_loader.work_signal.generation
+        if item := await sitemap_loader.fetch_next_request():
+            await sitemap_loader.mark_request_as_handled(item)
+        elif not await sitemap_loader.is_finished():
+            # Nothing is ready, so the loader has to notify before it gets new URLs or finishes.
+            await asyncio.wait_for(sitemap_loader.work_signal.wait(generation), timeout=5)
+
+    assert sitemap_loader.work_signal.generation == await sitemap_loader.get_total_count() + 1
+
+
 async def test_abort_sitemap_loading(server_url: URL, http_client: HttpClient) -> None:
     sitemap_url = (server_url / 'sitemap.xml').with_query(
         base64=encode_base64(get_basic_sitemap(url=server_url).encode())
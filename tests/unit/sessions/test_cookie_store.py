@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import time
+from email.message import Message
+from http.cookiejar import CookieJar
+from urllib.request import Request
+
+import pytest
+
+from crawlee.sessions._cookie_store import CookieStore
+
+_URLS = [
+    'https://example.com/login',
+    'http://www.example.com/a/b/c',
+    'https://sub.www.example.com/a/',
+    'http://localhost:8080/x/y',
+    'http://127.0.0.1:8000/',
+    'https://other.org/',
+    'http://example.com:81/a/',
+]
+
+
+class _Response:
+    def __init__(self, set_cookie_headers: list[str]) -> None:
+        self._message = Message()
+        for header in set_cookie_headers:
+            self._message['Set-Cookie'] = header
+
+    def info(self) -> Message:
+        return self._message
+
+
+@pytest.mark.parametrize(
+    'set_cookie_header',
+    [
+        'a=1',
+        'a=1; Path=/a; Secure; HttpOnly; SameSite=Lax',
+        'a=1; Path=/a/; Max-Age=100',
+        'a=1; Domain=example.com; Expires=Wed, 21 Oct 2099 07:28:00 GMT',
+        'a=1; Domain=.example.com; Path=; Path=/ignored',
+        'a=1; Domain=www.example.com',
+        'a=1; Domain=com',
+        'a=1; Domain=other.org',
+        'a=1; Domain=localhost',
+        'a=1; Max-Age=invalid',
+        'a=1; Expires=invalid',
+        'a=1; Version=1',
+        'a=1; Version=2',
+        'a=1; Port',
+        'a=1; Port="80,8080"',
+        'a=1; Path',
+        'a',
+        '=1',
+    ],
+)
+def test_matches_cookie_jar(set_cookie_header: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the store accepts and sends the same cookies as a `CookieJar` with the default policy."""
+    # Both compute the expiration time from `Max-Age` at the current second.
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now)
+    store, jar = CookieStore(), CookieJar()
+
+    for response_url in _URLS:
+        store.extract_cookies_from_headers(response_url, [set_cookie_header])
+        response_request = Request(response_url)  # noqa: S310
+        jar.extract_cookies(_Response([set_cookie_header]), response_request)  # ty: ignore[invalid-argument-type]
+
+        assert sorted(repr(vars(cookie)) for cookie in store) == sorted(repr(vars(cookie)) for cookie in jar)
+
+        for request_url in _URLS:
+            request = Request(request_url)  # noqa: S310
+            jar.add_cookie_header(request)
+            assert store.get_cookie_header(request_url) == request.get_header('Cookie', '')
+
+
+def test_cookie_header_cache_follows_changes() -> None:
+    """Test that the cached cookies of a host are refreshed when the cookies change."""
+    store = CookieStore()
+    store.extract_cookies_from_headers('https://example.com/', ['a=1; Path=/', 'b=2; Path=/'])
+    assert store.get_cookie_header('https://example.com/') == 'a=1; b=2'
+
+    store.extract_cookies_from_headers('https://example.com/', ['a=3; Path=/'])
+    assert store.get_cookie_header('https://example.com/') == 'a=3; b=2'
+
+    store.extract_cookies_from_headers('https://example.com/', ['b=2; Path=/; Max-Age=0'])
+    assert store.get_cookie_header('https://example.com/') == 'a=3'
+    assert len(store) == 1
+
+    store.clear()
+    assert store.get_cookie_header('https://example.com/') == ''
+
+
+def test_expired_cookies_are_removed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that cookies stop being sent and are removed from the store once they expire."""
+    store = CookieStore()
+    store.extract_cookies_from_headers('https://example.com/', ['short=1; Max-Age=10', 'long=2; Max-Age=1000'])
+    assert store.get_cookie_header('https://example.com/') == 'short=1; long=2'
+
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 100)
+
+    assert store.get_cookie_header('https://example.com/') == 'long=2'
+    assert [cookie.name for cookie in store] == ['long']
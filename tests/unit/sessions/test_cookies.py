@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from http.cookiejar import CookieJar
+
 import pytest
 
 from crawlee.sessions._cookies import CookieParam, PlaywrightCookieParam, SessionCookies
@@ -231,3 +233,33 @@ def test_get_cookie_string_round_trip() -> None:
     session_cookies.extract_cookies_from_headers('https://example.com/login', ['sid=abc123; Path=/'])
 
     assert session_cookies.get_cookie_string('https://example.com/dashboard') == 'sid=abc123'
+
+
+def test_cached_representations_follow_changes() -> None:
+    """Test that the cached dictionary and Playwright representations are refreshed and safe to modify."""
+    session_cookies = SessionCookies()
+    session_cookies.set('a', '1', domain='example.com')
+
+    cookie_dicts = session_cookies.get_cookies_as_dicts()
+    cookie_dicts[0]['value'] = 'modified'
+    assert session_cookies.get_cookies_as_dicts()[0]['value'] == '1'
+    assert session_cookies.get_cookies_as_playwright_format()[0]['value'] == '1'
+
+    session_cookies.extract_cookies_from_headers('https://example.com/', ['a=2; Path=/'])
+    assert session_cookies.get_cookies_as_dicts()[0]['value'] == '2'
+    assert session_cookies.get_cookies_as_playwright_format()[0]['value'] == '2'
+
+
+def test_wraps_foreign_cookie_jar() -> None:
+    """Test that a plain `CookieJar` is used as is, with the changes visible through both objects."""
+    jar = CookieJar()
+    session_cookies = SessionCookies(jar)
+    assert session_cookies.jar is jar
+
+    session_cookies.extract_cookies_from_headers('https://example.com/login', ['sid=abc123; Path=/'])
+    assert [cookie.name for cookie in jar] == ['sid']
+    assert session_cookies.get_cookie_string('https://example.com/dashboard') == 'sid=abc123'
+
+    jar.clear()
+    assert session_cookies.get_cookies_as_dicts() == []
+    assert session_cookies.get_cookies_as_playwright_format() == []
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from crawlee.sessions import Session
+from crawlee.sessions._session_index import SessionExpirationQueue, SessionIndex
+
+
+def test_add_remove_and_pick() -> None:
+    index = SessionIndex()
+    sessions = [Session(id=f'session_{i}') for i in range(5)]
+    for session in sessions:
+        index.add(session)
+
+    assert len(index) == 5
+    assert index.remove('session_1') is sessions[1]
+    assert index.remove('session_1') is None
+    assert index.remove('session_4') is sessions[4]
+    assert 'session_1' not in index
+    assert len(index) == 3
+
+    picked = {index.pick_random() for _ in range(200)}
+    assert picked == {sessions[0], sessions[2], sessions[3]}
+
+    # Adding a session with an indexed ID replaces the indexed session.
+    replacement = Session(id='session_0')
+    index.add(replacement)
+    assert len(index) == 3
+    assert index.remove('session_0') is replacement
+
+    index.clear()
+    assert index.pick_random() is None
+
+
+def test_remove_expired() -> None:
+    now = datetime.now(timezone.utc)
+    queue = SessionExpirationQueue()
+    expired = Session(id='expired', created_at=now - timedelta(hours=2), max_age=timedelta(hours=1))
+    expiring = Session(id='expiring', created_at=now, max_age=timedelta(minutes=5))
+    removed = Session(id='removed', created_at=now - timedelta(hours=2), max_age=timedelta(hours=1))
+    for session in (expired, expiring, removed):
+        queue.add(session)
+    assert queue.remove('removed') is removed
+
+    assert queue.remove_expired(now.timestamp()) == [expired]
+    assert queue.remove_expired((now + timedelta(minutes=10)).timestamp()) == [expiring]
+    assert len(queue) == 0
+
+
+def test_expiration_heap_is_compacted() -> None:
+    queue = SessionExpirationQueue()
+    for i in range(1000):
+        queue.add(Session(id=f'session_{i}'))
+        queue.remove(f'session_{i}')
+
+    queue.add(Session(id='kept'))
+    assert len(queue._heap) < 20
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import TYPE_CHECKING
 
 import pytest
@@ -9,7 +11,7 @@ import pytest
 from crawlee import service_locator
 from crawlee.events import EventManager
 from crawlee.events._types import Event, EventPersistStateData
-from crawlee.sessions import Session, SessionPool
+from crawlee.sessions import LowestErrorScoreSessionSelection, Session, SessionPool
 from crawlee.sessions._models import SessionPoolModel
 from crawlee.storages import KeyValueStore
 
@@ -99,6 +101,58 @@ async def test_get_session_no_usable(caplog: pytest.LogCaptureFixture, session_p
         assert session is None
 
 
+async def test_get_session_removes_unusable_sessions(session_pool: SessionPool) -> None:
+    """Check that sessions that became unusable or expired are removed from the pool and replaced."""
+    for session_id in session_pool.get_state(as_dict=False).sessions:
+        session = await session_pool.get_session_by_id(session_id)
+        assert session is not None
+        session.retire()
+
+    # Every picked unusable session is removed and replaced with a new, usable one.
+    for _ in range(50):
+        assert (await session_pool.get_session()).is_usable
+
+    assert session_pool.session_count == MAX_POOL_SIZE
+    assert session_pool.retired_session_count == 0
+
+    session_pool.add_session(Session(id='expiring', max_age=timedelta(milliseconds=50)))
+    assert await session_pool.get_session_by_id('expiring') is not None
+    await asyncio.sleep(0.1)
+
+    await session_pool.get_session()
+    assert 'expiring' not in session_pool.get_state(as_dict=False).sessions
+
+
+async def test_session_selection(caplog: pytest.LogCaptureFixture) -> None:
+    """Check that the pool selects sessions by its strategy and replaces the sessions retired after being used."""
+    async with SessionPool(
+        max_pool_size=MAX_POOL_SIZE,
+        persistence_enabled=False,
+        session_selection=LowestErrorScoreSessionSelection(),
+    ) as sp:
+        failed_session = await sp.get_session()
+        failed_session.mark_bad()
+
+        for _ in range(10):
+            session = await sp.get_session()
+            assert session is not failed_session
+            session.mark_good()
+
+        # The retired session is no longer selected, but it stays in the pool until it is replaced.
+        failed_session.retire()
+        assert failed_session.id in sp.get_state(as_dict=False).sessions
+        assert sp.retired_session_count == 1
+
+        with caplog.at_level(logging.WARNING):
+            assert await sp.get_session_by_id(failed_session.id) is None
+        assert f'Session with ID {failed_session.id} is not usable.' in caplog.text
+
+        await sp.get_session()
+        assert failed_session.id not in sp.get_state(as_dict=False).sessions
+        assert sp.retired_session_count == 0
+        assert sp.session_count == MAX_POOL_SIZE
+
+
 async def test_create_session_function() -> None:
     """Validate that a session created via a custom function works and has the expected fields set."""
     user_data = {'created_by': 'test_create_session_function'}
@@ -170,6 +224,51 @@ async def test_session_pool_persist_and_restore(event_manager: EventManager, kvs
         assert previous_state is None
 
 
+async def test_session_pool_incremental_persistence(event_manager: EventManager, kvs: KeyValueStore) -> None:
+    """Check that the sessions changed after the last snapshot are restored from the journal."""
+    service_locator.set_event_manager(event_manager)
+
+    async def persist() -> None:
+        event_manager.emit(event=Event.PERSIST_STATE, event_data=EventPersistStateData(is_migrating=False))
+        await event_manager.wait_for_all_listeners_to_complete()
+
+    create_session_pool = partial(
+        SessionPool,
+        max_pool_size=MAX_POOL_SIZE,
+        persistence_enabled=True,
+        persist_state_kvs_name=KVS_NAME,
+        persist_state_key=PERSIST_STATE_KEY,
+        incremental_persistence=True,
+    )
+
+    async with create_session_pool() as sp:
+        await persist()
+        session = await sp.get_session()
+        session.mark_bad()
+        retired_session_id = next(
+            session_id for session_id in sp.get_state(as_dict=False).sessions if session_id != session.id
+        )
+        retired_session = await sp.get_session_by_id(retired_session_id)
+        assert retired_session is not None
+        retired_session.retire()
+        assert sp.retired_session_count == 1
+        # The retired session is replaced, so both its removal and the new session go to the journal.
+        await sp.get_session()
+        assert retired_session_id not in sp.get_state(as_dict=False).sessions
+        await persist()
+        state = sp.get_state(as_dict=True)
+
+    # The snapshot is not rewritten, the changes go to the journal.
+    snapshot = SessionPoolModel.model_validate(await kvs.get_value(key=PERSIST_STATE_KEY))
+    assert snapshot.sessions[session.id].error_score == 0
+
+    async with create_session_pool() as sp:
+        assert sp.get_state(as_dict=True) == state
+        restored_session = await sp.get_session_by_id(session.id)
+        assert restored_session is not None
+        assert restored_session.error_score == 1
+
+
 async def test_methods_raise_error_when_not_active() -> None:
     session = Session()
     session_pool = SessionPool()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from crawlee.sessions import (
+    LeastRecentlyUsedSessionSelection,
+    LowestErrorScoreSessionSelection,
+    RandomSessionSelection,
+    Session,
+    SessionSelectionStrategy,
+    WeightedSessionSelection,
+)
+
+
+@pytest.mark.parametrize(
+    'strategy_class',
+    [
+        RandomSessionSelection,
+        LeastRecentlyUsedSessionSelection,
+        LowestErrorScoreSessionSelection,
+        WeightedSessionSelection,
+    ],
+)
+def test_add_remove_and_select(strategy_class: type[SessionSelectionStrategy]) -> None:
+    strategy = strategy_class()
+    assert strategy.select() is None
+
+    sessions = [Session(id=f'session_{i}') for i in range(40)]
+    for session in sessions:
+        strategy.add(session)
+    for session in sessions[:30]:
+        strategy.remove(session.id)
+    strategy.remove('unknown')
+
+    selected = {strategy.select() for _ in range(500)}
+    assert selected == set(sessions[30:])
+
+    # Adding a session with a known ID replaces the session.
+    replacement = Session(id='session_30')
+    strategy.add(replacement)
+    selected = {strategy.select() for _ in range(500)}
+    assert sessions[30] not in selected
+    assert replacement in selected
+
+    strategy.clear()
+    assert strategy.select() is None
+
+
+def test_least_recently_used_selection() -> None:
+    strategy = LeastRecentlyUsedSessionSelection()
+    sessions = [Session(id=f'session_{i}') for i in range(3)]
+    for session in sessions:
+        strategy.add(session)
+
+    first_round = [strategy.select() for _ in range(3)]
+    assert set(first_round) == set(sessions)
+
+    # A new session has never been used, so it goes first.
+    new_session = Session(id='new')
+    strategy.add(new_session)
+    assert strategy.select() is new_session
+    assert [strategy.select() for _ in range(3)] == first_round
+
+
+def test_lowest_error_score_selection() -> None:
+    strategy = LowestErrorScoreSessionSelection()
+    good, bad = Session(id='good'), Session(id='bad')
+    strategy.add(good)
+    strategy.add(bad)
+
+    bad.mark_bad()
+    strategy.update(bad)
+    assert [strategy.select() for _ in range(5)] == [good] * 5
+
+    # Out of the sessions with the same error score, the one selected the fewest times goes first.
+    bad.mark_good()
+    bad.mark_good()
+    strategy.update(bad)
+    assert strategy.select() is bad
+
+
+def test_weighted_selection() -> None:
+    strategy = WeightedSessionSelection(weight_function=lambda session: 1 / (1 + session.error_score) ** 4)
+    good, bad = Session(id='good'), Session(id='bad')
+    strategy.add(good)
+    strategy.add(bad)
+
+    bad.mark_bad()
+    strategy.update(bad)
+    counts = Counter(strategy.select() for _ in range(3400))
+    # The expected share of the bad session is 1/17.
+    assert 100 < counts[bad] < 300
+
+    with pytest.raises(ValueError, match='must be positive'):
+        WeightedSessionSelection(weight_function=lambda _: 0).add(Session())
+
+
+def test_weighted_selection_with_many_updates() -> None:
+    strategy = WeightedSessionSelection()
+    sessions = [Session(id=f'session_{i}', max_usage_count=1_000_000) for i in range(100)]
+    for session in sessions:
+        strategy.add(session)
+
+    for _ in range(20_000):
+        session = strategy.select()
+        assert session is not None
+        session.mark_good()
+        strategy.update(session)
+        if session.id == 'session_0':
+            strategy.remove(session.id)
+            strategy.add(session)
+
+    assert sum(strategy._weights) == pytest.approx(strategy._total_weight)
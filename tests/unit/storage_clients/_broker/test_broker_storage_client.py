@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from crawlee.configuration import Configuration
+from crawlee.storage_clients import MemoryStorageClient
+from crawlee.storage_clients._broker import BrokerStorageClient, StorageBroker
+from crawlee.storage_clients._broker._protocol import (
+    AUTH_CHALLENGE_SIZE,
+    FRAME_HEADER,
+    ITERATOR_CHUNK_SIZE,
+    MAX_MESSAGE_SIZE,
+    answer_challenge,
+)
+from crawlee.storages import Dataset, KeyValueStore, RequestQueue
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+
+@pytest.fixture
+async def broker() -> AsyncGenerator[StorageBroker, None]:
+    broker = StorageBroker(MemoryStorageClient(), configuration=Configuration(purge_on_start=True), authkey=b'secret')
+    await broker.start()
+    yield broker
+    await broker.stop()
+
+
+@pytest.fixture
+async def storage_client(broker: StorageBroker) -> AsyncGenerator[BrokerStorageClient, None]:
+    client = BrokerStorageClient(address=broker.address, authkey=b'secret')
+    yield client
+    await client.close()
+
+
+async def test_clients_share_request_queue(broker: StorageBroker, storage_client: BrokerStorageClient) -> None:
+    # The other client stands for another process, so it bypasses the storage instance cache of this one.
+    other_client = BrokerStorageClient(address=broker.address, authkey=b'secret')
+    rq = await RequestQueue.open(storage_client=storage_client)
+    other_rq = await other_client.create_rq_client()
+    assert rq.id == (await other_rq.get_metadata()).id
+
+    await rq.add_requests(['https://a.com', 'https://b.com'])
+    first = await rq.fetch_next_request()
+    second = await other_rq.fetch_next_request()
+    assert first is not None
+    assert second is not None
+    assert {first.url, second.url} == {'https://a.com', 'https://b.com'}
+
+    # A request in progress in one client is not handed out to the other.
+    assert await other_rq.fetch_next_request() is None
+    assert not await rq.is_finished()
+
+    await rq.mark_request_as_handled(first)
+    assert first.handled_at is not None
+    await other_rq.reclaim_request(second)
+    reclaimed = await rq.fetch_next_request()
+    assert reclaimed is not None
+    assert reclaimed.url == second.url
+    await rq.mark_request_as_handled(reclaimed)
+
+    assert await other_rq.is_finished()
+    assert (await other_rq.get_metadata()).handled_request_count == 2
+    await other_client.close()
+
+
+async def test_dataset_and_key_value_store(storage_client: BrokerStorageClient) -> None:
+    dataset = await Dataset.open(name='results', storage_client=storage_client)
+    await dataset.push_data([{'index': index} for index in range(ITERATOR_CHUNK_SIZE + 5)])
+
+    assert (await dataset.get_data(limit=2)).items == [{'index': 0}, {'index': 1}]
+    items = [item async for item in dataset.iterate_items()]
+    assert [item['index'] for item in items] == list(range(ITERATOR_CHUNK_SIZE + 5))
+
+    # Leaving an iteration early releases the iterator in the broker.
+    async for _ in dataset.iterate_items():
+        break
+
+    kvs = await KeyValueStore.open(storage_client=storage_client)
+    await kvs.set_value('state', {'count': 1})
+    await kvs.set_value('blob', b'\x00\x01', content_type='application/octet-stream')
+    assert await kvs.get_value('state') == {'count': 1}
+    assert await kvs.get_value('blob') == b'\x00\x01'
+    assert await kvs.record_exists('state')
+    assert sorted([key.key async for key in kvs.iterate_keys()]) == ['blob', 'state']
+
+    await kvs.delete_value('state')
+    assert await kvs.get_value('state') is None
+
+    await dataset.drop()
+    reopened = await Dataset.open(name='results', storage_client=storage_client)
+    assert (await reopened.get_metadata()).item_count == 0
+
+
+async def test_storages_are_purged_once(broker: StorageBroker, storage_client: BrokerStorageClient) -> None:
+    rq = await RequestQueue.open(storage_client=storage_client)
+    await rq.add_request('https://a.com')
+
+    # Another process opening the same storage gets the existing one, without purging it.
+    other_client = BrokerStorageClient(address=broker.address, authkey=b'secret')
+    other_rq = await other_client.create_rq_client()
+    assert (await other_rq.get_metadata()).total_request_count == 1
+    await other_client.close()
+
+
+async def test_errors_are_raised_in_client(storage_client: BrokerStorageClient) -> None:
+    kvs = await KeyValueStore.open(storage_client=storage_client)
+
+    with pytest.raises(ValueError, match='cannot be called'):
+        await storage_client._connection.call_storage('kvs', kvs.id, '_update_metadata')
+
+    with pytest.raises(ValueError, match='not open'):
+        await storage_client._connection.call_storage('kvs', 'unknown-id', 'get_metadata')
+
+
+async def test_wrong_authkey_is_rejected(broker: StorageBroker) -> None:
+    client = BrokerStorageClient(address=broker.address, authkey=b'wrong')
+
+    with pytest.raises(ConnectionError):
+        await client.create_rq_client()
+
+    await client.close()
+
+
+_unpickled_payloads = list[str]()
+
+
+def _record_unpickling(payload: str) -> str:
+    _unpickled_payloads.append(payload)
+    return payload
+
+
+class _Payload:
+    def __reduce__(self) -> tuple[object, tuple[str]]:
+        return _record_unpickling, ('payload',)
+
+
+async def test_nothing_is_unpickled_before_authentication(broker: StorageBroker) -> None:
+    reader, writer = await asyncio.open_connection(*broker.address)
+    await reader.readexactly(AUTH_CHALLENGE_SIZE)
+
+    payload = pickle.dumps(_Payload())
+    writer.write((FRAME_HEADER.pack(len(payload)) + payload).ljust(1024, b'\0'))
+    await writer.drain()
+
+    # The broker closes the connection without answering.
+    assert await reader.read() == b''
+    assert _unpickled_payloads == []
+    writer.close()
+
+
+async def test_oversized_message_closes_connection(broker: StorageBroker) -> None:
+    reader, writer = await asyncio.open_connection(*broker.address)
+    await answer_challenge(reader, writer, b'secret')
+
+    writer.write(FRAME_HEADER.pack(MAX_MESSAGE_SIZE + 1))
+    await writer.drain()
+
+    assert await reader.read() == b''
+    writer.close()
@@ -4,18 +4,20 @@ import asyncio
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
 from crawlee._consts import METADATA_FILENAME
+from crawlee._utils.file import atomic_write_many
 from crawlee.configuration import Configuration
 from crawlee.storage_clients import FileSystemStorageClient
+from crawlee.storage_clients._file_system import FileSystemDatasetClient
+from crawlee.storage_clients._file_system._dataset_segments import DatasetSegments
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
-    from crawlee.storage_clients._file_system import FileSystemDatasetClient
-
 
 @pytest.fixture
 def configuration(tmp_path: Path) -> Configuration:
@@ -106,6 +108,26 @@ async def test_file_persistence_and_content_verification(dataset_client: FileSys
     assert len(data_files) == 4  # Original item + 3 new items
 
 
+async def test_push_data_writes_batch_at_once(dataset_client: FileSystemDatasetClient) -> None:
+    """Test that a batch of items is written in a single call with consecutive item file names."""
+    await dataset_client.push_data({'id': 0})
+
+    with patch(
+        'crawlee.storage_clients._file_system._dataset_client.atomic_write_many', wraps=atomic_write_many
+    ) as write_many:
+        await dataset_client.push_data([{'id': i} for i in range(1, 4)])
+
+    write_many.assert_called_once()
+    assert sorted(path.name for path in dataset_client.path_to_dataset.glob('0*.json')) == [
+        '000000001.json',
+        '000000002.json',
+        '000000003.json',
+        '000000004.json',
+    ]
+    assert json.loads((dataset_client.path_to_dataset / '000000004.json').read_text()) == {'id': 3}
+    assert (await dataset_client.get_metadata()).item_count == 4
+
+
 async def test_drop_removes_files_from_disk(dataset_client: FileSystemDatasetClient) -> None:
     """Test that dropping a dataset removes the entire dataset directory from disk."""
     await dataset_client.push_data({'test': 'data'})
@@ -178,3 +200,93 @@ async def test_data_persistence_across_reopens() -> None:
     assert data.items[0] == test_data
 
     await reopened_client.drop()
+
+
+@pytest.fixture
+async def jsonl_dataset_client(
+    configuration: Configuration, monkeypatch: pytest.MonkeyPatch
+) -> AsyncGenerator[FileSystemDatasetClient, None]:
+    """A fixture for a file system dataset client using small segments with the `'jsonl'` storage format."""
+    monkeypatch.setattr(DatasetSegments, '_SEGMENT_MAX_BYTES', 256)
+    monkeypatch.setattr(DatasetSegments, '_INDEX_STRIDE', 4)
+    client = await FileSystemStorageClient(dataset_storage_format='jsonl').create_dataset_client(
+        name='test-dataset', configuration=configuration
+    )
+    yield client
+    await client.drop()
+
+
+async def test_jsonl_format_stores_items_in_segments(jsonl_dataset_client: FileSystemDatasetClient) -> None:
+    """Test that the `'jsonl'` storage format appends items to segment files instead of per-item files."""
+    await jsonl_dataset_client.push_data([{'id': i, 'payload': 'x' * 20} for i in range(50)])
+
+    assert [path.name for path in jsonl_dataset_client.path_to_dataset.glob('*.json')] == [METADATA_FILENAME]
+    segment_files = sorted((jsonl_dataset_client.path_to_dataset / 'segments').glob('*.jsonl'))
+    assert len(segment_files) > 1
+    assert segment_files[0].name == '000000001.jsonl'
+
+    lines = [line for file in segment_files for line in file.read_text(encoding='utf-8').splitlines()]
+    assert [json.loads(line)['id'] for line in lines] == list(range(50))
+
+    metadata = await jsonl_dataset_client.get_metadata()
+    assert metadata.item_count == 50
+
+
+@pytest.mark.parametrize(
+    ('offset', 'limit', 'desc', 'expected'),
+    [
+        pytest.param(0, None, False, list(range(50)), id='all'),
+        pytest.param(7, 13, False, list(range(7, 20)), id='offset-limit'),
+        pytest.param(45, 10, False, list(range(45, 50)), id='limit-past-end'),
+        pytest.param(0, 5, True, list(range(49, 44, -1)), id='desc'),
+        pytest.param(10, 21, True, list(range(39, 18, -1)), id='desc-offset-limit'),
+        pytest.param(60, None, False, [], id='offset-past-end'),
+    ],
+)
+async def test_jsonl_format_pagination(
+    jsonl_dataset_client: FileSystemDatasetClient,
+    offset: int,
+    limit: int | None,
+    *,
+    desc: bool,
+    expected: list[int],
+) -> None:
+    """Test that reads in the `'jsonl'` storage format return the same pages as the per-item format."""
+    await jsonl_dataset_client.push_data([{'id': i, 'payload': 'x' * 20} for i in range(50)])
+
+    page = await jsonl_dataset_client.get_data(offset=offset, limit=limit, desc=desc)
+    assert [item['id'] for item in page.items] == expected
+    assert page.total == 50
+
+    kwargs = {} if limit is None else {'limit': limit}
+    iterated = [item['id'] async for item in jsonl_dataset_client.iterate_items(offset=offset, desc=desc, **kwargs)]
+    assert iterated == expected
+
+    records = [record async for record in jsonl_dataset_client.iterate_raw_items(offset=offset, desc=desc, **kwargs)]
+    assert [json.loads(record)['id'] for record in records] == expected
+
+
+async def test_jsonl_format_reopen_and_torn_tail(configuration: Configuration, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the segments are restored on reopen and an incomplete trailing item is discarded."""
+    monkeypatch.setattr(DatasetSegments, '_SEGMENT_MAX_BYTES', 256)
+    storage_client = FileSystemStorageClient(dataset_storage_format='jsonl')
+    client = await storage_client.create_dataset_client(name='reopen-dataset', configuration=configuration)
+    await client.push_data([{'id': i, 'payload': 'x' * 20} for i in range(30)])
+    assert (client.path_to_dataset / 'segments' / 'index.json').exists()
+
+    # Simulate a crash in the middle of writing an item.
+    active_segment = max((client.path_to_dataset / 'segments').glob('*.jsonl'))
+    with active_segment.open('ab') as file:
+        file.write(b'{"id": 30, "payl')
+    await client._segments.close()  # type: ignore[union-attr]
+
+    reopened_client = await FileSystemDatasetClient.open(
+        id=None, name='reopen-dataset', alias=None, configuration=configuration, storage_format='jsonl'
+    )
+    assert (await reopened_client.get_metadata()).item_count == 30
+
+    await reopened_client.push_data({'id': 30})
+    page = await reopened_client.get_data(offset=25)
+    assert [item['id'] for item in page.items] == [25, 26, 27, 28, 29, 30]
+
+    await reopened_client.drop()
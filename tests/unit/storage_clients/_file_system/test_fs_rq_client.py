@@ -2,21 +2,23 @@ from __future__ import annotations
 
 import asyncio
 import json
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
 
 from crawlee import Request, service_locator
+from crawlee._utils.json_codec import get_json_codec
 from crawlee.configuration import Configuration
 from crawlee.storage_clients import FileSystemStorageClient, MemoryStorageClient
+from crawlee.storage_clients._file_system import FileSystemRequestQueueClient
+from crawlee.storage_clients._file_system._request_log import RequestLog
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
     from pathlib import Path
 
-    from crawlee.storage_clients._file_system import FileSystemRequestQueueClient
-
 
 @pytest.fixture
 def configuration(tmp_path: Path) -> Configuration:
@@ -294,11 +296,11 @@ async def test_cache_refresh_skips_handled_request_files(
     # the cache, which must not parse the handled files again.
     await rq_client.add_batch_of_requests([Request.from_url(f'https://example.com/new/{i}') for i in range(5)])
 
-    with patch.object(rq_client, '_parse_request_file', wraps=rq_client._parse_request_file) as parse_spy:
+    with patch.object(rq_client, '_parse_request_files', wraps=rq_client._parse_request_files) as parse_spy:
         request = await rq_client.fetch_next_request()
 
     assert request is not None
-    assert parse_spy.call_count == 5
+    assert sum(len(call.args[0]) for call in parse_spy.call_args_list) == 5
 
 
 async def test_handled_requests_pruned_from_pending_state(rq_client: FileSystemRequestQueueClient) -> None:
@@ -339,3 +341,311 @@ async def test_handled_requests_deduplicated_after_reopen() -> None:
     assert await reopened.fetch_next_request() is None
 
     await reopened.drop()
+
+
+@pytest.fixture
+async def log_rq_client(configuration: Configuration) -> AsyncGenerator[FileSystemRequestQueueClient, None]:
+    """A fixture for a file system request queue client using the log storage format."""
+    client = await FileSystemStorageClient(queue_storage_format='log').create_rq_client(
+        name='test-log-request-queue',
+        configuration=configuration,
+    )
+    yield client
+    await client.drop()
+
+
+async def test_log_format_does_not_create_request_files(log_rq_client: FileSystemRequestQueueClient) -> None:
+    """Test that the log storage format appends requests to segment files instead of one file per request."""
+    await log_rq_client.add_batch_of_requests([Request.from_url(f'https://example.com/{i}') for i in range(10)])
+
+    request = await log_rq_client.fetch_next_request()
+    assert request is not None
+    await log_rq_client.mark_request_as_handled(request)
+
+    assert await log_rq_client._get_request_files(log_rq_client.path_to_rq) == []
+
+    log_dir = log_rq_client.path_to_rq / 'requests_log'
+    segments = list(log_dir.glob('*.jsonl'))
+    assert len(segments) == 1
+    # 10 added requests and 1 handled request, each as one line.
+    assert len(segments[0].read_bytes().splitlines()) == 11
+
+
+async def test_log_format_persistence_across_reopens(configuration: Configuration) -> None:
+    """Test that a queue using the log storage format is restored from its index and the log tail on reopen."""
+    storage_client = FileSystemStorageClient(queue_storage_format='log')
+    client = await storage_client.create_rq_client(name='log-reopen-test', configuration=configuration)
+
+    await client.add_batch_of_requests([Request.from_url(f'https://example.com/{i}') for i in range(3)])
+    assert client._request_log is not None
+    await client._request_log.checkpoint()
+
+    # Records written after the checkpoint must be replayed from the log.
+    handled = await client.fetch_next_request()
+    assert handled is not None
+    await client.mark_request_as_handled(handled)
+    await client.add_batch_of_requests([Request.from_url('https://example.com/after-checkpoint')])
+
+    rq_id = (await client.get_metadata()).id
+    # Drop the recoverable state, so the queue has to be rediscovered from the log.
+    await client._state.reset()
+
+    reopened = await FileSystemRequestQueueClient.open(
+        id=rq_id, name=None, alias=None, configuration=configuration, storage_format='log'
+    )
+
+    response = await reopened.add_batch_of_requests([handled])
+    assert response.processed_requests[0].was_already_handled is True
+
+    fetched_urls = set()
+    while (request := await reopened.fetch_next_request()) is not None:
+        fetched_urls.add(request.url)
+
+    assert fetched_urls == {'https://example.com/1', 'https://example.com/2', 'https://example.com/after-checkpoint'}
+
+    await reopened.drop()
+
+
+async def test_log_format_truncates_torn_record(configuration: Configuration) -> None:
+    """Test that an incomplete record at the end of the log, e.g. after a crash, is discarded on reopen."""
+    client = await FileSystemStorageClient(queue_storage_format='log').create_rq_client(
+        name='log-torn-test', configuration=configuration
+    )
+    await client.add_batch_of_requests([Request.from_url('https://example.com/1')])
+
+    segment = next((client.path_to_rq / 'requests_log').glob('*.jsonl'))
+    size = segment.stat().st_size
+    with segment.open('ab') as file:
+        file.write(b'{"unique_key": "https://example.com/to')
+
+    log = await RequestLog.open(path_to_log=segment.parent, json_codec=get_json_codec())
+
+    assert len(log) == 1
+    assert segment.stat().st_size == size
+
+    await client.drop()
+
+
+async def test_log_format_compaction(configuration: Configuration, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that superseded records are compacted away without losing the latest version of any request."""
+    monkeypatch.setattr(RequestLog, '_COMPACTION_MIN_BYTES', 1)
+    monkeypatch.setattr(RequestLog, '_COMPACTION_MAX_GARBAGE_RATIO', 0.1)
+    monkeypatch.setattr(RequestLog, '_SEGMENT_MAX_BYTES', 1024)
+
+    client = await FileSystemStorageClient(queue_storage_format='log').create_rq_client(
+        name='log-compaction-test', configuration=configuration
+    )
+    await client.add_batch_of_requests([Request.from_url(f'https://example.com/{i}') for i in range(20)])
+
+    for _ in range(10):
+        request = await client.fetch_next_request()
+        assert request is not None
+        request.user_data['touched'] = True
+        await client.reclaim_request(request)
+
+    log_dir = client.path_to_rq / 'requests_log'
+    records = [line for segment in log_dir.glob('*.jsonl') for line in segment.read_bytes().splitlines()]
+    # Compaction keeps a single record per request.
+    assert len(records) < 30
+
+    log = await RequestLog.open(path_to_log=log_dir, json_codec=get_json_codec())
+    stored = await log.read(f'https://example.com/{i}' for i in range(20))
+    assert len(stored) == 20
+    assert sum(1 for request in stored.values() if request.user_data.get('touched')) == 10
+
+    await client.drop()
+
+
+async def test_log_checkpoints_spaced_by_index_size(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the log checkpoints its index less often as it grows and reopens from the last checkpoint."""
+    monkeypatch.setattr(RequestLog, '_CHECKPOINT_INTERVAL', 100)
+    log_dir = tmp_path / 'requests_log'
+    log = await RequestLog.open(path_to_log=log_dir, json_codec=get_json_codec())
+
+    with patch.object(RequestLog, '_write_index', autospec=True, side_effect=RequestLog._write_index) as write_index:
+        for batch in range(100):
+            requests = [Request.from_url(f'https://example.com/{batch}/{i}') for i in range(50)]
+            if batch % 2:
+                for request in requests:
+                    request.handled_at = datetime.now(timezone.utc)
+            await log.append(requests)
+            # Let the background checkpoint finish, so that every due checkpoint is written.
+            await log._wait_for_checkpoint()
+
+        # 5000 records with a checkpoint every 100 records would take 50 index writes.
+        assert 5 < write_index.call_count < 20
+
+    await log.append([Request.from_url('https://example.com/after-checkpoint')])
+    await log.close()
+
+    index = json.loads((log_dir / 'index.json').read_text())
+    assert 0 < len(index['entries']) < 5000
+
+    reopened = await RequestLog.open(path_to_log=log_dir, json_codec=get_json_codec())
+    assert len(reopened) == 5001
+    assert sum(handled for _, handled in reopened.iter_requests()) == 2500
+
+    unique_keys = ['https://example.com/0/0', 'https://example.com/99/49', 'https://example.com/after-checkpoint']
+    assert set(await reopened.read(unique_keys)) == set(unique_keys)
+
+
+async def test_cache_refill_window_preserves_order(
+    rq_client: FileSystemRequestQueueClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that refilling a cache smaller than the queue from the pending index keeps the fetch order."""
+    monkeypatch.setattr(rq_client, '_MAX_REQUESTS_IN_CACHE', 2)
+
+    await rq_client.add_batch_of_requests([Request.from_url(f'https://example.com/{i}') for i in range(5)])
+    await rq_client.add_batch_of_requests(
+        [Request.from_url('https://example.com/f1'), Request.from_url('https://example.com/f2')], forefront=True
+    )
+    # Moving an already queued request to the forefront leaves a stale entry behind in the index.
+    await rq_client.add_batch_of_requests([Request.from_url('https://example.com/3')], forefront=True)
+
+    fetched_urls = []
+    while (request := await rq_client.fetch_next_request()) is not None:
+        fetched_urls.append(request.url)
+        if fetched_urls.count(request.url) == 1 and request.url == 'https://example.com/0':
+            await rq_client.reclaim_request(request)
+        else:
+            await rq_client.mark_request_as_handled(request)
+
+    assert fetched_urls == [
+        'https://example.com/3',
+        'https://example.com/f2',
+        'https://example.com/f1',
+        'https://example.com/0',
+        # The reclaimed request goes back to the end of the cache, which holds only the reclaimed request.
+        'https://example.com/0',
+        'https://example.com/1',
+        'https://example.com/2',
+        'https://example.com/4',
+    ]
+    assert await rq_client.is_finished() is True
+
+
+async def test_next_cache_window_is_prefetched(
+    rq_client: FileSystemRequestQueueClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the next window of requests is read in the background, so the next refresh does not read it."""
+    monkeypatch.setattr(rq_client, '_MAX_REQUESTS_IN_CACHE', 2)
+    monkeypatch.setattr(rq_client, '_PREFETCH_THRESHOLD', 1)
+
+    await rq_client.add_batch_of_requests([Request.from_url(f'https://example.com/{i}') for i in range(4)])
+
+    # The first fetch fills the cache with 2 requests and, as only 1 is left, starts prefetching the next 2.
+    first = await rq_client.fetch_next_request()
+    assert first is not None
+    assert rq_client._prefetch_task is not None
+    await rq_client._prefetch_task
+
+    with patch.object(rq_client, '_read_requests', wraps=rq_client._read_requests) as read_spy:
+        fetched_urls = [first.url]
+        while (request := await rq_client.fetch_next_request()) is not None:
+            fetched_urls.append(request.url)
+
+    assert fetched_urls == [f'https://example.com/{i}' for i in range(4)]
+    # The refresh of the cache with requests 2 and 3 has nothing left to read.
+    assert all(call.args[0] == [] for call in read_spy.call_args_list)
+
+
+async def test_write_behind_coalesces_state_transitions(configuration: Configuration) -> None:
+    """Test that the write-behind mode buffers request writes and flushes them after the interval."""
+    client = await FileSystemStorageClient(queue_write_behind_interval=timedelta(seconds=10)).create_rq_client(
+        name='write-behind-test', configuration=configuration
+    )
+    await client.add_batch_of_requests([Request.from_url(f'https://example.com/{i}') for i in range(3)])
+
+    with patch.object(client, '_write_requests', wraps=client._write_requests) as write_spy:
+        for _ in range(3):
+            request = await client.fetch_next_request()
+            assert request is not None
+            await client.mark_request_as_handled(request)
+
+        assert write_spy.call_count == 0
+
+        # The buffered versions are visible to readers before they are flushed.
+        buffered = await client.get_request('https://example.com/0')
+        assert buffered is not None
+        assert buffered.handled_at is not None
+
+        async with client._lock:
+            await client._flush_pending_writes()
+
+    # All three transitions are written in a single batch.
+    assert write_spy.call_count == 1
+    assert len(write_spy.call_args.args[0]) == 3
+
+    stored = await client._parse_request_file(client._get_request_path('https://example.com/0'))
+    assert stored is not None
+    assert stored.handled_at is not None
+
+    with client.path_to_metadata.open() as f:
+        assert json.load(f)['handled_request_count'] == 3
+
+    await client.drop()
+
+
+async def test_write_behind_flushes_after_interval_and_on_persist_state(configuration: Configuration) -> None:
+    """Test that buffered writes are flushed once the interval elapses and when the state is persisted."""
+    service_locator.set_configuration(configuration)
+    client = await FileSystemStorageClient(queue_write_behind_interval=timedelta(milliseconds=50)).create_rq_client(
+        name='write-behind-flush-test', configuration=configuration
+    )
+    await client.add_batch_of_requests([Request.from_url(f'https://example.com/{i}') for i in range(2)])
+
+    request = await client.fetch_next_request()
+    assert request is not None
+    await client.mark_request_as_handled(request)
+    assert client._pending_writes
+
+    await asyncio.sleep(0.2)
+    assert not client._pending_writes
+
+    # With a long interval, only the persist state event flushes the buffered writes.
+    client._write_behind_interval = timedelta(hours=1)
+    request = await client.fetch_next_request()
+    assert request is not None
+    await client.reclaim_request(request)
+    assert client._pending_writes
+
+    event_manager = service_locator.get_event_manager()
+    async with event_manager:
+        pass
+
+    assert not client._pending_writes
+
+    await client.drop()
+
+
+async def test_incremental_state_persistence_across_reopens() -> None:
+    """Test that the queue state persisted as a snapshot and a journal of changes is restored on reopen."""
+    storage_client = FileSystemStorageClient(queue_incremental_state_persistence=True)
+    client = await storage_client.create_rq_client(name='incremental-state-test')
+
+    await client.add_batch_of_requests([Request.from_url(f'https://example.com/{i}') for i in range(3)])
+    await client._state.persist_state()
+
+    handled = await client.fetch_next_request()
+    assert handled is not None
+    await client.mark_request_as_handled(handled)
+    await client.add_batch_of_requests([Request.from_url('https://example.com/forefront')], forefront=True)
+    await client._state.persist_state()
+
+    # The changes after the first snapshot are stored in the journal.
+    assert client._state._journal_length == 1
+    state = client._state.current_value.model_copy(deep=True)
+
+    rq_id = (await client.get_metadata()).id
+    reopened = await storage_client.create_rq_client(id=rq_id)
+    assert reopened._state.current_value == state
+
+    response = await reopened.add_batch_of_requests([handled])
+    assert response.processed_requests[0].was_already_handled is True
+
+    fetched_urls = []
+    while request := await reopened.fetch_next_request():
+        fetched_urls.append(request.url)
+    assert fetched_urls == ['https://example.com/forefront', 'https://example.com/1', 'https://example.com/2']
+
+    await reopened.drop()
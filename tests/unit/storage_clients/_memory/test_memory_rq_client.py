@@ -7,6 +7,7 @@ from unittest.mock import patch
 import pytest
 
 from crawlee import Request
+from crawlee.configuration import Configuration
 from crawlee.storage_clients import MemoryStorageClient
 
 if TYPE_CHECKING:
@@ -341,3 +342,52 @@ async def test_reclaim_to_forefront_moves_request_to_the_front(rq_client: Memory
         'https://example.com/1',
         'https://example.com/2',
     ]
+
+
+async def test_compact_mode_processes_requests() -> None:
+    """Test that the compact mode keeps the queue semantics while storing requests in a compact form."""
+    rq_client = await MemoryStorageClient(compact_queues=True).create_rq_client(name='test-compact-rq')
+    requests = [Request.from_url(f'https://example.com/{i}', user_data={'index': i}) for i in range(3)]
+    await rq_client.add_batch_of_requests(requests)
+
+    assert all(isinstance(value, bytes) for value in rq_client._pending_requests.values())
+
+    pending = await rq_client.get_request(requests[1].unique_key)
+    assert pending is not None
+    assert pending.user_data['index'] == 1
+
+    fetched = await rq_client.fetch_next_request()
+    assert fetched is not None
+    assert fetched.url == 'https://example.com/0'
+    assert await rq_client.get_request(fetched.unique_key) is fetched
+
+    fetched.retry_count = 1
+    await rq_client.reclaim_request(fetched, forefront=True)
+
+    handled_urls = []
+    while (request := await rq_client.fetch_next_request()) is not None:
+        handled_urls.append(request.url)
+        await rq_client.mark_request_as_handled(request)
+
+    assert handled_urls == [f'https://example.com/{i}' for i in range(3)]
+    assert await rq_client.is_finished()
+    assert rq_client._handled_requests == {}
+    assert await rq_client.get_request(requests[0].unique_key) is None
+
+    metadata = await rq_client.get_metadata()
+    assert metadata.handled_request_count == 3
+    assert metadata.pending_request_count == 0
+
+    response = await rq_client.add_batch_of_requests([Request.from_url('https://example.com/0')])
+    assert response.processed_requests[0].was_already_handled is True
+
+    await rq_client.drop()
+
+
+async def test_compact_mode_is_part_of_the_cache_key() -> None:
+    """Test that storages opened by clients in a different mode are not shared."""
+    configuration = Configuration()
+
+    assert MemoryStorageClient().get_storage_client_cache_key(configuration) != MemoryStorageClient(
+        compact_queues=True
+    ).get_storage_client_cache_key(configuration)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,6 +8,7 @@ import pytest
 from redis.exceptions import RedisError
 
 from crawlee import Request
+from crawlee._utils.request_codec import decode_request
 from crawlee.storage_clients import RedisStorageClient
 from crawlee.storage_clients._redis._utils import await_redis_response
 
@@ -92,9 +92,8 @@ async def test_request_records_persistence(rq_client: RedisRequestQueueClient) -
     assert isinstance(requests_records_data, dict)
 
     for key in request_keys:
-        request_data = json.loads(requests_records_data[key])
-        assert 'url' in request_data
-        assert request_data['url'].startswith('https://example.com/')
+        request = decode_request(requests_records_data[key])
+        assert request.url.startswith('https://example.com/')
 
 
 async def test_drop_removes_records(rq_client: RedisRequestQueueClient) -> None:
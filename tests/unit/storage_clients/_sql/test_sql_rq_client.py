@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, patch
 
@@ -11,6 +10,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import create_async_engine
 
 from crawlee import Request
+from crawlee._utils.request_codec import decode_request
 from crawlee.configuration import Configuration
 from crawlee.storage_clients import SqlStorageClient
 from crawlee.storage_clients._sql._db_models import RequestDb, RequestQueueMetadataDb
@@ -134,8 +134,8 @@ async def test_request_records_persistence(rq_client: SqlRequestQueueClient) ->
         db_requests = result.scalars().all()
         assert len(db_requests) == 3
     for db_request in db_requests:
-        request = json.loads(db_request.data)
-        assert request['url'] in ['https://example.com/1', 'https://example.com/2', 'https://example.com/3']
+        request = decode_request(db_request.data)
+        assert request.url in ['https://example.com/1', 'https://example.com/2', 'https://example.com/3']
 
 
 async def test_drop_removes_records(rq_client: SqlRequestQueueClient) -> None:
@@ -19,7 +19,7 @@ if TYPE_CHECKING:
     from fakeredis import FakeAsyncRedis
 
 
-@pytest.fixture(params=['memory', 'file_system', 'sql', 'redis'])
+@pytest.fixture(params=['memory', 'file_system', 'file_system_log', 'sql', 'redis'])
 async def storage_client(
     request: pytest.FixtureRequest,
     redis_client: FakeAsyncRedis,
@@ -35,6 +35,8 @@ async def storage_client(
         storage_client = SqlStorageClient()
     elif storage_type == 'redis':
         storage_client = RedisStorageClient(redis=redis_client)
+    elif storage_type == 'file_system_log':
+        storage_client = FileSystemStorageClient(dataset_storage_format='jsonl', queue_storage_format='log')
     else:
         storage_client = FileSystemStorageClient()
     service_locator.set_storage_client(storage_client)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from io import StringIO
 from typing import TYPE_CHECKING
 
 import pytest
@@ -16,6 +17,7 @@ if TYPE_CHECKING:
     from pathlib import Path
     from typing import Any
 
+    from crawlee._utils.json_codec import JsonCodecName
     from crawlee.storage_clients import StorageClient
 
 
@@ -432,6 +434,73 @@ async def test_export_to_json(
     await kvs.drop()
 
 
+async def test_iterate_raw_items(dataset: Dataset) -> None:
+    """Test that raw records are the JSON form of the items, in the same order as `iterate_items`."""
+    items = [{'id': i, 'name': f'Item {i}', 'tag': 'ü'} for i in range(1, 11)]
+    await dataset.push_data(items)
+
+    records = [record async for record in dataset.iterate_raw_items(offset=2, limit=5, desc=True)]
+    assert [json.loads(record) for record in records] == [
+        item async for item in dataset.iterate_items(offset=2, limit=5, desc=True)
+    ]
+
+
+async def test_export_to_json_matches_json_dump(dataset: Dataset, storage_client: StorageClient) -> None:
+    """Test that the JSON export without kwargs is identical to dumping the parsed items."""
+    kvs = await KeyValueStore.open(name='export-kvs')
+
+    items = [{'id': 1, 'name': 'Item 1'}, {'id': 2, 'name': 'Položka 2', 'nested': {'value': None}}, {}]
+    await dataset.push_data(items)
+
+    await dataset.export_to(
+        key='dataset_export.json',
+        content_type='json',
+        to_kvs_name='export-kvs',
+        to_kvs_storage_client=storage_client,
+    )
+
+    record = await kvs.get_value(key='dataset_export.json')
+    assert record == json.dumps(items)
+
+    await kvs.drop()
+
+
+@pytest.mark.parametrize('json_codec', ['json', 'orjson'])
+async def test_export_to_json_matches_json_dump_with_json_codec(json_codec: JsonCodecName, tmp_path: Path) -> None:
+    """Test that the JSON export of a dataset stored in JSON lines does not depend on the codec of the records."""
+    pytest.importorskip(json_codec)
+    storage_client = FileSystemStorageClient(dataset_storage_format='jsonl')
+    configuration = Configuration(storage_dir=str(tmp_path), json_codec=json_codec)
+    dataset = await Dataset.open(storage_client=storage_client, configuration=configuration)
+
+    items = [{'a': 1, 'b': [1, 2]}, {'name': 'Položka', 'nested': {'value': None}}]
+    await dataset.push_data(items)
+
+    await dataset.export_to(
+        key='dataset_export.json',
+        content_type='json',
+        to_kvs_storage_client=storage_client,
+        to_kvs_configuration=configuration,
+    )
+
+    kvs = await KeyValueStore.open(storage_client=storage_client, configuration=configuration)
+    assert await kvs.get_value(key='dataset_export.json') == json.dumps(items)
+
+
+async def test_write_to_json(dataset: Dataset) -> None:
+    """Test writing the dataset to a stream, with the same output as `json.dump`."""
+    items = [{'a': 1, 'b': [1, 2]}, {'name': 'Položka', 'nested': {'value': None}}]
+    await dataset.push_data(items)
+
+    dst = StringIO()
+    await dataset.write_to_json(dst)
+    assert dst.getvalue() == json.dumps(items)
+
+    dst = StringIO()
+    await dataset.write_to_json(dst, indent=2, ensure_ascii=False)
+    assert dst.getvalue() == json.dumps(items, indent=2, ensure_ascii=False)
+
+
 async def test_export_to_csv(
     dataset: Dataset,
     storage_client: StorageClient,
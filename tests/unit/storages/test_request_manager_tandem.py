@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from unittest.mock import create_autospec
 
 import pytest
 
 from crawlee import Request
-from crawlee.request_loaders import RequestLoader, RequestManagerTandem
+from crawlee.request_loaders import RequestList, RequestLoader, RequestManagerTandem
+from crawlee.storage_clients import MemoryStorageClient, SqlStorageClient
 from crawlee.storages import RequestQueue
 
 
@@ -80,3 +82,43 @@ async def test_basic_functionality(test_input: TestInput) -> None:
         await tandem.mark_request_as_handled(request)
 
     assert processed == test_input.expected_result
+
+
+async def test_work_signal_follows_both_sources() -> None:
+    """Test that the tandem is notified about new work in either of its parts."""
+    request_queue = await RequestQueue.open(storage_client=MemoryStorageClient())
+    request_list = RequestList(['https://a.placeholder.com'])
+    tandem = RequestManagerTandem(request_list, request_queue)
+
+    work_signal = tandem.work_signal
+    assert work_signal is not None
+    generation = work_signal.generation
+
+    await request_queue.add_request('https://b.placeholder.com')
+    assert work_signal.generation > generation
+    generation = work_signal.generation
+
+    waiter = asyncio.create_task(work_signal.wait(generation))
+    request_list.work_signal.notify()
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+async def test_no_work_signal_without_signal_of_loader() -> None:
+    """Test that a tandem with a loader that does not notify about new work has to be polled."""
+    request_queue = await RequestQueue.open(storage_client=MemoryStorageClient())
+    request_loader = create_autospec(RequestLoader, instance=True)
+    request_loader.work_signal = None
+
+    assert RequestManagerTandem(request_loader, request_queue).work_signal is None
+
+
+async def test_no_work_signal_with_shared_queue() -> None:
+    """Test that a tandem with a queue that other processes can change has to be polled."""
+    storage_client = SqlStorageClient()
+    request_queue = await RequestQueue.open(storage_client=storage_client)
+
+    try:
+        assert request_queue.work_signal is None
+        assert RequestManagerTandem(RequestList([]), request_queue).work_signal is None
+    finally:
+        await storage_client.close()
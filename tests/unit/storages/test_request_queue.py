@@ -470,6 +470,25 @@ async def test_fetch_next_request_and_mark_handled(rq: RequestQueue) -> None:
     assert empty_request is None
 
 
+async def test_fetch_next_requests(rq: RequestQueue) -> None:
+    """Test fetching requests in batches."""
+    urls = [f'https://example.com/page{i}' for i in range(5)]
+    await rq.add_requests(urls, wait_for_all_requests_to_be_added=True)
+
+    batch = await rq.fetch_next_requests(3)
+    assert len(batch) == 3
+
+    # Fetched requests are in progress, so only the rest can be fetched.
+    rest = await rq.fetch_next_requests(10)
+    assert sorted(request.url for request in [*batch, *rest]) == urls
+    assert await rq.fetch_next_requests(10) == []
+
+    for request in [*batch, *rest]:
+        await rq.mark_request_as_handled(request)
+
+    assert await rq.is_finished()
+
+
 async def test_get_request_by_id(rq: RequestQueue) -> None:
     """Test retrieving a request by its ID."""
     # Add a request
@@ -524,6 +543,30 @@ async def test_reclaim_request(rq: RequestQueue) -> None:
     assert reclaimed_request.url == 'https://example.com'
 
 
+async def test_work_signal_notified_on_new_work(rq: RequestQueue) -> None:
+    """Test that adding and reclaiming requests notifies the work signal of the queue."""
+    work_signal = rq.work_signal
+    if work_signal is None:
+        pytest.skip('Queues that other processes can change have no work signal')
+
+    generation = work_signal.generation
+
+    await rq.add_request('https://example.com')
+    assert work_signal.generation > generation
+    generation = work_signal.generation
+
+    waiter = asyncio.create_task(work_signal.wait(generation))
+    await rq.add_requests(['https://example.com/1', 'https://example.com/2'], wait_for_all_requests_to_be_added=True)
+    await asyncio.wait_for(waiter, timeout=1)
+
+    request = await rq.fetch_next_request()
+    assert request is not None
+    generation = work_signal.generation
+
+    await rq.reclaim_request(request)
+    assert work_signal.generation > generation
+
+
 async def test_reclaim_request_with_forefront(rq: RequestQueue) -> None:
     """Test reclaiming a request to the front of the queue."""
     # Add requests